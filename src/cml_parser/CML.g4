@@ -137,7 +137,7 @@ domain
     ;
 
 subdomain
-    : 'Subdomain' name ('supports' idList)? body=contentBlock?
+    : 'Subdomain' name ('supports' idList)? ('type' '='? subdomainType)? body=contentBlock?
     ;
 
 subdomainType
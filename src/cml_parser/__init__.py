@@ -1,19 +1,144 @@
-from .parser import (
-    parse_file,
-    parse_file_safe,
-    parse_text,
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from .cml_objects import (
     ParseResult,
     Diagnostic,
-    CmlSyntaxError,
     RelationshipType,
 )
 
+# Everything that needs the generated ANTLR parser is imported on first access,
+# so `import cml_parser` stays cheap for tools that only use the object model.
+_LAZY_EXPORTS = {
+    "parse_file": ".parser",
+    "parse_file_safe": ".parser",
+    "parse_text": ".parser",
+    "parse_fragment": ".parser",
+    "parse_files": ".parallel",
+    "parse_file_parallel": ".parallel",
+    "FRAGMENT_KINDS": ".parser",
+    "ParserSession": ".parser",
+    "CmlSyntaxError": ".parser",
+    "CmlLimitExceeded": ".parser",
+    "CancellationToken": ".cancellation",
+    "CmlParseCancelled": ".cancellation",
+    "CmlParseTimeout": ".cancellation",
+    "ParseLimits": ".limits",
+    "PredictionStats": ".parser",
+    "get_prediction_stats": ".parser",
+    "reset_prediction_stats": ".parser",
+    "save_dfa_cache": ".dfa_cache",
+    "load_dfa_cache": ".dfa_cache",
+    "warm_dfa_cache": ".dfa_cache",
+    "CachePolicy": ".dfa_cache",
+    "ParserCacheStats": ".dfa_cache",
+    "set_cache_policy": ".dfa_cache",
+    "get_cache_policy": ".dfa_cache",
+    "get_parser_cache_stats": ".dfa_cache",
+    "reset_parser_cache_stats": ".dfa_cache",
+    "clear_parser_caches": ".dfa_cache",
+    "tokenize": ".tokens",
+    "TokenInfo": ".tokens",
+    "TokenCache": ".tokens",
+    "TokenCacheStats": ".tokens",
+    "outline_text": ".outline",
+    "outline_file": ".outline",
+    "outline_files": ".outline",
+    "OutlineEntry": ".outline",
+}
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .parser import (
+        parse_file,
+        parse_file_safe,
+        parse_text,
+        parse_fragment,
+        FRAGMENT_KINDS,
+        ParserSession,
+        CmlSyntaxError,
+        CmlLimitExceeded,
+        PredictionStats,
+        get_prediction_stats,
+        reset_prediction_stats,
+    )
+    from .cancellation import (
+        CancellationToken,
+        CmlParseCancelled,
+        CmlParseTimeout,
+    )
+    from .limits import ParseLimits
+    from .parallel import parse_file_parallel, parse_files
+    from .dfa_cache import (
+        save_dfa_cache,
+        load_dfa_cache,
+        warm_dfa_cache,
+        CachePolicy,
+        ParserCacheStats,
+        set_cache_policy,
+        get_cache_policy,
+        get_parser_cache_stats,
+        reset_parser_cache_stats,
+        clear_parser_caches,
+    )
+    from .tokens import (
+        tokenize,
+        TokenInfo,
+        TokenCache,
+        TokenCacheStats,
+    )
+    from .outline import OutlineEntry, outline_file, outline_files, outline_text
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 __all__ = [
     "parse_file",
     "parse_file_safe",
     "parse_text",
+    "parse_fragment",
+    "parse_files",
+    "parse_file_parallel",
+    "FRAGMENT_KINDS",
+    "ParserSession",
     "ParseResult",
     "Diagnostic",
     "CmlSyntaxError",
+    "CmlLimitExceeded",
+    "ParseLimits",
+    "CancellationToken",
+    "CmlParseCancelled",
+    "CmlParseTimeout",
     "RelationshipType",
+    "PredictionStats",
+    "get_prediction_stats",
+    "reset_prediction_stats",
+    "save_dfa_cache",
+    "load_dfa_cache",
+    "warm_dfa_cache",
+    "CachePolicy",
+    "ParserCacheStats",
+    "set_cache_policy",
+    "get_cache_policy",
+    "get_parser_cache_stats",
+    "reset_parser_cache_stats",
+    "clear_parser_caches",
+    "tokenize",
+    "TokenInfo",
+    "TokenCache",
+    "TokenCacheStats",
+    "outline_text",
+    "outline_file",
+    "outline_files",
+    "OutlineEntry",
 ]
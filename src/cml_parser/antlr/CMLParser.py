@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,1,358,3095,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
+        4,1,358,3102,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,
         7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,
         13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,
         20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,
@@ -65,1298 +65,1301 @@ def serializedATN():
         3,19,622,8,19,1,19,1,19,1,19,3,19,627,8,19,1,19,1,19,1,19,3,19,632,
         8,19,1,19,1,19,1,19,3,19,637,8,19,1,19,3,19,640,8,19,1,20,1,20,1,
         21,1,21,1,22,1,22,1,23,1,23,1,23,3,23,651,8,23,1,24,1,24,1,24,1,
-        24,3,24,657,8,24,1,24,3,24,660,8,24,1,25,1,25,1,26,1,26,1,26,3,26,
-        667,8,26,1,27,3,27,670,8,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,5,
-        27,679,8,27,10,27,12,27,682,9,27,1,27,1,27,1,27,3,27,687,8,27,1,
-        27,1,27,1,27,1,27,5,27,693,8,27,10,27,12,27,696,9,27,1,27,1,27,3,
-        27,700,8,27,1,28,1,28,1,28,1,28,3,28,706,8,28,1,29,1,29,1,29,3,29,
-        711,8,29,1,30,3,30,714,8,30,1,30,1,30,1,31,1,31,3,31,720,8,31,1,
-        32,1,32,1,32,1,32,1,32,1,32,1,32,3,32,729,8,32,1,33,3,33,732,8,33,
-        1,33,1,33,1,33,1,33,3,33,738,8,33,1,33,3,33,741,8,33,1,33,1,33,1,
-        33,1,33,5,33,747,8,33,10,33,12,33,750,9,33,5,33,752,8,33,10,33,12,
-        33,755,9,33,1,33,3,33,758,8,33,1,34,1,34,1,34,5,34,763,8,34,10,34,
-        12,34,766,9,34,1,34,1,34,1,35,1,35,3,35,772,8,35,1,35,1,35,1,35,
+        24,3,24,657,8,24,1,24,1,24,3,24,661,8,24,1,24,3,24,664,8,24,1,24,
+        3,24,667,8,24,1,25,1,25,1,26,1,26,1,26,3,26,674,8,26,1,27,3,27,677,
+        8,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,5,27,686,8,27,10,27,12,27,
+        689,9,27,1,27,1,27,1,27,3,27,694,8,27,1,27,1,27,1,27,1,27,5,27,700,
+        8,27,10,27,12,27,703,9,27,1,27,1,27,3,27,707,8,27,1,28,1,28,1,28,
+        1,28,3,28,713,8,28,1,29,1,29,1,29,3,29,718,8,29,1,30,3,30,721,8,
+        30,1,30,1,30,1,31,1,31,3,31,727,8,31,1,32,1,32,1,32,1,32,1,32,1,
+        32,1,32,3,32,736,8,32,1,33,3,33,739,8,33,1,33,1,33,1,33,1,33,3,33,
+        745,8,33,1,33,3,33,748,8,33,1,33,1,33,1,33,1,33,5,33,754,8,33,10,
+        33,12,33,757,9,33,5,33,759,8,33,10,33,12,33,762,9,33,1,33,3,33,765,
+        8,33,1,34,1,34,1,34,5,34,770,8,34,10,34,12,34,773,9,34,1,34,1,34,
+        1,35,1,35,3,35,779,8,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,
         1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,
-        1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,3,35,800,8,35,
-        1,35,1,35,3,35,804,8,35,1,35,1,35,3,35,808,8,35,1,35,1,35,1,35,1,
-        35,1,35,1,35,1,35,1,35,3,35,818,8,35,1,35,1,35,3,35,822,8,35,1,36,
-        3,36,825,8,36,1,36,1,36,1,36,1,36,3,36,831,8,36,1,36,3,36,834,8,
-        36,1,36,1,36,1,36,1,36,5,36,840,8,36,10,36,12,36,843,9,36,5,36,845,
-        8,36,10,36,12,36,848,9,36,1,36,3,36,851,8,36,1,37,1,37,5,37,855,
-        8,37,10,37,12,37,858,9,37,1,37,5,37,861,8,37,10,37,12,37,864,9,37,
-        1,37,1,37,1,38,1,38,3,38,870,8,38,1,38,1,38,1,38,1,38,1,38,1,38,
-        1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,3,38,886,8,38,1,38,1,38,
-        3,38,890,8,38,1,38,1,38,3,38,894,8,38,1,38,1,38,3,38,898,8,38,1,
+        1,35,1,35,1,35,1,35,1,35,3,35,807,8,35,1,35,1,35,3,35,811,8,35,1,
+        35,1,35,3,35,815,8,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,3,
+        35,825,8,35,1,35,1,35,3,35,829,8,35,1,36,3,36,832,8,36,1,36,1,36,
+        1,36,1,36,3,36,838,8,36,1,36,3,36,841,8,36,1,36,1,36,1,36,1,36,5,
+        36,847,8,36,10,36,12,36,850,9,36,5,36,852,8,36,10,36,12,36,855,9,
+        36,1,36,3,36,858,8,36,1,37,1,37,5,37,862,8,37,10,37,12,37,865,9,
+        37,1,37,5,37,868,8,37,10,37,12,37,871,9,37,1,37,1,37,1,38,1,38,3,
+        38,877,8,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,
+        38,1,38,1,38,1,38,3,38,893,8,38,1,38,1,38,3,38,897,8,38,1,38,1,38,
+        3,38,901,8,38,1,38,1,38,3,38,905,8,38,1,38,1,38,1,38,1,38,1,38,1,
         38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,
-        38,1,38,1,38,1,38,1,38,1,38,1,38,3,38,920,8,38,1,39,3,39,923,8,39,
-        1,39,1,39,1,39,1,39,3,39,929,8,39,1,39,3,39,932,8,39,1,39,1,39,1,
-        39,1,39,5,39,938,8,39,10,39,12,39,941,9,39,5,39,943,8,39,10,39,12,
-        39,946,9,39,1,39,3,39,949,8,39,1,40,1,40,1,40,5,40,954,8,40,10,40,
-        12,40,957,9,40,1,40,1,40,1,41,1,41,3,41,963,8,41,1,41,1,41,1,41,
-        1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,3,41,979,
-        8,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,
-        1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,3,41,1002,8,41,1,42,
-        3,42,1005,8,42,1,42,1,42,1,42,1,42,3,42,1011,8,42,1,42,3,42,1014,
-        8,42,1,42,1,42,1,42,1,42,5,42,1020,8,42,10,42,12,42,1023,9,42,5,
-        42,1025,8,42,10,42,12,42,1028,9,42,1,42,3,42,1031,8,42,1,43,1,43,
-        5,43,1035,8,43,10,43,12,43,1038,9,43,1,43,5,43,1041,8,43,10,43,12,
-        43,1044,9,43,1,43,1,43,1,44,1,44,3,44,1050,8,44,1,44,1,44,1,44,1,
-        44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,3,44,1066,8,
-        44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,
-        44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,3,44,1089,8,44,1,45,1,
-        45,1,45,3,45,1094,8,45,1,46,1,46,5,46,1098,8,46,10,46,12,46,1101,
-        9,46,1,46,5,46,1104,8,46,10,46,12,46,1107,9,46,1,46,1,46,1,47,1,
-        47,1,47,1,47,1,47,1,47,3,47,1117,8,47,1,48,3,48,1120,8,48,1,48,1,
-        48,1,49,1,49,1,49,1,49,3,49,1128,8,49,1,49,3,49,1131,8,49,1,49,5,
-        49,1134,8,49,10,49,12,49,1137,9,49,1,49,3,49,1140,8,49,1,50,1,50,
-        5,50,1144,8,50,10,50,12,50,1147,9,50,1,50,5,50,1150,8,50,10,50,12,
-        50,1153,9,50,1,50,1,50,1,51,1,51,1,51,1,51,1,51,1,51,3,51,1163,8,
-        51,1,51,1,51,1,51,1,51,1,51,1,51,3,51,1171,8,51,1,52,1,52,1,52,1,
-        52,1,52,1,52,1,52,1,52,1,52,3,52,1182,8,52,1,53,1,53,1,53,1,53,5,
-        53,1188,8,53,10,53,12,53,1191,9,53,1,53,5,53,1194,8,53,10,53,12,
-        53,1197,9,53,1,53,1,53,1,53,5,53,1202,8,53,10,53,12,53,1205,9,53,
-        1,53,3,53,1208,8,53,3,53,1210,8,53,1,53,1,53,1,54,1,54,1,54,1,54,
-        1,54,1,54,1,54,1,54,3,54,1222,8,54,1,55,1,55,1,55,3,55,1227,8,55,
-        1,55,3,55,1230,8,55,1,56,1,56,1,56,1,56,1,56,5,56,1237,8,56,10,56,
-        12,56,1240,9,56,1,56,1,56,3,56,1244,8,56,1,57,1,57,1,58,1,58,1,58,
-        1,58,1,58,1,58,5,58,1254,8,58,10,58,12,58,1257,9,58,5,58,1259,8,
-        58,10,58,12,58,1262,9,58,1,58,3,58,1265,8,58,1,59,1,59,5,59,1269,
-        8,59,10,59,12,59,1272,9,59,1,59,5,59,1275,8,59,10,59,12,59,1278,
-        9,59,1,59,1,59,1,60,1,60,3,60,1284,8,60,1,60,1,60,1,60,1,60,1,60,
-        1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,60,3,60,1299,8,60,1,60,1,60,
-        3,60,1303,8,60,1,60,3,60,1306,8,60,1,61,1,61,1,61,1,61,1,61,3,61,
-        1313,8,61,1,62,1,62,3,62,1317,8,62,1,62,3,62,1320,8,62,1,62,1,62,
-        1,62,5,62,1325,8,62,10,62,12,62,1328,9,62,1,62,3,62,1331,8,62,1,
-        62,1,62,3,62,1335,8,62,1,62,3,62,1338,8,62,1,62,1,62,3,62,1342,8,
-        62,3,62,1344,8,62,1,63,3,63,1347,8,63,1,63,3,63,1350,8,63,1,63,3,
-        63,1353,8,63,1,63,1,63,1,63,3,63,1358,8,63,1,63,5,63,1361,8,63,10,
-        63,12,63,1364,9,63,1,63,3,63,1367,8,63,1,63,3,63,1370,8,63,1,63,
-        3,63,1373,8,63,1,63,3,63,1376,8,63,1,63,3,63,1379,8,63,1,63,1,63,
-        1,63,1,63,3,63,1385,8,63,1,63,5,63,1388,8,63,10,63,12,63,1391,9,
-        63,1,63,3,63,1394,8,63,1,63,3,63,1397,8,63,3,63,1399,8,63,1,64,1,
-        64,1,64,1,65,1,65,3,65,1406,8,65,1,65,1,65,1,65,3,65,1411,8,65,3,
-        65,1413,8,65,3,65,1415,8,65,1,66,1,66,1,67,1,67,1,68,1,68,1,68,1,
-        68,3,68,1425,8,68,1,68,1,68,3,68,1429,8,68,1,69,1,69,3,69,1433,8,
-        69,1,70,3,70,1436,8,70,1,70,3,70,1439,8,70,1,70,1,70,1,70,5,70,1444,
-        8,70,10,70,12,70,1447,9,70,1,70,3,70,1450,8,70,1,70,3,70,1453,8,
-        70,1,70,3,70,1456,8,70,1,70,1,70,5,70,1460,8,70,10,70,12,70,1463,
-        9,70,1,70,3,70,1466,8,70,3,70,1468,8,70,1,71,3,71,1471,8,71,1,71,
-        3,71,1474,8,71,1,71,1,71,1,71,3,71,1479,8,71,1,71,1,71,5,71,1483,
-        8,71,10,71,12,71,1486,9,71,1,71,3,71,1489,8,71,1,72,1,72,3,72,1493,
-        8,72,1,72,3,72,1496,8,72,1,72,3,72,1499,8,72,1,72,1,72,5,72,1503,
-        8,72,10,72,12,72,1506,9,72,1,72,3,72,1509,8,72,1,73,1,73,3,73,1513,
-        8,73,1,73,3,73,1516,8,73,1,73,1,73,3,73,1520,8,73,3,73,1522,8,73,
-        1,74,1,74,1,74,3,74,1527,8,74,1,75,1,75,1,76,1,76,1,76,1,76,3,76,
-        1535,8,76,1,77,1,77,1,77,1,78,1,78,1,78,1,78,1,78,1,78,1,78,1,78,
-        1,78,1,78,3,78,1550,8,78,1,79,1,79,1,80,1,80,3,80,1556,8,80,1,80,
-        1,80,1,80,1,80,1,80,3,80,1563,8,80,1,80,1,80,3,80,1567,8,80,1,80,
-        1,80,1,80,1,80,1,80,3,80,1574,8,80,1,80,1,80,1,80,3,80,1579,8,80,
-        1,80,3,80,1582,8,80,1,80,3,80,1585,8,80,1,81,3,81,1588,8,81,1,81,
-        1,81,1,82,1,82,1,82,3,82,1595,8,82,1,83,1,83,5,83,1599,8,83,10,83,
-        12,83,1602,9,83,1,83,1,83,1,84,1,84,3,84,1608,8,84,1,85,1,85,3,85,
-        1612,8,85,1,85,1,85,1,85,3,85,1617,8,85,1,85,3,85,1620,8,85,1,86,
-        1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,
-        1,86,1,86,1,86,1,86,1,86,3,86,1641,8,86,1,87,1,87,3,87,1645,8,87,
-        1,87,1,87,3,87,1649,8,87,1,88,1,88,3,88,1653,8,88,1,88,1,88,3,88,
-        1657,8,88,1,88,1,88,3,88,1661,8,88,1,88,1,88,3,88,1665,8,88,1,88,
-        1,88,3,88,1669,8,88,1,88,1,88,3,88,1673,8,88,1,88,1,88,3,88,1677,
-        8,88,1,88,1,88,3,88,1681,8,88,1,88,1,88,3,88,1685,8,88,1,88,1,88,
-        3,88,1689,8,88,1,88,1,88,3,88,1693,8,88,1,88,1,88,3,88,1697,8,88,
-        1,88,1,88,3,88,1701,8,88,1,88,1,88,3,88,1705,8,88,1,88,1,88,3,88,
-        1709,8,88,1,88,1,88,3,88,1713,8,88,1,88,1,88,3,88,1717,8,88,1,88,
-        1,88,3,88,1721,8,88,3,88,1723,8,88,1,89,1,89,1,90,1,90,1,91,1,91,
-        1,92,1,92,1,92,1,92,3,92,1735,8,92,1,93,1,93,1,93,1,93,3,93,1741,
-        8,93,1,94,3,94,1744,8,94,1,94,1,94,1,94,1,94,3,94,1750,8,94,1,94,
-        1,94,1,94,1,94,3,94,1756,8,94,1,95,1,95,1,95,5,95,1761,8,95,10,95,
-        12,95,1764,9,95,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,
-        1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,3,96,1784,8,96,1,96,3,96,
-        1787,8,96,1,97,1,97,1,98,1,98,1,98,1,98,5,98,1795,8,98,10,98,12,
-        98,1798,9,98,1,98,3,98,1801,8,98,1,99,1,99,5,99,1805,8,99,10,99,
-        12,99,1808,9,99,1,99,1,99,1,100,1,100,1,100,1,100,1,100,1,100,3,
-        100,1818,8,100,1,101,1,101,1,101,1,101,5,101,1824,8,101,10,101,12,
-        101,1827,9,101,1,101,3,101,1830,8,101,1,102,1,102,5,102,1834,8,102,
-        10,102,12,102,1837,9,102,1,102,1,102,1,103,1,103,1,103,1,103,1,103,
-        3,103,1846,8,103,1,104,1,104,1,104,1,104,5,104,1852,8,104,10,104,
-        12,104,1855,9,104,1,104,3,104,1858,8,104,1,105,1,105,5,105,1862,
-        8,105,10,105,12,105,1865,9,105,1,105,1,105,1,106,1,106,1,106,3,106,
-        1872,8,106,1,107,1,107,1,107,1,107,5,107,1878,8,107,10,107,12,107,
-        1881,9,107,1,107,3,107,1884,8,107,1,108,1,108,5,108,1888,8,108,10,
-        108,12,108,1891,9,108,1,108,1,108,1,109,1,109,1,109,1,109,3,109,
-        1899,8,109,1,110,3,110,1902,8,110,1,110,3,110,1905,8,110,1,110,1,
-        110,1,110,1,110,3,110,1911,8,110,1,110,1,110,3,110,1915,8,110,1,
-        110,3,110,1918,8,110,1,110,5,110,1921,8,110,10,110,12,110,1924,9,
-        110,1,110,3,110,1927,8,110,1,111,1,111,1,111,1,111,1,111,1,111,1,
-        111,1,111,1,111,1,111,1,111,3,111,1940,8,111,1,111,1,111,1,111,3,
-        111,1945,8,111,3,111,1947,8,111,1,112,1,112,1,112,1,112,1,112,1,
-        112,1,112,1,112,1,112,3,112,1958,8,112,1,113,1,113,1,113,1,113,1,
-        113,1,113,1,113,3,113,1967,8,113,1,113,1,113,1,113,3,113,1972,8,
-        113,1,113,1,113,1,113,3,113,1977,8,113,1,113,1,113,1,113,1,113,3,
-        113,1983,8,113,1,114,1,114,3,114,1987,8,114,1,114,1,114,1,115,1,
-        115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,3,115,2000,8,115,1,
-        115,1,115,1,115,3,115,2005,8,115,3,115,2007,8,115,1,116,1,116,1,
-        116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
+        38,1,38,3,38,927,8,38,1,39,3,39,930,8,39,1,39,1,39,1,39,1,39,3,39,
+        936,8,39,1,39,3,39,939,8,39,1,39,1,39,1,39,1,39,5,39,945,8,39,10,
+        39,12,39,948,9,39,5,39,950,8,39,10,39,12,39,953,9,39,1,39,3,39,956,
+        8,39,1,40,1,40,1,40,5,40,961,8,40,10,40,12,40,964,9,40,1,40,1,40,
+        1,41,1,41,3,41,970,8,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,
+        1,41,1,41,1,41,1,41,1,41,1,41,3,41,986,8,41,1,41,1,41,1,41,1,41,
+        1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,
+        1,41,1,41,1,41,1,41,3,41,1009,8,41,1,42,3,42,1012,8,42,1,42,1,42,
+        1,42,1,42,3,42,1018,8,42,1,42,3,42,1021,8,42,1,42,1,42,1,42,1,42,
+        5,42,1027,8,42,10,42,12,42,1030,9,42,5,42,1032,8,42,10,42,12,42,
+        1035,9,42,1,42,3,42,1038,8,42,1,43,1,43,5,43,1042,8,43,10,43,12,
+        43,1045,9,43,1,43,5,43,1048,8,43,10,43,12,43,1051,9,43,1,43,1,43,
+        1,44,1,44,3,44,1057,8,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,
+        1,44,1,44,1,44,1,44,1,44,1,44,3,44,1073,8,44,1,44,1,44,1,44,1,44,
+        1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,
+        1,44,1,44,1,44,1,44,3,44,1096,8,44,1,45,1,45,1,45,3,45,1101,8,45,
+        1,46,1,46,5,46,1105,8,46,10,46,12,46,1108,9,46,1,46,5,46,1111,8,
+        46,10,46,12,46,1114,9,46,1,46,1,46,1,47,1,47,1,47,1,47,1,47,1,47,
+        3,47,1124,8,47,1,48,3,48,1127,8,48,1,48,1,48,1,49,1,49,1,49,1,49,
+        3,49,1135,8,49,1,49,3,49,1138,8,49,1,49,5,49,1141,8,49,10,49,12,
+        49,1144,9,49,1,49,3,49,1147,8,49,1,50,1,50,5,50,1151,8,50,10,50,
+        12,50,1154,9,50,1,50,5,50,1157,8,50,10,50,12,50,1160,9,50,1,50,1,
+        50,1,51,1,51,1,51,1,51,1,51,1,51,3,51,1170,8,51,1,51,1,51,1,51,1,
+        51,1,51,1,51,3,51,1178,8,51,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,
+        52,1,52,3,52,1189,8,52,1,53,1,53,1,53,1,53,5,53,1195,8,53,10,53,
+        12,53,1198,9,53,1,53,5,53,1201,8,53,10,53,12,53,1204,9,53,1,53,1,
+        53,1,53,5,53,1209,8,53,10,53,12,53,1212,9,53,1,53,3,53,1215,8,53,
+        3,53,1217,8,53,1,53,1,53,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,
+        3,54,1229,8,54,1,55,1,55,1,55,3,55,1234,8,55,1,55,3,55,1237,8,55,
+        1,56,1,56,1,56,1,56,1,56,5,56,1244,8,56,10,56,12,56,1247,9,56,1,
+        56,1,56,3,56,1251,8,56,1,57,1,57,1,58,1,58,1,58,1,58,1,58,1,58,5,
+        58,1261,8,58,10,58,12,58,1264,9,58,5,58,1266,8,58,10,58,12,58,1269,
+        9,58,1,58,3,58,1272,8,58,1,59,1,59,5,59,1276,8,59,10,59,12,59,1279,
+        9,59,1,59,5,59,1282,8,59,10,59,12,59,1285,9,59,1,59,1,59,1,60,1,
+        60,3,60,1291,8,60,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,
+        60,1,60,1,60,1,60,3,60,1306,8,60,1,60,1,60,3,60,1310,8,60,1,60,3,
+        60,1313,8,60,1,61,1,61,1,61,1,61,1,61,3,61,1320,8,61,1,62,1,62,3,
+        62,1324,8,62,1,62,3,62,1327,8,62,1,62,1,62,1,62,5,62,1332,8,62,10,
+        62,12,62,1335,9,62,1,62,3,62,1338,8,62,1,62,1,62,3,62,1342,8,62,
+        1,62,3,62,1345,8,62,1,62,1,62,3,62,1349,8,62,3,62,1351,8,62,1,63,
+        3,63,1354,8,63,1,63,3,63,1357,8,63,1,63,3,63,1360,8,63,1,63,1,63,
+        1,63,3,63,1365,8,63,1,63,5,63,1368,8,63,10,63,12,63,1371,9,63,1,
+        63,3,63,1374,8,63,1,63,3,63,1377,8,63,1,63,3,63,1380,8,63,1,63,3,
+        63,1383,8,63,1,63,3,63,1386,8,63,1,63,1,63,1,63,1,63,3,63,1392,8,
+        63,1,63,5,63,1395,8,63,10,63,12,63,1398,9,63,1,63,3,63,1401,8,63,
+        1,63,3,63,1404,8,63,3,63,1406,8,63,1,64,1,64,1,64,1,65,1,65,3,65,
+        1413,8,65,1,65,1,65,1,65,3,65,1418,8,65,3,65,1420,8,65,3,65,1422,
+        8,65,1,66,1,66,1,67,1,67,1,68,1,68,1,68,1,68,3,68,1432,8,68,1,68,
+        1,68,3,68,1436,8,68,1,69,1,69,3,69,1440,8,69,1,70,3,70,1443,8,70,
+        1,70,3,70,1446,8,70,1,70,1,70,1,70,5,70,1451,8,70,10,70,12,70,1454,
+        9,70,1,70,3,70,1457,8,70,1,70,3,70,1460,8,70,1,70,3,70,1463,8,70,
+        1,70,1,70,5,70,1467,8,70,10,70,12,70,1470,9,70,1,70,3,70,1473,8,
+        70,3,70,1475,8,70,1,71,3,71,1478,8,71,1,71,3,71,1481,8,71,1,71,1,
+        71,1,71,3,71,1486,8,71,1,71,1,71,5,71,1490,8,71,10,71,12,71,1493,
+        9,71,1,71,3,71,1496,8,71,1,72,1,72,3,72,1500,8,72,1,72,3,72,1503,
+        8,72,1,72,3,72,1506,8,72,1,72,1,72,5,72,1510,8,72,10,72,12,72,1513,
+        9,72,1,72,3,72,1516,8,72,1,73,1,73,3,73,1520,8,73,1,73,3,73,1523,
+        8,73,1,73,1,73,3,73,1527,8,73,3,73,1529,8,73,1,74,1,74,1,74,3,74,
+        1534,8,74,1,75,1,75,1,76,1,76,1,76,1,76,3,76,1542,8,76,1,77,1,77,
+        1,77,1,78,1,78,1,78,1,78,1,78,1,78,1,78,1,78,1,78,1,78,3,78,1557,
+        8,78,1,79,1,79,1,80,1,80,3,80,1563,8,80,1,80,1,80,1,80,1,80,1,80,
+        3,80,1570,8,80,1,80,1,80,3,80,1574,8,80,1,80,1,80,1,80,1,80,1,80,
+        3,80,1581,8,80,1,80,1,80,1,80,3,80,1586,8,80,1,80,3,80,1589,8,80,
+        1,80,3,80,1592,8,80,1,81,3,81,1595,8,81,1,81,1,81,1,82,1,82,1,82,
+        3,82,1602,8,82,1,83,1,83,5,83,1606,8,83,10,83,12,83,1609,9,83,1,
+        83,1,83,1,84,1,84,3,84,1615,8,84,1,85,1,85,3,85,1619,8,85,1,85,1,
+        85,1,85,3,85,1624,8,85,1,85,3,85,1627,8,85,1,86,1,86,1,86,1,86,1,
+        86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,86,1,
+        86,1,86,3,86,1648,8,86,1,87,1,87,3,87,1652,8,87,1,87,1,87,3,87,1656,
+        8,87,1,88,1,88,3,88,1660,8,88,1,88,1,88,3,88,1664,8,88,1,88,1,88,
+        3,88,1668,8,88,1,88,1,88,3,88,1672,8,88,1,88,1,88,3,88,1676,8,88,
+        1,88,1,88,3,88,1680,8,88,1,88,1,88,3,88,1684,8,88,1,88,1,88,3,88,
+        1688,8,88,1,88,1,88,3,88,1692,8,88,1,88,1,88,3,88,1696,8,88,1,88,
+        1,88,3,88,1700,8,88,1,88,1,88,3,88,1704,8,88,1,88,1,88,3,88,1708,
+        8,88,1,88,1,88,3,88,1712,8,88,1,88,1,88,3,88,1716,8,88,1,88,1,88,
+        3,88,1720,8,88,1,88,1,88,3,88,1724,8,88,1,88,1,88,3,88,1728,8,88,
+        3,88,1730,8,88,1,89,1,89,1,90,1,90,1,91,1,91,1,92,1,92,1,92,1,92,
+        3,92,1742,8,92,1,93,1,93,1,93,1,93,3,93,1748,8,93,1,94,3,94,1751,
+        8,94,1,94,1,94,1,94,1,94,3,94,1757,8,94,1,94,1,94,1,94,1,94,3,94,
+        1763,8,94,1,95,1,95,1,95,5,95,1768,8,95,10,95,12,95,1771,9,95,1,
+        96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,
+        96,1,96,1,96,1,96,1,96,3,96,1791,8,96,1,96,3,96,1794,8,96,1,97,1,
+        97,1,98,1,98,1,98,1,98,5,98,1802,8,98,10,98,12,98,1805,9,98,1,98,
+        3,98,1808,8,98,1,99,1,99,5,99,1812,8,99,10,99,12,99,1815,9,99,1,
+        99,1,99,1,100,1,100,1,100,1,100,1,100,1,100,3,100,1825,8,100,1,101,
+        1,101,1,101,1,101,5,101,1831,8,101,10,101,12,101,1834,9,101,1,101,
+        3,101,1837,8,101,1,102,1,102,5,102,1841,8,102,10,102,12,102,1844,
+        9,102,1,102,1,102,1,103,1,103,1,103,1,103,1,103,3,103,1853,8,103,
+        1,104,1,104,1,104,1,104,5,104,1859,8,104,10,104,12,104,1862,9,104,
+        1,104,3,104,1865,8,104,1,105,1,105,5,105,1869,8,105,10,105,12,105,
+        1872,9,105,1,105,1,105,1,106,1,106,1,106,3,106,1879,8,106,1,107,
+        1,107,1,107,1,107,5,107,1885,8,107,10,107,12,107,1888,9,107,1,107,
+        3,107,1891,8,107,1,108,1,108,5,108,1895,8,108,10,108,12,108,1898,
+        9,108,1,108,1,108,1,109,1,109,1,109,1,109,3,109,1906,8,109,1,110,
+        3,110,1909,8,110,1,110,3,110,1912,8,110,1,110,1,110,1,110,1,110,
+        3,110,1918,8,110,1,110,1,110,3,110,1922,8,110,1,110,3,110,1925,8,
+        110,1,110,5,110,1928,8,110,10,110,12,110,1931,9,110,1,110,3,110,
+        1934,8,110,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,
+        1,111,1,111,3,111,1947,8,111,1,111,1,111,1,111,3,111,1952,8,111,
+        3,111,1954,8,111,1,112,1,112,1,112,1,112,1,112,1,112,1,112,1,112,
+        1,112,3,112,1965,8,112,1,113,1,113,1,113,1,113,1,113,1,113,1,113,
+        3,113,1974,8,113,1,113,1,113,1,113,3,113,1979,8,113,1,113,1,113,
+        1,113,3,113,1984,8,113,1,113,1,113,1,113,1,113,3,113,1990,8,113,
+        1,114,1,114,3,114,1994,8,114,1,114,1,114,1,115,1,115,1,115,1,115,
+        1,115,1,115,1,115,1,115,1,115,3,115,2007,8,115,1,115,1,115,1,115,
+        3,115,2012,8,115,3,115,2014,8,115,1,116,1,116,1,116,1,116,1,116,
         1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
-        1,116,1,116,1,116,1,116,1,116,3,116,2038,8,116,1,116,3,116,2041,
-        8,116,1,116,1,116,1,116,3,116,2046,8,116,1,116,1,116,1,116,1,116,
-        1,116,3,116,2053,8,116,1,116,1,116,3,116,2057,8,116,1,116,1,116,
-        1,116,1,116,1,116,3,116,2064,8,116,3,116,2066,8,116,1,117,1,117,
-        1,118,1,118,3,118,2072,8,118,1,118,1,118,5,118,2076,8,118,10,118,
-        12,118,2079,9,118,1,118,1,118,1,119,1,119,1,119,1,119,1,119,1,119,
-        3,119,2089,8,119,1,120,1,120,1,120,3,120,2094,8,120,1,121,1,121,
-        1,121,1,121,5,121,2100,8,121,10,121,12,121,2103,9,121,1,121,1,121,
-        1,122,1,122,1,122,3,122,2110,8,122,1,123,1,123,1,123,3,123,2115,
-        8,123,1,123,3,123,2118,8,123,1,123,3,123,2121,8,123,1,124,3,124,
-        2124,8,124,1,124,3,124,2127,8,124,1,125,1,125,1,125,1,125,1,125,
-        3,125,2134,8,125,1,126,1,126,1,126,1,126,5,126,2140,8,126,10,126,
-        12,126,2143,9,126,1,127,1,127,1,127,3,127,2148,8,127,1,127,3,127,
-        2151,8,127,1,127,3,127,2154,8,127,1,128,3,128,2157,8,128,1,128,3,
-        128,2160,8,128,1,129,1,129,1,129,1,129,1,129,1,129,1,130,1,130,1,
-        130,1,130,3,130,2172,8,130,1,130,3,130,2175,8,130,1,131,1,131,5,
-        131,2179,8,131,10,131,12,131,2182,9,131,1,132,1,132,1,132,1,133,
-        3,133,2188,8,133,1,133,1,133,1,134,1,134,1,135,1,135,1,135,1,135,
-        1,136,1,136,1,136,1,136,5,136,2202,8,136,10,136,12,136,2205,9,136,
-        1,137,1,137,1,137,1,137,5,137,2211,8,137,10,137,12,137,2214,9,137,
-        1,137,1,137,1,138,1,138,3,138,2220,8,138,1,139,1,139,1,139,5,139,
-        2225,8,139,10,139,12,139,2228,9,139,1,140,1,140,3,140,2232,8,140,
-        1,140,1,140,1,140,1,140,1,140,5,140,2239,8,140,10,140,12,140,2242,
-        9,140,3,140,2244,8,140,1,140,1,140,1,141,1,141,3,141,2250,8,141,
-        1,142,1,142,1,143,1,143,1,143,1,143,1,143,5,143,2259,8,143,10,143,
-        12,143,2262,9,143,1,143,3,143,2265,8,143,1,144,1,144,1,144,1,144,
-        1,144,1,144,3,144,2273,8,144,1,145,1,145,3,145,2277,8,145,1,145,
-        1,145,1,146,1,146,3,146,2283,8,146,1,146,1,146,1,146,5,146,2288,
-        8,146,10,146,12,146,2291,9,146,1,147,1,147,3,147,2295,8,147,1,147,
-        4,147,2298,8,147,11,147,12,147,2299,1,148,1,148,3,148,2304,8,148,
-        1,148,1,148,3,148,2308,8,148,1,148,1,148,3,148,2312,8,148,1,148,
-        1,148,3,148,2316,8,148,3,148,2318,8,148,1,149,1,149,1,149,1,149,
-        3,149,2324,8,149,1,150,1,150,1,150,1,150,1,150,1,150,1,150,5,150,
-        2333,8,150,10,150,12,150,2336,9,150,1,151,1,151,3,151,2340,8,151,
-        1,152,1,152,1,152,1,152,1,152,1,152,1,152,1,152,1,152,1,152,3,152,
-        2352,8,152,1,153,1,153,1,153,1,154,1,154,1,155,3,155,2360,8,155,
-        1,155,1,155,3,155,2364,8,155,1,155,3,155,2367,8,155,1,156,1,156,
-        1,157,1,157,1,157,1,157,1,157,5,157,2376,8,157,10,157,12,157,2379,
-        9,157,1,158,1,158,3,158,2383,8,158,1,158,1,158,1,159,4,159,2388,
-        8,159,11,159,12,159,2389,1,160,1,160,1,160,1,160,1,160,3,160,2397,
-        8,160,1,160,1,160,1,160,1,160,5,160,2403,8,160,10,160,12,160,2406,
-        9,160,1,160,1,160,1,161,1,161,3,161,2412,8,161,1,161,1,161,1,161,
-        1,161,1,161,3,161,2419,8,161,1,161,1,161,1,161,1,161,1,161,1,162,
-        1,162,3,162,2428,8,162,1,162,1,162,4,162,2432,8,162,11,162,12,162,
-        2433,1,162,1,162,1,162,1,162,3,162,2440,8,162,1,163,1,163,1,163,
-        1,163,1,163,5,163,2447,8,163,10,163,12,163,2450,9,163,1,163,1,163,
-        1,163,3,163,2455,8,163,1,163,1,163,1,163,1,163,1,163,5,163,2462,
-        8,163,10,163,12,163,2465,9,163,1,163,1,163,1,163,1,164,4,164,2471,
-        8,164,11,164,12,164,2472,1,165,1,165,1,166,1,166,3,166,2479,8,166,
-        1,166,1,166,1,167,1,167,3,167,2485,8,167,1,167,1,167,1,168,1,168,
-        3,168,2491,8,168,1,168,1,168,1,169,1,169,1,169,3,169,2498,8,169,
-        1,169,1,169,5,169,2502,8,169,10,169,12,169,2505,9,169,1,169,1,169,
-        1,170,1,170,3,170,2511,8,170,1,171,1,171,1,171,1,171,5,171,2517,
-        8,171,10,171,12,171,2520,9,171,1,171,3,171,2523,8,171,1,172,1,172,
-        1,172,1,172,5,172,2529,8,172,10,172,12,172,2532,9,172,1,172,3,172,
-        2535,8,172,1,173,1,173,3,173,2539,8,173,1,173,1,173,1,173,3,173,
-        2544,8,173,1,173,1,173,1,173,3,173,2549,8,173,1,173,1,173,1,173,
-        3,173,2554,8,173,1,173,1,173,1,173,3,173,2559,8,173,1,173,1,173,
-        1,173,3,173,2564,8,173,1,174,1,174,5,174,2568,8,174,10,174,12,174,
-        2571,9,174,1,175,1,175,1,175,3,175,2576,8,175,1,176,1,176,1,176,
-        1,176,3,176,2582,8,176,1,176,1,176,1,176,1,176,1,176,1,176,5,176,
-        2590,8,176,10,176,12,176,2593,9,176,1,176,1,176,1,177,1,177,1,177,
-        1,177,1,177,1,177,5,177,2603,8,177,10,177,12,177,2606,9,177,1,177,
-        1,177,1,178,1,178,3,178,2612,8,178,1,178,1,178,3,178,2616,8,178,
-        1,178,1,178,3,178,2620,8,178,1,178,1,178,1,178,3,178,2625,8,178,
-        1,178,1,178,1,178,3,178,2630,8,178,1,178,3,178,2633,8,178,1,179,
-        1,179,1,179,1,179,1,179,5,179,2640,8,179,10,179,12,179,2643,9,179,
-        1,179,1,179,1,180,1,180,3,180,2649,8,180,1,180,1,180,3,180,2653,
-        8,180,1,180,1,180,1,180,3,180,2658,8,180,1,180,1,180,1,180,3,180,
-        2663,8,180,1,180,1,180,1,180,3,180,2668,8,180,1,180,3,180,2671,8,
-        180,1,181,1,181,1,181,1,181,5,181,2677,8,181,10,181,12,181,2680,
-        9,181,1,181,3,181,2683,8,181,1,182,1,182,3,182,2687,8,182,1,182,
-        1,182,1,182,3,182,2692,8,182,1,182,1,182,1,182,4,182,2697,8,182,
-        11,182,12,182,2698,3,182,2701,8,182,1,183,1,183,3,183,2705,8,183,
-        1,184,1,184,1,184,1,185,1,185,1,185,1,185,3,185,2714,8,185,1,186,
-        1,186,1,186,1,186,1,186,1,186,3,186,2722,8,186,1,187,1,187,1,187,
-        1,187,1,187,3,187,2729,8,187,1,187,1,187,1,187,1,187,1,187,1,187,
-        1,187,1,187,4,187,2739,8,187,11,187,12,187,2740,1,187,1,187,1,188,
-        1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,
-        1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,
-        3,188,2768,8,188,1,188,1,188,3,188,2772,8,188,1,188,1,188,1,188,
+        1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,
+        1,116,1,116,3,116,2045,8,116,1,116,3,116,2048,8,116,1,116,1,116,
+        1,116,3,116,2053,8,116,1,116,1,116,1,116,1,116,1,116,3,116,2060,
+        8,116,1,116,1,116,3,116,2064,8,116,1,116,1,116,1,116,1,116,1,116,
+        3,116,2071,8,116,3,116,2073,8,116,1,117,1,117,1,118,1,118,3,118,
+        2079,8,118,1,118,1,118,5,118,2083,8,118,10,118,12,118,2086,9,118,
+        1,118,1,118,1,119,1,119,1,119,1,119,1,119,1,119,3,119,2096,8,119,
+        1,120,1,120,1,120,3,120,2101,8,120,1,121,1,121,1,121,1,121,5,121,
+        2107,8,121,10,121,12,121,2110,9,121,1,121,1,121,1,122,1,122,1,122,
+        3,122,2117,8,122,1,123,1,123,1,123,3,123,2122,8,123,1,123,3,123,
+        2125,8,123,1,123,3,123,2128,8,123,1,124,3,124,2131,8,124,1,124,3,
+        124,2134,8,124,1,125,1,125,1,125,1,125,1,125,3,125,2141,8,125,1,
+        126,1,126,1,126,1,126,5,126,2147,8,126,10,126,12,126,2150,9,126,
+        1,127,1,127,1,127,3,127,2155,8,127,1,127,3,127,2158,8,127,1,127,
+        3,127,2161,8,127,1,128,3,128,2164,8,128,1,128,3,128,2167,8,128,1,
+        129,1,129,1,129,1,129,1,129,1,129,1,130,1,130,1,130,1,130,3,130,
+        2179,8,130,1,130,3,130,2182,8,130,1,131,1,131,5,131,2186,8,131,10,
+        131,12,131,2189,9,131,1,132,1,132,1,132,1,133,3,133,2195,8,133,1,
+        133,1,133,1,134,1,134,1,135,1,135,1,135,1,135,1,136,1,136,1,136,
+        1,136,5,136,2209,8,136,10,136,12,136,2212,9,136,1,137,1,137,1,137,
+        1,137,5,137,2218,8,137,10,137,12,137,2221,9,137,1,137,1,137,1,138,
+        1,138,3,138,2227,8,138,1,139,1,139,1,139,5,139,2232,8,139,10,139,
+        12,139,2235,9,139,1,140,1,140,3,140,2239,8,140,1,140,1,140,1,140,
+        1,140,1,140,5,140,2246,8,140,10,140,12,140,2249,9,140,3,140,2251,
+        8,140,1,140,1,140,1,141,1,141,3,141,2257,8,141,1,142,1,142,1,143,
+        1,143,1,143,1,143,1,143,5,143,2266,8,143,10,143,12,143,2269,9,143,
+        1,143,3,143,2272,8,143,1,144,1,144,1,144,1,144,1,144,1,144,3,144,
+        2280,8,144,1,145,1,145,3,145,2284,8,145,1,145,1,145,1,146,1,146,
+        3,146,2290,8,146,1,146,1,146,1,146,5,146,2295,8,146,10,146,12,146,
+        2298,9,146,1,147,1,147,3,147,2302,8,147,1,147,4,147,2305,8,147,11,
+        147,12,147,2306,1,148,1,148,3,148,2311,8,148,1,148,1,148,3,148,2315,
+        8,148,1,148,1,148,3,148,2319,8,148,1,148,1,148,3,148,2323,8,148,
+        3,148,2325,8,148,1,149,1,149,1,149,1,149,3,149,2331,8,149,1,150,
+        1,150,1,150,1,150,1,150,1,150,1,150,5,150,2340,8,150,10,150,12,150,
+        2343,9,150,1,151,1,151,3,151,2347,8,151,1,152,1,152,1,152,1,152,
+        1,152,1,152,1,152,1,152,1,152,1,152,3,152,2359,8,152,1,153,1,153,
+        1,153,1,154,1,154,1,155,3,155,2367,8,155,1,155,1,155,3,155,2371,
+        8,155,1,155,3,155,2374,8,155,1,156,1,156,1,157,1,157,1,157,1,157,
+        1,157,5,157,2383,8,157,10,157,12,157,2386,9,157,1,158,1,158,3,158,
+        2390,8,158,1,158,1,158,1,159,4,159,2395,8,159,11,159,12,159,2396,
+        1,160,1,160,1,160,1,160,1,160,3,160,2404,8,160,1,160,1,160,1,160,
+        1,160,5,160,2410,8,160,10,160,12,160,2413,9,160,1,160,1,160,1,161,
+        1,161,3,161,2419,8,161,1,161,1,161,1,161,1,161,1,161,3,161,2426,
+        8,161,1,161,1,161,1,161,1,161,1,161,1,162,1,162,3,162,2435,8,162,
+        1,162,1,162,4,162,2439,8,162,11,162,12,162,2440,1,162,1,162,1,162,
+        1,162,3,162,2447,8,162,1,163,1,163,1,163,1,163,1,163,5,163,2454,
+        8,163,10,163,12,163,2457,9,163,1,163,1,163,1,163,3,163,2462,8,163,
+        1,163,1,163,1,163,1,163,1,163,5,163,2469,8,163,10,163,12,163,2472,
+        9,163,1,163,1,163,1,163,1,164,4,164,2478,8,164,11,164,12,164,2479,
+        1,165,1,165,1,166,1,166,3,166,2486,8,166,1,166,1,166,1,167,1,167,
+        3,167,2492,8,167,1,167,1,167,1,168,1,168,3,168,2498,8,168,1,168,
+        1,168,1,169,1,169,1,169,3,169,2505,8,169,1,169,1,169,5,169,2509,
+        8,169,10,169,12,169,2512,9,169,1,169,1,169,1,170,1,170,3,170,2518,
+        8,170,1,171,1,171,1,171,1,171,5,171,2524,8,171,10,171,12,171,2527,
+        9,171,1,171,3,171,2530,8,171,1,172,1,172,1,172,1,172,5,172,2536,
+        8,172,10,172,12,172,2539,9,172,1,172,3,172,2542,8,172,1,173,1,173,
+        3,173,2546,8,173,1,173,1,173,1,173,3,173,2551,8,173,1,173,1,173,
+        1,173,3,173,2556,8,173,1,173,1,173,1,173,3,173,2561,8,173,1,173,
+        1,173,1,173,3,173,2566,8,173,1,173,1,173,1,173,3,173,2571,8,173,
+        1,174,1,174,5,174,2575,8,174,10,174,12,174,2578,9,174,1,175,1,175,
+        1,175,3,175,2583,8,175,1,176,1,176,1,176,1,176,3,176,2589,8,176,
+        1,176,1,176,1,176,1,176,1,176,1,176,5,176,2597,8,176,10,176,12,176,
+        2600,9,176,1,176,1,176,1,177,1,177,1,177,1,177,1,177,1,177,5,177,
+        2610,8,177,10,177,12,177,2613,9,177,1,177,1,177,1,178,1,178,3,178,
+        2619,8,178,1,178,1,178,3,178,2623,8,178,1,178,1,178,3,178,2627,8,
+        178,1,178,1,178,1,178,3,178,2632,8,178,1,178,1,178,1,178,3,178,2637,
+        8,178,1,178,3,178,2640,8,178,1,179,1,179,1,179,1,179,1,179,5,179,
+        2647,8,179,10,179,12,179,2650,9,179,1,179,1,179,1,180,1,180,3,180,
+        2656,8,180,1,180,1,180,3,180,2660,8,180,1,180,1,180,1,180,3,180,
+        2665,8,180,1,180,1,180,1,180,3,180,2670,8,180,1,180,1,180,1,180,
+        3,180,2675,8,180,1,180,3,180,2678,8,180,1,181,1,181,1,181,1,181,
+        5,181,2684,8,181,10,181,12,181,2687,9,181,1,181,3,181,2690,8,181,
+        1,182,1,182,3,182,2694,8,182,1,182,1,182,1,182,3,182,2699,8,182,
+        1,182,1,182,1,182,4,182,2704,8,182,11,182,12,182,2705,3,182,2708,
+        8,182,1,183,1,183,3,183,2712,8,183,1,184,1,184,1,184,1,185,1,185,
+        1,185,1,185,3,185,2721,8,185,1,186,1,186,1,186,1,186,1,186,1,186,
+        3,186,2729,8,186,1,187,1,187,1,187,1,187,1,187,3,187,2736,8,187,
+        1,187,1,187,1,187,1,187,1,187,1,187,1,187,1,187,4,187,2746,8,187,
+        11,187,12,187,2747,1,187,1,187,1,188,1,188,1,188,1,188,1,188,1,188,
         1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,
-        1,188,1,188,1,188,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,
+        1,188,1,188,1,188,1,188,1,188,1,188,3,188,2775,8,188,1,188,1,188,
+        3,188,2779,8,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,
+        1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,189,1,189,
         1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,
         1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,
-        1,189,1,190,1,190,5,190,2824,8,190,10,190,12,190,2827,9,190,1,190,
-        3,190,2830,8,190,1,191,1,191,1,191,1,191,1,191,1,191,1,191,1,191,
-        1,191,3,191,2841,8,191,1,192,1,192,1,192,1,192,1,192,1,192,5,192,
-        2849,8,192,10,192,12,192,2852,9,192,3,192,2854,8,192,1,192,1,192,
-        3,192,2858,8,192,1,193,1,193,1,193,1,193,1,193,1,193,5,193,2866,
-        8,193,10,193,12,193,2869,9,193,3,193,2871,8,193,1,193,1,193,3,193,
-        2875,8,193,1,194,1,194,1,194,1,194,1,194,1,194,5,194,2883,8,194,
-        10,194,12,194,2886,9,194,3,194,2888,8,194,1,194,1,194,3,194,2892,
-        8,194,1,195,1,195,1,195,1,195,1,195,1,195,5,195,2900,8,195,10,195,
-        12,195,2903,9,195,3,195,2905,8,195,1,195,1,195,3,195,2909,8,195,
-        1,196,1,196,1,196,1,196,1,196,1,196,5,196,2917,8,196,10,196,12,196,
-        2920,9,196,3,196,2922,8,196,1,196,1,196,3,196,2926,8,196,1,197,1,
-        197,1,197,1,197,1,197,1,197,5,197,2934,8,197,10,197,12,197,2937,
-        9,197,3,197,2939,8,197,1,197,1,197,3,197,2943,8,197,1,198,1,198,
-        1,198,5,198,2948,8,198,10,198,12,198,2951,9,198,1,198,1,198,1,199,
-        1,199,1,199,1,199,5,199,2959,8,199,10,199,12,199,2962,9,199,1,199,
-        1,199,1,200,1,200,1,200,3,200,2969,8,200,1,201,1,201,1,201,1,201,
-        1,202,1,202,3,202,2977,8,202,1,203,1,203,3,203,2981,8,203,1,204,
-        1,204,3,204,2985,8,204,1,204,5,204,2988,8,204,10,204,12,204,2991,
-        9,204,1,205,1,205,1,205,1,205,1,205,1,205,3,205,2999,8,205,1,206,
-        1,206,1,206,1,206,1,206,3,206,3006,8,206,1,206,1,206,1,207,1,207,
-        1,207,1,207,1,207,3,207,3015,8,207,1,207,1,207,1,208,1,208,1,208,
-        1,208,1,208,3,208,3024,8,208,1,208,1,208,1,209,1,209,1,209,1,209,
-        1,209,3,209,3033,8,209,1,209,1,209,1,210,1,210,1,210,1,210,1,210,
-        3,210,3042,8,210,1,210,1,210,1,211,1,211,1,211,1,211,1,211,3,211,
-        3051,8,211,1,211,1,211,1,212,1,212,1,212,5,212,3058,8,212,10,212,
-        12,212,3061,9,212,1,213,1,213,1,213,5,213,3066,8,213,10,213,12,213,
-        3069,9,213,1,214,1,214,1,214,5,214,3074,8,214,10,214,12,214,3077,
-        9,214,1,215,1,215,1,215,5,215,3082,8,215,10,215,12,215,3085,9,215,
-        1,216,1,216,1,216,5,216,3090,8,216,10,216,12,216,3093,9,216,1,216,
-        0,0,217,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,38,40,
-        42,44,46,48,50,52,54,56,58,60,62,64,66,68,70,72,74,76,78,80,82,84,
-        86,88,90,92,94,96,98,100,102,104,106,108,110,112,114,116,118,120,
-        122,124,126,128,130,132,134,136,138,140,142,144,146,148,150,152,
-        154,156,158,160,162,164,166,168,170,172,174,176,178,180,182,184,
-        186,188,190,192,194,196,198,200,202,204,206,208,210,212,214,216,
-        218,220,222,224,226,228,230,232,234,236,238,240,242,244,246,248,
-        250,252,254,256,258,260,262,264,266,268,270,272,274,276,278,280,
-        282,284,286,288,290,292,294,296,298,300,302,304,306,308,310,312,
-        314,316,318,320,322,324,326,328,330,332,334,336,338,340,342,344,
-        346,348,350,352,354,356,358,360,362,364,366,368,370,372,374,376,
-        378,380,382,384,386,388,390,392,394,396,398,400,402,404,406,408,
-        410,412,414,416,418,420,422,424,426,428,430,432,0,50,1,0,9,11,2,
-        0,9,9,12,13,1,0,15,20,1,0,24,33,1,0,34,36,1,0,40,44,2,0,9,9,54,57,
-        1,0,58,59,2,0,9,9,60,63,2,0,9,9,67,69,1,0,99,100,1,0,101,102,2,0,
-        353,353,355,355,1,0,113,114,1,0,115,116,1,0,117,118,5,0,80,80,90,
-        90,94,95,98,98,119,153,1,0,155,156,2,0,157,158,350,350,1,0,162,165,
-        1,0,173,176,1,0,177,178,2,0,9,9,186,188,3,0,9,9,186,186,189,190,
-        3,0,9,9,186,186,191,192,1,0,197,200,1,0,207,208,2,0,195,195,209,
-        209,2,0,81,81,218,220,2,0,102,102,222,222,1,0,223,224,2,0,222,222,
-        227,227,1,0,232,233,1,0,235,239,3,0,246,246,350,350,354,355,1,0,
-        247,249,2,0,250,250,352,352,2,0,167,167,251,252,1,0,4,4,1,0,247,
-        248,2,0,256,256,354,354,1,0,260,261,1,0,264,265,22,0,9,9,24,33,72,
-        72,80,80,90,90,94,95,98,98,100,100,102,102,119,153,167,167,173,193,
-        196,196,201,201,228,229,235,236,238,239,241,251,254,259,262,292,
-        350,352,354,354,1,0,300,302,1,0,288,289,2,0,290,290,300,301,17,0,
-        2,4,45,45,64,65,70,70,74,74,76,76,97,97,99,106,112,112,201,204,221,
-        221,223,223,232,232,240,240,253,253,289,289,303,303,2,0,3,4,106,
-        106,2,0,14,14,348,349,3530,0,438,1,0,0,0,2,443,1,0,0,0,4,462,1,0,
-        0,0,6,464,1,0,0,0,8,495,1,0,0,0,10,497,1,0,0,0,12,499,1,0,0,0,14,
-        501,1,0,0,0,16,520,1,0,0,0,18,523,1,0,0,0,20,530,1,0,0,0,22,537,
-        1,0,0,0,24,539,1,0,0,0,26,550,1,0,0,0,28,552,1,0,0,0,30,569,1,0,
-        0,0,32,571,1,0,0,0,34,573,1,0,0,0,36,590,1,0,0,0,38,639,1,0,0,0,
-        40,641,1,0,0,0,42,643,1,0,0,0,44,645,1,0,0,0,46,647,1,0,0,0,48,652,
-        1,0,0,0,50,661,1,0,0,0,52,663,1,0,0,0,54,699,1,0,0,0,56,705,1,0,
-        0,0,58,707,1,0,0,0,60,713,1,0,0,0,62,719,1,0,0,0,64,728,1,0,0,0,
-        66,731,1,0,0,0,68,759,1,0,0,0,70,821,1,0,0,0,72,824,1,0,0,0,74,852,
-        1,0,0,0,76,919,1,0,0,0,78,922,1,0,0,0,80,950,1,0,0,0,82,1001,1,0,
-        0,0,84,1004,1,0,0,0,86,1032,1,0,0,0,88,1088,1,0,0,0,90,1090,1,0,
-        0,0,92,1095,1,0,0,0,94,1116,1,0,0,0,96,1119,1,0,0,0,98,1123,1,0,
-        0,0,100,1141,1,0,0,0,102,1170,1,0,0,0,104,1181,1,0,0,0,106,1183,
-        1,0,0,0,108,1221,1,0,0,0,110,1223,1,0,0,0,112,1231,1,0,0,0,114,1245,
-        1,0,0,0,116,1247,1,0,0,0,118,1266,1,0,0,0,120,1305,1,0,0,0,122,1312,
-        1,0,0,0,124,1343,1,0,0,0,126,1398,1,0,0,0,128,1400,1,0,0,0,130,1414,
-        1,0,0,0,132,1416,1,0,0,0,134,1418,1,0,0,0,136,1428,1,0,0,0,138,1432,
-        1,0,0,0,140,1467,1,0,0,0,142,1470,1,0,0,0,144,1490,1,0,0,0,146,1521,
-        1,0,0,0,148,1523,1,0,0,0,150,1528,1,0,0,0,152,1534,1,0,0,0,154,1536,
-        1,0,0,0,156,1549,1,0,0,0,158,1551,1,0,0,0,160,1584,1,0,0,0,162,1587,
-        1,0,0,0,164,1594,1,0,0,0,166,1596,1,0,0,0,168,1607,1,0,0,0,170,1619,
-        1,0,0,0,172,1640,1,0,0,0,174,1642,1,0,0,0,176,1722,1,0,0,0,178,1724,
-        1,0,0,0,180,1726,1,0,0,0,182,1728,1,0,0,0,184,1730,1,0,0,0,186,1740,
-        1,0,0,0,188,1755,1,0,0,0,190,1757,1,0,0,0,192,1786,1,0,0,0,194,1788,
-        1,0,0,0,196,1790,1,0,0,0,198,1802,1,0,0,0,200,1817,1,0,0,0,202,1819,
-        1,0,0,0,204,1831,1,0,0,0,206,1845,1,0,0,0,208,1847,1,0,0,0,210,1859,
-        1,0,0,0,212,1871,1,0,0,0,214,1873,1,0,0,0,216,1885,1,0,0,0,218,1898,
-        1,0,0,0,220,1901,1,0,0,0,222,1946,1,0,0,0,224,1957,1,0,0,0,226,1982,
-        1,0,0,0,228,1984,1,0,0,0,230,2006,1,0,0,0,232,2065,1,0,0,0,234,2067,
-        1,0,0,0,236,2069,1,0,0,0,238,2088,1,0,0,0,240,2090,1,0,0,0,242,2095,
-        1,0,0,0,244,2109,1,0,0,0,246,2111,1,0,0,0,248,2123,1,0,0,0,250,2128,
-        1,0,0,0,252,2135,1,0,0,0,254,2144,1,0,0,0,256,2156,1,0,0,0,258,2161,
-        1,0,0,0,260,2167,1,0,0,0,262,2176,1,0,0,0,264,2183,1,0,0,0,266,2187,
-        1,0,0,0,268,2191,1,0,0,0,270,2193,1,0,0,0,272,2197,1,0,0,0,274,2206,
-        1,0,0,0,276,2217,1,0,0,0,278,2221,1,0,0,0,280,2229,1,0,0,0,282,2247,
-        1,0,0,0,284,2251,1,0,0,0,286,2253,1,0,0,0,288,2272,1,0,0,0,290,2274,
-        1,0,0,0,292,2280,1,0,0,0,294,2292,1,0,0,0,296,2317,1,0,0,0,298,2323,
-        1,0,0,0,300,2325,1,0,0,0,302,2339,1,0,0,0,304,2351,1,0,0,0,306,2353,
-        1,0,0,0,308,2356,1,0,0,0,310,2359,1,0,0,0,312,2368,1,0,0,0,314,2370,
-        1,0,0,0,316,2380,1,0,0,0,318,2387,1,0,0,0,320,2391,1,0,0,0,322,2409,
-        1,0,0,0,324,2425,1,0,0,0,326,2441,1,0,0,0,328,2470,1,0,0,0,330,2474,
-        1,0,0,0,332,2476,1,0,0,0,334,2482,1,0,0,0,336,2488,1,0,0,0,338,2494,
-        1,0,0,0,340,2510,1,0,0,0,342,2512,1,0,0,0,344,2524,1,0,0,0,346,2563,
-        1,0,0,0,348,2565,1,0,0,0,350,2572,1,0,0,0,352,2577,1,0,0,0,354,2596,
-        1,0,0,0,356,2632,1,0,0,0,358,2634,1,0,0,0,360,2670,1,0,0,0,362,2672,
-        1,0,0,0,364,2700,1,0,0,0,366,2704,1,0,0,0,368,2706,1,0,0,0,370,2709,
-        1,0,0,0,372,2721,1,0,0,0,374,2723,1,0,0,0,376,2744,1,0,0,0,378,2790,
-        1,0,0,0,380,2821,1,0,0,0,382,2840,1,0,0,0,384,2842,1,0,0,0,386,2859,
-        1,0,0,0,388,2876,1,0,0,0,390,2893,1,0,0,0,392,2910,1,0,0,0,394,2927,
-        1,0,0,0,396,2944,1,0,0,0,398,2954,1,0,0,0,400,2968,1,0,0,0,402,2970,
-        1,0,0,0,404,2974,1,0,0,0,406,2978,1,0,0,0,408,2982,1,0,0,0,410,2998,
-        1,0,0,0,412,3000,1,0,0,0,414,3009,1,0,0,0,416,3018,1,0,0,0,418,3027,
-        1,0,0,0,420,3036,1,0,0,0,422,3045,1,0,0,0,424,3054,1,0,0,0,426,3062,
-        1,0,0,0,428,3070,1,0,0,0,430,3078,1,0,0,0,432,3086,1,0,0,0,434,437,
-        3,2,1,0,435,437,3,4,2,0,436,434,1,0,0,0,436,435,1,0,0,0,437,440,
-        1,0,0,0,438,436,1,0,0,0,438,439,1,0,0,0,439,441,1,0,0,0,440,438,
-        1,0,0,0,441,442,5,0,0,1,442,1,1,0,0,0,443,444,5,1,0,0,444,445,5,
-        355,0,0,445,3,1,0,0,0,446,463,3,398,199,0,447,463,3,384,192,0,448,
-        463,3,386,193,0,449,463,3,388,194,0,450,463,3,390,195,0,451,463,
-        3,392,196,0,452,463,3,394,197,0,453,463,3,396,198,0,454,463,3,54,
-        27,0,455,463,3,6,3,0,456,463,3,34,17,0,457,463,3,46,23,0,458,463,
-        3,286,143,0,459,463,3,338,169,0,460,463,3,352,176,0,461,463,3,320,
-        160,0,462,446,1,0,0,0,462,447,1,0,0,0,462,448,1,0,0,0,462,449,1,
-        0,0,0,462,450,1,0,0,0,462,451,1,0,0,0,462,452,1,0,0,0,462,453,1,
-        0,0,0,462,454,1,0,0,0,462,455,1,0,0,0,462,456,1,0,0,0,462,457,1,
-        0,0,0,462,458,1,0,0,0,462,459,1,0,0,0,462,460,1,0,0,0,462,461,1,
-        0,0,0,463,5,1,0,0,0,464,466,5,2,0,0,465,467,3,330,165,0,466,465,
-        1,0,0,0,466,467,1,0,0,0,467,468,1,0,0,0,468,472,5,3,0,0,469,471,
-        3,8,4,0,470,469,1,0,0,0,471,474,1,0,0,0,472,470,1,0,0,0,472,473,
-        1,0,0,0,473,478,1,0,0,0,474,472,1,0,0,0,475,477,3,14,7,0,476,475,
-        1,0,0,0,477,480,1,0,0,0,478,476,1,0,0,0,478,479,1,0,0,0,479,481,
-        1,0,0,0,480,478,1,0,0,0,481,482,5,4,0,0,482,7,1,0,0,0,483,485,5,
-        5,0,0,484,486,5,6,0,0,485,484,1,0,0,0,485,486,1,0,0,0,486,487,1,
-        0,0,0,487,496,3,10,5,0,488,490,5,7,0,0,489,491,5,6,0,0,490,489,1,
-        0,0,0,490,491,1,0,0,0,491,492,1,0,0,0,492,496,3,12,6,0,493,494,5,
-        8,0,0,494,496,3,426,213,0,495,483,1,0,0,0,495,488,1,0,0,0,495,493,
-        1,0,0,0,496,9,1,0,0,0,497,498,7,0,0,0,498,11,1,0,0,0,499,500,7,1,
-        0,0,500,13,1,0,0,0,501,502,3,18,9,0,502,503,3,16,8,0,503,506,3,20,
-        10,0,504,505,5,14,0,0,505,507,5,354,0,0,506,504,1,0,0,0,506,507,
-        1,0,0,0,507,516,1,0,0,0,508,512,5,3,0,0,509,511,3,30,15,0,510,509,
-        1,0,0,0,511,514,1,0,0,0,512,510,1,0,0,0,512,513,1,0,0,0,513,515,
-        1,0,0,0,514,512,1,0,0,0,515,517,5,4,0,0,516,508,1,0,0,0,516,517,
-        1,0,0,0,517,15,1,0,0,0,518,521,3,28,14,0,519,521,3,22,11,0,520,518,
-        1,0,0,0,520,519,1,0,0,0,521,17,1,0,0,0,522,524,3,24,12,0,523,522,
-        1,0,0,0,523,524,1,0,0,0,524,525,1,0,0,0,525,527,3,330,165,0,526,
-        528,3,24,12,0,527,526,1,0,0,0,527,528,1,0,0,0,528,19,1,0,0,0,529,
-        531,3,24,12,0,530,529,1,0,0,0,530,531,1,0,0,0,531,532,1,0,0,0,532,
-        535,3,330,165,0,533,534,4,10,0,0,534,536,3,24,12,0,535,533,1,0,0,
-        0,535,536,1,0,0,0,536,21,1,0,0,0,537,538,7,2,0,0,538,23,1,0,0,0,
-        539,540,5,21,0,0,540,545,3,26,13,0,541,542,5,22,0,0,542,544,3,26,
-        13,0,543,541,1,0,0,0,544,547,1,0,0,0,545,543,1,0,0,0,545,546,1,0,
-        0,0,546,548,1,0,0,0,547,545,1,0,0,0,548,549,5,23,0,0,549,25,1,0,
-        0,0,550,551,7,3,0,0,551,27,1,0,0,0,552,553,7,4,0,0,553,29,1,0,0,
-        0,554,556,5,37,0,0,555,557,5,6,0,0,556,555,1,0,0,0,556,557,1,0,0,
-        0,557,558,1,0,0,0,558,570,5,355,0,0,559,561,5,38,0,0,560,562,5,6,
-        0,0,561,560,1,0,0,0,561,562,1,0,0,0,562,563,1,0,0,0,563,570,3,32,
-        16,0,564,566,5,39,0,0,565,567,5,6,0,0,566,565,1,0,0,0,566,567,1,
-        0,0,0,567,568,1,0,0,0,568,570,3,426,213,0,569,554,1,0,0,0,569,559,
-        1,0,0,0,569,564,1,0,0,0,570,31,1,0,0,0,571,572,7,5,0,0,572,33,1,
-        0,0,0,573,574,5,45,0,0,574,578,3,330,165,0,575,577,3,36,18,0,576,
-        575,1,0,0,0,577,580,1,0,0,0,578,576,1,0,0,0,578,579,1,0,0,0,579,
-        582,1,0,0,0,580,578,1,0,0,0,581,583,3,166,83,0,582,581,1,0,0,0,582,
-        583,1,0,0,0,583,35,1,0,0,0,584,585,5,46,0,0,585,591,3,426,213,0,
-        586,587,5,47,0,0,587,591,3,426,213,0,588,589,5,48,0,0,589,591,3,
-        330,165,0,590,584,1,0,0,0,590,586,1,0,0,0,590,588,1,0,0,0,591,37,
-        1,0,0,0,592,594,5,5,0,0,593,595,5,6,0,0,594,593,1,0,0,0,594,595,
-        1,0,0,0,595,596,1,0,0,0,596,640,3,40,20,0,597,599,5,49,0,0,598,600,
-        5,6,0,0,599,598,1,0,0,0,599,600,1,0,0,0,600,601,1,0,0,0,601,640,
-        5,355,0,0,602,604,5,37,0,0,603,605,5,6,0,0,604,603,1,0,0,0,604,605,
-        1,0,0,0,605,606,1,0,0,0,606,640,5,355,0,0,607,609,5,50,0,0,608,610,
-        5,6,0,0,609,608,1,0,0,0,609,610,1,0,0,0,610,611,1,0,0,0,611,616,
-        5,355,0,0,612,613,5,22,0,0,613,615,5,355,0,0,614,612,1,0,0,0,615,
-        618,1,0,0,0,616,614,1,0,0,0,616,617,1,0,0,0,617,640,1,0,0,0,618,
-        616,1,0,0,0,619,621,5,51,0,0,620,622,5,6,0,0,621,620,1,0,0,0,621,
-        622,1,0,0,0,622,623,1,0,0,0,623,640,3,42,21,0,624,626,5,52,0,0,625,
-        627,5,6,0,0,626,625,1,0,0,0,626,627,1,0,0,0,627,628,1,0,0,0,628,
-        640,5,355,0,0,629,631,5,53,0,0,630,632,5,6,0,0,631,630,1,0,0,0,631,
-        632,1,0,0,0,632,633,1,0,0,0,633,640,3,44,22,0,634,636,5,47,0,0,635,
-        637,5,6,0,0,636,635,1,0,0,0,636,637,1,0,0,0,637,638,1,0,0,0,638,
-        640,3,426,213,0,639,592,1,0,0,0,639,597,1,0,0,0,639,602,1,0,0,0,
-        639,607,1,0,0,0,639,619,1,0,0,0,639,624,1,0,0,0,639,629,1,0,0,0,
-        639,634,1,0,0,0,640,39,1,0,0,0,641,642,7,6,0,0,642,41,1,0,0,0,643,
-        644,7,7,0,0,644,43,1,0,0,0,645,646,7,8,0,0,646,45,1,0,0,0,647,648,
-        5,64,0,0,648,650,3,330,165,0,649,651,3,166,83,0,650,649,1,0,0,0,
-        650,651,1,0,0,0,651,47,1,0,0,0,652,653,5,65,0,0,653,656,3,330,165,
-        0,654,655,5,66,0,0,655,657,3,426,213,0,656,654,1,0,0,0,656,657,1,
-        0,0,0,657,659,1,0,0,0,658,660,3,166,83,0,659,658,1,0,0,0,659,660,
-        1,0,0,0,660,49,1,0,0,0,661,662,7,9,0,0,662,51,1,0,0,0,663,664,5,
-        70,0,0,664,666,3,330,165,0,665,667,3,166,83,0,666,665,1,0,0,0,666,
-        667,1,0,0,0,667,53,1,0,0,0,668,670,5,355,0,0,669,668,1,0,0,0,669,
-        670,1,0,0,0,670,671,1,0,0,0,671,672,5,71,0,0,672,673,3,330,165,0,
-        673,674,5,3,0,0,674,675,5,72,0,0,675,676,5,6,0,0,676,680,3,430,215,
-        0,677,679,3,56,28,0,678,677,1,0,0,0,679,682,1,0,0,0,680,678,1,0,
-        0,0,680,681,1,0,0,0,681,683,1,0,0,0,682,680,1,0,0,0,683,684,5,4,
-        0,0,684,700,1,0,0,0,685,687,5,355,0,0,686,685,1,0,0,0,686,687,1,
-        0,0,0,687,688,1,0,0,0,688,689,5,73,0,0,689,690,3,330,165,0,690,694,
-        5,3,0,0,691,693,3,56,28,0,692,691,1,0,0,0,693,696,1,0,0,0,694,692,
-        1,0,0,0,694,695,1,0,0,0,695,697,1,0,0,0,696,694,1,0,0,0,697,698,
-        5,4,0,0,698,700,1,0,0,0,699,669,1,0,0,0,699,686,1,0,0,0,700,55,1,
-        0,0,0,701,706,3,196,98,0,702,706,3,202,101,0,703,706,3,208,104,0,
-        704,706,3,60,30,0,705,701,1,0,0,0,705,702,1,0,0,0,705,703,1,0,0,
-        0,705,704,1,0,0,0,706,57,1,0,0,0,707,708,5,74,0,0,708,710,3,330,
-        165,0,709,711,3,166,83,0,710,709,1,0,0,0,710,711,1,0,0,0,711,59,
-        1,0,0,0,712,714,5,355,0,0,713,712,1,0,0,0,713,714,1,0,0,0,714,715,
-        1,0,0,0,715,716,3,62,31,0,716,61,1,0,0,0,717,720,3,64,32,0,718,720,
-        3,106,53,0,719,717,1,0,0,0,719,718,1,0,0,0,720,63,1,0,0,0,721,729,
-        3,66,33,0,722,729,3,72,36,0,723,729,3,78,39,0,724,729,3,84,42,0,
-        725,729,3,98,49,0,726,729,3,90,45,0,727,729,3,116,58,0,728,721,1,
-        0,0,0,728,722,1,0,0,0,728,723,1,0,0,0,728,724,1,0,0,0,728,725,1,
-        0,0,0,728,726,1,0,0,0,728,727,1,0,0,0,729,65,1,0,0,0,730,732,5,75,
-        0,0,731,730,1,0,0,0,731,732,1,0,0,0,732,733,1,0,0,0,733,734,5,76,
-        0,0,734,740,3,330,165,0,735,737,5,77,0,0,736,738,5,78,0,0,737,736,
-        1,0,0,0,737,738,1,0,0,0,738,739,1,0,0,0,739,741,3,330,165,0,740,
-        735,1,0,0,0,740,741,1,0,0,0,741,753,1,0,0,0,742,743,5,351,0,0,743,
-        748,3,96,48,0,744,745,5,22,0,0,745,747,3,96,48,0,746,744,1,0,0,0,
-        747,750,1,0,0,0,748,746,1,0,0,0,748,749,1,0,0,0,749,752,1,0,0,0,
-        750,748,1,0,0,0,751,742,1,0,0,0,752,755,1,0,0,0,753,751,1,0,0,0,
-        753,754,1,0,0,0,754,757,1,0,0,0,755,753,1,0,0,0,756,758,3,68,34,
-        0,757,756,1,0,0,0,757,758,1,0,0,0,758,67,1,0,0,0,759,764,5,3,0,0,
-        760,763,3,70,35,0,761,763,3,122,61,0,762,760,1,0,0,0,762,761,1,0,
-        0,0,763,766,1,0,0,0,764,762,1,0,0,0,764,765,1,0,0,0,765,767,1,0,
-        0,0,766,764,1,0,0,0,767,768,5,4,0,0,768,69,1,0,0,0,769,771,5,79,
-        0,0,770,772,5,78,0,0,771,770,1,0,0,0,771,772,1,0,0,0,772,773,1,0,
-        0,0,773,822,3,430,215,0,774,775,5,80,0,0,775,776,5,6,0,0,776,822,
-        5,355,0,0,777,778,5,81,0,0,778,779,5,6,0,0,779,822,3,430,215,0,780,
-        781,5,82,0,0,781,782,5,6,0,0,782,822,5,355,0,0,783,784,5,83,0,0,
-        784,785,5,6,0,0,785,822,5,355,0,0,786,787,5,84,0,0,787,788,5,6,0,
-        0,788,822,5,355,0,0,789,790,5,85,0,0,790,791,5,6,0,0,791,822,5,355,
-        0,0,792,793,5,86,0,0,793,794,5,6,0,0,794,822,5,355,0,0,795,796,5,
-        87,0,0,796,797,5,6,0,0,797,822,5,355,0,0,798,800,3,132,66,0,799,
-        798,1,0,0,0,799,800,1,0,0,0,800,801,1,0,0,0,801,822,5,88,0,0,802,
-        804,3,132,66,0,803,802,1,0,0,0,803,804,1,0,0,0,804,805,1,0,0,0,805,
-        822,5,89,0,0,806,808,3,132,66,0,807,806,1,0,0,0,807,808,1,0,0,0,
-        808,809,1,0,0,0,809,822,5,90,0,0,810,822,5,91,0,0,811,822,5,92,0,
-        0,812,822,5,93,0,0,813,814,5,94,0,0,814,815,5,6,0,0,815,822,5,355,
-        0,0,816,818,3,132,66,0,817,816,1,0,0,0,817,818,1,0,0,0,818,819,1,
-        0,0,0,819,822,5,95,0,0,820,822,5,96,0,0,821,769,1,0,0,0,821,774,
-        1,0,0,0,821,777,1,0,0,0,821,780,1,0,0,0,821,783,1,0,0,0,821,786,
-        1,0,0,0,821,789,1,0,0,0,821,792,1,0,0,0,821,795,1,0,0,0,821,799,
-        1,0,0,0,821,803,1,0,0,0,821,807,1,0,0,0,821,810,1,0,0,0,821,811,
-        1,0,0,0,821,812,1,0,0,0,821,813,1,0,0,0,821,817,1,0,0,0,821,820,
-        1,0,0,0,822,71,1,0,0,0,823,825,5,75,0,0,824,823,1,0,0,0,824,825,
-        1,0,0,0,825,826,1,0,0,0,826,827,5,97,0,0,827,833,3,330,165,0,828,
-        830,5,77,0,0,829,831,5,78,0,0,830,829,1,0,0,0,830,831,1,0,0,0,831,
-        832,1,0,0,0,832,834,3,330,165,0,833,828,1,0,0,0,833,834,1,0,0,0,
-        834,846,1,0,0,0,835,836,5,351,0,0,836,841,3,96,48,0,837,838,5,22,
-        0,0,838,840,3,96,48,0,839,837,1,0,0,0,840,843,1,0,0,0,841,839,1,
-        0,0,0,841,842,1,0,0,0,842,845,1,0,0,0,843,841,1,0,0,0,844,835,1,
-        0,0,0,845,848,1,0,0,0,846,844,1,0,0,0,846,847,1,0,0,0,847,850,1,
-        0,0,0,848,846,1,0,0,0,849,851,3,74,37,0,850,849,1,0,0,0,850,851,
-        1,0,0,0,851,73,1,0,0,0,852,856,5,3,0,0,853,855,3,76,38,0,854,853,
-        1,0,0,0,855,858,1,0,0,0,856,854,1,0,0,0,856,857,1,0,0,0,857,862,
-        1,0,0,0,858,856,1,0,0,0,859,861,3,122,61,0,860,859,1,0,0,0,861,864,
-        1,0,0,0,862,860,1,0,0,0,862,863,1,0,0,0,863,865,1,0,0,0,864,862,
-        1,0,0,0,865,866,5,4,0,0,866,75,1,0,0,0,867,869,5,79,0,0,868,870,
-        5,78,0,0,869,868,1,0,0,0,869,870,1,0,0,0,870,871,1,0,0,0,871,920,
-        3,430,215,0,872,873,5,81,0,0,873,874,5,6,0,0,874,920,3,430,215,0,
-        875,876,5,80,0,0,876,877,5,6,0,0,877,920,5,355,0,0,878,920,5,91,
-        0,0,879,920,5,92,0,0,880,920,5,93,0,0,881,882,5,94,0,0,882,883,5,
-        6,0,0,883,920,5,355,0,0,884,886,3,132,66,0,885,884,1,0,0,0,885,886,
-        1,0,0,0,886,887,1,0,0,0,887,920,5,95,0,0,888,890,3,132,66,0,889,
-        888,1,0,0,0,889,890,1,0,0,0,890,891,1,0,0,0,891,920,5,98,0,0,892,
-        894,3,132,66,0,893,892,1,0,0,0,893,894,1,0,0,0,894,895,1,0,0,0,895,
-        920,5,90,0,0,896,898,3,132,66,0,897,896,1,0,0,0,897,898,1,0,0,0,
-        898,899,1,0,0,0,899,920,5,89,0,0,900,920,5,96,0,0,901,902,5,87,0,
-        0,902,903,5,6,0,0,903,920,5,355,0,0,904,905,5,82,0,0,905,906,5,6,
-        0,0,906,920,5,355,0,0,907,908,5,83,0,0,908,909,5,6,0,0,909,920,5,
-        355,0,0,910,911,5,84,0,0,911,912,5,6,0,0,912,920,5,355,0,0,913,914,
-        5,85,0,0,914,915,5,6,0,0,915,920,5,355,0,0,916,917,5,86,0,0,917,
-        918,5,6,0,0,918,920,5,355,0,0,919,867,1,0,0,0,919,872,1,0,0,0,919,
-        875,1,0,0,0,919,878,1,0,0,0,919,879,1,0,0,0,919,880,1,0,0,0,919,
-        881,1,0,0,0,919,885,1,0,0,0,919,889,1,0,0,0,919,893,1,0,0,0,919,
-        897,1,0,0,0,919,900,1,0,0,0,919,901,1,0,0,0,919,904,1,0,0,0,919,
-        907,1,0,0,0,919,910,1,0,0,0,919,913,1,0,0,0,919,916,1,0,0,0,920,
-        77,1,0,0,0,921,923,5,75,0,0,922,921,1,0,0,0,922,923,1,0,0,0,923,
-        924,1,0,0,0,924,925,7,10,0,0,925,931,3,330,165,0,926,928,5,77,0,
-        0,927,929,5,78,0,0,928,927,1,0,0,0,928,929,1,0,0,0,929,930,1,0,0,
-        0,930,932,3,330,165,0,931,926,1,0,0,0,931,932,1,0,0,0,932,944,1,
-        0,0,0,933,934,5,351,0,0,934,939,3,96,48,0,935,936,5,22,0,0,936,938,
-        3,96,48,0,937,935,1,0,0,0,938,941,1,0,0,0,939,937,1,0,0,0,939,940,
-        1,0,0,0,940,943,1,0,0,0,941,939,1,0,0,0,942,933,1,0,0,0,943,946,
-        1,0,0,0,944,942,1,0,0,0,944,945,1,0,0,0,945,948,1,0,0,0,946,944,
-        1,0,0,0,947,949,3,80,40,0,948,947,1,0,0,0,948,949,1,0,0,0,949,79,
-        1,0,0,0,950,955,5,3,0,0,951,954,3,82,41,0,952,954,3,122,61,0,953,
-        951,1,0,0,0,953,952,1,0,0,0,954,957,1,0,0,0,955,953,1,0,0,0,955,
-        956,1,0,0,0,956,958,1,0,0,0,957,955,1,0,0,0,958,959,5,4,0,0,959,
-        81,1,0,0,0,960,962,5,79,0,0,961,963,5,78,0,0,962,961,1,0,0,0,962,
-        963,1,0,0,0,963,964,1,0,0,0,964,1002,3,430,215,0,965,966,5,81,0,
-        0,966,967,5,6,0,0,967,1002,3,430,215,0,968,969,5,80,0,0,969,970,
-        5,6,0,0,970,1002,5,355,0,0,971,1002,5,91,0,0,972,1002,5,92,0,0,973,
-        1002,5,93,0,0,974,975,5,94,0,0,975,976,5,6,0,0,976,1002,5,355,0,
-        0,977,979,3,132,66,0,978,977,1,0,0,0,978,979,1,0,0,0,979,980,1,0,
-        0,0,980,1002,5,90,0,0,981,982,5,87,0,0,982,983,5,6,0,0,983,1002,
-        5,355,0,0,984,985,5,82,0,0,985,986,5,6,0,0,986,1002,5,355,0,0,987,
-        988,5,83,0,0,988,989,5,6,0,0,989,1002,5,355,0,0,990,991,5,84,0,0,
-        991,992,5,6,0,0,992,1002,5,355,0,0,993,994,5,85,0,0,994,995,5,6,
-        0,0,995,1002,5,355,0,0,996,997,5,86,0,0,997,998,5,6,0,0,998,1002,
-        5,355,0,0,999,1002,5,96,0,0,1000,1002,5,98,0,0,1001,960,1,0,0,0,
-        1001,965,1,0,0,0,1001,968,1,0,0,0,1001,971,1,0,0,0,1001,972,1,0,
-        0,0,1001,973,1,0,0,0,1001,974,1,0,0,0,1001,978,1,0,0,0,1001,981,
-        1,0,0,0,1001,984,1,0,0,0,1001,987,1,0,0,0,1001,990,1,0,0,0,1001,
-        993,1,0,0,0,1001,996,1,0,0,0,1001,999,1,0,0,0,1001,1000,1,0,0,0,
-        1002,83,1,0,0,0,1003,1005,5,75,0,0,1004,1003,1,0,0,0,1004,1005,1,
-        0,0,0,1005,1006,1,0,0,0,1006,1007,7,11,0,0,1007,1013,3,330,165,0,
-        1008,1010,5,77,0,0,1009,1011,5,78,0,0,1010,1009,1,0,0,0,1010,1011,
-        1,0,0,0,1011,1012,1,0,0,0,1012,1014,3,330,165,0,1013,1008,1,0,0,
-        0,1013,1014,1,0,0,0,1014,1026,1,0,0,0,1015,1016,5,351,0,0,1016,1021,
-        3,96,48,0,1017,1018,5,22,0,0,1018,1020,3,96,48,0,1019,1017,1,0,0,
-        0,1020,1023,1,0,0,0,1021,1019,1,0,0,0,1021,1022,1,0,0,0,1022,1025,
-        1,0,0,0,1023,1021,1,0,0,0,1024,1015,1,0,0,0,1025,1028,1,0,0,0,1026,
-        1024,1,0,0,0,1026,1027,1,0,0,0,1027,1030,1,0,0,0,1028,1026,1,0,0,
-        0,1029,1031,3,86,43,0,1030,1029,1,0,0,0,1030,1031,1,0,0,0,1031,85,
-        1,0,0,0,1032,1036,5,3,0,0,1033,1035,3,88,44,0,1034,1033,1,0,0,0,
-        1035,1038,1,0,0,0,1036,1034,1,0,0,0,1036,1037,1,0,0,0,1037,1042,
-        1,0,0,0,1038,1036,1,0,0,0,1039,1041,3,122,61,0,1040,1039,1,0,0,0,
-        1041,1044,1,0,0,0,1042,1040,1,0,0,0,1042,1043,1,0,0,0,1043,1045,
-        1,0,0,0,1044,1042,1,0,0,0,1045,1046,5,4,0,0,1046,87,1,0,0,0,1047,
-        1049,5,79,0,0,1048,1050,5,78,0,0,1049,1048,1,0,0,0,1049,1050,1,0,
-        0,0,1050,1051,1,0,0,0,1051,1089,3,430,215,0,1052,1053,5,81,0,0,1053,
-        1054,5,6,0,0,1054,1089,3,430,215,0,1055,1056,5,80,0,0,1056,1057,
-        5,6,0,0,1057,1089,5,355,0,0,1058,1089,5,91,0,0,1059,1089,5,92,0,
-        0,1060,1089,5,93,0,0,1061,1062,5,94,0,0,1062,1063,5,6,0,0,1063,1089,
-        5,355,0,0,1064,1066,3,132,66,0,1065,1064,1,0,0,0,1065,1066,1,0,0,
-        0,1066,1067,1,0,0,0,1067,1089,5,90,0,0,1068,1089,5,98,0,0,1069,1089,
-        5,96,0,0,1070,1071,5,87,0,0,1071,1072,5,6,0,0,1072,1089,5,355,0,
-        0,1073,1074,5,82,0,0,1074,1075,5,6,0,0,1075,1089,5,355,0,0,1076,
-        1077,5,83,0,0,1077,1078,5,6,0,0,1078,1089,5,355,0,0,1079,1080,5,
-        84,0,0,1080,1081,5,6,0,0,1081,1089,5,355,0,0,1082,1083,5,85,0,0,
-        1083,1084,5,6,0,0,1084,1089,5,355,0,0,1085,1086,5,86,0,0,1086,1087,
-        5,6,0,0,1087,1089,5,355,0,0,1088,1047,1,0,0,0,1088,1052,1,0,0,0,
-        1088,1055,1,0,0,0,1088,1058,1,0,0,0,1088,1059,1,0,0,0,1088,1060,
-        1,0,0,0,1088,1061,1,0,0,0,1088,1065,1,0,0,0,1088,1068,1,0,0,0,1088,
-        1069,1,0,0,0,1088,1070,1,0,0,0,1088,1073,1,0,0,0,1088,1076,1,0,0,
-        0,1088,1079,1,0,0,0,1088,1082,1,0,0,0,1088,1085,1,0,0,0,1089,89,
-        1,0,0,0,1090,1091,5,103,0,0,1091,1093,3,330,165,0,1092,1094,3,92,
-        46,0,1093,1092,1,0,0,0,1093,1094,1,0,0,0,1094,91,1,0,0,0,1095,1099,
-        5,3,0,0,1096,1098,3,94,47,0,1097,1096,1,0,0,0,1098,1101,1,0,0,0,
-        1099,1097,1,0,0,0,1099,1100,1,0,0,0,1100,1105,1,0,0,0,1101,1099,
-        1,0,0,0,1102,1104,3,122,61,0,1103,1102,1,0,0,0,1104,1107,1,0,0,0,
-        1105,1103,1,0,0,0,1105,1106,1,0,0,0,1106,1108,1,0,0,0,1107,1105,
-        1,0,0,0,1108,1109,5,4,0,0,1109,93,1,0,0,0,1110,1111,5,81,0,0,1111,
-        1112,5,6,0,0,1112,1117,3,430,215,0,1113,1114,5,94,0,0,1114,1115,
-        5,6,0,0,1115,1117,5,355,0,0,1116,1110,1,0,0,0,1116,1113,1,0,0,0,
-        1117,95,1,0,0,0,1118,1120,5,78,0,0,1119,1118,1,0,0,0,1119,1120,1,
-        0,0,0,1120,1121,1,0,0,0,1121,1122,3,330,165,0,1122,97,1,0,0,0,1123,
-        1124,5,104,0,0,1124,1130,3,330,165,0,1125,1127,5,77,0,0,1126,1128,
-        5,78,0,0,1127,1126,1,0,0,0,1127,1128,1,0,0,0,1128,1129,1,0,0,0,1129,
-        1131,3,330,165,0,1130,1125,1,0,0,0,1130,1131,1,0,0,0,1131,1135,1,
-        0,0,0,1132,1134,3,104,52,0,1133,1132,1,0,0,0,1134,1137,1,0,0,0,1135,
-        1133,1,0,0,0,1135,1136,1,0,0,0,1136,1139,1,0,0,0,1137,1135,1,0,0,
-        0,1138,1140,3,100,50,0,1139,1138,1,0,0,0,1139,1140,1,0,0,0,1140,
-        99,1,0,0,0,1141,1145,5,3,0,0,1142,1144,3,102,51,0,1143,1142,1,0,
-        0,0,1144,1147,1,0,0,0,1145,1143,1,0,0,0,1145,1146,1,0,0,0,1146,1151,
-        1,0,0,0,1147,1145,1,0,0,0,1148,1150,3,122,61,0,1149,1148,1,0,0,0,
-        1150,1153,1,0,0,0,1151,1149,1,0,0,0,1151,1152,1,0,0,0,1152,1154,
-        1,0,0,0,1153,1151,1,0,0,0,1154,1155,5,4,0,0,1155,101,1,0,0,0,1156,
-        1157,5,81,0,0,1157,1158,5,6,0,0,1158,1171,3,430,215,0,1159,1162,
-        5,80,0,0,1160,1161,5,6,0,0,1161,1163,5,355,0,0,1162,1160,1,0,0,0,
-        1162,1163,1,0,0,0,1163,1171,1,0,0,0,1164,1171,5,91,0,0,1165,1171,
-        5,92,0,0,1166,1171,5,93,0,0,1167,1168,5,94,0,0,1168,1169,5,6,0,0,
-        1169,1171,5,355,0,0,1170,1156,1,0,0,0,1170,1159,1,0,0,0,1170,1164,
-        1,0,0,0,1170,1165,1,0,0,0,1170,1166,1,0,0,0,1170,1167,1,0,0,0,1171,
-        103,1,0,0,0,1172,1182,5,91,0,0,1173,1182,5,92,0,0,1174,1182,5,93,
-        0,0,1175,1176,5,94,0,0,1176,1177,5,6,0,0,1177,1182,5,355,0,0,1178,
-        1179,5,80,0,0,1179,1180,5,6,0,0,1180,1182,5,355,0,0,1181,1172,1,
-        0,0,0,1181,1173,1,0,0,0,1181,1174,1,0,0,0,1181,1175,1,0,0,0,1181,
-        1178,1,0,0,0,1182,105,1,0,0,0,1183,1184,5,105,0,0,1184,1185,3,330,
-        165,0,1185,1189,5,3,0,0,1186,1188,3,108,54,0,1187,1186,1,0,0,0,1188,
-        1191,1,0,0,0,1189,1187,1,0,0,0,1189,1190,1,0,0,0,1190,1195,1,0,0,
-        0,1191,1189,1,0,0,0,1192,1194,3,110,55,0,1193,1192,1,0,0,0,1194,
-        1197,1,0,0,0,1195,1193,1,0,0,0,1195,1196,1,0,0,0,1196,1209,1,0,0,
-        0,1197,1195,1,0,0,0,1198,1203,3,112,56,0,1199,1200,5,22,0,0,1200,
-        1202,3,112,56,0,1201,1199,1,0,0,0,1202,1205,1,0,0,0,1203,1201,1,
-        0,0,0,1203,1204,1,0,0,0,1204,1207,1,0,0,0,1205,1203,1,0,0,0,1206,
-        1208,5,106,0,0,1207,1206,1,0,0,0,1207,1208,1,0,0,0,1208,1210,1,0,
-        0,0,1209,1198,1,0,0,0,1209,1210,1,0,0,0,1210,1211,1,0,0,0,1211,1212,
-        5,4,0,0,1212,107,1,0,0,0,1213,1214,5,81,0,0,1214,1215,5,6,0,0,1215,
-        1222,3,430,215,0,1216,1217,5,94,0,0,1217,1218,5,6,0,0,1218,1222,
-        5,355,0,0,1219,1222,5,107,0,0,1220,1222,5,108,0,0,1221,1213,1,0,
-        0,0,1221,1216,1,0,0,0,1221,1219,1,0,0,0,1221,1220,1,0,0,0,1222,109,
-        1,0,0,0,1223,1224,3,192,96,0,1224,1226,3,330,165,0,1225,1227,5,109,
-        0,0,1226,1225,1,0,0,0,1226,1227,1,0,0,0,1227,1229,1,0,0,0,1228,1230,
-        5,106,0,0,1229,1228,1,0,0,0,1229,1230,1,0,0,0,1230,111,1,0,0,0,1231,
-        1243,3,330,165,0,1232,1233,5,110,0,0,1233,1238,3,114,57,0,1234,1235,
-        5,22,0,0,1235,1237,3,114,57,0,1236,1234,1,0,0,0,1237,1240,1,0,0,
-        0,1238,1236,1,0,0,0,1238,1239,1,0,0,0,1239,1241,1,0,0,0,1240,1238,
-        1,0,0,0,1241,1242,5,111,0,0,1242,1244,1,0,0,0,1243,1232,1,0,0,0,
-        1243,1244,1,0,0,0,1244,113,1,0,0,0,1245,1246,7,12,0,0,1246,115,1,
-        0,0,0,1247,1248,5,112,0,0,1248,1260,3,330,165,0,1249,1250,5,351,
-        0,0,1250,1255,3,96,48,0,1251,1252,5,22,0,0,1252,1254,3,96,48,0,1253,
-        1251,1,0,0,0,1254,1257,1,0,0,0,1255,1253,1,0,0,0,1255,1256,1,0,0,
-        0,1256,1259,1,0,0,0,1257,1255,1,0,0,0,1258,1249,1,0,0,0,1259,1262,
-        1,0,0,0,1260,1258,1,0,0,0,1260,1261,1,0,0,0,1261,1264,1,0,0,0,1262,
-        1260,1,0,0,0,1263,1265,3,118,59,0,1264,1263,1,0,0,0,1264,1265,1,
-        0,0,0,1265,117,1,0,0,0,1266,1270,5,3,0,0,1267,1269,3,120,60,0,1268,
-        1267,1,0,0,0,1269,1272,1,0,0,0,1270,1268,1,0,0,0,1270,1271,1,0,0,
-        0,1271,1276,1,0,0,0,1272,1270,1,0,0,0,1273,1275,3,122,61,0,1274,
-        1273,1,0,0,0,1275,1278,1,0,0,0,1276,1274,1,0,0,0,1276,1277,1,0,0,
-        0,1277,1279,1,0,0,0,1278,1276,1,0,0,0,1279,1280,5,4,0,0,1280,119,
-        1,0,0,0,1281,1283,5,79,0,0,1282,1284,5,78,0,0,1283,1282,1,0,0,0,
-        1283,1284,1,0,0,0,1284,1285,1,0,0,0,1285,1306,3,430,215,0,1286,1287,
-        5,81,0,0,1287,1288,5,6,0,0,1288,1306,3,430,215,0,1289,1290,5,80,
-        0,0,1290,1291,5,6,0,0,1291,1306,5,355,0,0,1292,1306,5,91,0,0,1293,
-        1306,5,92,0,0,1294,1295,5,94,0,0,1295,1296,5,6,0,0,1296,1306,5,355,
-        0,0,1297,1299,3,132,66,0,1298,1297,1,0,0,0,1298,1299,1,0,0,0,1299,
-        1300,1,0,0,0,1300,1306,5,95,0,0,1301,1303,3,132,66,0,1302,1301,1,
-        0,0,0,1302,1303,1,0,0,0,1303,1304,1,0,0,0,1304,1306,5,90,0,0,1305,
-        1281,1,0,0,0,1305,1286,1,0,0,0,1305,1289,1,0,0,0,1305,1292,1,0,0,
-        0,1305,1293,1,0,0,0,1305,1294,1,0,0,0,1305,1298,1,0,0,0,1305,1302,
-        1,0,0,0,1306,121,1,0,0,0,1307,1313,3,124,62,0,1308,1313,3,214,107,
-        0,1309,1313,3,138,69,0,1310,1313,3,126,63,0,1311,1313,3,380,190,
-        0,1312,1307,1,0,0,0,1312,1308,1,0,0,0,1312,1309,1,0,0,0,1312,1310,
-        1,0,0,0,1312,1311,1,0,0,0,1313,123,1,0,0,0,1314,1316,7,13,0,0,1315,
-        1317,5,355,0,0,1316,1315,1,0,0,0,1316,1317,1,0,0,0,1317,1319,1,0,
-        0,0,1318,1320,5,78,0,0,1319,1318,1,0,0,0,1319,1320,1,0,0,0,1320,
-        1321,1,0,0,0,1321,1322,3,192,96,0,1322,1326,3,330,165,0,1323,1325,
-        3,130,65,0,1324,1323,1,0,0,0,1325,1328,1,0,0,0,1326,1324,1,0,0,0,
-        1326,1327,1,0,0,0,1327,1330,1,0,0,0,1328,1326,1,0,0,0,1329,1331,
-        5,106,0,0,1330,1329,1,0,0,0,1330,1331,1,0,0,0,1331,1344,1,0,0,0,
-        1332,1334,7,13,0,0,1333,1335,5,355,0,0,1334,1333,1,0,0,0,1334,1335,
-        1,0,0,0,1335,1337,1,0,0,0,1336,1338,5,78,0,0,1337,1336,1,0,0,0,1337,
-        1338,1,0,0,0,1338,1339,1,0,0,0,1339,1341,3,192,96,0,1340,1342,5,
-        106,0,0,1341,1340,1,0,0,0,1341,1342,1,0,0,0,1342,1344,1,0,0,0,1343,
-        1314,1,0,0,0,1343,1332,1,0,0,0,1344,125,1,0,0,0,1345,1347,5,355,
-        0,0,1346,1345,1,0,0,0,1346,1347,1,0,0,0,1347,1349,1,0,0,0,1348,1350,
-        3,234,117,0,1349,1348,1,0,0,0,1349,1350,1,0,0,0,1350,1352,1,0,0,
-        0,1351,1353,7,14,0,0,1352,1351,1,0,0,0,1352,1353,1,0,0,0,1353,1354,
-        1,0,0,0,1354,1355,3,192,96,0,1355,1357,3,330,165,0,1356,1358,5,109,
-        0,0,1357,1356,1,0,0,0,1357,1358,1,0,0,0,1358,1362,1,0,0,0,1359,1361,
-        3,130,65,0,1360,1359,1,0,0,0,1361,1364,1,0,0,0,1362,1360,1,0,0,0,
-        1362,1363,1,0,0,0,1363,1366,1,0,0,0,1364,1362,1,0,0,0,1365,1367,
-        3,128,64,0,1366,1365,1,0,0,0,1366,1367,1,0,0,0,1367,1369,1,0,0,0,
-        1368,1370,5,106,0,0,1369,1368,1,0,0,0,1369,1370,1,0,0,0,1370,1399,
-        1,0,0,0,1371,1373,5,355,0,0,1372,1371,1,0,0,0,1372,1373,1,0,0,0,
-        1373,1375,1,0,0,0,1374,1376,3,234,117,0,1375,1374,1,0,0,0,1375,1376,
-        1,0,0,0,1376,1378,1,0,0,0,1377,1379,7,14,0,0,1378,1377,1,0,0,0,1378,
-        1379,1,0,0,0,1379,1380,1,0,0,0,1380,1381,3,330,165,0,1381,1382,5,
-        14,0,0,1382,1384,3,192,96,0,1383,1385,5,109,0,0,1384,1383,1,0,0,
-        0,1384,1385,1,0,0,0,1385,1389,1,0,0,0,1386,1388,3,130,65,0,1387,
-        1386,1,0,0,0,1388,1391,1,0,0,0,1389,1387,1,0,0,0,1389,1390,1,0,0,
-        0,1390,1393,1,0,0,0,1391,1389,1,0,0,0,1392,1394,3,128,64,0,1393,
-        1392,1,0,0,0,1393,1394,1,0,0,0,1394,1396,1,0,0,0,1395,1397,5,106,
-        0,0,1396,1395,1,0,0,0,1396,1397,1,0,0,0,1397,1399,1,0,0,0,1398,1346,
-        1,0,0,0,1398,1372,1,0,0,0,1399,127,1,0,0,0,1400,1401,7,13,0,0,1401,
-        1402,5,355,0,0,1402,129,1,0,0,0,1403,1415,3,136,68,0,1404,1406,3,
-        132,66,0,1405,1404,1,0,0,0,1405,1406,1,0,0,0,1406,1407,1,0,0,0,1407,
-        1412,3,134,67,0,1408,1409,5,6,0,0,1409,1411,5,355,0,0,1410,1408,
-        1,0,0,0,1410,1411,1,0,0,0,1411,1413,1,0,0,0,1412,1410,1,0,0,0,1412,
-        1413,1,0,0,0,1413,1415,1,0,0,0,1414,1403,1,0,0,0,1414,1405,1,0,0,
-        0,1415,131,1,0,0,0,1416,1417,7,15,0,0,1417,133,1,0,0,0,1418,1419,
-        7,16,0,0,1419,135,1,0,0,0,1420,1424,5,154,0,0,1421,1422,5,6,0,0,
-        1422,1425,5,355,0,0,1423,1425,3,330,165,0,1424,1421,1,0,0,0,1424,
-        1423,1,0,0,0,1425,1429,1,0,0,0,1426,1427,5,34,0,0,1427,1429,3,330,
-        165,0,1428,1420,1,0,0,0,1428,1426,1,0,0,0,1429,137,1,0,0,0,1430,
-        1433,3,142,71,0,1431,1433,3,144,72,0,1432,1430,1,0,0,0,1432,1431,
-        1,0,0,0,1433,139,1,0,0,0,1434,1436,5,355,0,0,1435,1434,1,0,0,0,1435,
-        1436,1,0,0,0,1436,1438,1,0,0,0,1437,1439,3,234,117,0,1438,1437,1,
-        0,0,0,1438,1439,1,0,0,0,1439,1440,1,0,0,0,1440,1441,3,192,96,0,1441,
-        1445,3,330,165,0,1442,1444,3,152,76,0,1443,1442,1,0,0,0,1444,1447,
-        1,0,0,0,1445,1443,1,0,0,0,1445,1446,1,0,0,0,1446,1449,1,0,0,0,1447,
-        1445,1,0,0,0,1448,1450,5,106,0,0,1449,1448,1,0,0,0,1449,1450,1,0,
-        0,0,1450,1468,1,0,0,0,1451,1453,5,355,0,0,1452,1451,1,0,0,0,1452,
-        1453,1,0,0,0,1453,1455,1,0,0,0,1454,1456,3,234,117,0,1455,1454,1,
-        0,0,0,1455,1456,1,0,0,0,1456,1457,1,0,0,0,1457,1461,3,330,165,0,
-        1458,1460,3,152,76,0,1459,1458,1,0,0,0,1460,1463,1,0,0,0,1461,1459,
-        1,0,0,0,1461,1462,1,0,0,0,1462,1465,1,0,0,0,1463,1461,1,0,0,0,1464,
-        1466,5,106,0,0,1465,1464,1,0,0,0,1465,1466,1,0,0,0,1466,1468,1,0,
-        0,0,1467,1435,1,0,0,0,1467,1452,1,0,0,0,1468,141,1,0,0,0,1469,1471,
-        3,146,73,0,1470,1469,1,0,0,0,1470,1471,1,0,0,0,1471,1473,1,0,0,0,
-        1472,1474,3,192,96,0,1473,1472,1,0,0,0,1473,1474,1,0,0,0,1474,1475,
-        1,0,0,0,1475,1476,3,330,165,0,1476,1478,5,110,0,0,1477,1479,3,190,
-        95,0,1478,1477,1,0,0,0,1478,1479,1,0,0,0,1479,1480,1,0,0,0,1480,
-        1484,5,111,0,0,1481,1483,3,152,76,0,1482,1481,1,0,0,0,1483,1486,
-        1,0,0,0,1484,1482,1,0,0,0,1484,1485,1,0,0,0,1485,1488,1,0,0,0,1486,
-        1484,1,0,0,0,1487,1489,5,106,0,0,1488,1487,1,0,0,0,1488,1489,1,0,
-        0,0,1489,143,1,0,0,0,1490,1492,7,17,0,0,1491,1493,5,75,0,0,1492,
-        1491,1,0,0,0,1492,1493,1,0,0,0,1493,1495,1,0,0,0,1494,1496,3,234,
-        117,0,1495,1494,1,0,0,0,1495,1496,1,0,0,0,1496,1498,1,0,0,0,1497,
-        1499,3,192,96,0,1498,1497,1,0,0,0,1498,1499,1,0,0,0,1499,1500,1,
-        0,0,0,1500,1504,3,330,165,0,1501,1503,3,152,76,0,1502,1501,1,0,0,
-        0,1503,1506,1,0,0,0,1504,1502,1,0,0,0,1504,1505,1,0,0,0,1505,1508,
-        1,0,0,0,1506,1504,1,0,0,0,1507,1509,5,106,0,0,1508,1507,1,0,0,0,
-        1508,1509,1,0,0,0,1509,145,1,0,0,0,1510,1512,7,17,0,0,1511,1513,
-        5,75,0,0,1512,1511,1,0,0,0,1512,1513,1,0,0,0,1513,1515,1,0,0,0,1514,
-        1516,3,234,117,0,1515,1514,1,0,0,0,1515,1516,1,0,0,0,1516,1522,1,
-        0,0,0,1517,1519,3,234,117,0,1518,1520,7,17,0,0,1519,1518,1,0,0,0,
-        1519,1520,1,0,0,0,1520,1522,1,0,0,0,1521,1510,1,0,0,0,1521,1517,
-        1,0,0,0,1522,147,1,0,0,0,1523,1524,5,14,0,0,1524,1526,3,150,75,0,
-        1525,1527,3,280,140,0,1526,1525,1,0,0,0,1526,1527,1,0,0,0,1527,149,
-        1,0,0,0,1528,1529,7,18,0,0,1529,151,1,0,0,0,1530,1535,3,156,78,0,
-        1531,1535,3,148,74,0,1532,1535,3,160,80,0,1533,1535,3,154,77,0,1534,
-        1530,1,0,0,0,1534,1531,1,0,0,0,1534,1532,1,0,0,0,1534,1533,1,0,0,
-        0,1535,153,1,0,0,0,1536,1537,5,159,0,0,1537,1538,3,428,214,0,1538,
-        155,1,0,0,0,1539,1540,5,94,0,0,1540,1541,5,6,0,0,1541,1550,5,355,
-        0,0,1542,1550,3,158,79,0,1543,1544,5,160,0,0,1544,1545,5,6,0,0,1545,
-        1550,5,355,0,0,1546,1547,5,161,0,0,1547,1548,5,6,0,0,1548,1550,5,
-        355,0,0,1549,1539,1,0,0,0,1549,1542,1,0,0,0,1549,1543,1,0,0,0,1549,
-        1546,1,0,0,0,1550,157,1,0,0,0,1551,1552,7,19,0,0,1552,159,1,0,0,
-        0,1553,1555,5,166,0,0,1554,1556,3,162,81,0,1555,1554,1,0,0,0,1555,
-        1556,1,0,0,0,1556,1557,1,0,0,0,1557,1558,5,167,0,0,1558,1562,3,164,
-        82,0,1559,1560,5,168,0,0,1560,1561,5,6,0,0,1561,1563,3,330,165,0,
-        1562,1559,1,0,0,0,1562,1563,1,0,0,0,1563,1585,1,0,0,0,1564,1566,
-        5,169,0,0,1565,1567,3,162,81,0,1566,1565,1,0,0,0,1566,1567,1,0,0,
-        0,1567,1568,1,0,0,0,1568,1569,5,167,0,0,1569,1573,3,164,82,0,1570,
-        1571,5,168,0,0,1571,1572,5,6,0,0,1572,1574,3,330,165,0,1573,1570,
-        1,0,0,0,1573,1574,1,0,0,0,1574,1585,1,0,0,0,1575,1576,5,170,0,0,
-        1576,1579,5,167,0,0,1577,1579,5,171,0,0,1578,1575,1,0,0,0,1578,1577,
-        1,0,0,0,1579,1581,1,0,0,0,1580,1582,5,78,0,0,1581,1580,1,0,0,0,1581,
-        1582,1,0,0,0,1582,1583,1,0,0,0,1583,1585,3,430,215,0,1584,1553,1,
-        0,0,0,1584,1564,1,0,0,0,1584,1578,1,0,0,0,1585,161,1,0,0,0,1586,
-        1588,5,78,0,0,1587,1586,1,0,0,0,1587,1588,1,0,0,0,1588,1589,1,0,
-        0,0,1589,1590,3,330,165,0,1590,163,1,0,0,0,1591,1595,5,355,0,0,1592,
-        1595,3,432,216,0,1593,1595,3,430,215,0,1594,1591,1,0,0,0,1594,1592,
-        1,0,0,0,1594,1593,1,0,0,0,1595,165,1,0,0,0,1596,1600,5,3,0,0,1597,
-        1599,3,168,84,0,1598,1597,1,0,0,0,1599,1602,1,0,0,0,1600,1598,1,
-        0,0,0,1600,1601,1,0,0,0,1601,1603,1,0,0,0,1602,1600,1,0,0,0,1603,
-        1604,5,4,0,0,1604,167,1,0,0,0,1605,1608,3,172,86,0,1606,1608,3,122,
-        61,0,1607,1605,1,0,0,0,1607,1606,1,0,0,0,1608,169,1,0,0,0,1609,1611,
-        5,5,0,0,1610,1612,5,6,0,0,1611,1610,1,0,0,0,1611,1612,1,0,0,0,1612,
-        1613,1,0,0,0,1613,1620,3,50,25,0,1614,1616,5,49,0,0,1615,1617,5,
-        6,0,0,1616,1615,1,0,0,0,1616,1617,1,0,0,0,1617,1618,1,0,0,0,1618,
-        1620,5,355,0,0,1619,1609,1,0,0,0,1619,1614,1,0,0,0,1620,171,1,0,
-        0,0,1621,1641,3,166,83,0,1622,1641,3,58,29,0,1623,1641,3,60,30,0,
-        1624,1641,3,196,98,0,1625,1641,3,202,101,0,1626,1641,3,208,104,0,
-        1627,1641,3,214,107,0,1628,1641,3,38,19,0,1629,1641,3,176,88,0,1630,
-        1641,3,170,85,0,1631,1641,3,186,93,0,1632,1641,3,184,92,0,1633,1641,
-        3,286,143,0,1634,1641,3,48,24,0,1635,1641,3,52,26,0,1636,1641,3,
-        236,118,0,1637,1641,3,6,3,0,1638,1641,3,46,23,0,1639,1641,3,174,
-        87,0,1640,1621,1,0,0,0,1640,1622,1,0,0,0,1640,1623,1,0,0,0,1640,
-        1624,1,0,0,0,1640,1625,1,0,0,0,1640,1626,1,0,0,0,1640,1627,1,0,0,
-        0,1640,1628,1,0,0,0,1640,1629,1,0,0,0,1640,1630,1,0,0,0,1640,1631,
-        1,0,0,0,1640,1632,1,0,0,0,1640,1633,1,0,0,0,1640,1634,1,0,0,0,1640,
-        1635,1,0,0,0,1640,1636,1,0,0,0,1640,1637,1,0,0,0,1640,1638,1,0,0,
-        0,1640,1639,1,0,0,0,1641,173,1,0,0,0,1642,1644,5,172,0,0,1643,1645,
-        5,6,0,0,1644,1643,1,0,0,0,1644,1645,1,0,0,0,1645,1646,1,0,0,0,1646,
-        1648,3,330,165,0,1647,1649,5,106,0,0,1648,1647,1,0,0,0,1648,1649,
-        1,0,0,0,1649,175,1,0,0,0,1650,1652,7,20,0,0,1651,1653,5,6,0,0,1652,
-        1651,1,0,0,0,1652,1653,1,0,0,0,1653,1654,1,0,0,0,1654,1656,3,426,
-        213,0,1655,1657,5,106,0,0,1656,1655,1,0,0,0,1656,1657,1,0,0,0,1657,
-        1723,1,0,0,0,1658,1660,7,21,0,0,1659,1661,5,6,0,0,1660,1659,1,0,
-        0,0,1660,1661,1,0,0,0,1661,1662,1,0,0,0,1662,1664,3,178,89,0,1663,
-        1665,5,106,0,0,1664,1663,1,0,0,0,1664,1665,1,0,0,0,1665,1723,1,0,
-        0,0,1666,1668,5,179,0,0,1667,1669,5,6,0,0,1668,1667,1,0,0,0,1668,
-        1669,1,0,0,0,1669,1670,1,0,0,0,1670,1672,3,178,89,0,1671,1673,5,
-        106,0,0,1672,1671,1,0,0,0,1672,1673,1,0,0,0,1673,1723,1,0,0,0,1674,
-        1676,5,180,0,0,1675,1677,5,6,0,0,1676,1675,1,0,0,0,1676,1677,1,0,
-        0,0,1677,1678,1,0,0,0,1678,1680,3,180,90,0,1679,1681,5,106,0,0,1680,
-        1679,1,0,0,0,1680,1681,1,0,0,0,1681,1723,1,0,0,0,1682,1684,5,181,
-        0,0,1683,1685,5,6,0,0,1684,1683,1,0,0,0,1684,1685,1,0,0,0,1685,1686,
-        1,0,0,0,1686,1688,3,180,90,0,1687,1689,5,106,0,0,1688,1687,1,0,0,
-        0,1688,1689,1,0,0,0,1689,1723,1,0,0,0,1690,1692,5,182,0,0,1691,1693,
-        5,6,0,0,1692,1691,1,0,0,0,1692,1693,1,0,0,0,1693,1694,1,0,0,0,1694,
-        1696,3,182,91,0,1695,1697,5,106,0,0,1696,1695,1,0,0,0,1696,1697,
-        1,0,0,0,1697,1723,1,0,0,0,1698,1700,5,183,0,0,1699,1701,5,6,0,0,
-        1700,1699,1,0,0,0,1700,1701,1,0,0,0,1701,1702,1,0,0,0,1702,1704,
-        3,180,90,0,1703,1705,5,106,0,0,1704,1703,1,0,0,0,1704,1705,1,0,0,
-        0,1705,1723,1,0,0,0,1706,1708,5,184,0,0,1707,1709,5,6,0,0,1708,1707,
-        1,0,0,0,1708,1709,1,0,0,0,1709,1710,1,0,0,0,1710,1712,5,355,0,0,
-        1711,1713,5,106,0,0,1712,1711,1,0,0,0,1712,1713,1,0,0,0,1713,1723,
-        1,0,0,0,1714,1716,5,185,0,0,1715,1717,5,6,0,0,1716,1715,1,0,0,0,
-        1716,1717,1,0,0,0,1717,1718,1,0,0,0,1718,1720,5,355,0,0,1719,1721,
-        5,106,0,0,1720,1719,1,0,0,0,1720,1721,1,0,0,0,1721,1723,1,0,0,0,
-        1722,1650,1,0,0,0,1722,1658,1,0,0,0,1722,1666,1,0,0,0,1722,1674,
-        1,0,0,0,1722,1682,1,0,0,0,1722,1690,1,0,0,0,1722,1698,1,0,0,0,1722,
-        1706,1,0,0,0,1722,1714,1,0,0,0,1723,177,1,0,0,0,1724,1725,7,22,0,
-        0,1725,179,1,0,0,0,1726,1727,7,23,0,0,1727,181,1,0,0,0,1728,1729,
-        7,24,0,0,1729,183,1,0,0,0,1730,1731,5,72,0,0,1731,1732,5,6,0,0,1732,
-        1734,3,430,215,0,1733,1735,5,106,0,0,1734,1733,1,0,0,0,1734,1735,
-        1,0,0,0,1735,185,1,0,0,0,1736,1741,5,193,0,0,1737,1738,5,94,0,0,
-        1738,1739,5,6,0,0,1739,1741,5,355,0,0,1740,1736,1,0,0,0,1740,1737,
-        1,0,0,0,1741,187,1,0,0,0,1742,1744,5,78,0,0,1743,1742,1,0,0,0,1743,
-        1744,1,0,0,0,1744,1745,1,0,0,0,1745,1746,3,192,96,0,1746,1747,3,
-        330,165,0,1747,1756,1,0,0,0,1748,1750,5,78,0,0,1749,1748,1,0,0,0,
-        1749,1750,1,0,0,0,1750,1751,1,0,0,0,1751,1752,3,330,165,0,1752,1753,
-        5,14,0,0,1753,1754,3,192,96,0,1754,1756,1,0,0,0,1755,1743,1,0,0,
-        0,1755,1749,1,0,0,0,1756,189,1,0,0,0,1757,1762,3,188,94,0,1758,1759,
-        5,22,0,0,1759,1761,3,188,94,0,1760,1758,1,0,0,0,1761,1764,1,0,0,
-        0,1762,1760,1,0,0,0,1762,1763,1,0,0,0,1763,191,1,0,0,0,1764,1762,
-        1,0,0,0,1765,1766,3,194,97,0,1766,1767,5,194,0,0,1767,1768,3,192,
-        96,0,1768,1769,5,195,0,0,1769,1787,1,0,0,0,1770,1771,5,196,0,0,1771,
-        1772,5,194,0,0,1772,1773,3,192,96,0,1773,1774,5,22,0,0,1774,1775,
-        3,192,96,0,1775,1776,5,195,0,0,1776,1787,1,0,0,0,1777,1778,3,430,
-        215,0,1778,1779,5,194,0,0,1779,1780,3,192,96,0,1780,1781,5,195,0,
-        0,1781,1787,1,0,0,0,1782,1784,5,78,0,0,1783,1782,1,0,0,0,1783,1784,
-        1,0,0,0,1784,1785,1,0,0,0,1785,1787,3,430,215,0,1786,1765,1,0,0,
-        0,1786,1770,1,0,0,0,1786,1777,1,0,0,0,1786,1783,1,0,0,0,1787,193,
-        1,0,0,0,1788,1789,7,25,0,0,1789,195,1,0,0,0,1790,1791,5,201,0,0,
-        1791,1796,3,330,165,0,1792,1795,3,222,111,0,1793,1795,3,228,114,
-        0,1794,1792,1,0,0,0,1794,1793,1,0,0,0,1795,1798,1,0,0,0,1796,1794,
-        1,0,0,0,1796,1797,1,0,0,0,1797,1800,1,0,0,0,1798,1796,1,0,0,0,1799,
-        1801,3,198,99,0,1800,1799,1,0,0,0,1800,1801,1,0,0,0,1801,197,1,0,
-        0,0,1802,1806,5,3,0,0,1803,1805,3,200,100,0,1804,1803,1,0,0,0,1805,
-        1808,1,0,0,0,1806,1804,1,0,0,0,1806,1807,1,0,0,0,1807,1809,1,0,0,
-        0,1808,1806,1,0,0,0,1809,1810,5,4,0,0,1810,199,1,0,0,0,1811,1818,
-        3,222,111,0,1812,1818,3,228,114,0,1813,1818,3,124,62,0,1814,1818,
-        3,138,69,0,1815,1818,3,140,70,0,1816,1818,3,380,190,0,1817,1811,
-        1,0,0,0,1817,1812,1,0,0,0,1817,1813,1,0,0,0,1817,1814,1,0,0,0,1817,
-        1815,1,0,0,0,1817,1816,1,0,0,0,1818,201,1,0,0,0,1819,1820,5,202,
-        0,0,1820,1825,3,330,165,0,1821,1824,3,224,112,0,1822,1824,3,228,
-        114,0,1823,1821,1,0,0,0,1823,1822,1,0,0,0,1824,1827,1,0,0,0,1825,
-        1823,1,0,0,0,1825,1826,1,0,0,0,1826,1829,1,0,0,0,1827,1825,1,0,0,
-        0,1828,1830,3,204,102,0,1829,1828,1,0,0,0,1829,1830,1,0,0,0,1830,
-        203,1,0,0,0,1831,1835,5,3,0,0,1832,1834,3,206,103,0,1833,1832,1,
-        0,0,0,1834,1837,1,0,0,0,1835,1833,1,0,0,0,1835,1836,1,0,0,0,1836,
-        1838,1,0,0,0,1837,1835,1,0,0,0,1838,1839,5,4,0,0,1839,205,1,0,0,
-        0,1840,1846,3,224,112,0,1841,1846,3,228,114,0,1842,1846,3,138,69,
-        0,1843,1846,3,140,70,0,1844,1846,3,380,190,0,1845,1840,1,0,0,0,1845,
-        1841,1,0,0,0,1845,1842,1,0,0,0,1845,1843,1,0,0,0,1845,1844,1,0,0,
-        0,1846,207,1,0,0,0,1847,1848,5,203,0,0,1848,1853,3,330,165,0,1849,
-        1852,3,226,113,0,1850,1852,3,228,114,0,1851,1849,1,0,0,0,1851,1850,
-        1,0,0,0,1852,1855,1,0,0,0,1853,1851,1,0,0,0,1853,1854,1,0,0,0,1854,
-        1857,1,0,0,0,1855,1853,1,0,0,0,1856,1858,3,210,105,0,1857,1856,1,
-        0,0,0,1857,1858,1,0,0,0,1858,209,1,0,0,0,1859,1863,5,3,0,0,1860,
-        1862,3,212,106,0,1861,1860,1,0,0,0,1862,1865,1,0,0,0,1863,1861,1,
-        0,0,0,1863,1864,1,0,0,0,1864,1866,1,0,0,0,1865,1863,1,0,0,0,1866,
-        1867,5,4,0,0,1867,211,1,0,0,0,1868,1872,3,226,113,0,1869,1872,3,
-        228,114,0,1870,1872,3,380,190,0,1871,1868,1,0,0,0,1871,1869,1,0,
-        0,0,1871,1870,1,0,0,0,1872,213,1,0,0,0,1873,1874,5,204,0,0,1874,
-        1879,3,330,165,0,1875,1878,3,230,115,0,1876,1878,3,228,114,0,1877,
-        1875,1,0,0,0,1877,1876,1,0,0,0,1878,1881,1,0,0,0,1879,1877,1,0,0,
-        0,1879,1880,1,0,0,0,1880,1883,1,0,0,0,1881,1879,1,0,0,0,1882,1884,
-        3,216,108,0,1883,1882,1,0,0,0,1883,1884,1,0,0,0,1884,215,1,0,0,0,
-        1885,1889,5,3,0,0,1886,1888,3,218,109,0,1887,1886,1,0,0,0,1888,1891,
-        1,0,0,0,1889,1887,1,0,0,0,1889,1890,1,0,0,0,1890,1892,1,0,0,0,1891,
-        1889,1,0,0,0,1892,1893,5,4,0,0,1893,217,1,0,0,0,1894,1899,3,230,
-        115,0,1895,1899,3,228,114,0,1896,1899,3,220,110,0,1897,1899,3,380,
-        190,0,1898,1894,1,0,0,0,1898,1895,1,0,0,0,1898,1896,1,0,0,0,1898,
-        1897,1,0,0,0,1899,219,1,0,0,0,1900,1902,3,234,117,0,1901,1900,1,
-        0,0,0,1901,1902,1,0,0,0,1902,1910,1,0,0,0,1903,1905,5,78,0,0,1904,
-        1903,1,0,0,0,1904,1905,1,0,0,0,1905,1906,1,0,0,0,1906,1907,3,192,
-        96,0,1907,1908,3,330,165,0,1908,1911,1,0,0,0,1909,1911,3,330,165,
-        0,1910,1904,1,0,0,0,1910,1909,1,0,0,0,1911,1917,1,0,0,0,1912,1914,
-        5,110,0,0,1913,1915,3,190,95,0,1914,1913,1,0,0,0,1914,1915,1,0,0,
-        0,1915,1916,1,0,0,0,1916,1918,5,111,0,0,1917,1912,1,0,0,0,1917,1918,
-        1,0,0,0,1918,1922,1,0,0,0,1919,1921,3,232,116,0,1920,1919,1,0,0,
-        0,1921,1924,1,0,0,0,1922,1920,1,0,0,0,1922,1923,1,0,0,0,1923,1926,
-        1,0,0,0,1924,1922,1,0,0,0,1925,1927,5,106,0,0,1926,1925,1,0,0,0,
-        1926,1927,1,0,0,0,1927,221,1,0,0,0,1928,1947,5,91,0,0,1929,1947,
-        5,92,0,0,1930,1947,5,205,0,0,1931,1947,5,93,0,0,1932,1933,5,94,0,
-        0,1933,1934,5,6,0,0,1934,1947,5,355,0,0,1935,1936,5,169,0,0,1936,
-        1939,5,167,0,0,1937,1940,5,355,0,0,1938,1940,3,432,216,0,1939,1937,
-        1,0,0,0,1939,1938,1,0,0,0,1940,1944,1,0,0,0,1941,1942,5,168,0,0,
-        1942,1943,5,6,0,0,1943,1945,3,330,165,0,1944,1941,1,0,0,0,1944,1945,
-        1,0,0,0,1945,1947,1,0,0,0,1946,1928,1,0,0,0,1946,1929,1,0,0,0,1946,
-        1930,1,0,0,0,1946,1931,1,0,0,0,1946,1932,1,0,0,0,1946,1935,1,0,0,
-        0,1947,223,1,0,0,0,1948,1958,5,91,0,0,1949,1958,5,92,0,0,1950,1958,
-        5,93,0,0,1951,1952,5,94,0,0,1952,1953,5,6,0,0,1953,1958,5,355,0,
-        0,1954,1955,5,160,0,0,1955,1956,5,6,0,0,1956,1958,5,355,0,0,1957,
-        1948,1,0,0,0,1957,1949,1,0,0,0,1957,1950,1,0,0,0,1957,1951,1,0,0,
-        0,1957,1954,1,0,0,0,1958,225,1,0,0,0,1959,1960,5,94,0,0,1960,1961,
-        5,6,0,0,1961,1983,5,355,0,0,1962,1963,5,169,0,0,1963,1966,5,167,
-        0,0,1964,1967,5,355,0,0,1965,1967,3,432,216,0,1966,1964,1,0,0,0,
-        1966,1965,1,0,0,0,1967,1971,1,0,0,0,1968,1969,5,168,0,0,1969,1970,
-        5,6,0,0,1970,1972,3,330,165,0,1971,1968,1,0,0,0,1971,1972,1,0,0,
-        0,1972,1983,1,0,0,0,1973,1974,5,206,0,0,1974,1976,5,167,0,0,1975,
-        1977,5,78,0,0,1976,1975,1,0,0,0,1976,1977,1,0,0,0,1977,1978,1,0,
-        0,0,1978,1983,3,430,215,0,1979,1980,7,26,0,0,1980,1981,5,6,0,0,1981,
-        1983,3,432,216,0,1982,1959,1,0,0,0,1982,1962,1,0,0,0,1982,1973,1,
-        0,0,0,1982,1979,1,0,0,0,1983,227,1,0,0,0,1984,1986,7,27,0,0,1985,
-        1987,5,78,0,0,1986,1985,1,0,0,0,1986,1987,1,0,0,0,1987,1988,1,0,
-        0,0,1988,1989,3,430,215,0,1989,229,1,0,0,0,1990,2007,5,91,0,0,1991,
-        2007,5,92,0,0,1992,1993,5,94,0,0,1993,1994,5,6,0,0,1994,2007,5,355,
-        0,0,1995,1996,5,169,0,0,1996,1999,5,167,0,0,1997,2000,5,355,0,0,
-        1998,2000,3,432,216,0,1999,1997,1,0,0,0,1999,1998,1,0,0,0,2000,2004,
-        1,0,0,0,2001,2002,5,168,0,0,2002,2003,5,6,0,0,2003,2005,3,330,165,
-        0,2004,2001,1,0,0,0,2004,2005,1,0,0,0,2005,2007,1,0,0,0,2006,1990,
-        1,0,0,0,2006,1991,1,0,0,0,2006,1992,1,0,0,0,2006,1995,1,0,0,0,2007,
-        231,1,0,0,0,2008,2009,5,159,0,0,2009,2066,3,428,214,0,2010,2011,
-        5,94,0,0,2011,2012,5,6,0,0,2012,2066,5,355,0,0,2013,2066,5,90,0,
-        0,2014,2066,5,91,0,0,2015,2066,5,92,0,0,2016,2066,5,210,0,0,2017,
-        2066,5,211,0,0,2018,2066,5,212,0,0,2019,2020,5,213,0,0,2020,2021,
-        5,6,0,0,2021,2066,5,355,0,0,2022,2023,5,214,0,0,2023,2024,5,6,0,
-        0,2024,2066,5,355,0,0,2025,2026,5,215,0,0,2026,2027,5,6,0,0,2027,
-        2066,5,355,0,0,2028,2029,5,216,0,0,2029,2030,5,6,0,0,2030,2066,5,
-        355,0,0,2031,2032,5,217,0,0,2032,2033,5,6,0,0,2033,2066,5,355,0,
-        0,2034,2035,5,170,0,0,2035,2038,5,167,0,0,2036,2038,5,171,0,0,2037,
-        2034,1,0,0,0,2037,2036,1,0,0,0,2038,2040,1,0,0,0,2039,2041,5,78,
-        0,0,2040,2039,1,0,0,0,2040,2041,1,0,0,0,2041,2042,1,0,0,0,2042,2066,
-        3,430,215,0,2043,2045,5,166,0,0,2044,2046,3,162,81,0,2045,2044,1,
-        0,0,0,2045,2046,1,0,0,0,2046,2047,1,0,0,0,2047,2048,5,167,0,0,2048,
-        2052,3,164,82,0,2049,2050,5,168,0,0,2050,2051,5,6,0,0,2051,2053,
-        3,330,165,0,2052,2049,1,0,0,0,2052,2053,1,0,0,0,2053,2066,1,0,0,
-        0,2054,2056,5,169,0,0,2055,2057,3,162,81,0,2056,2055,1,0,0,0,2056,
-        2057,1,0,0,0,2057,2058,1,0,0,0,2058,2059,5,167,0,0,2059,2063,3,164,
-        82,0,2060,2061,5,168,0,0,2061,2062,5,6,0,0,2062,2064,3,330,165,0,
-        2063,2060,1,0,0,0,2063,2064,1,0,0,0,2064,2066,1,0,0,0,2065,2008,
-        1,0,0,0,2065,2010,1,0,0,0,2065,2013,1,0,0,0,2065,2014,1,0,0,0,2065,
-        2015,1,0,0,0,2065,2016,1,0,0,0,2065,2017,1,0,0,0,2065,2018,1,0,0,
-        0,2065,2019,1,0,0,0,2065,2022,1,0,0,0,2065,2025,1,0,0,0,2065,2028,
-        1,0,0,0,2065,2031,1,0,0,0,2065,2037,1,0,0,0,2065,2043,1,0,0,0,2065,
-        2054,1,0,0,0,2066,233,1,0,0,0,2067,2068,7,28,0,0,2068,235,1,0,0,
-        0,2069,2071,5,221,0,0,2070,2072,3,330,165,0,2071,2070,1,0,0,0,2071,
-        2072,1,0,0,0,2072,2073,1,0,0,0,2073,2077,5,3,0,0,2074,2076,3,238,
-        119,0,2075,2074,1,0,0,0,2076,2079,1,0,0,0,2077,2075,1,0,0,0,2077,
-        2078,1,0,0,0,2078,2080,1,0,0,0,2079,2077,1,0,0,0,2080,2081,5,4,0,
-        0,2081,237,1,0,0,0,2082,2089,3,240,120,0,2083,2089,3,242,121,0,2084,
-        2089,3,196,98,0,2085,2089,3,274,137,0,2086,2089,3,78,39,0,2087,2089,
-        3,84,42,0,2088,2082,1,0,0,0,2088,2083,1,0,0,0,2088,2084,1,0,0,0,
-        2088,2085,1,0,0,0,2088,2086,1,0,0,0,2088,2087,1,0,0,0,2089,239,1,
-        0,0,0,2090,2091,7,29,0,0,2091,2093,3,330,165,0,2092,2094,5,106,0,
-        0,2093,2092,1,0,0,0,2093,2094,1,0,0,0,2094,241,1,0,0,0,2095,2096,
-        7,30,0,0,2096,2097,3,330,165,0,2097,2101,5,3,0,0,2098,2100,3,244,
-        122,0,2099,2098,1,0,0,0,2100,2103,1,0,0,0,2101,2099,1,0,0,0,2101,
-        2102,1,0,0,0,2102,2104,1,0,0,0,2103,2101,1,0,0,0,2104,2105,5,4,0,
-        0,2105,243,1,0,0,0,2106,2110,3,246,123,0,2107,2110,3,250,125,0,2108,
-        2110,3,254,127,0,2109,2106,1,0,0,0,2109,2107,1,0,0,0,2109,2108,1,
-        0,0,0,2110,245,1,0,0,0,2111,2112,5,222,0,0,2112,2114,3,330,165,0,
-        2113,2115,3,258,129,0,2114,2113,1,0,0,0,2114,2115,1,0,0,0,2115,2117,
-        1,0,0,0,2116,2118,3,248,124,0,2117,2116,1,0,0,0,2117,2118,1,0,0,
-        0,2118,2120,1,0,0,0,2119,2121,5,106,0,0,2120,2119,1,0,0,0,2120,2121,
-        1,0,0,0,2121,247,1,0,0,0,2122,2124,3,260,130,0,2123,2122,1,0,0,0,
-        2123,2124,1,0,0,0,2124,2126,1,0,0,0,2125,2127,3,270,135,0,2126,2125,
-        1,0,0,0,2126,2127,1,0,0,0,2127,249,1,0,0,0,2128,2129,5,225,0,0,2129,
-        2130,3,252,126,0,2130,2131,5,226,0,0,2131,2133,3,262,131,0,2132,
-        2134,5,106,0,0,2133,2132,1,0,0,0,2133,2134,1,0,0,0,2134,251,1,0,
-        0,0,2135,2141,3,330,165,0,2136,2137,3,284,142,0,2137,2138,3,330,
-        165,0,2138,2140,1,0,0,0,2139,2136,1,0,0,0,2140,2143,1,0,0,0,2141,
-        2139,1,0,0,0,2141,2142,1,0,0,0,2142,253,1,0,0,0,2143,2141,1,0,0,
-        0,2144,2145,5,227,0,0,2145,2147,3,330,165,0,2146,2148,3,258,129,
-        0,2147,2146,1,0,0,0,2147,2148,1,0,0,0,2148,2150,1,0,0,0,2149,2151,
-        3,256,128,0,2150,2149,1,0,0,0,2150,2151,1,0,0,0,2151,2153,1,0,0,
-        0,2152,2154,5,106,0,0,2153,2152,1,0,0,0,2153,2154,1,0,0,0,2154,255,
-        1,0,0,0,2155,2157,3,260,130,0,2156,2155,1,0,0,0,2156,2157,1,0,0,
-        0,2157,2159,1,0,0,0,2158,2160,3,270,135,0,2159,2158,1,0,0,0,2159,
-        2160,1,0,0,0,2160,257,1,0,0,0,2161,2162,5,21,0,0,2162,2163,5,228,
-        0,0,2163,2164,5,229,0,0,2164,2165,5,355,0,0,2165,2166,5,23,0,0,2166,
-        259,1,0,0,0,2167,2168,5,170,0,0,2168,2169,5,167,0,0,2169,2171,3,
-        330,165,0,2170,2172,5,230,0,0,2171,2170,1,0,0,0,2171,2172,1,0,0,
-        0,2172,2174,1,0,0,0,2173,2175,3,280,140,0,2174,2173,1,0,0,0,2174,
-        2175,1,0,0,0,2175,261,1,0,0,0,2176,2180,3,266,133,0,2177,2179,3,
-        264,132,0,2178,2177,1,0,0,0,2179,2182,1,0,0,0,2180,2178,1,0,0,0,
-        2180,2181,1,0,0,0,2181,263,1,0,0,0,2182,2180,1,0,0,0,2183,2184,3,
-        284,142,0,2184,2185,3,266,133,0,2185,265,1,0,0,0,2186,2188,3,268,
-        134,0,2187,2186,1,0,0,0,2187,2188,1,0,0,0,2188,2189,1,0,0,0,2189,
-        2190,3,330,165,0,2190,267,1,0,0,0,2191,2192,7,31,0,0,2192,269,1,
-        0,0,0,2193,2194,5,231,0,0,2194,2195,5,225,0,0,2195,2196,3,272,136,
-        0,2196,271,1,0,0,0,2197,2203,3,330,165,0,2198,2199,3,284,142,0,2199,
-        2200,3,330,165,0,2200,2202,1,0,0,0,2201,2198,1,0,0,0,2202,2205,1,
-        0,0,0,2203,2201,1,0,0,0,2203,2204,1,0,0,0,2204,273,1,0,0,0,2205,
-        2203,1,0,0,0,2206,2207,7,32,0,0,2207,2208,3,330,165,0,2208,2212,
-        5,3,0,0,2209,2211,3,276,138,0,2210,2209,1,0,0,0,2211,2214,1,0,0,
-        0,2212,2210,1,0,0,0,2212,2213,1,0,0,0,2213,2215,1,0,0,0,2214,2212,
-        1,0,0,0,2215,2216,5,4,0,0,2216,275,1,0,0,0,2217,2219,3,278,139,0,
-        2218,2220,5,106,0,0,2219,2218,1,0,0,0,2219,2220,1,0,0,0,2220,277,
-        1,0,0,0,2221,2226,3,330,165,0,2222,2223,5,234,0,0,2223,2225,3,330,
-        165,0,2224,2222,1,0,0,0,2225,2228,1,0,0,0,2226,2224,1,0,0,0,2226,
-        2227,1,0,0,0,2227,279,1,0,0,0,2228,2226,1,0,0,0,2229,2231,5,21,0,
-        0,2230,2232,3,426,213,0,2231,2230,1,0,0,0,2231,2232,1,0,0,0,2232,
-        2243,1,0,0,0,2233,2234,5,36,0,0,2234,2240,3,282,141,0,2235,2236,
-        3,284,142,0,2236,2237,3,282,141,0,2237,2239,1,0,0,0,2238,2235,1,
-        0,0,0,2239,2242,1,0,0,0,2240,2238,1,0,0,0,2240,2241,1,0,0,0,2241,
-        2244,1,0,0,0,2242,2240,1,0,0,0,2243,2233,1,0,0,0,2243,2244,1,0,0,
-        0,2244,2245,1,0,0,0,2245,2246,5,23,0,0,2246,281,1,0,0,0,2247,2249,
-        3,330,165,0,2248,2250,5,156,0,0,2249,2248,1,0,0,0,2249,2250,1,0,
-        0,0,2250,283,1,0,0,0,2251,2252,7,33,0,0,2252,285,1,0,0,0,2253,2254,
-        5,240,0,0,2254,2264,3,330,165,0,2255,2260,5,3,0,0,2256,2259,3,288,
-        144,0,2257,2259,3,318,159,0,2258,2256,1,0,0,0,2258,2257,1,0,0,0,
-        2259,2262,1,0,0,0,2260,2258,1,0,0,0,2260,2261,1,0,0,0,2261,2263,
-        1,0,0,0,2262,2260,1,0,0,0,2263,2265,5,4,0,0,2264,2255,1,0,0,0,2264,
-        2265,1,0,0,0,2265,287,1,0,0,0,2266,2273,3,290,145,0,2267,2273,3,
-        292,146,0,2268,2273,3,294,147,0,2269,2273,3,332,166,0,2270,2273,
-        3,334,167,0,2271,2273,3,336,168,0,2272,2266,1,0,0,0,2272,2267,1,
-        0,0,0,2272,2268,1,0,0,0,2272,2269,1,0,0,0,2272,2270,1,0,0,0,2272,
-        2271,1,0,0,0,2273,289,1,0,0,0,2274,2276,5,241,0,0,2275,2277,5,6,
-        0,0,2276,2275,1,0,0,0,2276,2277,1,0,0,0,2277,2278,1,0,0,0,2278,2279,
-        5,355,0,0,2279,291,1,0,0,0,2280,2282,5,242,0,0,2281,2283,5,6,0,0,
-        2282,2281,1,0,0,0,2282,2283,1,0,0,0,2283,2284,1,0,0,0,2284,2289,
-        5,355,0,0,2285,2286,5,22,0,0,2286,2288,5,355,0,0,2287,2285,1,0,0,
-        0,2288,2291,1,0,0,0,2289,2287,1,0,0,0,2289,2290,1,0,0,0,2290,293,
-        1,0,0,0,2291,2289,1,0,0,0,2292,2294,5,243,0,0,2293,2295,5,6,0,0,
-        2294,2293,1,0,0,0,2294,2295,1,0,0,0,2295,2297,1,0,0,0,2296,2298,
-        3,296,148,0,2297,2296,1,0,0,0,2298,2299,1,0,0,0,2299,2297,1,0,0,
-        0,2299,2300,1,0,0,0,2300,295,1,0,0,0,2301,2303,3,302,151,0,2302,
-        2304,5,22,0,0,2303,2302,1,0,0,0,2303,2304,1,0,0,0,2304,2318,1,0,
-        0,0,2305,2307,3,300,150,0,2306,2308,5,22,0,0,2307,2306,1,0,0,0,2307,
-        2308,1,0,0,0,2308,2318,1,0,0,0,2309,2311,5,355,0,0,2310,2312,5,22,
-        0,0,2311,2310,1,0,0,0,2311,2312,1,0,0,0,2312,2318,1,0,0,0,2313,2315,
-        3,298,149,0,2314,2316,5,22,0,0,2315,2314,1,0,0,0,2315,2316,1,0,0,
-        0,2316,2318,1,0,0,0,2317,2301,1,0,0,0,2317,2305,1,0,0,0,2317,2309,
-        1,0,0,0,2317,2313,1,0,0,0,2318,297,1,0,0,0,2319,2324,3,330,165,0,
-        2320,2324,5,350,0,0,2321,2324,5,351,0,0,2322,2324,5,352,0,0,2323,
-        2319,1,0,0,0,2323,2320,1,0,0,0,2323,2321,1,0,0,0,2323,2322,1,0,0,
-        0,2324,299,1,0,0,0,2325,2326,5,350,0,0,2326,2327,5,355,0,0,2327,
-        2328,5,351,0,0,2328,2329,5,352,0,0,2329,2334,5,355,0,0,2330,2331,
-        5,22,0,0,2331,2333,5,355,0,0,2332,2330,1,0,0,0,2333,2336,1,0,0,0,
-        2334,2332,1,0,0,0,2334,2335,1,0,0,0,2335,301,1,0,0,0,2336,2334,1,
-        0,0,0,2337,2340,3,304,152,0,2338,2340,3,306,153,0,2339,2337,1,0,
-        0,0,2339,2338,1,0,0,0,2340,303,1,0,0,0,2341,2342,5,244,0,0,2342,
-        2343,5,245,0,0,2343,2344,5,167,0,0,2344,2345,3,308,154,0,2345,2346,
-        3,310,155,0,2346,2352,1,0,0,0,2347,2348,5,244,0,0,2348,2349,5,245,
-        0,0,2349,2350,5,167,0,0,2350,2352,5,355,0,0,2351,2341,1,0,0,0,2351,
-        2347,1,0,0,0,2352,305,1,0,0,0,2353,2354,3,308,154,0,2354,2355,3,
-        310,155,0,2355,307,1,0,0,0,2356,2357,7,34,0,0,2357,309,1,0,0,0,2358,
-        2360,3,312,156,0,2359,2358,1,0,0,0,2359,2360,1,0,0,0,2360,2361,1,
-        0,0,0,2361,2363,5,355,0,0,2362,2364,3,314,157,0,2363,2362,1,0,0,
-        0,2363,2364,1,0,0,0,2364,2366,1,0,0,0,2365,2367,3,316,158,0,2366,
-        2365,1,0,0,0,2366,2367,1,0,0,0,2367,311,1,0,0,0,2368,2369,7,35,0,
-        0,2369,313,1,0,0,0,2370,2371,5,351,0,0,2371,2372,7,36,0,0,2372,2377,
-        5,355,0,0,2373,2374,5,22,0,0,2374,2376,5,355,0,0,2375,2373,1,0,0,
-        0,2376,2379,1,0,0,0,2377,2375,1,0,0,0,2377,2378,1,0,0,0,2378,315,
-        1,0,0,0,2379,2377,1,0,0,0,2380,2382,7,37,0,0,2381,2383,3,312,156,
-        0,2382,2381,1,0,0,0,2382,2383,1,0,0,0,2383,2384,1,0,0,0,2384,2385,
-        5,355,0,0,2385,317,1,0,0,0,2386,2388,8,38,0,0,2387,2386,1,0,0,0,
-        2388,2389,1,0,0,0,2389,2387,1,0,0,0,2389,2390,1,0,0,0,2390,319,1,
-        0,0,0,2391,2392,5,253,0,0,2392,2396,3,330,165,0,2393,2394,5,254,
-        0,0,2394,2395,5,229,0,0,2395,2397,3,330,165,0,2396,2393,1,0,0,0,
-        2396,2397,1,0,0,0,2397,2398,1,0,0,0,2398,2404,5,3,0,0,2399,2403,
-        3,324,162,0,2400,2403,3,322,161,0,2401,2403,3,328,164,0,2402,2399,
-        1,0,0,0,2402,2400,1,0,0,0,2402,2401,1,0,0,0,2403,2406,1,0,0,0,2404,
-        2402,1,0,0,0,2404,2405,1,0,0,0,2405,2407,1,0,0,0,2406,2404,1,0,0,
-        0,2407,2408,5,4,0,0,2408,321,1,0,0,0,2409,2411,5,255,0,0,2410,2412,
-        7,39,0,0,2411,2410,1,0,0,0,2411,2412,1,0,0,0,2412,2413,1,0,0,0,2413,
-        2414,5,355,0,0,2414,2415,5,244,0,0,2415,2416,5,245,0,0,2416,2418,
-        5,167,0,0,2417,2419,7,40,0,0,2418,2417,1,0,0,0,2418,2419,1,0,0,0,
-        2419,2420,1,0,0,0,2420,2421,5,355,0,0,2421,2422,5,257,0,0,2422,2423,
-        5,258,0,0,2423,2424,5,355,0,0,2424,323,1,0,0,0,2425,2427,5,255,0,
-        0,2426,2428,7,39,0,0,2427,2426,1,0,0,0,2427,2428,1,0,0,0,2428,2429,
-        1,0,0,0,2429,2431,5,355,0,0,2430,2432,3,302,151,0,2431,2430,1,0,
-        0,0,2432,2433,1,0,0,0,2433,2431,1,0,0,0,2433,2434,1,0,0,0,2434,2435,
-        1,0,0,0,2435,2436,5,257,0,0,2436,2437,5,258,0,0,2437,2439,5,355,
-        0,0,2438,2440,3,326,163,0,2439,2438,1,0,0,0,2439,2440,1,0,0,0,2440,
-        325,1,0,0,0,2441,2442,5,259,0,0,2442,2443,5,258,0,0,2443,2448,5,
-        355,0,0,2444,2445,5,22,0,0,2445,2447,5,355,0,0,2446,2444,1,0,0,0,
-        2447,2450,1,0,0,0,2448,2446,1,0,0,0,2448,2449,1,0,0,0,2449,2451,
-        1,0,0,0,2450,2448,1,0,0,0,2451,2452,7,41,0,0,2452,2454,5,262,0,0,
-        2453,2455,5,22,0,0,2454,2453,1,0,0,0,2454,2455,1,0,0,0,2455,2456,
-        1,0,0,0,2456,2457,5,263,0,0,2457,2458,5,258,0,0,2458,2463,5,355,
-        0,0,2459,2460,5,22,0,0,2460,2462,5,355,0,0,2461,2459,1,0,0,0,2462,
-        2465,1,0,0,0,2463,2461,1,0,0,0,2463,2464,1,0,0,0,2464,2466,1,0,0,
-        0,2465,2463,1,0,0,0,2466,2467,7,41,0,0,2467,2468,7,42,0,0,2468,327,
-        1,0,0,0,2469,2471,8,38,0,0,2470,2469,1,0,0,0,2471,2472,1,0,0,0,2472,
-        2470,1,0,0,0,2472,2473,1,0,0,0,2473,329,1,0,0,0,2474,2475,7,43,0,
-        0,2475,331,1,0,0,0,2476,2478,5,281,0,0,2477,2479,5,6,0,0,2478,2477,
-        1,0,0,0,2478,2479,1,0,0,0,2479,2480,1,0,0,0,2480,2481,5,355,0,0,
-        2481,333,1,0,0,0,2482,2484,5,282,0,0,2483,2485,5,6,0,0,2484,2483,
-        1,0,0,0,2484,2485,1,0,0,0,2485,2486,1,0,0,0,2486,2487,5,355,0,0,
-        2487,335,1,0,0,0,2488,2490,5,283,0,0,2489,2491,5,6,0,0,2490,2489,
-        1,0,0,0,2490,2491,1,0,0,0,2491,2492,1,0,0,0,2492,2493,5,355,0,0,
-        2493,337,1,0,0,0,2494,2497,5,289,0,0,2495,2496,5,293,0,0,2496,2498,
-        3,426,213,0,2497,2495,1,0,0,0,2497,2498,1,0,0,0,2498,2499,1,0,0,
-        0,2499,2503,5,3,0,0,2500,2502,3,340,170,0,2501,2500,1,0,0,0,2502,
-        2505,1,0,0,0,2503,2501,1,0,0,0,2503,2504,1,0,0,0,2504,2506,1,0,0,
-        0,2505,2503,1,0,0,0,2506,2507,5,4,0,0,2507,339,1,0,0,0,2508,2511,
-        3,342,171,0,2509,2511,3,344,172,0,2510,2508,1,0,0,0,2510,2509,1,
-        0,0,0,2511,341,1,0,0,0,2512,2513,5,294,0,0,2513,2522,3,330,165,0,
-        2514,2518,5,3,0,0,2515,2517,3,344,172,0,2516,2515,1,0,0,0,2517,2520,
-        1,0,0,0,2518,2516,1,0,0,0,2518,2519,1,0,0,0,2519,2521,1,0,0,0,2520,
-        2518,1,0,0,0,2521,2523,5,4,0,0,2522,2514,1,0,0,0,2522,2523,1,0,0,
-        0,2523,343,1,0,0,0,2524,2525,5,288,0,0,2525,2534,3,330,165,0,2526,
-        2530,5,3,0,0,2527,2529,3,346,173,0,2528,2527,1,0,0,0,2529,2532,1,
-        0,0,0,2530,2528,1,0,0,0,2530,2531,1,0,0,0,2531,2533,1,0,0,0,2532,
-        2530,1,0,0,0,2533,2535,5,4,0,0,2534,2526,1,0,0,0,2534,2535,1,0,0,
-        0,2535,345,1,0,0,0,2536,2538,5,295,0,0,2537,2539,5,6,0,0,2538,2537,
-        1,0,0,0,2538,2539,1,0,0,0,2539,2540,1,0,0,0,2540,2564,3,330,165,
-        0,2541,2543,5,296,0,0,2542,2544,5,6,0,0,2543,2542,1,0,0,0,2543,2544,
-        1,0,0,0,2544,2545,1,0,0,0,2545,2564,3,330,165,0,2546,2548,5,297,
-        0,0,2547,2549,5,6,0,0,2548,2547,1,0,0,0,2548,2549,1,0,0,0,2549,2550,
-        1,0,0,0,2550,2564,3,330,165,0,2551,2553,5,298,0,0,2552,2554,5,6,
-        0,0,2553,2552,1,0,0,0,2553,2554,1,0,0,0,2554,2555,1,0,0,0,2555,2564,
-        3,330,165,0,2556,2558,5,284,0,0,2557,2559,5,6,0,0,2558,2557,1,0,
-        0,0,2558,2559,1,0,0,0,2559,2560,1,0,0,0,2560,2564,5,355,0,0,2561,
-        2564,3,348,174,0,2562,2564,3,350,175,0,2563,2536,1,0,0,0,2563,2541,
-        1,0,0,0,2563,2546,1,0,0,0,2563,2551,1,0,0,0,2563,2556,1,0,0,0,2563,
-        2561,1,0,0,0,2563,2562,1,0,0,0,2564,347,1,0,0,0,2565,2569,5,299,
-        0,0,2566,2568,3,350,175,0,2567,2566,1,0,0,0,2568,2571,1,0,0,0,2569,
-        2567,1,0,0,0,2569,2570,1,0,0,0,2570,349,1,0,0,0,2571,2569,1,0,0,
-        0,2572,2573,7,44,0,0,2573,2575,5,355,0,0,2574,2576,3,330,165,0,2575,
-        2574,1,0,0,0,2575,2576,1,0,0,0,2576,351,1,0,0,0,2577,2578,5,303,
-        0,0,2578,2581,3,330,165,0,2579,2580,5,252,0,0,2580,2582,3,330,165,
-        0,2581,2579,1,0,0,0,2581,2582,1,0,0,0,2582,2583,1,0,0,0,2583,2591,
-        5,3,0,0,2584,2590,3,354,177,0,2585,2590,3,358,179,0,2586,2590,3,
-        374,187,0,2587,2590,3,376,188,0,2588,2590,3,378,189,0,2589,2584,
-        1,0,0,0,2589,2585,1,0,0,0,2589,2586,1,0,0,0,2589,2587,1,0,0,0,2589,
-        2588,1,0,0,0,2590,2593,1,0,0,0,2591,2589,1,0,0,0,2591,2592,1,0,0,
-        0,2592,2594,1,0,0,0,2593,2591,1,0,0,0,2594,2595,5,4,0,0,2595,353,
-        1,0,0,0,2596,2597,5,304,0,0,2597,2598,3,330,165,0,2598,2604,5,3,
-        0,0,2599,2603,3,356,178,0,2600,2603,3,358,179,0,2601,2603,3,362,
-        181,0,2602,2599,1,0,0,0,2602,2600,1,0,0,0,2602,2601,1,0,0,0,2603,
-        2606,1,0,0,0,2604,2602,1,0,0,0,2604,2605,1,0,0,0,2605,2607,1,0,0,
-        0,2606,2604,1,0,0,0,2607,2608,5,4,0,0,2608,355,1,0,0,0,2609,2611,
-        5,305,0,0,2610,2612,5,6,0,0,2611,2610,1,0,0,0,2611,2612,1,0,0,0,
-        2612,2615,1,0,0,0,2613,2616,3,330,165,0,2614,2616,5,355,0,0,2615,
-        2613,1,0,0,0,2615,2614,1,0,0,0,2616,2633,1,0,0,0,2617,2619,5,306,
-        0,0,2618,2620,5,6,0,0,2619,2618,1,0,0,0,2619,2620,1,0,0,0,2620,2621,
-        1,0,0,0,2621,2633,5,355,0,0,2622,2624,5,285,0,0,2623,2625,5,6,0,
-        0,2624,2623,1,0,0,0,2624,2625,1,0,0,0,2625,2626,1,0,0,0,2626,2633,
-        5,355,0,0,2627,2629,5,286,0,0,2628,2630,5,6,0,0,2629,2628,1,0,0,
-        0,2629,2630,1,0,0,0,2630,2631,1,0,0,0,2631,2633,5,355,0,0,2632,2609,
-        1,0,0,0,2632,2617,1,0,0,0,2632,2622,1,0,0,0,2632,2627,1,0,0,0,2633,
-        357,1,0,0,0,2634,2635,5,307,0,0,2635,2636,3,330,165,0,2636,2641,
-        5,3,0,0,2637,2640,3,360,180,0,2638,2640,3,362,181,0,2639,2637,1,
-        0,0,0,2639,2638,1,0,0,0,2640,2643,1,0,0,0,2641,2639,1,0,0,0,2641,
-        2642,1,0,0,0,2642,2644,1,0,0,0,2643,2641,1,0,0,0,2644,2645,5,4,0,
-        0,2645,359,1,0,0,0,2646,2648,5,305,0,0,2647,2649,5,6,0,0,2648,2647,
-        1,0,0,0,2648,2649,1,0,0,0,2649,2652,1,0,0,0,2650,2653,3,330,165,
-        0,2651,2653,5,355,0,0,2652,2650,1,0,0,0,2652,2651,1,0,0,0,2653,2671,
-        1,0,0,0,2654,2671,5,287,0,0,2655,2657,5,306,0,0,2656,2658,5,6,0,
-        0,2657,2656,1,0,0,0,2657,2658,1,0,0,0,2658,2659,1,0,0,0,2659,2671,
-        5,355,0,0,2660,2662,5,285,0,0,2661,2663,5,6,0,0,2662,2661,1,0,0,
-        0,2662,2663,1,0,0,0,2663,2664,1,0,0,0,2664,2671,5,355,0,0,2665,2667,
-        5,286,0,0,2666,2668,5,6,0,0,2667,2666,1,0,0,0,2667,2668,1,0,0,0,
-        2668,2669,1,0,0,0,2669,2671,5,355,0,0,2670,2646,1,0,0,0,2670,2654,
-        1,0,0,0,2670,2655,1,0,0,0,2670,2660,1,0,0,0,2670,2665,1,0,0,0,2671,
-        361,1,0,0,0,2672,2673,7,45,0,0,2673,2682,3,330,165,0,2674,2678,5,
-        3,0,0,2675,2677,3,364,182,0,2676,2675,1,0,0,0,2677,2680,1,0,0,0,
-        2678,2676,1,0,0,0,2678,2679,1,0,0,0,2679,2681,1,0,0,0,2680,2678,
-        1,0,0,0,2681,2683,5,4,0,0,2682,2674,1,0,0,0,2682,2683,1,0,0,0,2683,
-        363,1,0,0,0,2684,2686,5,297,0,0,2685,2687,5,6,0,0,2686,2685,1,0,
-        0,0,2686,2687,1,0,0,0,2687,2688,1,0,0,0,2688,2701,3,330,165,0,2689,
-        2691,5,298,0,0,2690,2692,5,6,0,0,2691,2690,1,0,0,0,2691,2692,1,0,
-        0,0,2692,2693,1,0,0,0,2693,2701,3,330,165,0,2694,2696,5,299,0,0,
-        2695,2697,3,366,183,0,2696,2695,1,0,0,0,2697,2698,1,0,0,0,2698,2696,
-        1,0,0,0,2698,2699,1,0,0,0,2699,2701,1,0,0,0,2700,2684,1,0,0,0,2700,
-        2689,1,0,0,0,2700,2694,1,0,0,0,2701,365,1,0,0,0,2702,2705,3,368,
-        184,0,2703,2705,3,370,185,0,2704,2702,1,0,0,0,2704,2703,1,0,0,0,
-        2705,367,1,0,0,0,2706,2707,7,46,0,0,2707,2708,5,355,0,0,2708,369,
-        1,0,0,0,2709,2710,5,302,0,0,2710,2713,5,355,0,0,2711,2714,3,330,
-        165,0,2712,2714,5,355,0,0,2713,2711,1,0,0,0,2713,2712,1,0,0,0,2713,
-        2714,1,0,0,0,2714,371,1,0,0,0,2715,2716,5,308,0,0,2716,2717,5,293,
-        0,0,2717,2722,5,355,0,0,2718,2719,5,309,0,0,2719,2720,5,293,0,0,
-        2720,2722,5,355,0,0,2721,2715,1,0,0,0,2721,2718,1,0,0,0,2722,373,
-        1,0,0,0,2723,2724,5,310,0,0,2724,2725,3,330,165,0,2725,2726,5,3,
-        0,0,2726,2728,5,255,0,0,2727,2729,7,39,0,0,2728,2727,1,0,0,0,2728,
-        2729,1,0,0,0,2729,2730,1,0,0,0,2730,2731,3,330,165,0,2731,2732,5,
-        244,0,0,2732,2733,5,269,0,0,2733,2734,5,355,0,0,2734,2735,5,311,
-        0,0,2735,2736,5,312,0,0,2736,2738,5,251,0,0,2737,2739,3,372,186,
-        0,2738,2737,1,0,0,0,2739,2740,1,0,0,0,2740,2738,1,0,0,0,2740,2741,
-        1,0,0,0,2741,2742,1,0,0,0,2742,2743,5,4,0,0,2743,375,1,0,0,0,2744,
-        2745,5,313,0,0,2745,2746,3,330,165,0,2746,2747,5,3,0,0,2747,2748,
-        5,314,0,0,2748,2749,5,249,0,0,2749,2750,5,315,0,0,2750,2751,5,316,
-        0,0,2751,2752,5,355,0,0,2752,2753,5,22,0,0,2753,2754,5,317,0,0,2754,
-        2755,5,318,0,0,2755,2756,5,319,0,0,2756,2767,5,167,0,0,2757,2768,
-        5,320,0,0,2758,2759,5,321,0,0,2759,2760,5,291,0,0,2760,2761,5,322,
-        0,0,2761,2768,5,246,0,0,2762,2763,5,320,0,0,2763,2764,5,22,0,0,2764,
-        2765,5,291,0,0,2765,2766,5,322,0,0,2766,2768,5,246,0,0,2767,2757,
-        1,0,0,0,2767,2758,1,0,0,0,2767,2762,1,0,0,0,2768,2769,1,0,0,0,2769,
-        2771,5,355,0,0,2770,2772,5,22,0,0,2771,2770,1,0,0,0,2771,2772,1,
-        0,0,0,2772,2773,1,0,0,0,2773,2774,5,323,0,0,2774,2775,5,324,0,0,
-        2775,2776,5,322,0,0,2776,2777,5,325,0,0,2777,2778,5,355,0,0,2778,
-        2779,5,351,0,0,2779,2780,5,249,0,0,2780,2781,5,326,0,0,2781,2782,
-        5,327,0,0,2782,2783,5,328,0,0,2783,2784,5,329,0,0,2784,2785,5,330,
-        0,0,2785,2786,5,88,0,0,2786,2787,5,331,0,0,2787,2788,5,355,0,0,2788,
-        2789,5,4,0,0,2789,377,1,0,0,0,2790,2791,5,332,0,0,2791,2792,3,330,
-        165,0,2792,2793,5,3,0,0,2793,2794,5,333,0,0,2794,2795,5,249,0,0,
-        2795,2796,5,267,0,0,2796,2797,5,293,0,0,2797,2798,5,249,0,0,2798,
-        2799,5,334,0,0,2799,2800,5,335,0,0,2800,2801,3,330,165,0,2801,2802,
-        5,336,0,0,2802,2803,5,355,0,0,2803,2804,5,337,0,0,2804,2805,5,338,
-        0,0,2805,2806,5,355,0,0,2806,2807,5,339,0,0,2807,2808,5,340,0,0,
-        2808,2809,5,341,0,0,2809,2810,5,311,0,0,2810,2811,5,355,0,0,2811,
-        2812,5,342,0,0,2812,2813,5,249,0,0,2813,2814,5,268,0,0,2814,2815,
-        5,293,0,0,2815,2816,5,343,0,0,2816,2817,5,341,0,0,2817,2818,5,311,
-        0,0,2818,2819,5,355,0,0,2819,2820,5,4,0,0,2820,379,1,0,0,0,2821,
-        2825,8,47,0,0,2822,2824,8,48,0,0,2823,2822,1,0,0,0,2824,2827,1,0,
-        0,0,2825,2823,1,0,0,0,2825,2826,1,0,0,0,2826,2829,1,0,0,0,2827,2825,
-        1,0,0,0,2828,2830,5,106,0,0,2829,2828,1,0,0,0,2829,2830,1,0,0,0,
-        2830,381,1,0,0,0,2831,2841,3,384,192,0,2832,2841,3,386,193,0,2833,
-        2841,3,388,194,0,2834,2841,3,390,195,0,2835,2841,3,392,196,0,2836,
-        2841,3,394,197,0,2837,2841,3,396,198,0,2838,2841,3,398,199,0,2839,
-        2841,3,410,205,0,2840,2831,1,0,0,0,2840,2832,1,0,0,0,2840,2833,1,
-        0,0,0,2840,2834,1,0,0,0,2840,2835,1,0,0,0,2840,2836,1,0,0,0,2840,
-        2837,1,0,0,0,2840,2838,1,0,0,0,2840,2839,1,0,0,0,2841,383,1,0,0,
-        0,2842,2843,5,74,0,0,2843,2844,5,355,0,0,2844,2853,5,3,0,0,2845,
-        2850,5,355,0,0,2846,2847,5,22,0,0,2847,2849,5,355,0,0,2848,2846,
-        1,0,0,0,2849,2852,1,0,0,0,2850,2848,1,0,0,0,2850,2851,1,0,0,0,2851,
-        2854,1,0,0,0,2852,2850,1,0,0,0,2853,2845,1,0,0,0,2853,2854,1,0,0,
-        0,2854,2855,1,0,0,0,2855,2857,5,4,0,0,2856,2858,5,106,0,0,2857,2856,
-        1,0,0,0,2857,2858,1,0,0,0,2858,385,1,0,0,0,2859,2860,5,76,0,0,2860,
-        2861,5,355,0,0,2861,2870,5,3,0,0,2862,2867,5,355,0,0,2863,2864,5,
-        22,0,0,2864,2866,5,355,0,0,2865,2863,1,0,0,0,2866,2869,1,0,0,0,2867,
-        2865,1,0,0,0,2867,2868,1,0,0,0,2868,2871,1,0,0,0,2869,2867,1,0,0,
-        0,2870,2862,1,0,0,0,2870,2871,1,0,0,0,2871,2872,1,0,0,0,2872,2874,
-        5,4,0,0,2873,2875,5,106,0,0,2874,2873,1,0,0,0,2874,2875,1,0,0,0,
-        2875,387,1,0,0,0,2876,2877,5,276,0,0,2877,2878,5,355,0,0,2878,2887,
-        5,3,0,0,2879,2884,5,355,0,0,2880,2881,5,22,0,0,2881,2883,5,355,0,
-        0,2882,2880,1,0,0,0,2883,2886,1,0,0,0,2884,2882,1,0,0,0,2884,2885,
-        1,0,0,0,2885,2888,1,0,0,0,2886,2884,1,0,0,0,2887,2879,1,0,0,0,2887,
-        2888,1,0,0,0,2888,2889,1,0,0,0,2889,2891,5,4,0,0,2890,2892,5,106,
-        0,0,2891,2890,1,0,0,0,2891,2892,1,0,0,0,2892,389,1,0,0,0,2893,2894,
-        5,277,0,0,2894,2895,5,355,0,0,2895,2904,5,3,0,0,2896,2901,5,355,
-        0,0,2897,2898,5,22,0,0,2898,2900,5,355,0,0,2899,2897,1,0,0,0,2900,
-        2903,1,0,0,0,2901,2899,1,0,0,0,2901,2902,1,0,0,0,2902,2905,1,0,0,
-        0,2903,2901,1,0,0,0,2904,2896,1,0,0,0,2904,2905,1,0,0,0,2905,2906,
-        1,0,0,0,2906,2908,5,4,0,0,2907,2909,5,106,0,0,2908,2907,1,0,0,0,
-        2908,2909,1,0,0,0,2909,391,1,0,0,0,2910,2911,5,278,0,0,2911,2912,
-        5,355,0,0,2912,2921,5,3,0,0,2913,2918,5,355,0,0,2914,2915,5,22,0,
-        0,2915,2917,5,355,0,0,2916,2914,1,0,0,0,2917,2920,1,0,0,0,2918,2916,
-        1,0,0,0,2918,2919,1,0,0,0,2919,2922,1,0,0,0,2920,2918,1,0,0,0,2921,
-        2913,1,0,0,0,2921,2922,1,0,0,0,2922,2923,1,0,0,0,2923,2925,5,4,0,
-        0,2924,2926,5,106,0,0,2925,2924,1,0,0,0,2925,2926,1,0,0,0,2926,393,
-        1,0,0,0,2927,2928,5,279,0,0,2928,2929,5,355,0,0,2929,2938,5,3,0,
-        0,2930,2935,5,355,0,0,2931,2932,5,22,0,0,2932,2934,5,355,0,0,2933,
-        2931,1,0,0,0,2934,2937,1,0,0,0,2935,2933,1,0,0,0,2935,2936,1,0,0,
-        0,2936,2939,1,0,0,0,2937,2935,1,0,0,0,2938,2930,1,0,0,0,2938,2939,
-        1,0,0,0,2939,2940,1,0,0,0,2940,2942,5,4,0,0,2941,2943,5,106,0,0,
-        2942,2941,1,0,0,0,2942,2943,1,0,0,0,2943,395,1,0,0,0,2944,2945,5,
-        280,0,0,2945,2949,5,3,0,0,2946,2948,3,410,205,0,2947,2946,1,0,0,
-        0,2948,2951,1,0,0,0,2949,2947,1,0,0,0,2949,2950,1,0,0,0,2950,2952,
-        1,0,0,0,2951,2949,1,0,0,0,2952,2953,5,4,0,0,2953,397,1,0,0,0,2954,
-        2955,5,240,0,0,2955,2956,3,330,165,0,2956,2960,5,3,0,0,2957,2959,
-        3,400,200,0,2958,2957,1,0,0,0,2959,2962,1,0,0,0,2960,2958,1,0,0,
-        0,2960,2961,1,0,0,0,2961,2963,1,0,0,0,2962,2960,1,0,0,0,2963,2964,
-        5,4,0,0,2964,399,1,0,0,0,2965,2969,3,402,201,0,2966,2969,3,404,202,
-        0,2967,2969,3,406,203,0,2968,2965,1,0,0,0,2968,2966,1,0,0,0,2968,
-        2967,1,0,0,0,2969,401,1,0,0,0,2970,2971,5,344,0,0,2971,2972,5,6,
-        0,0,2972,2973,5,345,0,0,2973,403,1,0,0,0,2974,2976,5,346,0,0,2975,
-        2977,3,408,204,0,2976,2975,1,0,0,0,2976,2977,1,0,0,0,2977,405,1,
-        0,0,0,2978,2980,5,347,0,0,2979,2981,3,408,204,0,2980,2979,1,0,0,
-        0,2980,2981,1,0,0,0,2981,407,1,0,0,0,2982,2989,5,355,0,0,2983,2985,
-        5,22,0,0,2984,2983,1,0,0,0,2984,2985,1,0,0,0,2985,2986,1,0,0,0,2986,
-        2988,5,355,0,0,2987,2984,1,0,0,0,2988,2991,1,0,0,0,2989,2987,1,0,
-        0,0,2989,2990,1,0,0,0,2990,409,1,0,0,0,2991,2989,1,0,0,0,2992,2999,
-        3,412,206,0,2993,2999,3,414,207,0,2994,2999,3,416,208,0,2995,2999,
-        3,418,209,0,2996,2999,3,420,210,0,2997,2999,3,422,211,0,2998,2992,
-        1,0,0,0,2998,2993,1,0,0,0,2998,2994,1,0,0,0,2998,2995,1,0,0,0,2998,
-        2996,1,0,0,0,2998,2997,1,0,0,0,2999,411,1,0,0,0,3000,3001,5,270,
-        0,0,3001,3002,5,3,0,0,3002,3003,5,266,0,0,3003,3005,3,330,165,0,
-        3004,3006,3,424,212,0,3005,3004,1,0,0,0,3005,3006,1,0,0,0,3006,3007,
-        1,0,0,0,3007,3008,5,4,0,0,3008,413,1,0,0,0,3009,3010,5,271,0,0,3010,
-        3011,5,3,0,0,3011,3012,5,266,0,0,3012,3014,3,330,165,0,3013,3015,
-        3,424,212,0,3014,3013,1,0,0,0,3014,3015,1,0,0,0,3015,3016,1,0,0,
-        0,3016,3017,5,4,0,0,3017,415,1,0,0,0,3018,3019,5,272,0,0,3019,3020,
-        5,3,0,0,3020,3021,5,266,0,0,3021,3023,3,330,165,0,3022,3024,3,424,
-        212,0,3023,3022,1,0,0,0,3023,3024,1,0,0,0,3024,3025,1,0,0,0,3025,
-        3026,5,4,0,0,3026,417,1,0,0,0,3027,3028,5,273,0,0,3028,3029,5,3,
-        0,0,3029,3030,5,266,0,0,3030,3032,3,330,165,0,3031,3033,3,424,212,
-        0,3032,3031,1,0,0,0,3032,3033,1,0,0,0,3033,3034,1,0,0,0,3034,3035,
-        5,4,0,0,3035,419,1,0,0,0,3036,3037,5,274,0,0,3037,3038,5,3,0,0,3038,
-        3039,5,266,0,0,3039,3041,3,330,165,0,3040,3042,3,424,212,0,3041,
-        3040,1,0,0,0,3041,3042,1,0,0,0,3042,3043,1,0,0,0,3043,3044,5,4,0,
-        0,3044,421,1,0,0,0,3045,3046,5,275,0,0,3046,3047,5,3,0,0,3047,3048,
-        5,266,0,0,3048,3050,3,330,165,0,3049,3051,3,424,212,0,3050,3049,
-        1,0,0,0,3050,3051,1,0,0,0,3051,3052,1,0,0,0,3052,3053,5,4,0,0,3053,
-        423,1,0,0,0,3054,3059,5,355,0,0,3055,3056,5,22,0,0,3056,3058,5,355,
-        0,0,3057,3055,1,0,0,0,3058,3061,1,0,0,0,3059,3057,1,0,0,0,3059,3060,
-        1,0,0,0,3060,425,1,0,0,0,3061,3059,1,0,0,0,3062,3067,3,330,165,0,
-        3063,3064,5,22,0,0,3064,3066,3,330,165,0,3065,3063,1,0,0,0,3066,
-        3069,1,0,0,0,3067,3065,1,0,0,0,3067,3068,1,0,0,0,3068,427,1,0,0,
-        0,3069,3067,1,0,0,0,3070,3075,3,430,215,0,3071,3072,5,22,0,0,3072,
-        3074,3,430,215,0,3073,3071,1,0,0,0,3074,3077,1,0,0,0,3075,3073,1,
-        0,0,0,3075,3076,1,0,0,0,3076,429,1,0,0,0,3077,3075,1,0,0,0,3078,
-        3083,3,330,165,0,3079,3080,5,348,0,0,3080,3082,3,330,165,0,3081,
-        3079,1,0,0,0,3082,3085,1,0,0,0,3083,3081,1,0,0,0,3083,3084,1,0,0,
-        0,3084,431,1,0,0,0,3085,3083,1,0,0,0,3086,3091,3,330,165,0,3087,
-        3088,7,49,0,0,3088,3090,3,330,165,0,3089,3087,1,0,0,0,3090,3093,
-        1,0,0,0,3091,3089,1,0,0,0,3091,3092,1,0,0,0,3092,433,1,0,0,0,3093,
-        3091,1,0,0,0,435,436,438,462,466,472,478,485,490,495,506,512,516,
+        1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,190,1,190,5,190,2831,
+        8,190,10,190,12,190,2834,9,190,1,190,3,190,2837,8,190,1,191,1,191,
+        1,191,1,191,1,191,1,191,1,191,1,191,1,191,3,191,2848,8,191,1,192,
+        1,192,1,192,1,192,1,192,1,192,5,192,2856,8,192,10,192,12,192,2859,
+        9,192,3,192,2861,8,192,1,192,1,192,3,192,2865,8,192,1,193,1,193,
+        1,193,1,193,1,193,1,193,5,193,2873,8,193,10,193,12,193,2876,9,193,
+        3,193,2878,8,193,1,193,1,193,3,193,2882,8,193,1,194,1,194,1,194,
+        1,194,1,194,1,194,5,194,2890,8,194,10,194,12,194,2893,9,194,3,194,
+        2895,8,194,1,194,1,194,3,194,2899,8,194,1,195,1,195,1,195,1,195,
+        1,195,1,195,5,195,2907,8,195,10,195,12,195,2910,9,195,3,195,2912,
+        8,195,1,195,1,195,3,195,2916,8,195,1,196,1,196,1,196,1,196,1,196,
+        1,196,5,196,2924,8,196,10,196,12,196,2927,9,196,3,196,2929,8,196,
+        1,196,1,196,3,196,2933,8,196,1,197,1,197,1,197,1,197,1,197,1,197,
+        5,197,2941,8,197,10,197,12,197,2944,9,197,3,197,2946,8,197,1,197,
+        1,197,3,197,2950,8,197,1,198,1,198,1,198,5,198,2955,8,198,10,198,
+        12,198,2958,9,198,1,198,1,198,1,199,1,199,1,199,1,199,5,199,2966,
+        8,199,10,199,12,199,2969,9,199,1,199,1,199,1,200,1,200,1,200,3,200,
+        2976,8,200,1,201,1,201,1,201,1,201,1,202,1,202,3,202,2984,8,202,
+        1,203,1,203,3,203,2988,8,203,1,204,1,204,3,204,2992,8,204,1,204,
+        5,204,2995,8,204,10,204,12,204,2998,9,204,1,205,1,205,1,205,1,205,
+        1,205,1,205,3,205,3006,8,205,1,206,1,206,1,206,1,206,1,206,3,206,
+        3013,8,206,1,206,1,206,1,207,1,207,1,207,1,207,1,207,3,207,3022,
+        8,207,1,207,1,207,1,208,1,208,1,208,1,208,1,208,3,208,3031,8,208,
+        1,208,1,208,1,209,1,209,1,209,1,209,1,209,3,209,3040,8,209,1,209,
+        1,209,1,210,1,210,1,210,1,210,1,210,3,210,3049,8,210,1,210,1,210,
+        1,211,1,211,1,211,1,211,1,211,3,211,3058,8,211,1,211,1,211,1,212,
+        1,212,1,212,5,212,3065,8,212,10,212,12,212,3068,9,212,1,213,1,213,
+        1,213,5,213,3073,8,213,10,213,12,213,3076,9,213,1,214,1,214,1,214,
+        5,214,3081,8,214,10,214,12,214,3084,9,214,1,215,1,215,1,215,5,215,
+        3089,8,215,10,215,12,215,3092,9,215,1,216,1,216,1,216,5,216,3097,
+        8,216,10,216,12,216,3100,9,216,1,216,0,0,217,0,2,4,6,8,10,12,14,
+        16,18,20,22,24,26,28,30,32,34,36,38,40,42,44,46,48,50,52,54,56,58,
+        60,62,64,66,68,70,72,74,76,78,80,82,84,86,88,90,92,94,96,98,100,
+        102,104,106,108,110,112,114,116,118,120,122,124,126,128,130,132,
+        134,136,138,140,142,144,146,148,150,152,154,156,158,160,162,164,
+        166,168,170,172,174,176,178,180,182,184,186,188,190,192,194,196,
+        198,200,202,204,206,208,210,212,214,216,218,220,222,224,226,228,
+        230,232,234,236,238,240,242,244,246,248,250,252,254,256,258,260,
+        262,264,266,268,270,272,274,276,278,280,282,284,286,288,290,292,
+        294,296,298,300,302,304,306,308,310,312,314,316,318,320,322,324,
+        326,328,330,332,334,336,338,340,342,344,346,348,350,352,354,356,
+        358,360,362,364,366,368,370,372,374,376,378,380,382,384,386,388,
+        390,392,394,396,398,400,402,404,406,408,410,412,414,416,418,420,
+        422,424,426,428,430,432,0,50,1,0,9,11,2,0,9,9,12,13,1,0,15,20,1,
+        0,24,33,1,0,34,36,1,0,40,44,2,0,9,9,54,57,1,0,58,59,2,0,9,9,60,63,
+        2,0,9,9,67,69,1,0,99,100,1,0,101,102,2,0,353,353,355,355,1,0,113,
+        114,1,0,115,116,1,0,117,118,5,0,80,80,90,90,94,95,98,98,119,153,
+        1,0,155,156,2,0,157,158,350,350,1,0,162,165,1,0,173,176,1,0,177,
+        178,2,0,9,9,186,188,3,0,9,9,186,186,189,190,3,0,9,9,186,186,191,
+        192,1,0,197,200,1,0,207,208,2,0,195,195,209,209,2,0,81,81,218,220,
+        2,0,102,102,222,222,1,0,223,224,2,0,222,222,227,227,1,0,232,233,
+        1,0,235,239,3,0,246,246,350,350,354,355,1,0,247,249,2,0,250,250,
+        352,352,2,0,167,167,251,252,1,0,4,4,1,0,247,248,2,0,256,256,354,
+        354,1,0,260,261,1,0,264,265,22,0,9,9,24,33,72,72,80,80,90,90,94,
+        95,98,98,100,100,102,102,119,153,167,167,173,193,196,196,201,201,
+        228,229,235,236,238,239,241,251,254,259,262,292,350,352,354,354,
+        1,0,300,302,1,0,288,289,2,0,290,290,300,301,17,0,2,4,45,45,64,65,
+        70,70,74,74,76,76,97,97,99,106,112,112,201,204,221,221,223,223,232,
+        232,240,240,253,253,289,289,303,303,2,0,3,4,106,106,2,0,14,14,348,
+        349,3539,0,438,1,0,0,0,2,443,1,0,0,0,4,462,1,0,0,0,6,464,1,0,0,0,
+        8,495,1,0,0,0,10,497,1,0,0,0,12,499,1,0,0,0,14,501,1,0,0,0,16,520,
+        1,0,0,0,18,523,1,0,0,0,20,530,1,0,0,0,22,537,1,0,0,0,24,539,1,0,
+        0,0,26,550,1,0,0,0,28,552,1,0,0,0,30,569,1,0,0,0,32,571,1,0,0,0,
+        34,573,1,0,0,0,36,590,1,0,0,0,38,639,1,0,0,0,40,641,1,0,0,0,42,643,
+        1,0,0,0,44,645,1,0,0,0,46,647,1,0,0,0,48,652,1,0,0,0,50,668,1,0,
+        0,0,52,670,1,0,0,0,54,706,1,0,0,0,56,712,1,0,0,0,58,714,1,0,0,0,
+        60,720,1,0,0,0,62,726,1,0,0,0,64,735,1,0,0,0,66,738,1,0,0,0,68,766,
+        1,0,0,0,70,828,1,0,0,0,72,831,1,0,0,0,74,859,1,0,0,0,76,926,1,0,
+        0,0,78,929,1,0,0,0,80,957,1,0,0,0,82,1008,1,0,0,0,84,1011,1,0,0,
+        0,86,1039,1,0,0,0,88,1095,1,0,0,0,90,1097,1,0,0,0,92,1102,1,0,0,
+        0,94,1123,1,0,0,0,96,1126,1,0,0,0,98,1130,1,0,0,0,100,1148,1,0,0,
+        0,102,1177,1,0,0,0,104,1188,1,0,0,0,106,1190,1,0,0,0,108,1228,1,
+        0,0,0,110,1230,1,0,0,0,112,1238,1,0,0,0,114,1252,1,0,0,0,116,1254,
+        1,0,0,0,118,1273,1,0,0,0,120,1312,1,0,0,0,122,1319,1,0,0,0,124,1350,
+        1,0,0,0,126,1405,1,0,0,0,128,1407,1,0,0,0,130,1421,1,0,0,0,132,1423,
+        1,0,0,0,134,1425,1,0,0,0,136,1435,1,0,0,0,138,1439,1,0,0,0,140,1474,
+        1,0,0,0,142,1477,1,0,0,0,144,1497,1,0,0,0,146,1528,1,0,0,0,148,1530,
+        1,0,0,0,150,1535,1,0,0,0,152,1541,1,0,0,0,154,1543,1,0,0,0,156,1556,
+        1,0,0,0,158,1558,1,0,0,0,160,1591,1,0,0,0,162,1594,1,0,0,0,164,1601,
+        1,0,0,0,166,1603,1,0,0,0,168,1614,1,0,0,0,170,1626,1,0,0,0,172,1647,
+        1,0,0,0,174,1649,1,0,0,0,176,1729,1,0,0,0,178,1731,1,0,0,0,180,1733,
+        1,0,0,0,182,1735,1,0,0,0,184,1737,1,0,0,0,186,1747,1,0,0,0,188,1762,
+        1,0,0,0,190,1764,1,0,0,0,192,1793,1,0,0,0,194,1795,1,0,0,0,196,1797,
+        1,0,0,0,198,1809,1,0,0,0,200,1824,1,0,0,0,202,1826,1,0,0,0,204,1838,
+        1,0,0,0,206,1852,1,0,0,0,208,1854,1,0,0,0,210,1866,1,0,0,0,212,1878,
+        1,0,0,0,214,1880,1,0,0,0,216,1892,1,0,0,0,218,1905,1,0,0,0,220,1908,
+        1,0,0,0,222,1953,1,0,0,0,224,1964,1,0,0,0,226,1989,1,0,0,0,228,1991,
+        1,0,0,0,230,2013,1,0,0,0,232,2072,1,0,0,0,234,2074,1,0,0,0,236,2076,
+        1,0,0,0,238,2095,1,0,0,0,240,2097,1,0,0,0,242,2102,1,0,0,0,244,2116,
+        1,0,0,0,246,2118,1,0,0,0,248,2130,1,0,0,0,250,2135,1,0,0,0,252,2142,
+        1,0,0,0,254,2151,1,0,0,0,256,2163,1,0,0,0,258,2168,1,0,0,0,260,2174,
+        1,0,0,0,262,2183,1,0,0,0,264,2190,1,0,0,0,266,2194,1,0,0,0,268,2198,
+        1,0,0,0,270,2200,1,0,0,0,272,2204,1,0,0,0,274,2213,1,0,0,0,276,2224,
+        1,0,0,0,278,2228,1,0,0,0,280,2236,1,0,0,0,282,2254,1,0,0,0,284,2258,
+        1,0,0,0,286,2260,1,0,0,0,288,2279,1,0,0,0,290,2281,1,0,0,0,292,2287,
+        1,0,0,0,294,2299,1,0,0,0,296,2324,1,0,0,0,298,2330,1,0,0,0,300,2332,
+        1,0,0,0,302,2346,1,0,0,0,304,2358,1,0,0,0,306,2360,1,0,0,0,308,2363,
+        1,0,0,0,310,2366,1,0,0,0,312,2375,1,0,0,0,314,2377,1,0,0,0,316,2387,
+        1,0,0,0,318,2394,1,0,0,0,320,2398,1,0,0,0,322,2416,1,0,0,0,324,2432,
+        1,0,0,0,326,2448,1,0,0,0,328,2477,1,0,0,0,330,2481,1,0,0,0,332,2483,
+        1,0,0,0,334,2489,1,0,0,0,336,2495,1,0,0,0,338,2501,1,0,0,0,340,2517,
+        1,0,0,0,342,2519,1,0,0,0,344,2531,1,0,0,0,346,2570,1,0,0,0,348,2572,
+        1,0,0,0,350,2579,1,0,0,0,352,2584,1,0,0,0,354,2603,1,0,0,0,356,2639,
+        1,0,0,0,358,2641,1,0,0,0,360,2677,1,0,0,0,362,2679,1,0,0,0,364,2707,
+        1,0,0,0,366,2711,1,0,0,0,368,2713,1,0,0,0,370,2716,1,0,0,0,372,2728,
+        1,0,0,0,374,2730,1,0,0,0,376,2751,1,0,0,0,378,2797,1,0,0,0,380,2828,
+        1,0,0,0,382,2847,1,0,0,0,384,2849,1,0,0,0,386,2866,1,0,0,0,388,2883,
+        1,0,0,0,390,2900,1,0,0,0,392,2917,1,0,0,0,394,2934,1,0,0,0,396,2951,
+        1,0,0,0,398,2961,1,0,0,0,400,2975,1,0,0,0,402,2977,1,0,0,0,404,2981,
+        1,0,0,0,406,2985,1,0,0,0,408,2989,1,0,0,0,410,3005,1,0,0,0,412,3007,
+        1,0,0,0,414,3016,1,0,0,0,416,3025,1,0,0,0,418,3034,1,0,0,0,420,3043,
+        1,0,0,0,422,3052,1,0,0,0,424,3061,1,0,0,0,426,3069,1,0,0,0,428,3077,
+        1,0,0,0,430,3085,1,0,0,0,432,3093,1,0,0,0,434,437,3,2,1,0,435,437,
+        3,4,2,0,436,434,1,0,0,0,436,435,1,0,0,0,437,440,1,0,0,0,438,436,
+        1,0,0,0,438,439,1,0,0,0,439,441,1,0,0,0,440,438,1,0,0,0,441,442,
+        5,0,0,1,442,1,1,0,0,0,443,444,5,1,0,0,444,445,5,355,0,0,445,3,1,
+        0,0,0,446,463,3,398,199,0,447,463,3,384,192,0,448,463,3,386,193,
+        0,449,463,3,388,194,0,450,463,3,390,195,0,451,463,3,392,196,0,452,
+        463,3,394,197,0,453,463,3,396,198,0,454,463,3,54,27,0,455,463,3,
+        6,3,0,456,463,3,34,17,0,457,463,3,46,23,0,458,463,3,286,143,0,459,
+        463,3,338,169,0,460,463,3,352,176,0,461,463,3,320,160,0,462,446,
+        1,0,0,0,462,447,1,0,0,0,462,448,1,0,0,0,462,449,1,0,0,0,462,450,
+        1,0,0,0,462,451,1,0,0,0,462,452,1,0,0,0,462,453,1,0,0,0,462,454,
+        1,0,0,0,462,455,1,0,0,0,462,456,1,0,0,0,462,457,1,0,0,0,462,458,
+        1,0,0,0,462,459,1,0,0,0,462,460,1,0,0,0,462,461,1,0,0,0,463,5,1,
+        0,0,0,464,466,5,2,0,0,465,467,3,330,165,0,466,465,1,0,0,0,466,467,
+        1,0,0,0,467,468,1,0,0,0,468,472,5,3,0,0,469,471,3,8,4,0,470,469,
+        1,0,0,0,471,474,1,0,0,0,472,470,1,0,0,0,472,473,1,0,0,0,473,478,
+        1,0,0,0,474,472,1,0,0,0,475,477,3,14,7,0,476,475,1,0,0,0,477,480,
+        1,0,0,0,478,476,1,0,0,0,478,479,1,0,0,0,479,481,1,0,0,0,480,478,
+        1,0,0,0,481,482,5,4,0,0,482,7,1,0,0,0,483,485,5,5,0,0,484,486,5,
+        6,0,0,485,484,1,0,0,0,485,486,1,0,0,0,486,487,1,0,0,0,487,496,3,
+        10,5,0,488,490,5,7,0,0,489,491,5,6,0,0,490,489,1,0,0,0,490,491,1,
+        0,0,0,491,492,1,0,0,0,492,496,3,12,6,0,493,494,5,8,0,0,494,496,3,
+        426,213,0,495,483,1,0,0,0,495,488,1,0,0,0,495,493,1,0,0,0,496,9,
+        1,0,0,0,497,498,7,0,0,0,498,11,1,0,0,0,499,500,7,1,0,0,500,13,1,
+        0,0,0,501,502,3,18,9,0,502,503,3,16,8,0,503,506,3,20,10,0,504,505,
+        5,14,0,0,505,507,5,354,0,0,506,504,1,0,0,0,506,507,1,0,0,0,507,516,
+        1,0,0,0,508,512,5,3,0,0,509,511,3,30,15,0,510,509,1,0,0,0,511,514,
+        1,0,0,0,512,510,1,0,0,0,512,513,1,0,0,0,513,515,1,0,0,0,514,512,
+        1,0,0,0,515,517,5,4,0,0,516,508,1,0,0,0,516,517,1,0,0,0,517,15,1,
+        0,0,0,518,521,3,28,14,0,519,521,3,22,11,0,520,518,1,0,0,0,520,519,
+        1,0,0,0,521,17,1,0,0,0,522,524,3,24,12,0,523,522,1,0,0,0,523,524,
+        1,0,0,0,524,525,1,0,0,0,525,527,3,330,165,0,526,528,3,24,12,0,527,
+        526,1,0,0,0,527,528,1,0,0,0,528,19,1,0,0,0,529,531,3,24,12,0,530,
+        529,1,0,0,0,530,531,1,0,0,0,531,532,1,0,0,0,532,535,3,330,165,0,
+        533,534,4,10,0,0,534,536,3,24,12,0,535,533,1,0,0,0,535,536,1,0,0,
+        0,536,21,1,0,0,0,537,538,7,2,0,0,538,23,1,0,0,0,539,540,5,21,0,0,
+        540,545,3,26,13,0,541,542,5,22,0,0,542,544,3,26,13,0,543,541,1,0,
+        0,0,544,547,1,0,0,0,545,543,1,0,0,0,545,546,1,0,0,0,546,548,1,0,
+        0,0,547,545,1,0,0,0,548,549,5,23,0,0,549,25,1,0,0,0,550,551,7,3,
+        0,0,551,27,1,0,0,0,552,553,7,4,0,0,553,29,1,0,0,0,554,556,5,37,0,
+        0,555,557,5,6,0,0,556,555,1,0,0,0,556,557,1,0,0,0,557,558,1,0,0,
+        0,558,570,5,355,0,0,559,561,5,38,0,0,560,562,5,6,0,0,561,560,1,0,
+        0,0,561,562,1,0,0,0,562,563,1,0,0,0,563,570,3,32,16,0,564,566,5,
+        39,0,0,565,567,5,6,0,0,566,565,1,0,0,0,566,567,1,0,0,0,567,568,1,
+        0,0,0,568,570,3,426,213,0,569,554,1,0,0,0,569,559,1,0,0,0,569,564,
+        1,0,0,0,570,31,1,0,0,0,571,572,7,5,0,0,572,33,1,0,0,0,573,574,5,
+        45,0,0,574,578,3,330,165,0,575,577,3,36,18,0,576,575,1,0,0,0,577,
+        580,1,0,0,0,578,576,1,0,0,0,578,579,1,0,0,0,579,582,1,0,0,0,580,
+        578,1,0,0,0,581,583,3,166,83,0,582,581,1,0,0,0,582,583,1,0,0,0,583,
+        35,1,0,0,0,584,585,5,46,0,0,585,591,3,426,213,0,586,587,5,47,0,0,
+        587,591,3,426,213,0,588,589,5,48,0,0,589,591,3,330,165,0,590,584,
+        1,0,0,0,590,586,1,0,0,0,590,588,1,0,0,0,591,37,1,0,0,0,592,594,5,
+        5,0,0,593,595,5,6,0,0,594,593,1,0,0,0,594,595,1,0,0,0,595,596,1,
+        0,0,0,596,640,3,40,20,0,597,599,5,49,0,0,598,600,5,6,0,0,599,598,
+        1,0,0,0,599,600,1,0,0,0,600,601,1,0,0,0,601,640,5,355,0,0,602,604,
+        5,37,0,0,603,605,5,6,0,0,604,603,1,0,0,0,604,605,1,0,0,0,605,606,
+        1,0,0,0,606,640,5,355,0,0,607,609,5,50,0,0,608,610,5,6,0,0,609,608,
+        1,0,0,0,609,610,1,0,0,0,610,611,1,0,0,0,611,616,5,355,0,0,612,613,
+        5,22,0,0,613,615,5,355,0,0,614,612,1,0,0,0,615,618,1,0,0,0,616,614,
+        1,0,0,0,616,617,1,0,0,0,617,640,1,0,0,0,618,616,1,0,0,0,619,621,
+        5,51,0,0,620,622,5,6,0,0,621,620,1,0,0,0,621,622,1,0,0,0,622,623,
+        1,0,0,0,623,640,3,42,21,0,624,626,5,52,0,0,625,627,5,6,0,0,626,625,
+        1,0,0,0,626,627,1,0,0,0,627,628,1,0,0,0,628,640,5,355,0,0,629,631,
+        5,53,0,0,630,632,5,6,0,0,631,630,1,0,0,0,631,632,1,0,0,0,632,633,
+        1,0,0,0,633,640,3,44,22,0,634,636,5,47,0,0,635,637,5,6,0,0,636,635,
+        1,0,0,0,636,637,1,0,0,0,637,638,1,0,0,0,638,640,3,426,213,0,639,
+        592,1,0,0,0,639,597,1,0,0,0,639,602,1,0,0,0,639,607,1,0,0,0,639,
+        619,1,0,0,0,639,624,1,0,0,0,639,629,1,0,0,0,639,634,1,0,0,0,640,
+        39,1,0,0,0,641,642,7,6,0,0,642,41,1,0,0,0,643,644,7,7,0,0,644,43,
+        1,0,0,0,645,646,7,8,0,0,646,45,1,0,0,0,647,648,5,64,0,0,648,650,
+        3,330,165,0,649,651,3,166,83,0,650,649,1,0,0,0,650,651,1,0,0,0,651,
+        47,1,0,0,0,652,653,5,65,0,0,653,656,3,330,165,0,654,655,5,66,0,0,
+        655,657,3,426,213,0,656,654,1,0,0,0,656,657,1,0,0,0,657,663,1,0,
+        0,0,658,660,5,5,0,0,659,661,5,6,0,0,660,659,1,0,0,0,660,661,1,0,
+        0,0,661,662,1,0,0,0,662,664,3,50,25,0,663,658,1,0,0,0,663,664,1,
+        0,0,0,664,666,1,0,0,0,665,667,3,166,83,0,666,665,1,0,0,0,666,667,
+        1,0,0,0,667,49,1,0,0,0,668,669,7,9,0,0,669,51,1,0,0,0,670,671,5,
+        70,0,0,671,673,3,330,165,0,672,674,3,166,83,0,673,672,1,0,0,0,673,
+        674,1,0,0,0,674,53,1,0,0,0,675,677,5,355,0,0,676,675,1,0,0,0,676,
+        677,1,0,0,0,677,678,1,0,0,0,678,679,5,71,0,0,679,680,3,330,165,0,
+        680,681,5,3,0,0,681,682,5,72,0,0,682,683,5,6,0,0,683,687,3,430,215,
+        0,684,686,3,56,28,0,685,684,1,0,0,0,686,689,1,0,0,0,687,685,1,0,
+        0,0,687,688,1,0,0,0,688,690,1,0,0,0,689,687,1,0,0,0,690,691,5,4,
+        0,0,691,707,1,0,0,0,692,694,5,355,0,0,693,692,1,0,0,0,693,694,1,
+        0,0,0,694,695,1,0,0,0,695,696,5,73,0,0,696,697,3,330,165,0,697,701,
+        5,3,0,0,698,700,3,56,28,0,699,698,1,0,0,0,700,703,1,0,0,0,701,699,
+        1,0,0,0,701,702,1,0,0,0,702,704,1,0,0,0,703,701,1,0,0,0,704,705,
+        5,4,0,0,705,707,1,0,0,0,706,676,1,0,0,0,706,693,1,0,0,0,707,55,1,
+        0,0,0,708,713,3,196,98,0,709,713,3,202,101,0,710,713,3,208,104,0,
+        711,713,3,60,30,0,712,708,1,0,0,0,712,709,1,0,0,0,712,710,1,0,0,
+        0,712,711,1,0,0,0,713,57,1,0,0,0,714,715,5,74,0,0,715,717,3,330,
+        165,0,716,718,3,166,83,0,717,716,1,0,0,0,717,718,1,0,0,0,718,59,
+        1,0,0,0,719,721,5,355,0,0,720,719,1,0,0,0,720,721,1,0,0,0,721,722,
+        1,0,0,0,722,723,3,62,31,0,723,61,1,0,0,0,724,727,3,64,32,0,725,727,
+        3,106,53,0,726,724,1,0,0,0,726,725,1,0,0,0,727,63,1,0,0,0,728,736,
+        3,66,33,0,729,736,3,72,36,0,730,736,3,78,39,0,731,736,3,84,42,0,
+        732,736,3,98,49,0,733,736,3,90,45,0,734,736,3,116,58,0,735,728,1,
+        0,0,0,735,729,1,0,0,0,735,730,1,0,0,0,735,731,1,0,0,0,735,732,1,
+        0,0,0,735,733,1,0,0,0,735,734,1,0,0,0,736,65,1,0,0,0,737,739,5,75,
+        0,0,738,737,1,0,0,0,738,739,1,0,0,0,739,740,1,0,0,0,740,741,5,76,
+        0,0,741,747,3,330,165,0,742,744,5,77,0,0,743,745,5,78,0,0,744,743,
+        1,0,0,0,744,745,1,0,0,0,745,746,1,0,0,0,746,748,3,330,165,0,747,
+        742,1,0,0,0,747,748,1,0,0,0,748,760,1,0,0,0,749,750,5,351,0,0,750,
+        755,3,96,48,0,751,752,5,22,0,0,752,754,3,96,48,0,753,751,1,0,0,0,
+        754,757,1,0,0,0,755,753,1,0,0,0,755,756,1,0,0,0,756,759,1,0,0,0,
+        757,755,1,0,0,0,758,749,1,0,0,0,759,762,1,0,0,0,760,758,1,0,0,0,
+        760,761,1,0,0,0,761,764,1,0,0,0,762,760,1,0,0,0,763,765,3,68,34,
+        0,764,763,1,0,0,0,764,765,1,0,0,0,765,67,1,0,0,0,766,771,5,3,0,0,
+        767,770,3,70,35,0,768,770,3,122,61,0,769,767,1,0,0,0,769,768,1,0,
+        0,0,770,773,1,0,0,0,771,769,1,0,0,0,771,772,1,0,0,0,772,774,1,0,
+        0,0,773,771,1,0,0,0,774,775,5,4,0,0,775,69,1,0,0,0,776,778,5,79,
+        0,0,777,779,5,78,0,0,778,777,1,0,0,0,778,779,1,0,0,0,779,780,1,0,
+        0,0,780,829,3,430,215,0,781,782,5,80,0,0,782,783,5,6,0,0,783,829,
+        5,355,0,0,784,785,5,81,0,0,785,786,5,6,0,0,786,829,3,430,215,0,787,
+        788,5,82,0,0,788,789,5,6,0,0,789,829,5,355,0,0,790,791,5,83,0,0,
+        791,792,5,6,0,0,792,829,5,355,0,0,793,794,5,84,0,0,794,795,5,6,0,
+        0,795,829,5,355,0,0,796,797,5,85,0,0,797,798,5,6,0,0,798,829,5,355,
+        0,0,799,800,5,86,0,0,800,801,5,6,0,0,801,829,5,355,0,0,802,803,5,
+        87,0,0,803,804,5,6,0,0,804,829,5,355,0,0,805,807,3,132,66,0,806,
+        805,1,0,0,0,806,807,1,0,0,0,807,808,1,0,0,0,808,829,5,88,0,0,809,
+        811,3,132,66,0,810,809,1,0,0,0,810,811,1,0,0,0,811,812,1,0,0,0,812,
+        829,5,89,0,0,813,815,3,132,66,0,814,813,1,0,0,0,814,815,1,0,0,0,
+        815,816,1,0,0,0,816,829,5,90,0,0,817,829,5,91,0,0,818,829,5,92,0,
+        0,819,829,5,93,0,0,820,821,5,94,0,0,821,822,5,6,0,0,822,829,5,355,
+        0,0,823,825,3,132,66,0,824,823,1,0,0,0,824,825,1,0,0,0,825,826,1,
+        0,0,0,826,829,5,95,0,0,827,829,5,96,0,0,828,776,1,0,0,0,828,781,
+        1,0,0,0,828,784,1,0,0,0,828,787,1,0,0,0,828,790,1,0,0,0,828,793,
+        1,0,0,0,828,796,1,0,0,0,828,799,1,0,0,0,828,802,1,0,0,0,828,806,
+        1,0,0,0,828,810,1,0,0,0,828,814,1,0,0,0,828,817,1,0,0,0,828,818,
+        1,0,0,0,828,819,1,0,0,0,828,820,1,0,0,0,828,824,1,0,0,0,828,827,
+        1,0,0,0,829,71,1,0,0,0,830,832,5,75,0,0,831,830,1,0,0,0,831,832,
+        1,0,0,0,832,833,1,0,0,0,833,834,5,97,0,0,834,840,3,330,165,0,835,
+        837,5,77,0,0,836,838,5,78,0,0,837,836,1,0,0,0,837,838,1,0,0,0,838,
+        839,1,0,0,0,839,841,3,330,165,0,840,835,1,0,0,0,840,841,1,0,0,0,
+        841,853,1,0,0,0,842,843,5,351,0,0,843,848,3,96,48,0,844,845,5,22,
+        0,0,845,847,3,96,48,0,846,844,1,0,0,0,847,850,1,0,0,0,848,846,1,
+        0,0,0,848,849,1,0,0,0,849,852,1,0,0,0,850,848,1,0,0,0,851,842,1,
+        0,0,0,852,855,1,0,0,0,853,851,1,0,0,0,853,854,1,0,0,0,854,857,1,
+        0,0,0,855,853,1,0,0,0,856,858,3,74,37,0,857,856,1,0,0,0,857,858,
+        1,0,0,0,858,73,1,0,0,0,859,863,5,3,0,0,860,862,3,76,38,0,861,860,
+        1,0,0,0,862,865,1,0,0,0,863,861,1,0,0,0,863,864,1,0,0,0,864,869,
+        1,0,0,0,865,863,1,0,0,0,866,868,3,122,61,0,867,866,1,0,0,0,868,871,
+        1,0,0,0,869,867,1,0,0,0,869,870,1,0,0,0,870,872,1,0,0,0,871,869,
+        1,0,0,0,872,873,5,4,0,0,873,75,1,0,0,0,874,876,5,79,0,0,875,877,
+        5,78,0,0,876,875,1,0,0,0,876,877,1,0,0,0,877,878,1,0,0,0,878,927,
+        3,430,215,0,879,880,5,81,0,0,880,881,5,6,0,0,881,927,3,430,215,0,
+        882,883,5,80,0,0,883,884,5,6,0,0,884,927,5,355,0,0,885,927,5,91,
+        0,0,886,927,5,92,0,0,887,927,5,93,0,0,888,889,5,94,0,0,889,890,5,
+        6,0,0,890,927,5,355,0,0,891,893,3,132,66,0,892,891,1,0,0,0,892,893,
+        1,0,0,0,893,894,1,0,0,0,894,927,5,95,0,0,895,897,3,132,66,0,896,
+        895,1,0,0,0,896,897,1,0,0,0,897,898,1,0,0,0,898,927,5,98,0,0,899,
+        901,3,132,66,0,900,899,1,0,0,0,900,901,1,0,0,0,901,902,1,0,0,0,902,
+        927,5,90,0,0,903,905,3,132,66,0,904,903,1,0,0,0,904,905,1,0,0,0,
+        905,906,1,0,0,0,906,927,5,89,0,0,907,927,5,96,0,0,908,909,5,87,0,
+        0,909,910,5,6,0,0,910,927,5,355,0,0,911,912,5,82,0,0,912,913,5,6,
+        0,0,913,927,5,355,0,0,914,915,5,83,0,0,915,916,5,6,0,0,916,927,5,
+        355,0,0,917,918,5,84,0,0,918,919,5,6,0,0,919,927,5,355,0,0,920,921,
+        5,85,0,0,921,922,5,6,0,0,922,927,5,355,0,0,923,924,5,86,0,0,924,
+        925,5,6,0,0,925,927,5,355,0,0,926,874,1,0,0,0,926,879,1,0,0,0,926,
+        882,1,0,0,0,926,885,1,0,0,0,926,886,1,0,0,0,926,887,1,0,0,0,926,
+        888,1,0,0,0,926,892,1,0,0,0,926,896,1,0,0,0,926,900,1,0,0,0,926,
+        904,1,0,0,0,926,907,1,0,0,0,926,908,1,0,0,0,926,911,1,0,0,0,926,
+        914,1,0,0,0,926,917,1,0,0,0,926,920,1,0,0,0,926,923,1,0,0,0,927,
+        77,1,0,0,0,928,930,5,75,0,0,929,928,1,0,0,0,929,930,1,0,0,0,930,
+        931,1,0,0,0,931,932,7,10,0,0,932,938,3,330,165,0,933,935,5,77,0,
+        0,934,936,5,78,0,0,935,934,1,0,0,0,935,936,1,0,0,0,936,937,1,0,0,
+        0,937,939,3,330,165,0,938,933,1,0,0,0,938,939,1,0,0,0,939,951,1,
+        0,0,0,940,941,5,351,0,0,941,946,3,96,48,0,942,943,5,22,0,0,943,945,
+        3,96,48,0,944,942,1,0,0,0,945,948,1,0,0,0,946,944,1,0,0,0,946,947,
+        1,0,0,0,947,950,1,0,0,0,948,946,1,0,0,0,949,940,1,0,0,0,950,953,
+        1,0,0,0,951,949,1,0,0,0,951,952,1,0,0,0,952,955,1,0,0,0,953,951,
+        1,0,0,0,954,956,3,80,40,0,955,954,1,0,0,0,955,956,1,0,0,0,956,79,
+        1,0,0,0,957,962,5,3,0,0,958,961,3,82,41,0,959,961,3,122,61,0,960,
+        958,1,0,0,0,960,959,1,0,0,0,961,964,1,0,0,0,962,960,1,0,0,0,962,
+        963,1,0,0,0,963,965,1,0,0,0,964,962,1,0,0,0,965,966,5,4,0,0,966,
+        81,1,0,0,0,967,969,5,79,0,0,968,970,5,78,0,0,969,968,1,0,0,0,969,
+        970,1,0,0,0,970,971,1,0,0,0,971,1009,3,430,215,0,972,973,5,81,0,
+        0,973,974,5,6,0,0,974,1009,3,430,215,0,975,976,5,80,0,0,976,977,
+        5,6,0,0,977,1009,5,355,0,0,978,1009,5,91,0,0,979,1009,5,92,0,0,980,
+        1009,5,93,0,0,981,982,5,94,0,0,982,983,5,6,0,0,983,1009,5,355,0,
+        0,984,986,3,132,66,0,985,984,1,0,0,0,985,986,1,0,0,0,986,987,1,0,
+        0,0,987,1009,5,90,0,0,988,989,5,87,0,0,989,990,5,6,0,0,990,1009,
+        5,355,0,0,991,992,5,82,0,0,992,993,5,6,0,0,993,1009,5,355,0,0,994,
+        995,5,83,0,0,995,996,5,6,0,0,996,1009,5,355,0,0,997,998,5,84,0,0,
+        998,999,5,6,0,0,999,1009,5,355,0,0,1000,1001,5,85,0,0,1001,1002,
+        5,6,0,0,1002,1009,5,355,0,0,1003,1004,5,86,0,0,1004,1005,5,6,0,0,
+        1005,1009,5,355,0,0,1006,1009,5,96,0,0,1007,1009,5,98,0,0,1008,967,
+        1,0,0,0,1008,972,1,0,0,0,1008,975,1,0,0,0,1008,978,1,0,0,0,1008,
+        979,1,0,0,0,1008,980,1,0,0,0,1008,981,1,0,0,0,1008,985,1,0,0,0,1008,
+        988,1,0,0,0,1008,991,1,0,0,0,1008,994,1,0,0,0,1008,997,1,0,0,0,1008,
+        1000,1,0,0,0,1008,1003,1,0,0,0,1008,1006,1,0,0,0,1008,1007,1,0,0,
+        0,1009,83,1,0,0,0,1010,1012,5,75,0,0,1011,1010,1,0,0,0,1011,1012,
+        1,0,0,0,1012,1013,1,0,0,0,1013,1014,7,11,0,0,1014,1020,3,330,165,
+        0,1015,1017,5,77,0,0,1016,1018,5,78,0,0,1017,1016,1,0,0,0,1017,1018,
+        1,0,0,0,1018,1019,1,0,0,0,1019,1021,3,330,165,0,1020,1015,1,0,0,
+        0,1020,1021,1,0,0,0,1021,1033,1,0,0,0,1022,1023,5,351,0,0,1023,1028,
+        3,96,48,0,1024,1025,5,22,0,0,1025,1027,3,96,48,0,1026,1024,1,0,0,
+        0,1027,1030,1,0,0,0,1028,1026,1,0,0,0,1028,1029,1,0,0,0,1029,1032,
+        1,0,0,0,1030,1028,1,0,0,0,1031,1022,1,0,0,0,1032,1035,1,0,0,0,1033,
+        1031,1,0,0,0,1033,1034,1,0,0,0,1034,1037,1,0,0,0,1035,1033,1,0,0,
+        0,1036,1038,3,86,43,0,1037,1036,1,0,0,0,1037,1038,1,0,0,0,1038,85,
+        1,0,0,0,1039,1043,5,3,0,0,1040,1042,3,88,44,0,1041,1040,1,0,0,0,
+        1042,1045,1,0,0,0,1043,1041,1,0,0,0,1043,1044,1,0,0,0,1044,1049,
+        1,0,0,0,1045,1043,1,0,0,0,1046,1048,3,122,61,0,1047,1046,1,0,0,0,
+        1048,1051,1,0,0,0,1049,1047,1,0,0,0,1049,1050,1,0,0,0,1050,1052,
+        1,0,0,0,1051,1049,1,0,0,0,1052,1053,5,4,0,0,1053,87,1,0,0,0,1054,
+        1056,5,79,0,0,1055,1057,5,78,0,0,1056,1055,1,0,0,0,1056,1057,1,0,
+        0,0,1057,1058,1,0,0,0,1058,1096,3,430,215,0,1059,1060,5,81,0,0,1060,
+        1061,5,6,0,0,1061,1096,3,430,215,0,1062,1063,5,80,0,0,1063,1064,
+        5,6,0,0,1064,1096,5,355,0,0,1065,1096,5,91,0,0,1066,1096,5,92,0,
+        0,1067,1096,5,93,0,0,1068,1069,5,94,0,0,1069,1070,5,6,0,0,1070,1096,
+        5,355,0,0,1071,1073,3,132,66,0,1072,1071,1,0,0,0,1072,1073,1,0,0,
+        0,1073,1074,1,0,0,0,1074,1096,5,90,0,0,1075,1096,5,98,0,0,1076,1096,
+        5,96,0,0,1077,1078,5,87,0,0,1078,1079,5,6,0,0,1079,1096,5,355,0,
+        0,1080,1081,5,82,0,0,1081,1082,5,6,0,0,1082,1096,5,355,0,0,1083,
+        1084,5,83,0,0,1084,1085,5,6,0,0,1085,1096,5,355,0,0,1086,1087,5,
+        84,0,0,1087,1088,5,6,0,0,1088,1096,5,355,0,0,1089,1090,5,85,0,0,
+        1090,1091,5,6,0,0,1091,1096,5,355,0,0,1092,1093,5,86,0,0,1093,1094,
+        5,6,0,0,1094,1096,5,355,0,0,1095,1054,1,0,0,0,1095,1059,1,0,0,0,
+        1095,1062,1,0,0,0,1095,1065,1,0,0,0,1095,1066,1,0,0,0,1095,1067,
+        1,0,0,0,1095,1068,1,0,0,0,1095,1072,1,0,0,0,1095,1075,1,0,0,0,1095,
+        1076,1,0,0,0,1095,1077,1,0,0,0,1095,1080,1,0,0,0,1095,1083,1,0,0,
+        0,1095,1086,1,0,0,0,1095,1089,1,0,0,0,1095,1092,1,0,0,0,1096,89,
+        1,0,0,0,1097,1098,5,103,0,0,1098,1100,3,330,165,0,1099,1101,3,92,
+        46,0,1100,1099,1,0,0,0,1100,1101,1,0,0,0,1101,91,1,0,0,0,1102,1106,
+        5,3,0,0,1103,1105,3,94,47,0,1104,1103,1,0,0,0,1105,1108,1,0,0,0,
+        1106,1104,1,0,0,0,1106,1107,1,0,0,0,1107,1112,1,0,0,0,1108,1106,
+        1,0,0,0,1109,1111,3,122,61,0,1110,1109,1,0,0,0,1111,1114,1,0,0,0,
+        1112,1110,1,0,0,0,1112,1113,1,0,0,0,1113,1115,1,0,0,0,1114,1112,
+        1,0,0,0,1115,1116,5,4,0,0,1116,93,1,0,0,0,1117,1118,5,81,0,0,1118,
+        1119,5,6,0,0,1119,1124,3,430,215,0,1120,1121,5,94,0,0,1121,1122,
+        5,6,0,0,1122,1124,5,355,0,0,1123,1117,1,0,0,0,1123,1120,1,0,0,0,
+        1124,95,1,0,0,0,1125,1127,5,78,0,0,1126,1125,1,0,0,0,1126,1127,1,
+        0,0,0,1127,1128,1,0,0,0,1128,1129,3,330,165,0,1129,97,1,0,0,0,1130,
+        1131,5,104,0,0,1131,1137,3,330,165,0,1132,1134,5,77,0,0,1133,1135,
+        5,78,0,0,1134,1133,1,0,0,0,1134,1135,1,0,0,0,1135,1136,1,0,0,0,1136,
+        1138,3,330,165,0,1137,1132,1,0,0,0,1137,1138,1,0,0,0,1138,1142,1,
+        0,0,0,1139,1141,3,104,52,0,1140,1139,1,0,0,0,1141,1144,1,0,0,0,1142,
+        1140,1,0,0,0,1142,1143,1,0,0,0,1143,1146,1,0,0,0,1144,1142,1,0,0,
+        0,1145,1147,3,100,50,0,1146,1145,1,0,0,0,1146,1147,1,0,0,0,1147,
+        99,1,0,0,0,1148,1152,5,3,0,0,1149,1151,3,102,51,0,1150,1149,1,0,
+        0,0,1151,1154,1,0,0,0,1152,1150,1,0,0,0,1152,1153,1,0,0,0,1153,1158,
+        1,0,0,0,1154,1152,1,0,0,0,1155,1157,3,122,61,0,1156,1155,1,0,0,0,
+        1157,1160,1,0,0,0,1158,1156,1,0,0,0,1158,1159,1,0,0,0,1159,1161,
+        1,0,0,0,1160,1158,1,0,0,0,1161,1162,5,4,0,0,1162,101,1,0,0,0,1163,
+        1164,5,81,0,0,1164,1165,5,6,0,0,1165,1178,3,430,215,0,1166,1169,
+        5,80,0,0,1167,1168,5,6,0,0,1168,1170,5,355,0,0,1169,1167,1,0,0,0,
+        1169,1170,1,0,0,0,1170,1178,1,0,0,0,1171,1178,5,91,0,0,1172,1178,
+        5,92,0,0,1173,1178,5,93,0,0,1174,1175,5,94,0,0,1175,1176,5,6,0,0,
+        1176,1178,5,355,0,0,1177,1163,1,0,0,0,1177,1166,1,0,0,0,1177,1171,
+        1,0,0,0,1177,1172,1,0,0,0,1177,1173,1,0,0,0,1177,1174,1,0,0,0,1178,
+        103,1,0,0,0,1179,1189,5,91,0,0,1180,1189,5,92,0,0,1181,1189,5,93,
+        0,0,1182,1183,5,94,0,0,1183,1184,5,6,0,0,1184,1189,5,355,0,0,1185,
+        1186,5,80,0,0,1186,1187,5,6,0,0,1187,1189,5,355,0,0,1188,1179,1,
+        0,0,0,1188,1180,1,0,0,0,1188,1181,1,0,0,0,1188,1182,1,0,0,0,1188,
+        1185,1,0,0,0,1189,105,1,0,0,0,1190,1191,5,105,0,0,1191,1192,3,330,
+        165,0,1192,1196,5,3,0,0,1193,1195,3,108,54,0,1194,1193,1,0,0,0,1195,
+        1198,1,0,0,0,1196,1194,1,0,0,0,1196,1197,1,0,0,0,1197,1202,1,0,0,
+        0,1198,1196,1,0,0,0,1199,1201,3,110,55,0,1200,1199,1,0,0,0,1201,
+        1204,1,0,0,0,1202,1200,1,0,0,0,1202,1203,1,0,0,0,1203,1216,1,0,0,
+        0,1204,1202,1,0,0,0,1205,1210,3,112,56,0,1206,1207,5,22,0,0,1207,
+        1209,3,112,56,0,1208,1206,1,0,0,0,1209,1212,1,0,0,0,1210,1208,1,
+        0,0,0,1210,1211,1,0,0,0,1211,1214,1,0,0,0,1212,1210,1,0,0,0,1213,
+        1215,5,106,0,0,1214,1213,1,0,0,0,1214,1215,1,0,0,0,1215,1217,1,0,
+        0,0,1216,1205,1,0,0,0,1216,1217,1,0,0,0,1217,1218,1,0,0,0,1218,1219,
+        5,4,0,0,1219,107,1,0,0,0,1220,1221,5,81,0,0,1221,1222,5,6,0,0,1222,
+        1229,3,430,215,0,1223,1224,5,94,0,0,1224,1225,5,6,0,0,1225,1229,
+        5,355,0,0,1226,1229,5,107,0,0,1227,1229,5,108,0,0,1228,1220,1,0,
+        0,0,1228,1223,1,0,0,0,1228,1226,1,0,0,0,1228,1227,1,0,0,0,1229,109,
+        1,0,0,0,1230,1231,3,192,96,0,1231,1233,3,330,165,0,1232,1234,5,109,
+        0,0,1233,1232,1,0,0,0,1233,1234,1,0,0,0,1234,1236,1,0,0,0,1235,1237,
+        5,106,0,0,1236,1235,1,0,0,0,1236,1237,1,0,0,0,1237,111,1,0,0,0,1238,
+        1250,3,330,165,0,1239,1240,5,110,0,0,1240,1245,3,114,57,0,1241,1242,
+        5,22,0,0,1242,1244,3,114,57,0,1243,1241,1,0,0,0,1244,1247,1,0,0,
+        0,1245,1243,1,0,0,0,1245,1246,1,0,0,0,1246,1248,1,0,0,0,1247,1245,
+        1,0,0,0,1248,1249,5,111,0,0,1249,1251,1,0,0,0,1250,1239,1,0,0,0,
+        1250,1251,1,0,0,0,1251,113,1,0,0,0,1252,1253,7,12,0,0,1253,115,1,
+        0,0,0,1254,1255,5,112,0,0,1255,1267,3,330,165,0,1256,1257,5,351,
+        0,0,1257,1262,3,96,48,0,1258,1259,5,22,0,0,1259,1261,3,96,48,0,1260,
+        1258,1,0,0,0,1261,1264,1,0,0,0,1262,1260,1,0,0,0,1262,1263,1,0,0,
+        0,1263,1266,1,0,0,0,1264,1262,1,0,0,0,1265,1256,1,0,0,0,1266,1269,
+        1,0,0,0,1267,1265,1,0,0,0,1267,1268,1,0,0,0,1268,1271,1,0,0,0,1269,
+        1267,1,0,0,0,1270,1272,3,118,59,0,1271,1270,1,0,0,0,1271,1272,1,
+        0,0,0,1272,117,1,0,0,0,1273,1277,5,3,0,0,1274,1276,3,120,60,0,1275,
+        1274,1,0,0,0,1276,1279,1,0,0,0,1277,1275,1,0,0,0,1277,1278,1,0,0,
+        0,1278,1283,1,0,0,0,1279,1277,1,0,0,0,1280,1282,3,122,61,0,1281,
+        1280,1,0,0,0,1282,1285,1,0,0,0,1283,1281,1,0,0,0,1283,1284,1,0,0,
+        0,1284,1286,1,0,0,0,1285,1283,1,0,0,0,1286,1287,5,4,0,0,1287,119,
+        1,0,0,0,1288,1290,5,79,0,0,1289,1291,5,78,0,0,1290,1289,1,0,0,0,
+        1290,1291,1,0,0,0,1291,1292,1,0,0,0,1292,1313,3,430,215,0,1293,1294,
+        5,81,0,0,1294,1295,5,6,0,0,1295,1313,3,430,215,0,1296,1297,5,80,
+        0,0,1297,1298,5,6,0,0,1298,1313,5,355,0,0,1299,1313,5,91,0,0,1300,
+        1313,5,92,0,0,1301,1302,5,94,0,0,1302,1303,5,6,0,0,1303,1313,5,355,
+        0,0,1304,1306,3,132,66,0,1305,1304,1,0,0,0,1305,1306,1,0,0,0,1306,
+        1307,1,0,0,0,1307,1313,5,95,0,0,1308,1310,3,132,66,0,1309,1308,1,
+        0,0,0,1309,1310,1,0,0,0,1310,1311,1,0,0,0,1311,1313,5,90,0,0,1312,
+        1288,1,0,0,0,1312,1293,1,0,0,0,1312,1296,1,0,0,0,1312,1299,1,0,0,
+        0,1312,1300,1,0,0,0,1312,1301,1,0,0,0,1312,1305,1,0,0,0,1312,1309,
+        1,0,0,0,1313,121,1,0,0,0,1314,1320,3,124,62,0,1315,1320,3,214,107,
+        0,1316,1320,3,138,69,0,1317,1320,3,126,63,0,1318,1320,3,380,190,
+        0,1319,1314,1,0,0,0,1319,1315,1,0,0,0,1319,1316,1,0,0,0,1319,1317,
+        1,0,0,0,1319,1318,1,0,0,0,1320,123,1,0,0,0,1321,1323,7,13,0,0,1322,
+        1324,5,355,0,0,1323,1322,1,0,0,0,1323,1324,1,0,0,0,1324,1326,1,0,
+        0,0,1325,1327,5,78,0,0,1326,1325,1,0,0,0,1326,1327,1,0,0,0,1327,
+        1328,1,0,0,0,1328,1329,3,192,96,0,1329,1333,3,330,165,0,1330,1332,
+        3,130,65,0,1331,1330,1,0,0,0,1332,1335,1,0,0,0,1333,1331,1,0,0,0,
+        1333,1334,1,0,0,0,1334,1337,1,0,0,0,1335,1333,1,0,0,0,1336,1338,
+        5,106,0,0,1337,1336,1,0,0,0,1337,1338,1,0,0,0,1338,1351,1,0,0,0,
+        1339,1341,7,13,0,0,1340,1342,5,355,0,0,1341,1340,1,0,0,0,1341,1342,
+        1,0,0,0,1342,1344,1,0,0,0,1343,1345,5,78,0,0,1344,1343,1,0,0,0,1344,
+        1345,1,0,0,0,1345,1346,1,0,0,0,1346,1348,3,192,96,0,1347,1349,5,
+        106,0,0,1348,1347,1,0,0,0,1348,1349,1,0,0,0,1349,1351,1,0,0,0,1350,
+        1321,1,0,0,0,1350,1339,1,0,0,0,1351,125,1,0,0,0,1352,1354,5,355,
+        0,0,1353,1352,1,0,0,0,1353,1354,1,0,0,0,1354,1356,1,0,0,0,1355,1357,
+        3,234,117,0,1356,1355,1,0,0,0,1356,1357,1,0,0,0,1357,1359,1,0,0,
+        0,1358,1360,7,14,0,0,1359,1358,1,0,0,0,1359,1360,1,0,0,0,1360,1361,
+        1,0,0,0,1361,1362,3,192,96,0,1362,1364,3,330,165,0,1363,1365,5,109,
+        0,0,1364,1363,1,0,0,0,1364,1365,1,0,0,0,1365,1369,1,0,0,0,1366,1368,
+        3,130,65,0,1367,1366,1,0,0,0,1368,1371,1,0,0,0,1369,1367,1,0,0,0,
+        1369,1370,1,0,0,0,1370,1373,1,0,0,0,1371,1369,1,0,0,0,1372,1374,
+        3,128,64,0,1373,1372,1,0,0,0,1373,1374,1,0,0,0,1374,1376,1,0,0,0,
+        1375,1377,5,106,0,0,1376,1375,1,0,0,0,1376,1377,1,0,0,0,1377,1406,
+        1,0,0,0,1378,1380,5,355,0,0,1379,1378,1,0,0,0,1379,1380,1,0,0,0,
+        1380,1382,1,0,0,0,1381,1383,3,234,117,0,1382,1381,1,0,0,0,1382,1383,
+        1,0,0,0,1383,1385,1,0,0,0,1384,1386,7,14,0,0,1385,1384,1,0,0,0,1385,
+        1386,1,0,0,0,1386,1387,1,0,0,0,1387,1388,3,330,165,0,1388,1389,5,
+        14,0,0,1389,1391,3,192,96,0,1390,1392,5,109,0,0,1391,1390,1,0,0,
+        0,1391,1392,1,0,0,0,1392,1396,1,0,0,0,1393,1395,3,130,65,0,1394,
+        1393,1,0,0,0,1395,1398,1,0,0,0,1396,1394,1,0,0,0,1396,1397,1,0,0,
+        0,1397,1400,1,0,0,0,1398,1396,1,0,0,0,1399,1401,3,128,64,0,1400,
+        1399,1,0,0,0,1400,1401,1,0,0,0,1401,1403,1,0,0,0,1402,1404,5,106,
+        0,0,1403,1402,1,0,0,0,1403,1404,1,0,0,0,1404,1406,1,0,0,0,1405,1353,
+        1,0,0,0,1405,1379,1,0,0,0,1406,127,1,0,0,0,1407,1408,7,13,0,0,1408,
+        1409,5,355,0,0,1409,129,1,0,0,0,1410,1422,3,136,68,0,1411,1413,3,
+        132,66,0,1412,1411,1,0,0,0,1412,1413,1,0,0,0,1413,1414,1,0,0,0,1414,
+        1419,3,134,67,0,1415,1416,5,6,0,0,1416,1418,5,355,0,0,1417,1415,
+        1,0,0,0,1417,1418,1,0,0,0,1418,1420,1,0,0,0,1419,1417,1,0,0,0,1419,
+        1420,1,0,0,0,1420,1422,1,0,0,0,1421,1410,1,0,0,0,1421,1412,1,0,0,
+        0,1422,131,1,0,0,0,1423,1424,7,15,0,0,1424,133,1,0,0,0,1425,1426,
+        7,16,0,0,1426,135,1,0,0,0,1427,1431,5,154,0,0,1428,1429,5,6,0,0,
+        1429,1432,5,355,0,0,1430,1432,3,330,165,0,1431,1428,1,0,0,0,1431,
+        1430,1,0,0,0,1432,1436,1,0,0,0,1433,1434,5,34,0,0,1434,1436,3,330,
+        165,0,1435,1427,1,0,0,0,1435,1433,1,0,0,0,1436,137,1,0,0,0,1437,
+        1440,3,142,71,0,1438,1440,3,144,72,0,1439,1437,1,0,0,0,1439,1438,
+        1,0,0,0,1440,139,1,0,0,0,1441,1443,5,355,0,0,1442,1441,1,0,0,0,1442,
+        1443,1,0,0,0,1443,1445,1,0,0,0,1444,1446,3,234,117,0,1445,1444,1,
+        0,0,0,1445,1446,1,0,0,0,1446,1447,1,0,0,0,1447,1448,3,192,96,0,1448,
+        1452,3,330,165,0,1449,1451,3,152,76,0,1450,1449,1,0,0,0,1451,1454,
+        1,0,0,0,1452,1450,1,0,0,0,1452,1453,1,0,0,0,1453,1456,1,0,0,0,1454,
+        1452,1,0,0,0,1455,1457,5,106,0,0,1456,1455,1,0,0,0,1456,1457,1,0,
+        0,0,1457,1475,1,0,0,0,1458,1460,5,355,0,0,1459,1458,1,0,0,0,1459,
+        1460,1,0,0,0,1460,1462,1,0,0,0,1461,1463,3,234,117,0,1462,1461,1,
+        0,0,0,1462,1463,1,0,0,0,1463,1464,1,0,0,0,1464,1468,3,330,165,0,
+        1465,1467,3,152,76,0,1466,1465,1,0,0,0,1467,1470,1,0,0,0,1468,1466,
+        1,0,0,0,1468,1469,1,0,0,0,1469,1472,1,0,0,0,1470,1468,1,0,0,0,1471,
+        1473,5,106,0,0,1472,1471,1,0,0,0,1472,1473,1,0,0,0,1473,1475,1,0,
+        0,0,1474,1442,1,0,0,0,1474,1459,1,0,0,0,1475,141,1,0,0,0,1476,1478,
+        3,146,73,0,1477,1476,1,0,0,0,1477,1478,1,0,0,0,1478,1480,1,0,0,0,
+        1479,1481,3,192,96,0,1480,1479,1,0,0,0,1480,1481,1,0,0,0,1481,1482,
+        1,0,0,0,1482,1483,3,330,165,0,1483,1485,5,110,0,0,1484,1486,3,190,
+        95,0,1485,1484,1,0,0,0,1485,1486,1,0,0,0,1486,1487,1,0,0,0,1487,
+        1491,5,111,0,0,1488,1490,3,152,76,0,1489,1488,1,0,0,0,1490,1493,
+        1,0,0,0,1491,1489,1,0,0,0,1491,1492,1,0,0,0,1492,1495,1,0,0,0,1493,
+        1491,1,0,0,0,1494,1496,5,106,0,0,1495,1494,1,0,0,0,1495,1496,1,0,
+        0,0,1496,143,1,0,0,0,1497,1499,7,17,0,0,1498,1500,5,75,0,0,1499,
+        1498,1,0,0,0,1499,1500,1,0,0,0,1500,1502,1,0,0,0,1501,1503,3,234,
+        117,0,1502,1501,1,0,0,0,1502,1503,1,0,0,0,1503,1505,1,0,0,0,1504,
+        1506,3,192,96,0,1505,1504,1,0,0,0,1505,1506,1,0,0,0,1506,1507,1,
+        0,0,0,1507,1511,3,330,165,0,1508,1510,3,152,76,0,1509,1508,1,0,0,
+        0,1510,1513,1,0,0,0,1511,1509,1,0,0,0,1511,1512,1,0,0,0,1512,1515,
+        1,0,0,0,1513,1511,1,0,0,0,1514,1516,5,106,0,0,1515,1514,1,0,0,0,
+        1515,1516,1,0,0,0,1516,145,1,0,0,0,1517,1519,7,17,0,0,1518,1520,
+        5,75,0,0,1519,1518,1,0,0,0,1519,1520,1,0,0,0,1520,1522,1,0,0,0,1521,
+        1523,3,234,117,0,1522,1521,1,0,0,0,1522,1523,1,0,0,0,1523,1529,1,
+        0,0,0,1524,1526,3,234,117,0,1525,1527,7,17,0,0,1526,1525,1,0,0,0,
+        1526,1527,1,0,0,0,1527,1529,1,0,0,0,1528,1517,1,0,0,0,1528,1524,
+        1,0,0,0,1529,147,1,0,0,0,1530,1531,5,14,0,0,1531,1533,3,150,75,0,
+        1532,1534,3,280,140,0,1533,1532,1,0,0,0,1533,1534,1,0,0,0,1534,149,
+        1,0,0,0,1535,1536,7,18,0,0,1536,151,1,0,0,0,1537,1542,3,156,78,0,
+        1538,1542,3,148,74,0,1539,1542,3,160,80,0,1540,1542,3,154,77,0,1541,
+        1537,1,0,0,0,1541,1538,1,0,0,0,1541,1539,1,0,0,0,1541,1540,1,0,0,
+        0,1542,153,1,0,0,0,1543,1544,5,159,0,0,1544,1545,3,428,214,0,1545,
+        155,1,0,0,0,1546,1547,5,94,0,0,1547,1548,5,6,0,0,1548,1557,5,355,
+        0,0,1549,1557,3,158,79,0,1550,1551,5,160,0,0,1551,1552,5,6,0,0,1552,
+        1557,5,355,0,0,1553,1554,5,161,0,0,1554,1555,5,6,0,0,1555,1557,5,
+        355,0,0,1556,1546,1,0,0,0,1556,1549,1,0,0,0,1556,1550,1,0,0,0,1556,
+        1553,1,0,0,0,1557,157,1,0,0,0,1558,1559,7,19,0,0,1559,159,1,0,0,
+        0,1560,1562,5,166,0,0,1561,1563,3,162,81,0,1562,1561,1,0,0,0,1562,
+        1563,1,0,0,0,1563,1564,1,0,0,0,1564,1565,5,167,0,0,1565,1569,3,164,
+        82,0,1566,1567,5,168,0,0,1567,1568,5,6,0,0,1568,1570,3,330,165,0,
+        1569,1566,1,0,0,0,1569,1570,1,0,0,0,1570,1592,1,0,0,0,1571,1573,
+        5,169,0,0,1572,1574,3,162,81,0,1573,1572,1,0,0,0,1573,1574,1,0,0,
+        0,1574,1575,1,0,0,0,1575,1576,5,167,0,0,1576,1580,3,164,82,0,1577,
+        1578,5,168,0,0,1578,1579,5,6,0,0,1579,1581,3,330,165,0,1580,1577,
+        1,0,0,0,1580,1581,1,0,0,0,1581,1592,1,0,0,0,1582,1583,5,170,0,0,
+        1583,1586,5,167,0,0,1584,1586,5,171,0,0,1585,1582,1,0,0,0,1585,1584,
+        1,0,0,0,1586,1588,1,0,0,0,1587,1589,5,78,0,0,1588,1587,1,0,0,0,1588,
+        1589,1,0,0,0,1589,1590,1,0,0,0,1590,1592,3,430,215,0,1591,1560,1,
+        0,0,0,1591,1571,1,0,0,0,1591,1585,1,0,0,0,1592,161,1,0,0,0,1593,
+        1595,5,78,0,0,1594,1593,1,0,0,0,1594,1595,1,0,0,0,1595,1596,1,0,
+        0,0,1596,1597,3,330,165,0,1597,163,1,0,0,0,1598,1602,5,355,0,0,1599,
+        1602,3,432,216,0,1600,1602,3,430,215,0,1601,1598,1,0,0,0,1601,1599,
+        1,0,0,0,1601,1600,1,0,0,0,1602,165,1,0,0,0,1603,1607,5,3,0,0,1604,
+        1606,3,168,84,0,1605,1604,1,0,0,0,1606,1609,1,0,0,0,1607,1605,1,
+        0,0,0,1607,1608,1,0,0,0,1608,1610,1,0,0,0,1609,1607,1,0,0,0,1610,
+        1611,5,4,0,0,1611,167,1,0,0,0,1612,1615,3,172,86,0,1613,1615,3,122,
+        61,0,1614,1612,1,0,0,0,1614,1613,1,0,0,0,1615,169,1,0,0,0,1616,1618,
+        5,5,0,0,1617,1619,5,6,0,0,1618,1617,1,0,0,0,1618,1619,1,0,0,0,1619,
+        1620,1,0,0,0,1620,1627,3,50,25,0,1621,1623,5,49,0,0,1622,1624,5,
+        6,0,0,1623,1622,1,0,0,0,1623,1624,1,0,0,0,1624,1625,1,0,0,0,1625,
+        1627,5,355,0,0,1626,1616,1,0,0,0,1626,1621,1,0,0,0,1627,171,1,0,
+        0,0,1628,1648,3,166,83,0,1629,1648,3,58,29,0,1630,1648,3,60,30,0,
+        1631,1648,3,196,98,0,1632,1648,3,202,101,0,1633,1648,3,208,104,0,
+        1634,1648,3,214,107,0,1635,1648,3,38,19,0,1636,1648,3,176,88,0,1637,
+        1648,3,170,85,0,1638,1648,3,186,93,0,1639,1648,3,184,92,0,1640,1648,
+        3,286,143,0,1641,1648,3,48,24,0,1642,1648,3,52,26,0,1643,1648,3,
+        236,118,0,1644,1648,3,6,3,0,1645,1648,3,46,23,0,1646,1648,3,174,
+        87,0,1647,1628,1,0,0,0,1647,1629,1,0,0,0,1647,1630,1,0,0,0,1647,
+        1631,1,0,0,0,1647,1632,1,0,0,0,1647,1633,1,0,0,0,1647,1634,1,0,0,
+        0,1647,1635,1,0,0,0,1647,1636,1,0,0,0,1647,1637,1,0,0,0,1647,1638,
+        1,0,0,0,1647,1639,1,0,0,0,1647,1640,1,0,0,0,1647,1641,1,0,0,0,1647,
+        1642,1,0,0,0,1647,1643,1,0,0,0,1647,1644,1,0,0,0,1647,1645,1,0,0,
+        0,1647,1646,1,0,0,0,1648,173,1,0,0,0,1649,1651,5,172,0,0,1650,1652,
+        5,6,0,0,1651,1650,1,0,0,0,1651,1652,1,0,0,0,1652,1653,1,0,0,0,1653,
+        1655,3,330,165,0,1654,1656,5,106,0,0,1655,1654,1,0,0,0,1655,1656,
+        1,0,0,0,1656,175,1,0,0,0,1657,1659,7,20,0,0,1658,1660,5,6,0,0,1659,
+        1658,1,0,0,0,1659,1660,1,0,0,0,1660,1661,1,0,0,0,1661,1663,3,426,
+        213,0,1662,1664,5,106,0,0,1663,1662,1,0,0,0,1663,1664,1,0,0,0,1664,
+        1730,1,0,0,0,1665,1667,7,21,0,0,1666,1668,5,6,0,0,1667,1666,1,0,
+        0,0,1667,1668,1,0,0,0,1668,1669,1,0,0,0,1669,1671,3,178,89,0,1670,
+        1672,5,106,0,0,1671,1670,1,0,0,0,1671,1672,1,0,0,0,1672,1730,1,0,
+        0,0,1673,1675,5,179,0,0,1674,1676,5,6,0,0,1675,1674,1,0,0,0,1675,
+        1676,1,0,0,0,1676,1677,1,0,0,0,1677,1679,3,178,89,0,1678,1680,5,
+        106,0,0,1679,1678,1,0,0,0,1679,1680,1,0,0,0,1680,1730,1,0,0,0,1681,
+        1683,5,180,0,0,1682,1684,5,6,0,0,1683,1682,1,0,0,0,1683,1684,1,0,
+        0,0,1684,1685,1,0,0,0,1685,1687,3,180,90,0,1686,1688,5,106,0,0,1687,
+        1686,1,0,0,0,1687,1688,1,0,0,0,1688,1730,1,0,0,0,1689,1691,5,181,
+        0,0,1690,1692,5,6,0,0,1691,1690,1,0,0,0,1691,1692,1,0,0,0,1692,1693,
+        1,0,0,0,1693,1695,3,180,90,0,1694,1696,5,106,0,0,1695,1694,1,0,0,
+        0,1695,1696,1,0,0,0,1696,1730,1,0,0,0,1697,1699,5,182,0,0,1698,1700,
+        5,6,0,0,1699,1698,1,0,0,0,1699,1700,1,0,0,0,1700,1701,1,0,0,0,1701,
+        1703,3,182,91,0,1702,1704,5,106,0,0,1703,1702,1,0,0,0,1703,1704,
+        1,0,0,0,1704,1730,1,0,0,0,1705,1707,5,183,0,0,1706,1708,5,6,0,0,
+        1707,1706,1,0,0,0,1707,1708,1,0,0,0,1708,1709,1,0,0,0,1709,1711,
+        3,180,90,0,1710,1712,5,106,0,0,1711,1710,1,0,0,0,1711,1712,1,0,0,
+        0,1712,1730,1,0,0,0,1713,1715,5,184,0,0,1714,1716,5,6,0,0,1715,1714,
+        1,0,0,0,1715,1716,1,0,0,0,1716,1717,1,0,0,0,1717,1719,5,355,0,0,
+        1718,1720,5,106,0,0,1719,1718,1,0,0,0,1719,1720,1,0,0,0,1720,1730,
+        1,0,0,0,1721,1723,5,185,0,0,1722,1724,5,6,0,0,1723,1722,1,0,0,0,
+        1723,1724,1,0,0,0,1724,1725,1,0,0,0,1725,1727,5,355,0,0,1726,1728,
+        5,106,0,0,1727,1726,1,0,0,0,1727,1728,1,0,0,0,1728,1730,1,0,0,0,
+        1729,1657,1,0,0,0,1729,1665,1,0,0,0,1729,1673,1,0,0,0,1729,1681,
+        1,0,0,0,1729,1689,1,0,0,0,1729,1697,1,0,0,0,1729,1705,1,0,0,0,1729,
+        1713,1,0,0,0,1729,1721,1,0,0,0,1730,177,1,0,0,0,1731,1732,7,22,0,
+        0,1732,179,1,0,0,0,1733,1734,7,23,0,0,1734,181,1,0,0,0,1735,1736,
+        7,24,0,0,1736,183,1,0,0,0,1737,1738,5,72,0,0,1738,1739,5,6,0,0,1739,
+        1741,3,430,215,0,1740,1742,5,106,0,0,1741,1740,1,0,0,0,1741,1742,
+        1,0,0,0,1742,185,1,0,0,0,1743,1748,5,193,0,0,1744,1745,5,94,0,0,
+        1745,1746,5,6,0,0,1746,1748,5,355,0,0,1747,1743,1,0,0,0,1747,1744,
+        1,0,0,0,1748,187,1,0,0,0,1749,1751,5,78,0,0,1750,1749,1,0,0,0,1750,
+        1751,1,0,0,0,1751,1752,1,0,0,0,1752,1753,3,192,96,0,1753,1754,3,
+        330,165,0,1754,1763,1,0,0,0,1755,1757,5,78,0,0,1756,1755,1,0,0,0,
+        1756,1757,1,0,0,0,1757,1758,1,0,0,0,1758,1759,3,330,165,0,1759,1760,
+        5,14,0,0,1760,1761,3,192,96,0,1761,1763,1,0,0,0,1762,1750,1,0,0,
+        0,1762,1756,1,0,0,0,1763,189,1,0,0,0,1764,1769,3,188,94,0,1765,1766,
+        5,22,0,0,1766,1768,3,188,94,0,1767,1765,1,0,0,0,1768,1771,1,0,0,
+        0,1769,1767,1,0,0,0,1769,1770,1,0,0,0,1770,191,1,0,0,0,1771,1769,
+        1,0,0,0,1772,1773,3,194,97,0,1773,1774,5,194,0,0,1774,1775,3,192,
+        96,0,1775,1776,5,195,0,0,1776,1794,1,0,0,0,1777,1778,5,196,0,0,1778,
+        1779,5,194,0,0,1779,1780,3,192,96,0,1780,1781,5,22,0,0,1781,1782,
+        3,192,96,0,1782,1783,5,195,0,0,1783,1794,1,0,0,0,1784,1785,3,430,
+        215,0,1785,1786,5,194,0,0,1786,1787,3,192,96,0,1787,1788,5,195,0,
+        0,1788,1794,1,0,0,0,1789,1791,5,78,0,0,1790,1789,1,0,0,0,1790,1791,
+        1,0,0,0,1791,1792,1,0,0,0,1792,1794,3,430,215,0,1793,1772,1,0,0,
+        0,1793,1777,1,0,0,0,1793,1784,1,0,0,0,1793,1790,1,0,0,0,1794,193,
+        1,0,0,0,1795,1796,7,25,0,0,1796,195,1,0,0,0,1797,1798,5,201,0,0,
+        1798,1803,3,330,165,0,1799,1802,3,222,111,0,1800,1802,3,228,114,
+        0,1801,1799,1,0,0,0,1801,1800,1,0,0,0,1802,1805,1,0,0,0,1803,1801,
+        1,0,0,0,1803,1804,1,0,0,0,1804,1807,1,0,0,0,1805,1803,1,0,0,0,1806,
+        1808,3,198,99,0,1807,1806,1,0,0,0,1807,1808,1,0,0,0,1808,197,1,0,
+        0,0,1809,1813,5,3,0,0,1810,1812,3,200,100,0,1811,1810,1,0,0,0,1812,
+        1815,1,0,0,0,1813,1811,1,0,0,0,1813,1814,1,0,0,0,1814,1816,1,0,0,
+        0,1815,1813,1,0,0,0,1816,1817,5,4,0,0,1817,199,1,0,0,0,1818,1825,
+        3,222,111,0,1819,1825,3,228,114,0,1820,1825,3,124,62,0,1821,1825,
+        3,138,69,0,1822,1825,3,140,70,0,1823,1825,3,380,190,0,1824,1818,
+        1,0,0,0,1824,1819,1,0,0,0,1824,1820,1,0,0,0,1824,1821,1,0,0,0,1824,
+        1822,1,0,0,0,1824,1823,1,0,0,0,1825,201,1,0,0,0,1826,1827,5,202,
+        0,0,1827,1832,3,330,165,0,1828,1831,3,224,112,0,1829,1831,3,228,
+        114,0,1830,1828,1,0,0,0,1830,1829,1,0,0,0,1831,1834,1,0,0,0,1832,
+        1830,1,0,0,0,1832,1833,1,0,0,0,1833,1836,1,0,0,0,1834,1832,1,0,0,
+        0,1835,1837,3,204,102,0,1836,1835,1,0,0,0,1836,1837,1,0,0,0,1837,
+        203,1,0,0,0,1838,1842,5,3,0,0,1839,1841,3,206,103,0,1840,1839,1,
+        0,0,0,1841,1844,1,0,0,0,1842,1840,1,0,0,0,1842,1843,1,0,0,0,1843,
+        1845,1,0,0,0,1844,1842,1,0,0,0,1845,1846,5,4,0,0,1846,205,1,0,0,
+        0,1847,1853,3,224,112,0,1848,1853,3,228,114,0,1849,1853,3,138,69,
+        0,1850,1853,3,140,70,0,1851,1853,3,380,190,0,1852,1847,1,0,0,0,1852,
+        1848,1,0,0,0,1852,1849,1,0,0,0,1852,1850,1,0,0,0,1852,1851,1,0,0,
+        0,1853,207,1,0,0,0,1854,1855,5,203,0,0,1855,1860,3,330,165,0,1856,
+        1859,3,226,113,0,1857,1859,3,228,114,0,1858,1856,1,0,0,0,1858,1857,
+        1,0,0,0,1859,1862,1,0,0,0,1860,1858,1,0,0,0,1860,1861,1,0,0,0,1861,
+        1864,1,0,0,0,1862,1860,1,0,0,0,1863,1865,3,210,105,0,1864,1863,1,
+        0,0,0,1864,1865,1,0,0,0,1865,209,1,0,0,0,1866,1870,5,3,0,0,1867,
+        1869,3,212,106,0,1868,1867,1,0,0,0,1869,1872,1,0,0,0,1870,1868,1,
+        0,0,0,1870,1871,1,0,0,0,1871,1873,1,0,0,0,1872,1870,1,0,0,0,1873,
+        1874,5,4,0,0,1874,211,1,0,0,0,1875,1879,3,226,113,0,1876,1879,3,
+        228,114,0,1877,1879,3,380,190,0,1878,1875,1,0,0,0,1878,1876,1,0,
+        0,0,1878,1877,1,0,0,0,1879,213,1,0,0,0,1880,1881,5,204,0,0,1881,
+        1886,3,330,165,0,1882,1885,3,230,115,0,1883,1885,3,228,114,0,1884,
+        1882,1,0,0,0,1884,1883,1,0,0,0,1885,1888,1,0,0,0,1886,1884,1,0,0,
+        0,1886,1887,1,0,0,0,1887,1890,1,0,0,0,1888,1886,1,0,0,0,1889,1891,
+        3,216,108,0,1890,1889,1,0,0,0,1890,1891,1,0,0,0,1891,215,1,0,0,0,
+        1892,1896,5,3,0,0,1893,1895,3,218,109,0,1894,1893,1,0,0,0,1895,1898,
+        1,0,0,0,1896,1894,1,0,0,0,1896,1897,1,0,0,0,1897,1899,1,0,0,0,1898,
+        1896,1,0,0,0,1899,1900,5,4,0,0,1900,217,1,0,0,0,1901,1906,3,230,
+        115,0,1902,1906,3,228,114,0,1903,1906,3,220,110,0,1904,1906,3,380,
+        190,0,1905,1901,1,0,0,0,1905,1902,1,0,0,0,1905,1903,1,0,0,0,1905,
+        1904,1,0,0,0,1906,219,1,0,0,0,1907,1909,3,234,117,0,1908,1907,1,
+        0,0,0,1908,1909,1,0,0,0,1909,1917,1,0,0,0,1910,1912,5,78,0,0,1911,
+        1910,1,0,0,0,1911,1912,1,0,0,0,1912,1913,1,0,0,0,1913,1914,3,192,
+        96,0,1914,1915,3,330,165,0,1915,1918,1,0,0,0,1916,1918,3,330,165,
+        0,1917,1911,1,0,0,0,1917,1916,1,0,0,0,1918,1924,1,0,0,0,1919,1921,
+        5,110,0,0,1920,1922,3,190,95,0,1921,1920,1,0,0,0,1921,1922,1,0,0,
+        0,1922,1923,1,0,0,0,1923,1925,5,111,0,0,1924,1919,1,0,0,0,1924,1925,
+        1,0,0,0,1925,1929,1,0,0,0,1926,1928,3,232,116,0,1927,1926,1,0,0,
+        0,1928,1931,1,0,0,0,1929,1927,1,0,0,0,1929,1930,1,0,0,0,1930,1933,
+        1,0,0,0,1931,1929,1,0,0,0,1932,1934,5,106,0,0,1933,1932,1,0,0,0,
+        1933,1934,1,0,0,0,1934,221,1,0,0,0,1935,1954,5,91,0,0,1936,1954,
+        5,92,0,0,1937,1954,5,205,0,0,1938,1954,5,93,0,0,1939,1940,5,94,0,
+        0,1940,1941,5,6,0,0,1941,1954,5,355,0,0,1942,1943,5,169,0,0,1943,
+        1946,5,167,0,0,1944,1947,5,355,0,0,1945,1947,3,432,216,0,1946,1944,
+        1,0,0,0,1946,1945,1,0,0,0,1947,1951,1,0,0,0,1948,1949,5,168,0,0,
+        1949,1950,5,6,0,0,1950,1952,3,330,165,0,1951,1948,1,0,0,0,1951,1952,
+        1,0,0,0,1952,1954,1,0,0,0,1953,1935,1,0,0,0,1953,1936,1,0,0,0,1953,
+        1937,1,0,0,0,1953,1938,1,0,0,0,1953,1939,1,0,0,0,1953,1942,1,0,0,
+        0,1954,223,1,0,0,0,1955,1965,5,91,0,0,1956,1965,5,92,0,0,1957,1965,
+        5,93,0,0,1958,1959,5,94,0,0,1959,1960,5,6,0,0,1960,1965,5,355,0,
+        0,1961,1962,5,160,0,0,1962,1963,5,6,0,0,1963,1965,5,355,0,0,1964,
+        1955,1,0,0,0,1964,1956,1,0,0,0,1964,1957,1,0,0,0,1964,1958,1,0,0,
+        0,1964,1961,1,0,0,0,1965,225,1,0,0,0,1966,1967,5,94,0,0,1967,1968,
+        5,6,0,0,1968,1990,5,355,0,0,1969,1970,5,169,0,0,1970,1973,5,167,
+        0,0,1971,1974,5,355,0,0,1972,1974,3,432,216,0,1973,1971,1,0,0,0,
+        1973,1972,1,0,0,0,1974,1978,1,0,0,0,1975,1976,5,168,0,0,1976,1977,
+        5,6,0,0,1977,1979,3,330,165,0,1978,1975,1,0,0,0,1978,1979,1,0,0,
+        0,1979,1990,1,0,0,0,1980,1981,5,206,0,0,1981,1983,5,167,0,0,1982,
+        1984,5,78,0,0,1983,1982,1,0,0,0,1983,1984,1,0,0,0,1984,1985,1,0,
+        0,0,1985,1990,3,430,215,0,1986,1987,7,26,0,0,1987,1988,5,6,0,0,1988,
+        1990,3,432,216,0,1989,1966,1,0,0,0,1989,1969,1,0,0,0,1989,1980,1,
+        0,0,0,1989,1986,1,0,0,0,1990,227,1,0,0,0,1991,1993,7,27,0,0,1992,
+        1994,5,78,0,0,1993,1992,1,0,0,0,1993,1994,1,0,0,0,1994,1995,1,0,
+        0,0,1995,1996,3,430,215,0,1996,229,1,0,0,0,1997,2014,5,91,0,0,1998,
+        2014,5,92,0,0,1999,2000,5,94,0,0,2000,2001,5,6,0,0,2001,2014,5,355,
+        0,0,2002,2003,5,169,0,0,2003,2006,5,167,0,0,2004,2007,5,355,0,0,
+        2005,2007,3,432,216,0,2006,2004,1,0,0,0,2006,2005,1,0,0,0,2007,2011,
+        1,0,0,0,2008,2009,5,168,0,0,2009,2010,5,6,0,0,2010,2012,3,330,165,
+        0,2011,2008,1,0,0,0,2011,2012,1,0,0,0,2012,2014,1,0,0,0,2013,1997,
+        1,0,0,0,2013,1998,1,0,0,0,2013,1999,1,0,0,0,2013,2002,1,0,0,0,2014,
+        231,1,0,0,0,2015,2016,5,159,0,0,2016,2073,3,428,214,0,2017,2018,
+        5,94,0,0,2018,2019,5,6,0,0,2019,2073,5,355,0,0,2020,2073,5,90,0,
+        0,2021,2073,5,91,0,0,2022,2073,5,92,0,0,2023,2073,5,210,0,0,2024,
+        2073,5,211,0,0,2025,2073,5,212,0,0,2026,2027,5,213,0,0,2027,2028,
+        5,6,0,0,2028,2073,5,355,0,0,2029,2030,5,214,0,0,2030,2031,5,6,0,
+        0,2031,2073,5,355,0,0,2032,2033,5,215,0,0,2033,2034,5,6,0,0,2034,
+        2073,5,355,0,0,2035,2036,5,216,0,0,2036,2037,5,6,0,0,2037,2073,5,
+        355,0,0,2038,2039,5,217,0,0,2039,2040,5,6,0,0,2040,2073,5,355,0,
+        0,2041,2042,5,170,0,0,2042,2045,5,167,0,0,2043,2045,5,171,0,0,2044,
+        2041,1,0,0,0,2044,2043,1,0,0,0,2045,2047,1,0,0,0,2046,2048,5,78,
+        0,0,2047,2046,1,0,0,0,2047,2048,1,0,0,0,2048,2049,1,0,0,0,2049,2073,
+        3,430,215,0,2050,2052,5,166,0,0,2051,2053,3,162,81,0,2052,2051,1,
+        0,0,0,2052,2053,1,0,0,0,2053,2054,1,0,0,0,2054,2055,5,167,0,0,2055,
+        2059,3,164,82,0,2056,2057,5,168,0,0,2057,2058,5,6,0,0,2058,2060,
+        3,330,165,0,2059,2056,1,0,0,0,2059,2060,1,0,0,0,2060,2073,1,0,0,
+        0,2061,2063,5,169,0,0,2062,2064,3,162,81,0,2063,2062,1,0,0,0,2063,
+        2064,1,0,0,0,2064,2065,1,0,0,0,2065,2066,5,167,0,0,2066,2070,3,164,
+        82,0,2067,2068,5,168,0,0,2068,2069,5,6,0,0,2069,2071,3,330,165,0,
+        2070,2067,1,0,0,0,2070,2071,1,0,0,0,2071,2073,1,0,0,0,2072,2015,
+        1,0,0,0,2072,2017,1,0,0,0,2072,2020,1,0,0,0,2072,2021,1,0,0,0,2072,
+        2022,1,0,0,0,2072,2023,1,0,0,0,2072,2024,1,0,0,0,2072,2025,1,0,0,
+        0,2072,2026,1,0,0,0,2072,2029,1,0,0,0,2072,2032,1,0,0,0,2072,2035,
+        1,0,0,0,2072,2038,1,0,0,0,2072,2044,1,0,0,0,2072,2050,1,0,0,0,2072,
+        2061,1,0,0,0,2073,233,1,0,0,0,2074,2075,7,28,0,0,2075,235,1,0,0,
+        0,2076,2078,5,221,0,0,2077,2079,3,330,165,0,2078,2077,1,0,0,0,2078,
+        2079,1,0,0,0,2079,2080,1,0,0,0,2080,2084,5,3,0,0,2081,2083,3,238,
+        119,0,2082,2081,1,0,0,0,2083,2086,1,0,0,0,2084,2082,1,0,0,0,2084,
+        2085,1,0,0,0,2085,2087,1,0,0,0,2086,2084,1,0,0,0,2087,2088,5,4,0,
+        0,2088,237,1,0,0,0,2089,2096,3,240,120,0,2090,2096,3,242,121,0,2091,
+        2096,3,196,98,0,2092,2096,3,274,137,0,2093,2096,3,78,39,0,2094,2096,
+        3,84,42,0,2095,2089,1,0,0,0,2095,2090,1,0,0,0,2095,2091,1,0,0,0,
+        2095,2092,1,0,0,0,2095,2093,1,0,0,0,2095,2094,1,0,0,0,2096,239,1,
+        0,0,0,2097,2098,7,29,0,0,2098,2100,3,330,165,0,2099,2101,5,106,0,
+        0,2100,2099,1,0,0,0,2100,2101,1,0,0,0,2101,241,1,0,0,0,2102,2103,
+        7,30,0,0,2103,2104,3,330,165,0,2104,2108,5,3,0,0,2105,2107,3,244,
+        122,0,2106,2105,1,0,0,0,2107,2110,1,0,0,0,2108,2106,1,0,0,0,2108,
+        2109,1,0,0,0,2109,2111,1,0,0,0,2110,2108,1,0,0,0,2111,2112,5,4,0,
+        0,2112,243,1,0,0,0,2113,2117,3,246,123,0,2114,2117,3,250,125,0,2115,
+        2117,3,254,127,0,2116,2113,1,0,0,0,2116,2114,1,0,0,0,2116,2115,1,
+        0,0,0,2117,245,1,0,0,0,2118,2119,5,222,0,0,2119,2121,3,330,165,0,
+        2120,2122,3,258,129,0,2121,2120,1,0,0,0,2121,2122,1,0,0,0,2122,2124,
+        1,0,0,0,2123,2125,3,248,124,0,2124,2123,1,0,0,0,2124,2125,1,0,0,
+        0,2125,2127,1,0,0,0,2126,2128,5,106,0,0,2127,2126,1,0,0,0,2127,2128,
+        1,0,0,0,2128,247,1,0,0,0,2129,2131,3,260,130,0,2130,2129,1,0,0,0,
+        2130,2131,1,0,0,0,2131,2133,1,0,0,0,2132,2134,3,270,135,0,2133,2132,
+        1,0,0,0,2133,2134,1,0,0,0,2134,249,1,0,0,0,2135,2136,5,225,0,0,2136,
+        2137,3,252,126,0,2137,2138,5,226,0,0,2138,2140,3,262,131,0,2139,
+        2141,5,106,0,0,2140,2139,1,0,0,0,2140,2141,1,0,0,0,2141,251,1,0,
+        0,0,2142,2148,3,330,165,0,2143,2144,3,284,142,0,2144,2145,3,330,
+        165,0,2145,2147,1,0,0,0,2146,2143,1,0,0,0,2147,2150,1,0,0,0,2148,
+        2146,1,0,0,0,2148,2149,1,0,0,0,2149,253,1,0,0,0,2150,2148,1,0,0,
+        0,2151,2152,5,227,0,0,2152,2154,3,330,165,0,2153,2155,3,258,129,
+        0,2154,2153,1,0,0,0,2154,2155,1,0,0,0,2155,2157,1,0,0,0,2156,2158,
+        3,256,128,0,2157,2156,1,0,0,0,2157,2158,1,0,0,0,2158,2160,1,0,0,
+        0,2159,2161,5,106,0,0,2160,2159,1,0,0,0,2160,2161,1,0,0,0,2161,255,
+        1,0,0,0,2162,2164,3,260,130,0,2163,2162,1,0,0,0,2163,2164,1,0,0,
+        0,2164,2166,1,0,0,0,2165,2167,3,270,135,0,2166,2165,1,0,0,0,2166,
+        2167,1,0,0,0,2167,257,1,0,0,0,2168,2169,5,21,0,0,2169,2170,5,228,
+        0,0,2170,2171,5,229,0,0,2171,2172,5,355,0,0,2172,2173,5,23,0,0,2173,
+        259,1,0,0,0,2174,2175,5,170,0,0,2175,2176,5,167,0,0,2176,2178,3,
+        330,165,0,2177,2179,5,230,0,0,2178,2177,1,0,0,0,2178,2179,1,0,0,
+        0,2179,2181,1,0,0,0,2180,2182,3,280,140,0,2181,2180,1,0,0,0,2181,
+        2182,1,0,0,0,2182,261,1,0,0,0,2183,2187,3,266,133,0,2184,2186,3,
+        264,132,0,2185,2184,1,0,0,0,2186,2189,1,0,0,0,2187,2185,1,0,0,0,
+        2187,2188,1,0,0,0,2188,263,1,0,0,0,2189,2187,1,0,0,0,2190,2191,3,
+        284,142,0,2191,2192,3,266,133,0,2192,265,1,0,0,0,2193,2195,3,268,
+        134,0,2194,2193,1,0,0,0,2194,2195,1,0,0,0,2195,2196,1,0,0,0,2196,
+        2197,3,330,165,0,2197,267,1,0,0,0,2198,2199,7,31,0,0,2199,269,1,
+        0,0,0,2200,2201,5,231,0,0,2201,2202,5,225,0,0,2202,2203,3,272,136,
+        0,2203,271,1,0,0,0,2204,2210,3,330,165,0,2205,2206,3,284,142,0,2206,
+        2207,3,330,165,0,2207,2209,1,0,0,0,2208,2205,1,0,0,0,2209,2212,1,
+        0,0,0,2210,2208,1,0,0,0,2210,2211,1,0,0,0,2211,273,1,0,0,0,2212,
+        2210,1,0,0,0,2213,2214,7,32,0,0,2214,2215,3,330,165,0,2215,2219,
+        5,3,0,0,2216,2218,3,276,138,0,2217,2216,1,0,0,0,2218,2221,1,0,0,
+        0,2219,2217,1,0,0,0,2219,2220,1,0,0,0,2220,2222,1,0,0,0,2221,2219,
+        1,0,0,0,2222,2223,5,4,0,0,2223,275,1,0,0,0,2224,2226,3,278,139,0,
+        2225,2227,5,106,0,0,2226,2225,1,0,0,0,2226,2227,1,0,0,0,2227,277,
+        1,0,0,0,2228,2233,3,330,165,0,2229,2230,5,234,0,0,2230,2232,3,330,
+        165,0,2231,2229,1,0,0,0,2232,2235,1,0,0,0,2233,2231,1,0,0,0,2233,
+        2234,1,0,0,0,2234,279,1,0,0,0,2235,2233,1,0,0,0,2236,2238,5,21,0,
+        0,2237,2239,3,426,213,0,2238,2237,1,0,0,0,2238,2239,1,0,0,0,2239,
+        2250,1,0,0,0,2240,2241,5,36,0,0,2241,2247,3,282,141,0,2242,2243,
+        3,284,142,0,2243,2244,3,282,141,0,2244,2246,1,0,0,0,2245,2242,1,
+        0,0,0,2246,2249,1,0,0,0,2247,2245,1,0,0,0,2247,2248,1,0,0,0,2248,
+        2251,1,0,0,0,2249,2247,1,0,0,0,2250,2240,1,0,0,0,2250,2251,1,0,0,
+        0,2251,2252,1,0,0,0,2252,2253,5,23,0,0,2253,281,1,0,0,0,2254,2256,
+        3,330,165,0,2255,2257,5,156,0,0,2256,2255,1,0,0,0,2256,2257,1,0,
+        0,0,2257,283,1,0,0,0,2258,2259,7,33,0,0,2259,285,1,0,0,0,2260,2261,
+        5,240,0,0,2261,2271,3,330,165,0,2262,2267,5,3,0,0,2263,2266,3,288,
+        144,0,2264,2266,3,318,159,0,2265,2263,1,0,0,0,2265,2264,1,0,0,0,
+        2266,2269,1,0,0,0,2267,2265,1,0,0,0,2267,2268,1,0,0,0,2268,2270,
+        1,0,0,0,2269,2267,1,0,0,0,2270,2272,5,4,0,0,2271,2262,1,0,0,0,2271,
+        2272,1,0,0,0,2272,287,1,0,0,0,2273,2280,3,290,145,0,2274,2280,3,
+        292,146,0,2275,2280,3,294,147,0,2276,2280,3,332,166,0,2277,2280,
+        3,334,167,0,2278,2280,3,336,168,0,2279,2273,1,0,0,0,2279,2274,1,
+        0,0,0,2279,2275,1,0,0,0,2279,2276,1,0,0,0,2279,2277,1,0,0,0,2279,
+        2278,1,0,0,0,2280,289,1,0,0,0,2281,2283,5,241,0,0,2282,2284,5,6,
+        0,0,2283,2282,1,0,0,0,2283,2284,1,0,0,0,2284,2285,1,0,0,0,2285,2286,
+        5,355,0,0,2286,291,1,0,0,0,2287,2289,5,242,0,0,2288,2290,5,6,0,0,
+        2289,2288,1,0,0,0,2289,2290,1,0,0,0,2290,2291,1,0,0,0,2291,2296,
+        5,355,0,0,2292,2293,5,22,0,0,2293,2295,5,355,0,0,2294,2292,1,0,0,
+        0,2295,2298,1,0,0,0,2296,2294,1,0,0,0,2296,2297,1,0,0,0,2297,293,
+        1,0,0,0,2298,2296,1,0,0,0,2299,2301,5,243,0,0,2300,2302,5,6,0,0,
+        2301,2300,1,0,0,0,2301,2302,1,0,0,0,2302,2304,1,0,0,0,2303,2305,
+        3,296,148,0,2304,2303,1,0,0,0,2305,2306,1,0,0,0,2306,2304,1,0,0,
+        0,2306,2307,1,0,0,0,2307,295,1,0,0,0,2308,2310,3,302,151,0,2309,
+        2311,5,22,0,0,2310,2309,1,0,0,0,2310,2311,1,0,0,0,2311,2325,1,0,
+        0,0,2312,2314,3,300,150,0,2313,2315,5,22,0,0,2314,2313,1,0,0,0,2314,
+        2315,1,0,0,0,2315,2325,1,0,0,0,2316,2318,5,355,0,0,2317,2319,5,22,
+        0,0,2318,2317,1,0,0,0,2318,2319,1,0,0,0,2319,2325,1,0,0,0,2320,2322,
+        3,298,149,0,2321,2323,5,22,0,0,2322,2321,1,0,0,0,2322,2323,1,0,0,
+        0,2323,2325,1,0,0,0,2324,2308,1,0,0,0,2324,2312,1,0,0,0,2324,2316,
+        1,0,0,0,2324,2320,1,0,0,0,2325,297,1,0,0,0,2326,2331,3,330,165,0,
+        2327,2331,5,350,0,0,2328,2331,5,351,0,0,2329,2331,5,352,0,0,2330,
+        2326,1,0,0,0,2330,2327,1,0,0,0,2330,2328,1,0,0,0,2330,2329,1,0,0,
+        0,2331,299,1,0,0,0,2332,2333,5,350,0,0,2333,2334,5,355,0,0,2334,
+        2335,5,351,0,0,2335,2336,5,352,0,0,2336,2341,5,355,0,0,2337,2338,
+        5,22,0,0,2338,2340,5,355,0,0,2339,2337,1,0,0,0,2340,2343,1,0,0,0,
+        2341,2339,1,0,0,0,2341,2342,1,0,0,0,2342,301,1,0,0,0,2343,2341,1,
+        0,0,0,2344,2347,3,304,152,0,2345,2347,3,306,153,0,2346,2344,1,0,
+        0,0,2346,2345,1,0,0,0,2347,303,1,0,0,0,2348,2349,5,244,0,0,2349,
+        2350,5,245,0,0,2350,2351,5,167,0,0,2351,2352,3,308,154,0,2352,2353,
+        3,310,155,0,2353,2359,1,0,0,0,2354,2355,5,244,0,0,2355,2356,5,245,
+        0,0,2356,2357,5,167,0,0,2357,2359,5,355,0,0,2358,2348,1,0,0,0,2358,
+        2354,1,0,0,0,2359,305,1,0,0,0,2360,2361,3,308,154,0,2361,2362,3,
+        310,155,0,2362,307,1,0,0,0,2363,2364,7,34,0,0,2364,309,1,0,0,0,2365,
+        2367,3,312,156,0,2366,2365,1,0,0,0,2366,2367,1,0,0,0,2367,2368,1,
+        0,0,0,2368,2370,5,355,0,0,2369,2371,3,314,157,0,2370,2369,1,0,0,
+        0,2370,2371,1,0,0,0,2371,2373,1,0,0,0,2372,2374,3,316,158,0,2373,
+        2372,1,0,0,0,2373,2374,1,0,0,0,2374,311,1,0,0,0,2375,2376,7,35,0,
+        0,2376,313,1,0,0,0,2377,2378,5,351,0,0,2378,2379,7,36,0,0,2379,2384,
+        5,355,0,0,2380,2381,5,22,0,0,2381,2383,5,355,0,0,2382,2380,1,0,0,
+        0,2383,2386,1,0,0,0,2384,2382,1,0,0,0,2384,2385,1,0,0,0,2385,315,
+        1,0,0,0,2386,2384,1,0,0,0,2387,2389,7,37,0,0,2388,2390,3,312,156,
+        0,2389,2388,1,0,0,0,2389,2390,1,0,0,0,2390,2391,1,0,0,0,2391,2392,
+        5,355,0,0,2392,317,1,0,0,0,2393,2395,8,38,0,0,2394,2393,1,0,0,0,
+        2395,2396,1,0,0,0,2396,2394,1,0,0,0,2396,2397,1,0,0,0,2397,319,1,
+        0,0,0,2398,2399,5,253,0,0,2399,2403,3,330,165,0,2400,2401,5,254,
+        0,0,2401,2402,5,229,0,0,2402,2404,3,330,165,0,2403,2400,1,0,0,0,
+        2403,2404,1,0,0,0,2404,2405,1,0,0,0,2405,2411,5,3,0,0,2406,2410,
+        3,324,162,0,2407,2410,3,322,161,0,2408,2410,3,328,164,0,2409,2406,
+        1,0,0,0,2409,2407,1,0,0,0,2409,2408,1,0,0,0,2410,2413,1,0,0,0,2411,
+        2409,1,0,0,0,2411,2412,1,0,0,0,2412,2414,1,0,0,0,2413,2411,1,0,0,
+        0,2414,2415,5,4,0,0,2415,321,1,0,0,0,2416,2418,5,255,0,0,2417,2419,
+        7,39,0,0,2418,2417,1,0,0,0,2418,2419,1,0,0,0,2419,2420,1,0,0,0,2420,
+        2421,5,355,0,0,2421,2422,5,244,0,0,2422,2423,5,245,0,0,2423,2425,
+        5,167,0,0,2424,2426,7,40,0,0,2425,2424,1,0,0,0,2425,2426,1,0,0,0,
+        2426,2427,1,0,0,0,2427,2428,5,355,0,0,2428,2429,5,257,0,0,2429,2430,
+        5,258,0,0,2430,2431,5,355,0,0,2431,323,1,0,0,0,2432,2434,5,255,0,
+        0,2433,2435,7,39,0,0,2434,2433,1,0,0,0,2434,2435,1,0,0,0,2435,2436,
+        1,0,0,0,2436,2438,5,355,0,0,2437,2439,3,302,151,0,2438,2437,1,0,
+        0,0,2439,2440,1,0,0,0,2440,2438,1,0,0,0,2440,2441,1,0,0,0,2441,2442,
+        1,0,0,0,2442,2443,5,257,0,0,2443,2444,5,258,0,0,2444,2446,5,355,
+        0,0,2445,2447,3,326,163,0,2446,2445,1,0,0,0,2446,2447,1,0,0,0,2447,
+        325,1,0,0,0,2448,2449,5,259,0,0,2449,2450,5,258,0,0,2450,2455,5,
+        355,0,0,2451,2452,5,22,0,0,2452,2454,5,355,0,0,2453,2451,1,0,0,0,
+        2454,2457,1,0,0,0,2455,2453,1,0,0,0,2455,2456,1,0,0,0,2456,2458,
+        1,0,0,0,2457,2455,1,0,0,0,2458,2459,7,41,0,0,2459,2461,5,262,0,0,
+        2460,2462,5,22,0,0,2461,2460,1,0,0,0,2461,2462,1,0,0,0,2462,2463,
+        1,0,0,0,2463,2464,5,263,0,0,2464,2465,5,258,0,0,2465,2470,5,355,
+        0,0,2466,2467,5,22,0,0,2467,2469,5,355,0,0,2468,2466,1,0,0,0,2469,
+        2472,1,0,0,0,2470,2468,1,0,0,0,2470,2471,1,0,0,0,2471,2473,1,0,0,
+        0,2472,2470,1,0,0,0,2473,2474,7,41,0,0,2474,2475,7,42,0,0,2475,327,
+        1,0,0,0,2476,2478,8,38,0,0,2477,2476,1,0,0,0,2478,2479,1,0,0,0,2479,
+        2477,1,0,0,0,2479,2480,1,0,0,0,2480,329,1,0,0,0,2481,2482,7,43,0,
+        0,2482,331,1,0,0,0,2483,2485,5,281,0,0,2484,2486,5,6,0,0,2485,2484,
+        1,0,0,0,2485,2486,1,0,0,0,2486,2487,1,0,0,0,2487,2488,5,355,0,0,
+        2488,333,1,0,0,0,2489,2491,5,282,0,0,2490,2492,5,6,0,0,2491,2490,
+        1,0,0,0,2491,2492,1,0,0,0,2492,2493,1,0,0,0,2493,2494,5,355,0,0,
+        2494,335,1,0,0,0,2495,2497,5,283,0,0,2496,2498,5,6,0,0,2497,2496,
+        1,0,0,0,2497,2498,1,0,0,0,2498,2499,1,0,0,0,2499,2500,5,355,0,0,
+        2500,337,1,0,0,0,2501,2504,5,289,0,0,2502,2503,5,293,0,0,2503,2505,
+        3,426,213,0,2504,2502,1,0,0,0,2504,2505,1,0,0,0,2505,2506,1,0,0,
+        0,2506,2510,5,3,0,0,2507,2509,3,340,170,0,2508,2507,1,0,0,0,2509,
+        2512,1,0,0,0,2510,2508,1,0,0,0,2510,2511,1,0,0,0,2511,2513,1,0,0,
+        0,2512,2510,1,0,0,0,2513,2514,5,4,0,0,2514,339,1,0,0,0,2515,2518,
+        3,342,171,0,2516,2518,3,344,172,0,2517,2515,1,0,0,0,2517,2516,1,
+        0,0,0,2518,341,1,0,0,0,2519,2520,5,294,0,0,2520,2529,3,330,165,0,
+        2521,2525,5,3,0,0,2522,2524,3,344,172,0,2523,2522,1,0,0,0,2524,2527,
+        1,0,0,0,2525,2523,1,0,0,0,2525,2526,1,0,0,0,2526,2528,1,0,0,0,2527,
+        2525,1,0,0,0,2528,2530,5,4,0,0,2529,2521,1,0,0,0,2529,2530,1,0,0,
+        0,2530,343,1,0,0,0,2531,2532,5,288,0,0,2532,2541,3,330,165,0,2533,
+        2537,5,3,0,0,2534,2536,3,346,173,0,2535,2534,1,0,0,0,2536,2539,1,
+        0,0,0,2537,2535,1,0,0,0,2537,2538,1,0,0,0,2538,2540,1,0,0,0,2539,
+        2537,1,0,0,0,2540,2542,5,4,0,0,2541,2533,1,0,0,0,2541,2542,1,0,0,
+        0,2542,345,1,0,0,0,2543,2545,5,295,0,0,2544,2546,5,6,0,0,2545,2544,
+        1,0,0,0,2545,2546,1,0,0,0,2546,2547,1,0,0,0,2547,2571,3,330,165,
+        0,2548,2550,5,296,0,0,2549,2551,5,6,0,0,2550,2549,1,0,0,0,2550,2551,
+        1,0,0,0,2551,2552,1,0,0,0,2552,2571,3,330,165,0,2553,2555,5,297,
+        0,0,2554,2556,5,6,0,0,2555,2554,1,0,0,0,2555,2556,1,0,0,0,2556,2557,
+        1,0,0,0,2557,2571,3,330,165,0,2558,2560,5,298,0,0,2559,2561,5,6,
+        0,0,2560,2559,1,0,0,0,2560,2561,1,0,0,0,2561,2562,1,0,0,0,2562,2571,
+        3,330,165,0,2563,2565,5,284,0,0,2564,2566,5,6,0,0,2565,2564,1,0,
+        0,0,2565,2566,1,0,0,0,2566,2567,1,0,0,0,2567,2571,5,355,0,0,2568,
+        2571,3,348,174,0,2569,2571,3,350,175,0,2570,2543,1,0,0,0,2570,2548,
+        1,0,0,0,2570,2553,1,0,0,0,2570,2558,1,0,0,0,2570,2563,1,0,0,0,2570,
+        2568,1,0,0,0,2570,2569,1,0,0,0,2571,347,1,0,0,0,2572,2576,5,299,
+        0,0,2573,2575,3,350,175,0,2574,2573,1,0,0,0,2575,2578,1,0,0,0,2576,
+        2574,1,0,0,0,2576,2577,1,0,0,0,2577,349,1,0,0,0,2578,2576,1,0,0,
+        0,2579,2580,7,44,0,0,2580,2582,5,355,0,0,2581,2583,3,330,165,0,2582,
+        2581,1,0,0,0,2582,2583,1,0,0,0,2583,351,1,0,0,0,2584,2585,5,303,
+        0,0,2585,2588,3,330,165,0,2586,2587,5,252,0,0,2587,2589,3,330,165,
+        0,2588,2586,1,0,0,0,2588,2589,1,0,0,0,2589,2590,1,0,0,0,2590,2598,
+        5,3,0,0,2591,2597,3,354,177,0,2592,2597,3,358,179,0,2593,2597,3,
+        374,187,0,2594,2597,3,376,188,0,2595,2597,3,378,189,0,2596,2591,
+        1,0,0,0,2596,2592,1,0,0,0,2596,2593,1,0,0,0,2596,2594,1,0,0,0,2596,
+        2595,1,0,0,0,2597,2600,1,0,0,0,2598,2596,1,0,0,0,2598,2599,1,0,0,
+        0,2599,2601,1,0,0,0,2600,2598,1,0,0,0,2601,2602,5,4,0,0,2602,353,
+        1,0,0,0,2603,2604,5,304,0,0,2604,2605,3,330,165,0,2605,2611,5,3,
+        0,0,2606,2610,3,356,178,0,2607,2610,3,358,179,0,2608,2610,3,362,
+        181,0,2609,2606,1,0,0,0,2609,2607,1,0,0,0,2609,2608,1,0,0,0,2610,
+        2613,1,0,0,0,2611,2609,1,0,0,0,2611,2612,1,0,0,0,2612,2614,1,0,0,
+        0,2613,2611,1,0,0,0,2614,2615,5,4,0,0,2615,355,1,0,0,0,2616,2618,
+        5,305,0,0,2617,2619,5,6,0,0,2618,2617,1,0,0,0,2618,2619,1,0,0,0,
+        2619,2622,1,0,0,0,2620,2623,3,330,165,0,2621,2623,5,355,0,0,2622,
+        2620,1,0,0,0,2622,2621,1,0,0,0,2623,2640,1,0,0,0,2624,2626,5,306,
+        0,0,2625,2627,5,6,0,0,2626,2625,1,0,0,0,2626,2627,1,0,0,0,2627,2628,
+        1,0,0,0,2628,2640,5,355,0,0,2629,2631,5,285,0,0,2630,2632,5,6,0,
+        0,2631,2630,1,0,0,0,2631,2632,1,0,0,0,2632,2633,1,0,0,0,2633,2640,
+        5,355,0,0,2634,2636,5,286,0,0,2635,2637,5,6,0,0,2636,2635,1,0,0,
+        0,2636,2637,1,0,0,0,2637,2638,1,0,0,0,2638,2640,5,355,0,0,2639,2616,
+        1,0,0,0,2639,2624,1,0,0,0,2639,2629,1,0,0,0,2639,2634,1,0,0,0,2640,
+        357,1,0,0,0,2641,2642,5,307,0,0,2642,2643,3,330,165,0,2643,2648,
+        5,3,0,0,2644,2647,3,360,180,0,2645,2647,3,362,181,0,2646,2644,1,
+        0,0,0,2646,2645,1,0,0,0,2647,2650,1,0,0,0,2648,2646,1,0,0,0,2648,
+        2649,1,0,0,0,2649,2651,1,0,0,0,2650,2648,1,0,0,0,2651,2652,5,4,0,
+        0,2652,359,1,0,0,0,2653,2655,5,305,0,0,2654,2656,5,6,0,0,2655,2654,
+        1,0,0,0,2655,2656,1,0,0,0,2656,2659,1,0,0,0,2657,2660,3,330,165,
+        0,2658,2660,5,355,0,0,2659,2657,1,0,0,0,2659,2658,1,0,0,0,2660,2678,
+        1,0,0,0,2661,2678,5,287,0,0,2662,2664,5,306,0,0,2663,2665,5,6,0,
+        0,2664,2663,1,0,0,0,2664,2665,1,0,0,0,2665,2666,1,0,0,0,2666,2678,
+        5,355,0,0,2667,2669,5,285,0,0,2668,2670,5,6,0,0,2669,2668,1,0,0,
+        0,2669,2670,1,0,0,0,2670,2671,1,0,0,0,2671,2678,5,355,0,0,2672,2674,
+        5,286,0,0,2673,2675,5,6,0,0,2674,2673,1,0,0,0,2674,2675,1,0,0,0,
+        2675,2676,1,0,0,0,2676,2678,5,355,0,0,2677,2653,1,0,0,0,2677,2661,
+        1,0,0,0,2677,2662,1,0,0,0,2677,2667,1,0,0,0,2677,2672,1,0,0,0,2678,
+        361,1,0,0,0,2679,2680,7,45,0,0,2680,2689,3,330,165,0,2681,2685,5,
+        3,0,0,2682,2684,3,364,182,0,2683,2682,1,0,0,0,2684,2687,1,0,0,0,
+        2685,2683,1,0,0,0,2685,2686,1,0,0,0,2686,2688,1,0,0,0,2687,2685,
+        1,0,0,0,2688,2690,5,4,0,0,2689,2681,1,0,0,0,2689,2690,1,0,0,0,2690,
+        363,1,0,0,0,2691,2693,5,297,0,0,2692,2694,5,6,0,0,2693,2692,1,0,
+        0,0,2693,2694,1,0,0,0,2694,2695,1,0,0,0,2695,2708,3,330,165,0,2696,
+        2698,5,298,0,0,2697,2699,5,6,0,0,2698,2697,1,0,0,0,2698,2699,1,0,
+        0,0,2699,2700,1,0,0,0,2700,2708,3,330,165,0,2701,2703,5,299,0,0,
+        2702,2704,3,366,183,0,2703,2702,1,0,0,0,2704,2705,1,0,0,0,2705,2703,
+        1,0,0,0,2705,2706,1,0,0,0,2706,2708,1,0,0,0,2707,2691,1,0,0,0,2707,
+        2696,1,0,0,0,2707,2701,1,0,0,0,2708,365,1,0,0,0,2709,2712,3,368,
+        184,0,2710,2712,3,370,185,0,2711,2709,1,0,0,0,2711,2710,1,0,0,0,
+        2712,367,1,0,0,0,2713,2714,7,46,0,0,2714,2715,5,355,0,0,2715,369,
+        1,0,0,0,2716,2717,5,302,0,0,2717,2720,5,355,0,0,2718,2721,3,330,
+        165,0,2719,2721,5,355,0,0,2720,2718,1,0,0,0,2720,2719,1,0,0,0,2720,
+        2721,1,0,0,0,2721,371,1,0,0,0,2722,2723,5,308,0,0,2723,2724,5,293,
+        0,0,2724,2729,5,355,0,0,2725,2726,5,309,0,0,2726,2727,5,293,0,0,
+        2727,2729,5,355,0,0,2728,2722,1,0,0,0,2728,2725,1,0,0,0,2729,373,
+        1,0,0,0,2730,2731,5,310,0,0,2731,2732,3,330,165,0,2732,2733,5,3,
+        0,0,2733,2735,5,255,0,0,2734,2736,7,39,0,0,2735,2734,1,0,0,0,2735,
+        2736,1,0,0,0,2736,2737,1,0,0,0,2737,2738,3,330,165,0,2738,2739,5,
+        244,0,0,2739,2740,5,269,0,0,2740,2741,5,355,0,0,2741,2742,5,311,
+        0,0,2742,2743,5,312,0,0,2743,2745,5,251,0,0,2744,2746,3,372,186,
+        0,2745,2744,1,0,0,0,2746,2747,1,0,0,0,2747,2745,1,0,0,0,2747,2748,
+        1,0,0,0,2748,2749,1,0,0,0,2749,2750,5,4,0,0,2750,375,1,0,0,0,2751,
+        2752,5,313,0,0,2752,2753,3,330,165,0,2753,2754,5,3,0,0,2754,2755,
+        5,314,0,0,2755,2756,5,249,0,0,2756,2757,5,315,0,0,2757,2758,5,316,
+        0,0,2758,2759,5,355,0,0,2759,2760,5,22,0,0,2760,2761,5,317,0,0,2761,
+        2762,5,318,0,0,2762,2763,5,319,0,0,2763,2774,5,167,0,0,2764,2775,
+        5,320,0,0,2765,2766,5,321,0,0,2766,2767,5,291,0,0,2767,2768,5,322,
+        0,0,2768,2775,5,246,0,0,2769,2770,5,320,0,0,2770,2771,5,22,0,0,2771,
+        2772,5,291,0,0,2772,2773,5,322,0,0,2773,2775,5,246,0,0,2774,2764,
+        1,0,0,0,2774,2765,1,0,0,0,2774,2769,1,0,0,0,2775,2776,1,0,0,0,2776,
+        2778,5,355,0,0,2777,2779,5,22,0,0,2778,2777,1,0,0,0,2778,2779,1,
+        0,0,0,2779,2780,1,0,0,0,2780,2781,5,323,0,0,2781,2782,5,324,0,0,
+        2782,2783,5,322,0,0,2783,2784,5,325,0,0,2784,2785,5,355,0,0,2785,
+        2786,5,351,0,0,2786,2787,5,249,0,0,2787,2788,5,326,0,0,2788,2789,
+        5,327,0,0,2789,2790,5,328,0,0,2790,2791,5,329,0,0,2791,2792,5,330,
+        0,0,2792,2793,5,88,0,0,2793,2794,5,331,0,0,2794,2795,5,355,0,0,2795,
+        2796,5,4,0,0,2796,377,1,0,0,0,2797,2798,5,332,0,0,2798,2799,3,330,
+        165,0,2799,2800,5,3,0,0,2800,2801,5,333,0,0,2801,2802,5,249,0,0,
+        2802,2803,5,267,0,0,2803,2804,5,293,0,0,2804,2805,5,249,0,0,2805,
+        2806,5,334,0,0,2806,2807,5,335,0,0,2807,2808,3,330,165,0,2808,2809,
+        5,336,0,0,2809,2810,5,355,0,0,2810,2811,5,337,0,0,2811,2812,5,338,
+        0,0,2812,2813,5,355,0,0,2813,2814,5,339,0,0,2814,2815,5,340,0,0,
+        2815,2816,5,341,0,0,2816,2817,5,311,0,0,2817,2818,5,355,0,0,2818,
+        2819,5,342,0,0,2819,2820,5,249,0,0,2820,2821,5,268,0,0,2821,2822,
+        5,293,0,0,2822,2823,5,343,0,0,2823,2824,5,341,0,0,2824,2825,5,311,
+        0,0,2825,2826,5,355,0,0,2826,2827,5,4,0,0,2827,379,1,0,0,0,2828,
+        2832,8,47,0,0,2829,2831,8,48,0,0,2830,2829,1,0,0,0,2831,2834,1,0,
+        0,0,2832,2830,1,0,0,0,2832,2833,1,0,0,0,2833,2836,1,0,0,0,2834,2832,
+        1,0,0,0,2835,2837,5,106,0,0,2836,2835,1,0,0,0,2836,2837,1,0,0,0,
+        2837,381,1,0,0,0,2838,2848,3,384,192,0,2839,2848,3,386,193,0,2840,
+        2848,3,388,194,0,2841,2848,3,390,195,0,2842,2848,3,392,196,0,2843,
+        2848,3,394,197,0,2844,2848,3,396,198,0,2845,2848,3,398,199,0,2846,
+        2848,3,410,205,0,2847,2838,1,0,0,0,2847,2839,1,0,0,0,2847,2840,1,
+        0,0,0,2847,2841,1,0,0,0,2847,2842,1,0,0,0,2847,2843,1,0,0,0,2847,
+        2844,1,0,0,0,2847,2845,1,0,0,0,2847,2846,1,0,0,0,2848,383,1,0,0,
+        0,2849,2850,5,74,0,0,2850,2851,5,355,0,0,2851,2860,5,3,0,0,2852,
+        2857,5,355,0,0,2853,2854,5,22,0,0,2854,2856,5,355,0,0,2855,2853,
+        1,0,0,0,2856,2859,1,0,0,0,2857,2855,1,0,0,0,2857,2858,1,0,0,0,2858,
+        2861,1,0,0,0,2859,2857,1,0,0,0,2860,2852,1,0,0,0,2860,2861,1,0,0,
+        0,2861,2862,1,0,0,0,2862,2864,5,4,0,0,2863,2865,5,106,0,0,2864,2863,
+        1,0,0,0,2864,2865,1,0,0,0,2865,385,1,0,0,0,2866,2867,5,76,0,0,2867,
+        2868,5,355,0,0,2868,2877,5,3,0,0,2869,2874,5,355,0,0,2870,2871,5,
+        22,0,0,2871,2873,5,355,0,0,2872,2870,1,0,0,0,2873,2876,1,0,0,0,2874,
+        2872,1,0,0,0,2874,2875,1,0,0,0,2875,2878,1,0,0,0,2876,2874,1,0,0,
+        0,2877,2869,1,0,0,0,2877,2878,1,0,0,0,2878,2879,1,0,0,0,2879,2881,
+        5,4,0,0,2880,2882,5,106,0,0,2881,2880,1,0,0,0,2881,2882,1,0,0,0,
+        2882,387,1,0,0,0,2883,2884,5,276,0,0,2884,2885,5,355,0,0,2885,2894,
+        5,3,0,0,2886,2891,5,355,0,0,2887,2888,5,22,0,0,2888,2890,5,355,0,
+        0,2889,2887,1,0,0,0,2890,2893,1,0,0,0,2891,2889,1,0,0,0,2891,2892,
+        1,0,0,0,2892,2895,1,0,0,0,2893,2891,1,0,0,0,2894,2886,1,0,0,0,2894,
+        2895,1,0,0,0,2895,2896,1,0,0,0,2896,2898,5,4,0,0,2897,2899,5,106,
+        0,0,2898,2897,1,0,0,0,2898,2899,1,0,0,0,2899,389,1,0,0,0,2900,2901,
+        5,277,0,0,2901,2902,5,355,0,0,2902,2911,5,3,0,0,2903,2908,5,355,
+        0,0,2904,2905,5,22,0,0,2905,2907,5,355,0,0,2906,2904,1,0,0,0,2907,
+        2910,1,0,0,0,2908,2906,1,0,0,0,2908,2909,1,0,0,0,2909,2912,1,0,0,
+        0,2910,2908,1,0,0,0,2911,2903,1,0,0,0,2911,2912,1,0,0,0,2912,2913,
+        1,0,0,0,2913,2915,5,4,0,0,2914,2916,5,106,0,0,2915,2914,1,0,0,0,
+        2915,2916,1,0,0,0,2916,391,1,0,0,0,2917,2918,5,278,0,0,2918,2919,
+        5,355,0,0,2919,2928,5,3,0,0,2920,2925,5,355,0,0,2921,2922,5,22,0,
+        0,2922,2924,5,355,0,0,2923,2921,1,0,0,0,2924,2927,1,0,0,0,2925,2923,
+        1,0,0,0,2925,2926,1,0,0,0,2926,2929,1,0,0,0,2927,2925,1,0,0,0,2928,
+        2920,1,0,0,0,2928,2929,1,0,0,0,2929,2930,1,0,0,0,2930,2932,5,4,0,
+        0,2931,2933,5,106,0,0,2932,2931,1,0,0,0,2932,2933,1,0,0,0,2933,393,
+        1,0,0,0,2934,2935,5,279,0,0,2935,2936,5,355,0,0,2936,2945,5,3,0,
+        0,2937,2942,5,355,0,0,2938,2939,5,22,0,0,2939,2941,5,355,0,0,2940,
+        2938,1,0,0,0,2941,2944,1,0,0,0,2942,2940,1,0,0,0,2942,2943,1,0,0,
+        0,2943,2946,1,0,0,0,2944,2942,1,0,0,0,2945,2937,1,0,0,0,2945,2946,
+        1,0,0,0,2946,2947,1,0,0,0,2947,2949,5,4,0,0,2948,2950,5,106,0,0,
+        2949,2948,1,0,0,0,2949,2950,1,0,0,0,2950,395,1,0,0,0,2951,2952,5,
+        280,0,0,2952,2956,5,3,0,0,2953,2955,3,410,205,0,2954,2953,1,0,0,
+        0,2955,2958,1,0,0,0,2956,2954,1,0,0,0,2956,2957,1,0,0,0,2957,2959,
+        1,0,0,0,2958,2956,1,0,0,0,2959,2960,5,4,0,0,2960,397,1,0,0,0,2961,
+        2962,5,240,0,0,2962,2963,3,330,165,0,2963,2967,5,3,0,0,2964,2966,
+        3,400,200,0,2965,2964,1,0,0,0,2966,2969,1,0,0,0,2967,2965,1,0,0,
+        0,2967,2968,1,0,0,0,2968,2970,1,0,0,0,2969,2967,1,0,0,0,2970,2971,
+        5,4,0,0,2971,399,1,0,0,0,2972,2976,3,402,201,0,2973,2976,3,404,202,
+        0,2974,2976,3,406,203,0,2975,2972,1,0,0,0,2975,2973,1,0,0,0,2975,
+        2974,1,0,0,0,2976,401,1,0,0,0,2977,2978,5,344,0,0,2978,2979,5,6,
+        0,0,2979,2980,5,345,0,0,2980,403,1,0,0,0,2981,2983,5,346,0,0,2982,
+        2984,3,408,204,0,2983,2982,1,0,0,0,2983,2984,1,0,0,0,2984,405,1,
+        0,0,0,2985,2987,5,347,0,0,2986,2988,3,408,204,0,2987,2986,1,0,0,
+        0,2987,2988,1,0,0,0,2988,407,1,0,0,0,2989,2996,5,355,0,0,2990,2992,
+        5,22,0,0,2991,2990,1,0,0,0,2991,2992,1,0,0,0,2992,2993,1,0,0,0,2993,
+        2995,5,355,0,0,2994,2991,1,0,0,0,2995,2998,1,0,0,0,2996,2994,1,0,
+        0,0,2996,2997,1,0,0,0,2997,409,1,0,0,0,2998,2996,1,0,0,0,2999,3006,
+        3,412,206,0,3000,3006,3,414,207,0,3001,3006,3,416,208,0,3002,3006,
+        3,418,209,0,3003,3006,3,420,210,0,3004,3006,3,422,211,0,3005,2999,
+        1,0,0,0,3005,3000,1,0,0,0,3005,3001,1,0,0,0,3005,3002,1,0,0,0,3005,
+        3003,1,0,0,0,3005,3004,1,0,0,0,3006,411,1,0,0,0,3007,3008,5,270,
+        0,0,3008,3009,5,3,0,0,3009,3010,5,266,0,0,3010,3012,3,330,165,0,
+        3011,3013,3,424,212,0,3012,3011,1,0,0,0,3012,3013,1,0,0,0,3013,3014,
+        1,0,0,0,3014,3015,5,4,0,0,3015,413,1,0,0,0,3016,3017,5,271,0,0,3017,
+        3018,5,3,0,0,3018,3019,5,266,0,0,3019,3021,3,330,165,0,3020,3022,
+        3,424,212,0,3021,3020,1,0,0,0,3021,3022,1,0,0,0,3022,3023,1,0,0,
+        0,3023,3024,5,4,0,0,3024,415,1,0,0,0,3025,3026,5,272,0,0,3026,3027,
+        5,3,0,0,3027,3028,5,266,0,0,3028,3030,3,330,165,0,3029,3031,3,424,
+        212,0,3030,3029,1,0,0,0,3030,3031,1,0,0,0,3031,3032,1,0,0,0,3032,
+        3033,5,4,0,0,3033,417,1,0,0,0,3034,3035,5,273,0,0,3035,3036,5,3,
+        0,0,3036,3037,5,266,0,0,3037,3039,3,330,165,0,3038,3040,3,424,212,
+        0,3039,3038,1,0,0,0,3039,3040,1,0,0,0,3040,3041,1,0,0,0,3041,3042,
+        5,4,0,0,3042,419,1,0,0,0,3043,3044,5,274,0,0,3044,3045,5,3,0,0,3045,
+        3046,5,266,0,0,3046,3048,3,330,165,0,3047,3049,3,424,212,0,3048,
+        3047,1,0,0,0,3048,3049,1,0,0,0,3049,3050,1,0,0,0,3050,3051,5,4,0,
+        0,3051,421,1,0,0,0,3052,3053,5,275,0,0,3053,3054,5,3,0,0,3054,3055,
+        5,266,0,0,3055,3057,3,330,165,0,3056,3058,3,424,212,0,3057,3056,
+        1,0,0,0,3057,3058,1,0,0,0,3058,3059,1,0,0,0,3059,3060,5,4,0,0,3060,
+        423,1,0,0,0,3061,3066,5,355,0,0,3062,3063,5,22,0,0,3063,3065,5,355,
+        0,0,3064,3062,1,0,0,0,3065,3068,1,0,0,0,3066,3064,1,0,0,0,3066,3067,
+        1,0,0,0,3067,425,1,0,0,0,3068,3066,1,0,0,0,3069,3074,3,330,165,0,
+        3070,3071,5,22,0,0,3071,3073,3,330,165,0,3072,3070,1,0,0,0,3073,
+        3076,1,0,0,0,3074,3072,1,0,0,0,3074,3075,1,0,0,0,3075,427,1,0,0,
+        0,3076,3074,1,0,0,0,3077,3082,3,430,215,0,3078,3079,5,22,0,0,3079,
+        3081,3,430,215,0,3080,3078,1,0,0,0,3081,3084,1,0,0,0,3082,3080,1,
+        0,0,0,3082,3083,1,0,0,0,3083,429,1,0,0,0,3084,3082,1,0,0,0,3085,
+        3090,3,330,165,0,3086,3087,5,348,0,0,3087,3089,3,330,165,0,3088,
+        3086,1,0,0,0,3089,3092,1,0,0,0,3090,3088,1,0,0,0,3090,3091,1,0,0,
+        0,3091,431,1,0,0,0,3092,3090,1,0,0,0,3093,3098,3,330,165,0,3094,
+        3095,7,49,0,0,3095,3097,3,330,165,0,3096,3094,1,0,0,0,3097,3100,
+        1,0,0,0,3098,3096,1,0,0,0,3098,3099,1,0,0,0,3099,433,1,0,0,0,3100,
+        3098,1,0,0,0,437,436,438,462,466,472,478,485,490,495,506,512,516,
         520,523,527,530,535,545,556,561,566,569,578,582,590,594,599,604,
-        609,616,621,626,631,636,639,650,656,659,666,669,680,686,694,699,
-        705,710,713,719,728,731,737,740,748,753,757,762,764,771,799,803,
-        807,817,821,824,830,833,841,846,850,856,862,869,885,889,893,897,
-        919,922,928,931,939,944,948,953,955,962,978,1001,1004,1010,1013,
-        1021,1026,1030,1036,1042,1049,1065,1088,1093,1099,1105,1116,1119,
-        1127,1130,1135,1139,1145,1151,1162,1170,1181,1189,1195,1203,1207,
-        1209,1221,1226,1229,1238,1243,1255,1260,1264,1270,1276,1283,1298,
-        1302,1305,1312,1316,1319,1326,1330,1334,1337,1341,1343,1346,1349,
-        1352,1357,1362,1366,1369,1372,1375,1378,1384,1389,1393,1396,1398,
-        1405,1410,1412,1414,1424,1428,1432,1435,1438,1445,1449,1452,1455,
-        1461,1465,1467,1470,1473,1478,1484,1488,1492,1495,1498,1504,1508,
-        1512,1515,1519,1521,1526,1534,1549,1555,1562,1566,1573,1578,1581,
-        1584,1587,1594,1600,1607,1611,1616,1619,1640,1644,1648,1652,1656,
-        1660,1664,1668,1672,1676,1680,1684,1688,1692,1696,1700,1704,1708,
-        1712,1716,1720,1722,1734,1740,1743,1749,1755,1762,1783,1786,1794,
-        1796,1800,1806,1817,1823,1825,1829,1835,1845,1851,1853,1857,1863,
-        1871,1877,1879,1883,1889,1898,1901,1904,1910,1914,1917,1922,1926,
-        1939,1944,1946,1957,1966,1971,1976,1982,1986,1999,2004,2006,2037,
-        2040,2045,2052,2056,2063,2065,2071,2077,2088,2093,2101,2109,2114,
-        2117,2120,2123,2126,2133,2141,2147,2150,2153,2156,2159,2171,2174,
-        2180,2187,2203,2212,2219,2226,2231,2240,2243,2249,2258,2260,2264,
-        2272,2276,2282,2289,2294,2299,2303,2307,2311,2315,2317,2323,2334,
-        2339,2351,2359,2363,2366,2377,2382,2389,2396,2402,2404,2411,2418,
-        2427,2433,2439,2448,2454,2463,2472,2478,2484,2490,2497,2503,2510,
-        2518,2522,2530,2534,2538,2543,2548,2553,2558,2563,2569,2575,2581,
-        2589,2591,2602,2604,2611,2615,2619,2624,2629,2632,2639,2641,2648,
-        2652,2657,2662,2667,2670,2678,2682,2686,2691,2698,2700,2704,2713,
-        2721,2728,2740,2767,2771,2825,2829,2840,2850,2853,2857,2867,2870,
-        2874,2884,2887,2891,2901,2904,2908,2918,2921,2925,2935,2938,2942,
-        2949,2960,2968,2976,2980,2984,2989,2998,3005,3014,3023,3032,3041,
-        3050,3059,3067,3075,3083,3091
+        609,616,621,626,631,636,639,650,656,660,663,666,673,676,687,693,
+        701,706,712,717,720,726,735,738,744,747,755,760,764,769,771,778,
+        806,810,814,824,828,831,837,840,848,853,857,863,869,876,892,896,
+        900,904,926,929,935,938,946,951,955,960,962,969,985,1008,1011,1017,
+        1020,1028,1033,1037,1043,1049,1056,1072,1095,1100,1106,1112,1123,
+        1126,1134,1137,1142,1146,1152,1158,1169,1177,1188,1196,1202,1210,
+        1214,1216,1228,1233,1236,1245,1250,1262,1267,1271,1277,1283,1290,
+        1305,1309,1312,1319,1323,1326,1333,1337,1341,1344,1348,1350,1353,
+        1356,1359,1364,1369,1373,1376,1379,1382,1385,1391,1396,1400,1403,
+        1405,1412,1417,1419,1421,1431,1435,1439,1442,1445,1452,1456,1459,
+        1462,1468,1472,1474,1477,1480,1485,1491,1495,1499,1502,1505,1511,
+        1515,1519,1522,1526,1528,1533,1541,1556,1562,1569,1573,1580,1585,
+        1588,1591,1594,1601,1607,1614,1618,1623,1626,1647,1651,1655,1659,
+        1663,1667,1671,1675,1679,1683,1687,1691,1695,1699,1703,1707,1711,
+        1715,1719,1723,1727,1729,1741,1747,1750,1756,1762,1769,1790,1793,
+        1801,1803,1807,1813,1824,1830,1832,1836,1842,1852,1858,1860,1864,
+        1870,1878,1884,1886,1890,1896,1905,1908,1911,1917,1921,1924,1929,
+        1933,1946,1951,1953,1964,1973,1978,1983,1989,1993,2006,2011,2013,
+        2044,2047,2052,2059,2063,2070,2072,2078,2084,2095,2100,2108,2116,
+        2121,2124,2127,2130,2133,2140,2148,2154,2157,2160,2163,2166,2178,
+        2181,2187,2194,2210,2219,2226,2233,2238,2247,2250,2256,2265,2267,
+        2271,2279,2283,2289,2296,2301,2306,2310,2314,2318,2322,2324,2330,
+        2341,2346,2358,2366,2370,2373,2384,2389,2396,2403,2409,2411,2418,
+        2425,2434,2440,2446,2455,2461,2470,2479,2485,2491,2497,2504,2510,
+        2517,2525,2529,2537,2541,2545,2550,2555,2560,2565,2570,2576,2582,
+        2588,2596,2598,2609,2611,2618,2622,2626,2631,2636,2639,2646,2648,
+        2655,2659,2664,2669,2674,2677,2685,2689,2693,2698,2705,2707,2711,
+        2720,2728,2735,2747,2774,2778,2832,2836,2847,2857,2860,2864,2874,
+        2877,2881,2891,2894,2898,2908,2911,2915,2925,2928,2932,2942,2945,
+        2949,2956,2967,2975,2983,2987,2991,2996,3005,3012,3021,3030,3039,
+        3048,3057,3066,3074,3082,3090,3098
     ]
 
 class CMLParser ( Parser ):
@@ -4110,6 +4113,10 @@ class CMLParser ( Parser ):
             return self.getTypedRuleContext(CMLParser.IdListContext,0)
 
 
+        def subdomainType(self):
+            return self.getTypedRuleContext(CMLParser.SubdomainTypeContext,0)
+
+
         def contentBlock(self):
             return self.getTypedRuleContext(CMLParser.ContentBlockContext,0)
 
@@ -4138,6 +4145,7 @@ class CMLParser ( Parser ):
 
         localctx = CMLParser.SubdomainContext(self, self._ctx, self.state)
         self.enterRule(localctx, 48, self.RULE_subdomain)
+        self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
             self.state = 652
@@ -4154,11 +4162,29 @@ class CMLParser ( Parser ):
                 self.idList()
 
 
-            self.state = 659
+            self.state = 663
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,37,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,38,self._ctx)
             if la_ == 1:
                 self.state = 658
+                self.match(CMLParser.T__4)
+                self.state = 660
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==6:
+                    self.state = 659
+                    self.match(CMLParser.T__5)
+
+
+                self.state = 662
+                self.subdomainType()
+
+
+            self.state = 666
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,39,self._ctx)
+            if la_ == 1:
+                self.state = 665
                 localctx.body = self.contentBlock()
 
 
@@ -4206,7 +4232,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 661
+            self.state = 668
             _la = self._input.LA(1)
             if not(((((_la - 9)) & ~0x3f) == 0 and ((1 << (_la - 9)) & 2017612633061982209) != 0)):
                 self._errHandler.recoverInline(self)
@@ -4264,15 +4290,15 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 52, self.RULE_module)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 663
+            self.state = 670
             self.match(CMLParser.T__69)
-            self.state = 664
+            self.state = 671
             self.name()
-            self.state = 666
+            self.state = 673
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,38,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,40,self._ctx)
             if la_ == 1:
-                self.state = 665
+                self.state = 672
                 localctx.body = self.contentBlock()
 
 
@@ -4336,72 +4362,72 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 54, self.RULE_tacticDDDApplication)
         self._la = 0 # Token type
         try:
-            self.state = 699
+            self.state = 706
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,43,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,45,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 669
+                self.state = 676
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==355:
-                    self.state = 668
+                    self.state = 675
                     self.match(CMLParser.STRING)
 
 
-                self.state = 671
+                self.state = 678
                 self.match(CMLParser.T__70)
-                self.state = 672
+                self.state = 679
                 self.name()
-                self.state = 673
+                self.state = 680
                 self.match(CMLParser.T__2)
-                self.state = 674
+                self.state = 681
                 self.match(CMLParser.T__71)
-                self.state = 675
+                self.state = 682
                 self.match(CMLParser.T__5)
-                self.state = 676
+                self.state = 683
                 self.qualifiedName()
-                self.state = 680
+                self.state = 687
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while ((((_la - 75)) & ~0x3f) == 0 and ((1 << (_la - 75)) & 139573854211) != 0) or ((((_la - 201)) & ~0x3f) == 0 and ((1 << (_la - 201)) & 7) != 0) or _la==355:
-                    self.state = 677
+                    self.state = 684
                     self.tacticDDDElement()
-                    self.state = 682
+                    self.state = 689
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 683
+                self.state = 690
                 self.match(CMLParser.T__3)
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 686
+                self.state = 693
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==355:
-                    self.state = 685
+                    self.state = 692
                     self.match(CMLParser.STRING)
 
 
-                self.state = 688
+                self.state = 695
                 self.match(CMLParser.T__72)
-                self.state = 689
+                self.state = 696
                 self.name()
-                self.state = 690
+                self.state = 697
                 self.match(CMLParser.T__2)
-                self.state = 694
+                self.state = 701
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while ((((_la - 75)) & ~0x3f) == 0 and ((1 << (_la - 75)) & 139573854211) != 0) or ((((_la - 201)) & ~0x3f) == 0 and ((1 << (_la - 201)) & 7) != 0) or _la==355:
-                    self.state = 691
+                    self.state = 698
                     self.tacticDDDElement()
-                    self.state = 696
+                    self.state = 703
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 697
+                self.state = 704
                 self.match(CMLParser.T__3)
                 pass
 
@@ -4463,27 +4489,27 @@ class CMLParser ( Parser ):
         localctx = CMLParser.TacticDDDElementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 56, self.RULE_tacticDDDElement)
         try:
-            self.state = 705
+            self.state = 712
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [201]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 701
+                self.state = 708
                 self.service()
                 pass
             elif token in [202]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 702
+                self.state = 709
                 self.resource()
                 pass
             elif token in [203]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 703
+                self.state = 710
                 self.consumer()
                 pass
             elif token in [75, 76, 97, 99, 100, 101, 102, 103, 104, 105, 112, 355]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 704
+                self.state = 711
                 self.domainObject()
                 pass
             else:
@@ -4540,15 +4566,15 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 58, self.RULE_aggregate)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 707
+            self.state = 714
             self.match(CMLParser.T__73)
-            self.state = 708
+            self.state = 715
             self.name()
-            self.state = 710
+            self.state = 717
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,45,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,47,self._ctx)
             if la_ == 1:
-                self.state = 709
+                self.state = 716
                 localctx.body = self.contentBlock()
 
 
@@ -4602,15 +4628,15 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 713
+            self.state = 720
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 712
+                self.state = 719
                 self.match(CMLParser.STRING)
 
 
-            self.state = 715
+            self.state = 722
             self.simpleDomainObjectOrEnum()
         except RecognitionException as re:
             localctx.exception = re
@@ -4661,17 +4687,17 @@ class CMLParser ( Parser ):
         localctx = CMLParser.SimpleDomainObjectOrEnumContext(self, self._ctx, self.state)
         self.enterRule(localctx, 62, self.RULE_simpleDomainObjectOrEnum)
         try:
-            self.state = 719
+            self.state = 726
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [75, 76, 97, 99, 100, 101, 102, 103, 104, 112]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 717
+                self.state = 724
                 self.simpleDomainObject()
                 pass
             elif token in [105]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 718
+                self.state = 725
                 self.enumDecl()
                 pass
             else:
@@ -4746,48 +4772,48 @@ class CMLParser ( Parser ):
         localctx = CMLParser.SimpleDomainObjectContext(self, self._ctx, self.state)
         self.enterRule(localctx, 64, self.RULE_simpleDomainObject)
         try:
-            self.state = 728
+            self.state = 735
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,48,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,50,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 721
+                self.state = 728
                 self.entity()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 722
+                self.state = 729
                 self.valueObject()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 723
+                self.state = 730
                 self.domainEvent()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 724
+                self.state = 731
                 self.commandEvent()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 725
+                self.state = 732
                 self.dataTransferObject()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 726
+                self.state = 733
                 self.trait()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 727
+                self.state = 734
                 self.basicType()
                 pass
 
@@ -4860,67 +4886,67 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 731
+            self.state = 738
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==75:
-                self.state = 730
+                self.state = 737
                 self.match(CMLParser.T__74)
 
 
-            self.state = 733
+            self.state = 740
             self.match(CMLParser.T__75)
-            self.state = 734
+            self.state = 741
             self.name()
-            self.state = 740
+            self.state = 747
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,51,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,53,self._ctx)
             if la_ == 1:
-                self.state = 735
+                self.state = 742
                 self.match(CMLParser.T__76)
-                self.state = 737
+                self.state = 744
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 736
+                    self.state = 743
                     self.match(CMLParser.T__77)
 
 
-                self.state = 739
+                self.state = 746
                 self.name()
 
 
-            self.state = 753
+            self.state = 760
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,53,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,55,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 742
+                    self.state = 749
                     self.match(CMLParser.WITH)
-                    self.state = 743
+                    self.state = 750
                     self.traitRef()
-                    self.state = 748
+                    self.state = 755
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,52,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,54,self._ctx)
                     while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                         if _alt==1:
-                            self.state = 744
+                            self.state = 751
                             self.match(CMLParser.T__21)
-                            self.state = 745
+                            self.state = 752
                             self.traitRef() 
-                        self.state = 750
+                        self.state = 757
                         self._errHandler.sync(self)
-                        _alt = self._interp.adaptivePredict(self._input,52,self._ctx)
+                        _alt = self._interp.adaptivePredict(self._input,54,self._ctx)
              
-                self.state = 755
+                self.state = 762
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,53,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,55,self._ctx)
 
-            self.state = 757
+            self.state = 764
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,54,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,56,self._ctx)
             if la_ == 1:
-                self.state = 756
+                self.state = 763
                 localctx.body = self.entityBody()
 
 
@@ -4981,31 +5007,31 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 759
+            self.state = 766
             self.match(CMLParser.T__2)
-            self.state = 764
+            self.state = 771
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72475425637649) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596597505) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35184372088833) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 762
+                self.state = 769
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,55,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,57,self._ctx)
                 if la_ == 1:
-                    self.state = 760
+                    self.state = 767
                     self.entityFlag()
                     pass
 
                 elif la_ == 2:
-                    self.state = 761
+                    self.state = 768
                     self.feature()
                     pass
 
 
-                self.state = 766
+                self.state = 773
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 767
+            self.state = 774
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -5060,192 +5086,192 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 70, self.RULE_entityFlag)
         self._la = 0 # Token type
         try:
-            self.state = 821
+            self.state = 828
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,62,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,64,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 769
+                self.state = 776
                 self.match(CMLParser.T__78)
-                self.state = 771
+                self.state = 778
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 770
+                    self.state = 777
                     self.match(CMLParser.T__77)
 
 
-                self.state = 773
+                self.state = 780
                 self.qualifiedName()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 774
+                self.state = 781
                 self.match(CMLParser.T__79)
-                self.state = 775
+                self.state = 782
                 self.match(CMLParser.T__5)
-                self.state = 776
+                self.state = 783
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 777
+                self.state = 784
                 self.match(CMLParser.T__80)
-                self.state = 778
+                self.state = 785
                 self.match(CMLParser.T__5)
-                self.state = 779
+                self.state = 786
                 self.qualifiedName()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 780
+                self.state = 787
                 self.match(CMLParser.T__81)
-                self.state = 781
+                self.state = 788
                 self.match(CMLParser.T__5)
-                self.state = 782
+                self.state = 789
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 783
+                self.state = 790
                 self.match(CMLParser.T__82)
-                self.state = 784
+                self.state = 791
                 self.match(CMLParser.T__5)
-                self.state = 785
+                self.state = 792
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 786
+                self.state = 793
                 self.match(CMLParser.T__83)
-                self.state = 787
+                self.state = 794
                 self.match(CMLParser.T__5)
-                self.state = 788
+                self.state = 795
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 789
+                self.state = 796
                 self.match(CMLParser.T__84)
-                self.state = 790
+                self.state = 797
                 self.match(CMLParser.T__5)
-                self.state = 791
+                self.state = 798
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 792
+                self.state = 799
                 self.match(CMLParser.T__85)
-                self.state = 793
+                self.state = 800
                 self.match(CMLParser.T__5)
-                self.state = 794
+                self.state = 801
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 795
+                self.state = 802
                 self.match(CMLParser.T__86)
-                self.state = 796
+                self.state = 803
                 self.match(CMLParser.T__5)
-                self.state = 797
+                self.state = 804
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 799
+                self.state = 806
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 798
+                    self.state = 805
                     self.notPrefix()
 
 
-                self.state = 801
+                self.state = 808
                 self.match(CMLParser.T__87)
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 803
+                self.state = 810
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 802
+                    self.state = 809
                     self.notPrefix()
 
 
-                self.state = 805
+                self.state = 812
                 self.match(CMLParser.T__88)
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 807
+                self.state = 814
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 806
+                    self.state = 813
                     self.notPrefix()
 
 
-                self.state = 809
+                self.state = 816
                 self.match(CMLParser.T__89)
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 810
+                self.state = 817
                 self.match(CMLParser.T__90)
                 pass
 
             elif la_ == 14:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 811
+                self.state = 818
                 self.match(CMLParser.T__91)
                 pass
 
             elif la_ == 15:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 812
+                self.state = 819
                 self.match(CMLParser.T__92)
                 pass
 
             elif la_ == 16:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 813
+                self.state = 820
                 self.match(CMLParser.T__93)
-                self.state = 814
+                self.state = 821
                 self.match(CMLParser.T__5)
-                self.state = 815
+                self.state = 822
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 17:
                 self.enterOuterAlt(localctx, 17)
-                self.state = 817
+                self.state = 824
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 816
+                    self.state = 823
                     self.notPrefix()
 
 
-                self.state = 819
+                self.state = 826
                 self.match(CMLParser.T__94)
                 pass
 
             elif la_ == 18:
                 self.enterOuterAlt(localctx, 18)
-                self.state = 820
+                self.state = 827
                 self.match(CMLParser.T__95)
                 pass
 
@@ -5318,67 +5344,67 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 824
+            self.state = 831
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==75:
-                self.state = 823
+                self.state = 830
                 self.match(CMLParser.T__74)
 
 
-            self.state = 826
+            self.state = 833
             self.match(CMLParser.T__96)
-            self.state = 827
+            self.state = 834
             self.name()
-            self.state = 833
+            self.state = 840
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,65,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,67,self._ctx)
             if la_ == 1:
-                self.state = 828
+                self.state = 835
                 self.match(CMLParser.T__76)
-                self.state = 830
+                self.state = 837
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 829
+                    self.state = 836
                     self.match(CMLParser.T__77)
 
 
-                self.state = 832
+                self.state = 839
                 self.name()
 
 
-            self.state = 846
+            self.state = 853
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,67,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,69,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 835
+                    self.state = 842
                     self.match(CMLParser.WITH)
-                    self.state = 836
+                    self.state = 843
                     self.traitRef()
-                    self.state = 841
+                    self.state = 848
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,66,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,68,self._ctx)
                     while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                         if _alt==1:
-                            self.state = 837
+                            self.state = 844
                             self.match(CMLParser.T__21)
-                            self.state = 838
+                            self.state = 845
                             self.traitRef() 
-                        self.state = 843
+                        self.state = 850
                         self._errHandler.sync(self)
-                        _alt = self._interp.adaptivePredict(self._input,66,self._ctx)
+                        _alt = self._interp.adaptivePredict(self._input,68,self._ctx)
              
-                self.state = 848
+                self.state = 855
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,67,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,69,self._ctx)
 
-            self.state = 850
+            self.state = 857
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,68,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,70,self._ctx)
             if la_ == 1:
-                self.state = 849
+                self.state = 856
                 localctx.body = self.valueObjectBody()
 
 
@@ -5439,30 +5465,30 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 852
+            self.state = 859
             self.match(CMLParser.T__2)
-            self.state = 856
+            self.state = 863
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,69,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,71,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 853
+                    self.state = 860
                     self.valueObjectFlag() 
-                self.state = 858
+                self.state = 865
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,69,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,71,self._ctx)
 
-            self.state = 862
+            self.state = 869
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72475425637649) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596597505) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35184372088833) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 859
+                self.state = 866
                 self.feature()
-                self.state = 864
+                self.state = 871
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 865
+            self.state = 872
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -5517,192 +5543,192 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 76, self.RULE_valueObjectFlag)
         self._la = 0 # Token type
         try:
-            self.state = 919
+            self.state = 926
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,76,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,78,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 867
+                self.state = 874
                 self.match(CMLParser.T__78)
-                self.state = 869
+                self.state = 876
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 868
+                    self.state = 875
                     self.match(CMLParser.T__77)
 
 
-                self.state = 871
+                self.state = 878
                 self.qualifiedName()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 872
+                self.state = 879
                 self.match(CMLParser.T__80)
-                self.state = 873
+                self.state = 880
                 self.match(CMLParser.T__5)
-                self.state = 874
+                self.state = 881
                 self.qualifiedName()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 875
+                self.state = 882
                 self.match(CMLParser.T__79)
-                self.state = 876
+                self.state = 883
                 self.match(CMLParser.T__5)
-                self.state = 877
+                self.state = 884
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 878
+                self.state = 885
                 self.match(CMLParser.T__90)
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 879
+                self.state = 886
                 self.match(CMLParser.T__91)
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 880
+                self.state = 887
                 self.match(CMLParser.T__92)
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 881
+                self.state = 888
                 self.match(CMLParser.T__93)
-                self.state = 882
+                self.state = 889
                 self.match(CMLParser.T__5)
-                self.state = 883
+                self.state = 890
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 885
+                self.state = 892
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 884
+                    self.state = 891
                     self.notPrefix()
 
 
-                self.state = 887
+                self.state = 894
                 self.match(CMLParser.T__94)
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 889
+                self.state = 896
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 888
+                    self.state = 895
                     self.notPrefix()
 
 
-                self.state = 891
+                self.state = 898
                 self.match(CMLParser.T__97)
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 893
+                self.state = 900
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 892
+                    self.state = 899
                     self.notPrefix()
 
 
-                self.state = 895
+                self.state = 902
                 self.match(CMLParser.T__89)
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 897
+                self.state = 904
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 896
+                    self.state = 903
                     self.notPrefix()
 
 
-                self.state = 899
+                self.state = 906
                 self.match(CMLParser.T__88)
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 900
+                self.state = 907
                 self.match(CMLParser.T__95)
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 901
+                self.state = 908
                 self.match(CMLParser.T__86)
-                self.state = 902
+                self.state = 909
                 self.match(CMLParser.T__5)
-                self.state = 903
+                self.state = 910
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 14:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 904
+                self.state = 911
                 self.match(CMLParser.T__81)
-                self.state = 905
+                self.state = 912
                 self.match(CMLParser.T__5)
-                self.state = 906
+                self.state = 913
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 15:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 907
+                self.state = 914
                 self.match(CMLParser.T__82)
-                self.state = 908
+                self.state = 915
                 self.match(CMLParser.T__5)
-                self.state = 909
+                self.state = 916
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 16:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 910
+                self.state = 917
                 self.match(CMLParser.T__83)
-                self.state = 911
+                self.state = 918
                 self.match(CMLParser.T__5)
-                self.state = 912
+                self.state = 919
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 17:
                 self.enterOuterAlt(localctx, 17)
-                self.state = 913
+                self.state = 920
                 self.match(CMLParser.T__84)
-                self.state = 914
+                self.state = 921
                 self.match(CMLParser.T__5)
-                self.state = 915
+                self.state = 922
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 18:
                 self.enterOuterAlt(localctx, 18)
-                self.state = 916
+                self.state = 923
                 self.match(CMLParser.T__85)
-                self.state = 917
+                self.state = 924
                 self.match(CMLParser.T__5)
-                self.state = 918
+                self.state = 925
                 self.match(CMLParser.STRING)
                 pass
 
@@ -5775,72 +5801,72 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 922
+            self.state = 929
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==75:
-                self.state = 921
+                self.state = 928
                 self.match(CMLParser.T__74)
 
 
-            self.state = 924
+            self.state = 931
             _la = self._input.LA(1)
             if not(_la==99 or _la==100):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 925
+            self.state = 932
             self.name()
-            self.state = 931
+            self.state = 938
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,79,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,81,self._ctx)
             if la_ == 1:
-                self.state = 926
+                self.state = 933
                 self.match(CMLParser.T__76)
-                self.state = 928
+                self.state = 935
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 927
+                    self.state = 934
                     self.match(CMLParser.T__77)
 
 
-                self.state = 930
+                self.state = 937
                 self.name()
 
 
-            self.state = 944
+            self.state = 951
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,81,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,83,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 933
+                    self.state = 940
                     self.match(CMLParser.WITH)
-                    self.state = 934
+                    self.state = 941
                     self.traitRef()
-                    self.state = 939
+                    self.state = 946
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,80,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,82,self._ctx)
                     while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                         if _alt==1:
-                            self.state = 935
+                            self.state = 942
                             self.match(CMLParser.T__21)
-                            self.state = 936
+                            self.state = 943
                             self.traitRef() 
-                        self.state = 941
+                        self.state = 948
                         self._errHandler.sync(self)
-                        _alt = self._interp.adaptivePredict(self._input,80,self._ctx)
+                        _alt = self._interp.adaptivePredict(self._input,82,self._ctx)
              
-                self.state = 946
+                self.state = 953
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,81,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,83,self._ctx)
 
-            self.state = 948
+            self.state = 955
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,82,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,84,self._ctx)
             if la_ == 1:
-                self.state = 947
+                self.state = 954
                 localctx.body = self.domainEventBody()
 
 
@@ -5901,31 +5927,31 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 950
+            self.state = 957
             self.match(CMLParser.T__2)
-            self.state = 955
+            self.state = 962
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72475425637649) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596597505) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35184372088833) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 953
+                self.state = 960
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,83,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,85,self._ctx)
                 if la_ == 1:
-                    self.state = 951
+                    self.state = 958
                     self.domainEventFlag()
                     pass
 
                 elif la_ == 2:
-                    self.state = 952
+                    self.state = 959
                     self.feature()
                     pass
 
 
-                self.state = 957
+                self.state = 964
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 958
+            self.state = 965
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -5980,141 +6006,141 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 82, self.RULE_domainEventFlag)
         self._la = 0 # Token type
         try:
-            self.state = 1001
+            self.state = 1008
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [79]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 960
+                self.state = 967
                 self.match(CMLParser.T__78)
-                self.state = 962
+                self.state = 969
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 961
+                    self.state = 968
                     self.match(CMLParser.T__77)
 
 
-                self.state = 964
+                self.state = 971
                 self.qualifiedName()
                 pass
             elif token in [81]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 965
+                self.state = 972
                 self.match(CMLParser.T__80)
-                self.state = 966
+                self.state = 973
                 self.match(CMLParser.T__5)
-                self.state = 967
+                self.state = 974
                 self.qualifiedName()
                 pass
             elif token in [80]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 968
+                self.state = 975
                 self.match(CMLParser.T__79)
-                self.state = 969
+                self.state = 976
                 self.match(CMLParser.T__5)
-                self.state = 970
+                self.state = 977
                 self.match(CMLParser.STRING)
                 pass
             elif token in [91]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 971
+                self.state = 978
                 self.match(CMLParser.T__90)
                 pass
             elif token in [92]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 972
+                self.state = 979
                 self.match(CMLParser.T__91)
                 pass
             elif token in [93]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 973
+                self.state = 980
                 self.match(CMLParser.T__92)
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 974
+                self.state = 981
                 self.match(CMLParser.T__93)
-                self.state = 975
+                self.state = 982
                 self.match(CMLParser.T__5)
-                self.state = 976
+                self.state = 983
                 self.match(CMLParser.STRING)
                 pass
             elif token in [90, 117, 118]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 978
+                self.state = 985
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 977
+                    self.state = 984
                     self.notPrefix()
 
 
-                self.state = 980
+                self.state = 987
                 self.match(CMLParser.T__89)
                 pass
             elif token in [87]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 981
+                self.state = 988
                 self.match(CMLParser.T__86)
-                self.state = 982
+                self.state = 989
                 self.match(CMLParser.T__5)
-                self.state = 983
+                self.state = 990
                 self.match(CMLParser.STRING)
                 pass
             elif token in [82]:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 984
+                self.state = 991
                 self.match(CMLParser.T__81)
-                self.state = 985
+                self.state = 992
                 self.match(CMLParser.T__5)
-                self.state = 986
+                self.state = 993
                 self.match(CMLParser.STRING)
                 pass
             elif token in [83]:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 987
+                self.state = 994
                 self.match(CMLParser.T__82)
-                self.state = 988
+                self.state = 995
                 self.match(CMLParser.T__5)
-                self.state = 989
+                self.state = 996
                 self.match(CMLParser.STRING)
                 pass
             elif token in [84]:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 990
+                self.state = 997
                 self.match(CMLParser.T__83)
-                self.state = 991
+                self.state = 998
                 self.match(CMLParser.T__5)
-                self.state = 992
+                self.state = 999
                 self.match(CMLParser.STRING)
                 pass
             elif token in [85]:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 993
+                self.state = 1000
                 self.match(CMLParser.T__84)
-                self.state = 994
+                self.state = 1001
                 self.match(CMLParser.T__5)
-                self.state = 995
+                self.state = 1002
                 self.match(CMLParser.STRING)
                 pass
             elif token in [86]:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 996
+                self.state = 1003
                 self.match(CMLParser.T__85)
-                self.state = 997
+                self.state = 1004
                 self.match(CMLParser.T__5)
-                self.state = 998
+                self.state = 1005
                 self.match(CMLParser.STRING)
                 pass
             elif token in [96]:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 999
+                self.state = 1006
                 self.match(CMLParser.T__95)
                 pass
             elif token in [98]:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 1000
+                self.state = 1007
                 self.match(CMLParser.T__97)
                 pass
             else:
@@ -6188,72 +6214,72 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1004
+            self.state = 1011
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==75:
-                self.state = 1003
+                self.state = 1010
                 self.match(CMLParser.T__74)
 
 
-            self.state = 1006
+            self.state = 1013
             _la = self._input.LA(1)
             if not(_la==101 or _la==102):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 1007
+            self.state = 1014
             self.name()
-            self.state = 1013
+            self.state = 1020
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,90,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,92,self._ctx)
             if la_ == 1:
-                self.state = 1008
+                self.state = 1015
                 self.match(CMLParser.T__76)
-                self.state = 1010
+                self.state = 1017
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 1009
+                    self.state = 1016
                     self.match(CMLParser.T__77)
 
 
-                self.state = 1012
+                self.state = 1019
                 self.name()
 
 
-            self.state = 1026
+            self.state = 1033
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,92,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,94,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1015
+                    self.state = 1022
                     self.match(CMLParser.WITH)
-                    self.state = 1016
+                    self.state = 1023
                     self.traitRef()
-                    self.state = 1021
+                    self.state = 1028
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,91,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,93,self._ctx)
                     while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                         if _alt==1:
-                            self.state = 1017
+                            self.state = 1024
                             self.match(CMLParser.T__21)
-                            self.state = 1018
+                            self.state = 1025
                             self.traitRef() 
-                        self.state = 1023
+                        self.state = 1030
                         self._errHandler.sync(self)
-                        _alt = self._interp.adaptivePredict(self._input,91,self._ctx)
+                        _alt = self._interp.adaptivePredict(self._input,93,self._ctx)
              
-                self.state = 1028
+                self.state = 1035
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,92,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,94,self._ctx)
 
-            self.state = 1030
+            self.state = 1037
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,93,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,95,self._ctx)
             if la_ == 1:
-                self.state = 1029
+                self.state = 1036
                 localctx.body = self.commandEventBody()
 
 
@@ -6314,30 +6340,30 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1032
+            self.state = 1039
             self.match(CMLParser.T__2)
-            self.state = 1036
+            self.state = 1043
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,94,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,96,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1033
+                    self.state = 1040
                     self.commandEventFlag() 
-                self.state = 1038
+                self.state = 1045
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,94,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,96,self._ctx)
 
-            self.state = 1042
+            self.state = 1049
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72475425637649) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596597505) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35184372088833) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 1039
+                self.state = 1046
                 self.feature()
-                self.state = 1044
+                self.state = 1051
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1045
+            self.state = 1052
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -6392,141 +6418,141 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 88, self.RULE_commandEventFlag)
         self._la = 0 # Token type
         try:
-            self.state = 1088
+            self.state = 1095
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [79]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1047
+                self.state = 1054
                 self.match(CMLParser.T__78)
-                self.state = 1049
+                self.state = 1056
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 1048
+                    self.state = 1055
                     self.match(CMLParser.T__77)
 
 
-                self.state = 1051
+                self.state = 1058
                 self.qualifiedName()
                 pass
             elif token in [81]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1052
+                self.state = 1059
                 self.match(CMLParser.T__80)
-                self.state = 1053
+                self.state = 1060
                 self.match(CMLParser.T__5)
-                self.state = 1054
+                self.state = 1061
                 self.qualifiedName()
                 pass
             elif token in [80]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1055
+                self.state = 1062
                 self.match(CMLParser.T__79)
-                self.state = 1056
+                self.state = 1063
                 self.match(CMLParser.T__5)
-                self.state = 1057
+                self.state = 1064
                 self.match(CMLParser.STRING)
                 pass
             elif token in [91]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1058
+                self.state = 1065
                 self.match(CMLParser.T__90)
                 pass
             elif token in [92]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1059
+                self.state = 1066
                 self.match(CMLParser.T__91)
                 pass
             elif token in [93]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1060
+                self.state = 1067
                 self.match(CMLParser.T__92)
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 1061
+                self.state = 1068
                 self.match(CMLParser.T__93)
-                self.state = 1062
+                self.state = 1069
                 self.match(CMLParser.T__5)
-                self.state = 1063
+                self.state = 1070
                 self.match(CMLParser.STRING)
                 pass
             elif token in [90, 117, 118]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 1065
+                self.state = 1072
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 1064
+                    self.state = 1071
                     self.notPrefix()
 
 
-                self.state = 1067
+                self.state = 1074
                 self.match(CMLParser.T__89)
                 pass
             elif token in [98]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 1068
+                self.state = 1075
                 self.match(CMLParser.T__97)
                 pass
             elif token in [96]:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 1069
+                self.state = 1076
                 self.match(CMLParser.T__95)
                 pass
             elif token in [87]:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 1070
+                self.state = 1077
                 self.match(CMLParser.T__86)
-                self.state = 1071
+                self.state = 1078
                 self.match(CMLParser.T__5)
-                self.state = 1072
+                self.state = 1079
                 self.match(CMLParser.STRING)
                 pass
             elif token in [82]:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 1073
+                self.state = 1080
                 self.match(CMLParser.T__81)
-                self.state = 1074
+                self.state = 1081
                 self.match(CMLParser.T__5)
-                self.state = 1075
+                self.state = 1082
                 self.match(CMLParser.STRING)
                 pass
             elif token in [83]:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 1076
+                self.state = 1083
                 self.match(CMLParser.T__82)
-                self.state = 1077
+                self.state = 1084
                 self.match(CMLParser.T__5)
-                self.state = 1078
+                self.state = 1085
                 self.match(CMLParser.STRING)
                 pass
             elif token in [84]:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 1079
+                self.state = 1086
                 self.match(CMLParser.T__83)
-                self.state = 1080
+                self.state = 1087
                 self.match(CMLParser.T__5)
-                self.state = 1081
+                self.state = 1088
                 self.match(CMLParser.STRING)
                 pass
             elif token in [85]:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 1082
+                self.state = 1089
                 self.match(CMLParser.T__84)
-                self.state = 1083
+                self.state = 1090
                 self.match(CMLParser.T__5)
-                self.state = 1084
+                self.state = 1091
                 self.match(CMLParser.STRING)
                 pass
             elif token in [86]:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 1085
+                self.state = 1092
                 self.match(CMLParser.T__85)
-                self.state = 1086
+                self.state = 1093
                 self.match(CMLParser.T__5)
-                self.state = 1087
+                self.state = 1094
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -6582,15 +6608,15 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 90, self.RULE_trait)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1090
+            self.state = 1097
             self.match(CMLParser.T__102)
-            self.state = 1091
+            self.state = 1098
             self.name()
-            self.state = 1093
+            self.state = 1100
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,99,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,101,self._ctx)
             if la_ == 1:
-                self.state = 1092
+                self.state = 1099
                 self.traitBody()
 
 
@@ -6651,30 +6677,30 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1095
+            self.state = 1102
             self.match(CMLParser.T__2)
-            self.state = 1099
+            self.state = 1106
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,100,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,102,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1096
+                    self.state = 1103
                     self.traitFlag() 
-                self.state = 1101
+                self.state = 1108
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,100,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,102,self._ctx)
 
-            self.state = 1105
+            self.state = 1112
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72475425637649) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596597505) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35184372088833) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 1102
+                self.state = 1109
                 self.feature()
-                self.state = 1107
+                self.state = 1114
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1108
+            self.state = 1115
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -6724,25 +6750,25 @@ class CMLParser ( Parser ):
         localctx = CMLParser.TraitFlagContext(self, self._ctx, self.state)
         self.enterRule(localctx, 94, self.RULE_traitFlag)
         try:
-            self.state = 1116
+            self.state = 1123
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [81]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1110
+                self.state = 1117
                 self.match(CMLParser.T__80)
-                self.state = 1111
+                self.state = 1118
                 self.match(CMLParser.T__5)
-                self.state = 1112
+                self.state = 1119
                 self.qualifiedName()
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1113
+                self.state = 1120
                 self.match(CMLParser.T__93)
-                self.state = 1114
+                self.state = 1121
                 self.match(CMLParser.T__5)
-                self.state = 1115
+                self.state = 1122
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -6795,15 +6821,15 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1119
+            self.state = 1126
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==78:
-                self.state = 1118
+                self.state = 1125
                 self.match(CMLParser.T__77)
 
 
-            self.state = 1121
+            self.state = 1128
             self.name()
         except RecognitionException as re:
             localctx.exception = re
@@ -6867,44 +6893,44 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1123
+            self.state = 1130
             self.match(CMLParser.T__103)
-            self.state = 1124
+            self.state = 1131
             self.name()
-            self.state = 1130
+            self.state = 1137
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,105,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,107,self._ctx)
             if la_ == 1:
-                self.state = 1125
+                self.state = 1132
                 self.match(CMLParser.T__76)
-                self.state = 1127
+                self.state = 1134
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 1126
+                    self.state = 1133
                     self.match(CMLParser.T__77)
 
 
-                self.state = 1129
+                self.state = 1136
                 self.name()
 
 
-            self.state = 1135
+            self.state = 1142
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,106,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,108,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1132
+                    self.state = 1139
                     self.dtoModifier() 
-                self.state = 1137
+                self.state = 1144
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,106,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,108,self._ctx)
 
-            self.state = 1139
+            self.state = 1146
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,107,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,109,self._ctx)
             if la_ == 1:
-                self.state = 1138
+                self.state = 1145
                 localctx.body = self.dtoBody()
 
 
@@ -6965,30 +6991,30 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1141
+            self.state = 1148
             self.match(CMLParser.T__2)
-            self.state = 1145
+            self.state = 1152
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,108,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,110,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1142
+                    self.state = 1149
                     self.dtoFlag() 
-                self.state = 1147
+                self.state = 1154
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,108,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,110,self._ctx)
 
-            self.state = 1151
+            self.state = 1158
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72475425637649) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596597505) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35184372088833) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 1148
+                self.state = 1155
                 self.feature()
-                self.state = 1153
+                self.state = 1160
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1154
+            self.state = 1161
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -7038,55 +7064,55 @@ class CMLParser ( Parser ):
         localctx = CMLParser.DtoFlagContext(self, self._ctx, self.state)
         self.enterRule(localctx, 102, self.RULE_dtoFlag)
         try:
-            self.state = 1170
+            self.state = 1177
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [81]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1156
+                self.state = 1163
                 self.match(CMLParser.T__80)
-                self.state = 1157
+                self.state = 1164
                 self.match(CMLParser.T__5)
-                self.state = 1158
+                self.state = 1165
                 self.qualifiedName()
                 pass
             elif token in [80]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1159
+                self.state = 1166
                 self.match(CMLParser.T__79)
-                self.state = 1162
+                self.state = 1169
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,110,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,112,self._ctx)
                 if la_ == 1:
-                    self.state = 1160
+                    self.state = 1167
                     self.match(CMLParser.T__5)
-                    self.state = 1161
+                    self.state = 1168
                     self.match(CMLParser.STRING)
 
 
                 pass
             elif token in [91]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1164
+                self.state = 1171
                 self.match(CMLParser.T__90)
                 pass
             elif token in [92]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1165
+                self.state = 1172
                 self.match(CMLParser.T__91)
                 pass
             elif token in [93]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1166
+                self.state = 1173
                 self.match(CMLParser.T__92)
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1167
+                self.state = 1174
                 self.match(CMLParser.T__93)
-                self.state = 1168
+                self.state = 1175
                 self.match(CMLParser.T__5)
-                self.state = 1169
+                self.state = 1176
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -7136,40 +7162,40 @@ class CMLParser ( Parser ):
         localctx = CMLParser.DtoModifierContext(self, self._ctx, self.state)
         self.enterRule(localctx, 104, self.RULE_dtoModifier)
         try:
-            self.state = 1181
+            self.state = 1188
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [91]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1172
+                self.state = 1179
                 self.match(CMLParser.T__90)
                 pass
             elif token in [92]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1173
+                self.state = 1180
                 self.match(CMLParser.T__91)
                 pass
             elif token in [93]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1174
+                self.state = 1181
                 self.match(CMLParser.T__92)
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1175
+                self.state = 1182
                 self.match(CMLParser.T__93)
-                self.state = 1176
+                self.state = 1183
                 self.match(CMLParser.T__5)
-                self.state = 1177
+                self.state = 1184
                 self.match(CMLParser.STRING)
                 pass
             elif token in [80]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1178
+                self.state = 1185
                 self.match(CMLParser.T__79)
-                self.state = 1179
+                self.state = 1186
                 self.match(CMLParser.T__5)
-                self.state = 1180
+                self.state = 1187
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -7243,63 +7269,63 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1183
+            self.state = 1190
             self.match(CMLParser.T__104)
-            self.state = 1184
+            self.state = 1191
             self.name()
-            self.state = 1185
+            self.state = 1192
             self.match(CMLParser.T__2)
-            self.state = 1189
+            self.state = 1196
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,113,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,115,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1186
+                    self.state = 1193
                     self.enumOption() 
-                self.state = 1191
+                self.state = 1198
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,113,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,115,self._ctx)
 
-            self.state = 1195
+            self.state = 1202
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,114,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,116,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1192
+                    self.state = 1199
                     self.enumAttribute() 
-                self.state = 1197
+                self.state = 1204
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,114,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,116,self._ctx)
 
-            self.state = 1209
+            self.state = 1216
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if ((((_la - 9)) & ~0x3f) == 0 and ((1 << (_la - 9)) & -9223372036821254143) != 0) or ((((_la - 80)) & ~0x3f) == 0 and ((1 << (_la - 80)) & -549750258687) != 0) or ((((_la - 144)) & ~0x3f) == 0 and ((1 << (_la - 144)) & 149744687081587711) != 0) or ((((_la - 228)) & ~0x3f) == 0 and ((1 << (_la - 228)) & -12935238269) != 0) or ((((_la - 292)) & ~0x3f) == 0 and ((1 << (_la - 292)) & 6629298651489370113) != 0):
-                self.state = 1198
+                self.state = 1205
                 self.enumValue()
-                self.state = 1203
+                self.state = 1210
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==22:
-                    self.state = 1199
+                    self.state = 1206
                     self.match(CMLParser.T__21)
-                    self.state = 1200
+                    self.state = 1207
                     self.enumValue()
-                    self.state = 1205
+                    self.state = 1212
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 1207
+                self.state = 1214
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1206
+                    self.state = 1213
                     self.match(CMLParser.T__105)
 
 
 
 
-            self.state = 1211
+            self.state = 1218
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -7349,35 +7375,35 @@ class CMLParser ( Parser ):
         localctx = CMLParser.EnumOptionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 108, self.RULE_enumOption)
         try:
-            self.state = 1221
+            self.state = 1228
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [81]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1213
+                self.state = 1220
                 self.match(CMLParser.T__80)
-                self.state = 1214
+                self.state = 1221
                 self.match(CMLParser.T__5)
-                self.state = 1215
+                self.state = 1222
                 self.qualifiedName()
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1216
+                self.state = 1223
                 self.match(CMLParser.T__93)
-                self.state = 1217
+                self.state = 1224
                 self.match(CMLParser.T__5)
-                self.state = 1218
+                self.state = 1225
                 self.match(CMLParser.STRING)
                 pass
             elif token in [107]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1219
+                self.state = 1226
                 self.match(CMLParser.T__106)
                 pass
             elif token in [108]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1220
+                self.state = 1227
                 self.match(CMLParser.T__107)
                 pass
             else:
@@ -7434,23 +7460,23 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1223
+            self.state = 1230
             self.type_()
-            self.state = 1224
+            self.state = 1231
             self.name()
-            self.state = 1226
+            self.state = 1233
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==109:
-                self.state = 1225
+                self.state = 1232
                 self.match(CMLParser.T__108)
 
 
-            self.state = 1229
+            self.state = 1236
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 1228
+                self.state = 1235
                 self.match(CMLParser.T__105)
 
 
@@ -7508,29 +7534,29 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1231
+            self.state = 1238
             self.name()
-            self.state = 1243
+            self.state = 1250
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==110:
-                self.state = 1232
+                self.state = 1239
                 self.match(CMLParser.T__109)
-                self.state = 1233
+                self.state = 1240
                 self.enumParameter()
-                self.state = 1238
+                self.state = 1245
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==22:
-                    self.state = 1234
+                    self.state = 1241
                     self.match(CMLParser.T__21)
-                    self.state = 1235
+                    self.state = 1242
                     self.enumParameter()
-                    self.state = 1240
+                    self.state = 1247
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 1241
+                self.state = 1248
                 self.match(CMLParser.T__110)
 
 
@@ -7583,7 +7609,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1245
+            self.state = 1252
             _la = self._input.LA(1)
             if not(_la==353 or _la==355):
                 self._errHandler.recoverInline(self)
@@ -7654,41 +7680,41 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 116, self.RULE_basicType)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1247
+            self.state = 1254
             self.match(CMLParser.T__111)
-            self.state = 1248
+            self.state = 1255
             self.name()
-            self.state = 1260
+            self.state = 1267
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,124,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,126,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1249
+                    self.state = 1256
                     self.match(CMLParser.WITH)
-                    self.state = 1250
+                    self.state = 1257
                     self.traitRef()
-                    self.state = 1255
+                    self.state = 1262
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,123,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,125,self._ctx)
                     while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                         if _alt==1:
-                            self.state = 1251
+                            self.state = 1258
                             self.match(CMLParser.T__21)
-                            self.state = 1252
+                            self.state = 1259
                             self.traitRef() 
-                        self.state = 1257
+                        self.state = 1264
                         self._errHandler.sync(self)
-                        _alt = self._interp.adaptivePredict(self._input,123,self._ctx)
+                        _alt = self._interp.adaptivePredict(self._input,125,self._ctx)
              
-                self.state = 1262
+                self.state = 1269
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,124,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,126,self._ctx)
 
-            self.state = 1264
+            self.state = 1271
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,125,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,127,self._ctx)
             if la_ == 1:
-                self.state = 1263
+                self.state = 1270
                 localctx.body = self.basicTypeBody()
 
 
@@ -7749,30 +7775,30 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1266
+            self.state = 1273
             self.match(CMLParser.T__2)
-            self.state = 1270
+            self.state = 1277
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,126,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,128,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1267
+                    self.state = 1274
                     self.basicTypeFlag() 
-                self.state = 1272
+                self.state = 1279
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,126,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,128,self._ctx)
 
-            self.state = 1276
+            self.state = 1283
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72475425637649) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596597505) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35184372088833) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 1273
+                self.state = 1280
                 self.feature()
-                self.state = 1278
+                self.state = 1285
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1279
+            self.state = 1286
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -7827,92 +7853,92 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 120, self.RULE_basicTypeFlag)
         self._la = 0 # Token type
         try:
-            self.state = 1305
+            self.state = 1312
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,131,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,133,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1281
+                self.state = 1288
                 self.match(CMLParser.T__78)
-                self.state = 1283
+                self.state = 1290
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 1282
+                    self.state = 1289
                     self.match(CMLParser.T__77)
 
 
-                self.state = 1285
+                self.state = 1292
                 self.qualifiedName()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1286
+                self.state = 1293
                 self.match(CMLParser.T__80)
-                self.state = 1287
+                self.state = 1294
                 self.match(CMLParser.T__5)
-                self.state = 1288
+                self.state = 1295
                 self.qualifiedName()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1289
+                self.state = 1296
                 self.match(CMLParser.T__79)
-                self.state = 1290
+                self.state = 1297
                 self.match(CMLParser.T__5)
-                self.state = 1291
+                self.state = 1298
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1292
+                self.state = 1299
                 self.match(CMLParser.T__90)
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1293
+                self.state = 1300
                 self.match(CMLParser.T__91)
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1294
+                self.state = 1301
                 self.match(CMLParser.T__93)
-                self.state = 1295
+                self.state = 1302
                 self.match(CMLParser.T__5)
-                self.state = 1296
+                self.state = 1303
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 1298
+                self.state = 1305
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 1297
+                    self.state = 1304
                     self.notPrefix()
 
 
-                self.state = 1300
+                self.state = 1307
                 self.match(CMLParser.T__94)
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 1302
+                self.state = 1309
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 1301
+                    self.state = 1308
                     self.notPrefix()
 
 
-                self.state = 1304
+                self.state = 1311
                 self.match(CMLParser.T__89)
                 pass
 
@@ -7978,36 +8004,36 @@ class CMLParser ( Parser ):
         localctx = CMLParser.FeatureContext(self, self._ctx, self.state)
         self.enterRule(localctx, 122, self.RULE_feature)
         try:
-            self.state = 1312
+            self.state = 1319
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,132,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,134,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1307
+                self.state = 1314
                 self.association()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1308
+                self.state = 1315
                 self.repository()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1309
+                self.state = 1316
                 self.operation()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1310
+                self.state = 1317
                 self.attribute()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1311
+                self.state = 1318
                 self.rawStatement()
                 pass
 
@@ -8073,54 +8099,54 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 124, self.RULE_association)
         self._la = 0 # Token type
         try:
-            self.state = 1343
+            self.state = 1350
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,140,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,142,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1314
+                self.state = 1321
                 _la = self._input.LA(1)
                 if not(_la==113 or _la==114):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 1316
+                self.state = 1323
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==355:
-                    self.state = 1315
+                    self.state = 1322
                     self.match(CMLParser.STRING)
 
 
-                self.state = 1319
+                self.state = 1326
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,134,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,136,self._ctx)
                 if la_ == 1:
-                    self.state = 1318
+                    self.state = 1325
                     localctx.reference = self.match(CMLParser.T__77)
 
 
-                self.state = 1321
+                self.state = 1328
                 self.type_()
-                self.state = 1322
+                self.state = 1329
                 self.name()
-                self.state = 1326
+                self.state = 1333
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,135,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,137,self._ctx)
                 while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                     if _alt==1:
-                        self.state = 1323
+                        self.state = 1330
                         self.attributeOption() 
-                    self.state = 1328
+                    self.state = 1335
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,135,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,137,self._ctx)
 
-                self.state = 1330
+                self.state = 1337
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1329
+                    self.state = 1336
                     self.match(CMLParser.T__105)
 
 
@@ -8128,36 +8154,36 @@ class CMLParser ( Parser ):
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1332
+                self.state = 1339
                 _la = self._input.LA(1)
                 if not(_la==113 or _la==114):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 1334
+                self.state = 1341
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==355:
-                    self.state = 1333
+                    self.state = 1340
                     self.match(CMLParser.STRING)
 
 
-                self.state = 1337
+                self.state = 1344
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,138,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,140,self._ctx)
                 if la_ == 1:
-                    self.state = 1336
+                    self.state = 1343
                     localctx.reference = self.match(CMLParser.T__77)
 
 
-                self.state = 1339
+                self.state = 1346
                 self.type_()
-                self.state = 1341
+                self.state = 1348
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1340
+                    self.state = 1347
                     self.match(CMLParser.T__105)
 
 
@@ -8287,33 +8313,33 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 126, self.RULE_attribute)
         self._la = 0 # Token type
         try:
-            self.state = 1398
+            self.state = 1405
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,155,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,157,self._ctx)
             if la_ == 1:
                 localctx = CMLParser.JavaStyleAttributeContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1346
+                self.state = 1353
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==355:
-                    self.state = 1345
+                    self.state = 1352
                     self.match(CMLParser.STRING)
 
 
-                self.state = 1349
+                self.state = 1356
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==81 or ((((_la - 218)) & ~0x3f) == 0 and ((1 << (_la - 218)) & 7) != 0):
-                    self.state = 1348
+                    self.state = 1355
                     self.visibility()
 
 
-                self.state = 1352
+                self.state = 1359
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==115 or _la==116:
-                    self.state = 1351
+                    self.state = 1358
                     localctx.reference = self._input.LT(1)
                     _la = self._input.LA(1)
                     if not(_la==115 or _la==116):
@@ -8323,42 +8349,42 @@ class CMLParser ( Parser ):
                         self.consume()
 
 
-                self.state = 1354
+                self.state = 1361
                 localctx.attrType = self.type_()
-                self.state = 1355
+                self.state = 1362
                 localctx.attrName = self.name()
-                self.state = 1357
+                self.state = 1364
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,144,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,146,self._ctx)
                 if la_ == 1:
-                    self.state = 1356
+                    self.state = 1363
                     self.match(CMLParser.T__108)
 
 
-                self.state = 1362
+                self.state = 1369
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,145,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,147,self._ctx)
                 while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                     if _alt==1:
-                        self.state = 1359
+                        self.state = 1366
                         self.attributeOption() 
-                    self.state = 1364
+                    self.state = 1371
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,145,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,147,self._ctx)
 
-                self.state = 1366
+                self.state = 1373
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,146,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,148,self._ctx)
                 if la_ == 1:
-                    self.state = 1365
+                    self.state = 1372
                     self.attributeAssociationLabel()
 
 
-                self.state = 1369
+                self.state = 1376
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1368
+                    self.state = 1375
                     self.match(CMLParser.T__105)
 
 
@@ -8367,27 +8393,27 @@ class CMLParser ( Parser ):
             elif la_ == 2:
                 localctx = CMLParser.KotlinStyleAttributeContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1372
+                self.state = 1379
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==355:
-                    self.state = 1371
+                    self.state = 1378
                     self.match(CMLParser.STRING)
 
 
-                self.state = 1375
+                self.state = 1382
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==81 or ((((_la - 218)) & ~0x3f) == 0 and ((1 << (_la - 218)) & 7) != 0):
-                    self.state = 1374
+                    self.state = 1381
                     self.visibility()
 
 
-                self.state = 1378
+                self.state = 1385
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==115 or _la==116:
-                    self.state = 1377
+                    self.state = 1384
                     localctx.reference = self._input.LT(1)
                     _la = self._input.LA(1)
                     if not(_la==115 or _la==116):
@@ -8397,44 +8423,44 @@ class CMLParser ( Parser ):
                         self.consume()
 
 
-                self.state = 1380
+                self.state = 1387
                 localctx.attrName = self.name()
-                self.state = 1381
+                self.state = 1388
                 self.match(CMLParser.T__13)
-                self.state = 1382
+                self.state = 1389
                 localctx.attrType = self.type_()
-                self.state = 1384
+                self.state = 1391
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,151,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,153,self._ctx)
                 if la_ == 1:
-                    self.state = 1383
+                    self.state = 1390
                     self.match(CMLParser.T__108)
 
 
-                self.state = 1389
+                self.state = 1396
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,152,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,154,self._ctx)
                 while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                     if _alt==1:
-                        self.state = 1386
+                        self.state = 1393
                         self.attributeOption() 
-                    self.state = 1391
+                    self.state = 1398
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,152,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,154,self._ctx)
 
-                self.state = 1393
+                self.state = 1400
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,153,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,155,self._ctx)
                 if la_ == 1:
-                    self.state = 1392
+                    self.state = 1399
                     self.attributeAssociationLabel()
 
 
-                self.state = 1396
+                self.state = 1403
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1395
+                    self.state = 1402
                     self.match(CMLParser.T__105)
 
 
@@ -8487,14 +8513,14 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1400
+            self.state = 1407
             _la = self._input.LA(1)
             if not(_la==113 or _la==114):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 1401
+            self.state = 1408
             self.match(CMLParser.STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -8553,37 +8579,37 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 130, self.RULE_attributeOption)
         self._la = 0 # Token type
         try:
-            self.state = 1414
+            self.state = 1421
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [34, 154]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1403
+                self.state = 1410
                 self.oppositeHolder()
                 pass
             elif token in [80, 90, 94, 95, 98, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1405
+                self.state = 1412
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==117 or _la==118:
-                    self.state = 1404
+                    self.state = 1411
                     self.notPrefix()
 
 
-                self.state = 1407
+                self.state = 1414
                 self.attributeOptionKey()
-                self.state = 1412
+                self.state = 1419
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,158,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,160,self._ctx)
                 if la_ == 1:
-                    self.state = 1410
+                    self.state = 1417
                     self._errHandler.sync(self)
-                    la_ = self._interp.adaptivePredict(self._input,157,self._ctx)
+                    la_ = self._interp.adaptivePredict(self._input,159,self._ctx)
                     if la_ == 1:
-                        self.state = 1408
+                        self.state = 1415
                         self.match(CMLParser.T__5)
-                        self.state = 1409
+                        self.state = 1416
                         self.match(CMLParser.STRING)
 
 
@@ -8637,7 +8663,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1416
+            self.state = 1423
             _la = self._input.LA(1)
             if not(_la==117 or _la==118):
                 self._errHandler.recoverInline(self)
@@ -8688,7 +8714,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1418
+            self.state = 1425
             _la = self._input.LA(1)
             if not(((((_la - 80)) & ~0x3f) == 0 and ((1 << (_la - 80)) & -549755501567) != 0) or ((((_la - 144)) & ~0x3f) == 0 and ((1 << (_la - 144)) & 1023) != 0)):
                 self._errHandler.recoverInline(self)
@@ -8743,24 +8769,24 @@ class CMLParser ( Parser ):
         localctx = CMLParser.OppositeHolderContext(self, self._ctx, self.state)
         self.enterRule(localctx, 136, self.RULE_oppositeHolder)
         try:
-            self.state = 1428
+            self.state = 1435
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [154]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1420
+                self.state = 1427
                 self.match(CMLParser.T__153)
-                self.state = 1424
+                self.state = 1431
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [6]:
-                    self.state = 1421
+                    self.state = 1428
                     self.match(CMLParser.T__5)
-                    self.state = 1422
+                    self.state = 1429
                     self.match(CMLParser.STRING)
                     pass
                 elif token in [9, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 72, 80, 90, 94, 95, 98, 100, 102, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 167, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 196, 201, 228, 229, 235, 236, 238, 239, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 254, 255, 256, 257, 258, 259, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 350, 351, 352, 354]:
-                    self.state = 1423
+                    self.state = 1430
                     self.name()
                     pass
                 else:
@@ -8769,9 +8795,9 @@ class CMLParser ( Parser ):
                 pass
             elif token in [34]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1426
+                self.state = 1433
                 self.match(CMLParser.T__33)
-                self.state = 1427
+                self.state = 1434
                 self.name()
                 pass
             else:
@@ -8826,18 +8852,18 @@ class CMLParser ( Parser ):
         localctx = CMLParser.OperationContext(self, self._ctx, self.state)
         self.enterRule(localctx, 138, self.RULE_operation)
         try:
-            self.state = 1432
+            self.state = 1439
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,162,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,164,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1430
+                self.state = 1437
                 self.operationWithParams()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1431
+                self.state = 1438
                 self.operationNoParams()
                 pass
 
@@ -8907,47 +8933,47 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 140, self.RULE_callableOperationNoParens)
         self._la = 0 # Token type
         try:
-            self.state = 1467
+            self.state = 1474
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,171,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,173,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1435
+                self.state = 1442
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==355:
-                    self.state = 1434
+                    self.state = 1441
                     self.match(CMLParser.STRING)
 
 
-                self.state = 1438
+                self.state = 1445
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==81 or ((((_la - 218)) & ~0x3f) == 0 and ((1 << (_la - 218)) & 7) != 0):
-                    self.state = 1437
+                    self.state = 1444
                     self.visibility()
 
 
-                self.state = 1440
+                self.state = 1447
                 localctx.returnType = self.type_()
-                self.state = 1441
+                self.state = 1448
                 self.name()
-                self.state = 1445
+                self.state = 1452
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,165,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,167,self._ctx)
                 while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                     if _alt==1:
-                        self.state = 1442
+                        self.state = 1449
                         self.operationClause() 
-                    self.state = 1447
+                    self.state = 1454
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,165,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,167,self._ctx)
 
-                self.state = 1449
+                self.state = 1456
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1448
+                    self.state = 1455
                     self.match(CMLParser.T__105)
 
 
@@ -8955,40 +8981,40 @@ class CMLParser ( Parser ):
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1452
+                self.state = 1459
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==355:
-                    self.state = 1451
+                    self.state = 1458
                     self.match(CMLParser.STRING)
 
 
-                self.state = 1455
+                self.state = 1462
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==81 or ((((_la - 218)) & ~0x3f) == 0 and ((1 << (_la - 218)) & 7) != 0):
-                    self.state = 1454
+                    self.state = 1461
                     self.visibility()
 
 
-                self.state = 1457
+                self.state = 1464
                 self.name()
-                self.state = 1461
+                self.state = 1468
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,169,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,171,self._ctx)
                 while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                     if _alt==1:
-                        self.state = 1458
+                        self.state = 1465
                         self.operationClause() 
-                    self.state = 1463
+                    self.state = 1470
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,169,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,171,self._ctx)
 
-                self.state = 1465
+                self.state = 1472
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1464
+                    self.state = 1471
                     self.match(CMLParser.T__105)
 
 
@@ -9062,52 +9088,52 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1470
+            self.state = 1477
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==81 or ((((_la - 155)) & ~0x3f) == 0 and ((1 << (_la - 155)) & -9223372036854775805) != 0) or _la==219 or _la==220:
-                self.state = 1469
+                self.state = 1476
                 self.operationPrefix()
 
 
-            self.state = 1473
+            self.state = 1480
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,173,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,175,self._ctx)
             if la_ == 1:
-                self.state = 1472
+                self.state = 1479
                 localctx.returnType = self.type_()
 
 
-            self.state = 1475
+            self.state = 1482
             self.name()
-            self.state = 1476
+            self.state = 1483
             self.match(CMLParser.T__109)
-            self.state = 1478
+            self.state = 1485
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if ((((_la - 9)) & ~0x3f) == 0 and ((1 << (_la - 9)) & -9223372036821254143) != 0) or ((((_la - 78)) & ~0x3f) == 0 and ((1 << (_la - 78)) & -2199001034747) != 0) or ((((_la - 142)) & ~0x3f) == 0 and ((1 << (_la - 142)) & 1139410703610810367) != 0) or ((((_la - 228)) & ~0x3f) == 0 and ((1 << (_la - 228)) & -12935238269) != 0) or ((((_la - 292)) & ~0x3f) == 0 and ((1 << (_la - 292)) & 6629298651489370113) != 0):
-                self.state = 1477
+                self.state = 1484
                 self.parameterList()
 
 
-            self.state = 1480
+            self.state = 1487
             self.match(CMLParser.T__110)
-            self.state = 1484
+            self.state = 1491
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,175,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,177,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1481
+                    self.state = 1488
                     self.operationClause() 
-                self.state = 1486
+                self.state = 1493
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,175,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,177,self._ctx)
 
-            self.state = 1488
+            self.state = 1495
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 1487
+                self.state = 1494
                 self.match(CMLParser.T__105)
 
 
@@ -9174,55 +9200,55 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1490
+            self.state = 1497
             _la = self._input.LA(1)
             if not(_la==155 or _la==156):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 1492
+            self.state = 1499
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==75:
-                self.state = 1491
+                self.state = 1498
                 self.match(CMLParser.T__74)
 
 
-            self.state = 1495
+            self.state = 1502
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==81 or ((((_la - 218)) & ~0x3f) == 0 and ((1 << (_la - 218)) & 7) != 0):
-                self.state = 1494
+                self.state = 1501
                 self.visibility()
 
 
-            self.state = 1498
+            self.state = 1505
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,179,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,181,self._ctx)
             if la_ == 1:
-                self.state = 1497
+                self.state = 1504
                 localctx.returnType = self.type_()
 
 
-            self.state = 1500
+            self.state = 1507
             self.name()
-            self.state = 1504
+            self.state = 1511
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,180,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,182,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1501
+                    self.state = 1508
                     self.operationClause() 
-                self.state = 1506
+                self.state = 1513
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,180,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,182,self._ctx)
 
-            self.state = 1508
+            self.state = 1515
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 1507
+                self.state = 1514
                 self.match(CMLParser.T__105)
 
 
@@ -9272,44 +9298,44 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 146, self.RULE_operationPrefix)
         self._la = 0 # Token type
         try:
-            self.state = 1521
+            self.state = 1528
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [155, 156]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1510
+                self.state = 1517
                 _la = self._input.LA(1)
                 if not(_la==155 or _la==156):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 1512
+                self.state = 1519
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==75:
-                    self.state = 1511
+                    self.state = 1518
                     self.match(CMLParser.T__74)
 
 
-                self.state = 1515
+                self.state = 1522
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==81 or ((((_la - 218)) & ~0x3f) == 0 and ((1 << (_la - 218)) & 7) != 0):
-                    self.state = 1514
+                    self.state = 1521
                     self.visibility()
 
 
                 pass
             elif token in [81, 218, 219, 220]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1517
+                self.state = 1524
                 self.visibility()
-                self.state = 1519
+                self.state = 1526
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==155 or _la==156:
-                    self.state = 1518
+                    self.state = 1525
                     _la = self._input.LA(1)
                     if not(_la==155 or _la==156):
                         self._errHandler.recoverInline(self)
@@ -9372,15 +9398,15 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 148, self.RULE_operationHint)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1523
+            self.state = 1530
             self.match(CMLParser.T__13)
-            self.state = 1524
+            self.state = 1531
             self.operationHintType()
-            self.state = 1526
+            self.state = 1533
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,186,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,188,self._ctx)
             if la_ == 1:
-                self.state = 1525
+                self.state = 1532
                 self.stateTransition()
 
 
@@ -9430,7 +9456,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1528
+            self.state = 1535
             _la = self._input.LA(1)
             if not(_la==157 or _la==158 or _la==350):
                 self._errHandler.recoverInline(self)
@@ -9494,27 +9520,27 @@ class CMLParser ( Parser ):
         localctx = CMLParser.OperationClauseContext(self, self._ctx, self.state)
         self.enterRule(localctx, 152, self.RULE_operationClause)
         try:
-            self.state = 1534
+            self.state = 1541
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [94, 160, 161, 162, 163, 164, 165]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1530
+                self.state = 1537
                 self.operationOption()
                 pass
             elif token in [14]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1531
+                self.state = 1538
                 self.operationHint()
                 pass
             elif token in [166, 169, 170, 171]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1532
+                self.state = 1539
                 self.operationTail()
                 pass
             elif token in [159]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1533
+                self.state = 1540
                 self.throwsClause()
                 pass
             else:
@@ -9566,9 +9592,9 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 154, self.RULE_throwsClause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1536
+            self.state = 1543
             self.match(CMLParser.T__158)
-            self.state = 1537
+            self.state = 1544
             self.qualifiedNameList()
         except RecognitionException as re:
             localctx.exception = re
@@ -9618,39 +9644,39 @@ class CMLParser ( Parser ):
         localctx = CMLParser.OperationOptionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 156, self.RULE_operationOption)
         try:
-            self.state = 1549
+            self.state = 1556
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [94]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1539
+                self.state = 1546
                 self.match(CMLParser.T__93)
-                self.state = 1540
+                self.state = 1547
                 self.match(CMLParser.T__5)
-                self.state = 1541
+                self.state = 1548
                 self.match(CMLParser.STRING)
                 pass
             elif token in [162, 163, 164, 165]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1542
+                self.state = 1549
                 self.httpMethod()
                 pass
             elif token in [160]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1543
+                self.state = 1550
                 self.match(CMLParser.T__159)
-                self.state = 1544
+                self.state = 1551
                 self.match(CMLParser.T__5)
-                self.state = 1545
+                self.state = 1552
                 self.match(CMLParser.STRING)
                 pass
             elif token in [161]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1546
+                self.state = 1553
                 self.match(CMLParser.T__160)
-                self.state = 1547
+                self.state = 1554
                 self.match(CMLParser.T__5)
-                self.state = 1548
+                self.state = 1555
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -9700,7 +9726,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1551
+            self.state = 1558
             _la = self._input.LA(1)
             if not(((((_la - 162)) & ~0x3f) == 0 and ((1 << (_la - 162)) & 15) != 0)):
                 self._errHandler.recoverInline(self)
@@ -9765,94 +9791,94 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 160, self.RULE_operationTail)
         self._la = 0 # Token type
         try:
-            self.state = 1584
+            self.state = 1591
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [166]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1553
+                self.state = 1560
                 self.match(CMLParser.T__165)
-                self.state = 1555
+                self.state = 1562
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,189,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,191,self._ctx)
                 if la_ == 1:
-                    self.state = 1554
+                    self.state = 1561
                     self.eventTypeRef()
 
 
-                self.state = 1557
+                self.state = 1564
                 self.match(CMLParser.T__166)
-                self.state = 1558
+                self.state = 1565
                 self.operationTarget()
-                self.state = 1562
+                self.state = 1569
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,190,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,192,self._ctx)
                 if la_ == 1:
-                    self.state = 1559
+                    self.state = 1566
                     self.match(CMLParser.T__167)
-                    self.state = 1560
+                    self.state = 1567
                     self.match(CMLParser.T__5)
-                    self.state = 1561
+                    self.state = 1568
                     self.name()
 
 
                 pass
             elif token in [169]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1564
+                self.state = 1571
                 self.match(CMLParser.T__168)
-                self.state = 1566
+                self.state = 1573
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,191,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,193,self._ctx)
                 if la_ == 1:
-                    self.state = 1565
+                    self.state = 1572
                     self.eventTypeRef()
 
 
-                self.state = 1568
+                self.state = 1575
                 self.match(CMLParser.T__166)
-                self.state = 1569
+                self.state = 1576
                 self.operationTarget()
-                self.state = 1573
+                self.state = 1580
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,192,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,194,self._ctx)
                 if la_ == 1:
-                    self.state = 1570
+                    self.state = 1577
                     self.match(CMLParser.T__167)
-                    self.state = 1571
+                    self.state = 1578
                     self.match(CMLParser.T__5)
-                    self.state = 1572
+                    self.state = 1579
                     self.name()
 
 
                 pass
             elif token in [170, 171]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1578
+                self.state = 1585
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [170]:
-                    self.state = 1575
+                    self.state = 1582
                     self.match(CMLParser.T__169)
-                    self.state = 1576
+                    self.state = 1583
                     self.match(CMLParser.T__166)
                     pass
                 elif token in [171]:
-                    self.state = 1577
+                    self.state = 1584
                     self.match(CMLParser.T__170)
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 1581
+                self.state = 1588
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 1580
+                    self.state = 1587
                     self.match(CMLParser.T__77)
 
 
-                self.state = 1583
+                self.state = 1590
                 self.qualifiedName()
                 pass
             else:
@@ -9905,15 +9931,15 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1587
+            self.state = 1594
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==78:
-                self.state = 1586
+                self.state = 1593
                 self.match(CMLParser.T__77)
 
 
-            self.state = 1589
+            self.state = 1596
             self.name()
         except RecognitionException as re:
             localctx.exception = re
@@ -9967,24 +9993,24 @@ class CMLParser ( Parser ):
         localctx = CMLParser.OperationTargetContext(self, self._ctx, self.state)
         self.enterRule(localctx, 164, self.RULE_operationTarget)
         try:
-            self.state = 1594
+            self.state = 1601
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,197,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,199,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1591
+                self.state = 1598
                 self.match(CMLParser.STRING)
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1592
+                self.state = 1599
                 self.channelIdentifier()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1593
+                self.state = 1600
                 self.qualifiedName()
                 pass
 
@@ -10039,19 +10065,19 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1596
+            self.state = 1603
             self.match(CMLParser.T__2)
-            self.state = 1600
+            self.state = 1607
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088850) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & -4398046511105) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & -1) != 0) or ((((_la - 192)) & ~0x3f) == 0 and ((1 << (_la - 192)) & -2305844110872805377) != 0) or ((((_la - 256)) & ~0x3f) == 0 and ((1 << (_la - 256)) & -140737488355329) != 0) or ((((_la - 320)) & ~0x3f) == 0 and ((1 << (_la - 320)) & 549755813887) != 0):
-                self.state = 1597
+                self.state = 1604
                 self.contentEntry()
-                self.state = 1602
+                self.state = 1609
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1603
+            self.state = 1610
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -10102,18 +10128,18 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ContentEntryContext(self, self._ctx, self.state)
         self.enterRule(localctx, 168, self.RULE_contentEntry)
         try:
-            self.state = 1607
+            self.state = 1614
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,199,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,201,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1605
+                self.state = 1612
                 self.contentItem()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1606
+                self.state = 1613
                 self.feature()
                 pass
 
@@ -10167,37 +10193,37 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 170, self.RULE_subdomainAttribute)
         self._la = 0 # Token type
         try:
-            self.state = 1619
+            self.state = 1626
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [5]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1609
+                self.state = 1616
                 self.match(CMLParser.T__4)
-                self.state = 1611
+                self.state = 1618
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1610
+                    self.state = 1617
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1613
+                self.state = 1620
                 self.subdomainType()
                 pass
             elif token in [49]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1614
+                self.state = 1621
                 self.match(CMLParser.T__48)
-                self.state = 1616
+                self.state = 1623
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1615
+                    self.state = 1622
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1618
+                self.state = 1625
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -10320,120 +10346,120 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ContentItemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 172, self.RULE_contentItem)
         try:
-            self.state = 1640
+            self.state = 1647
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,203,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,205,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1621
+                self.state = 1628
                 self.contentBlock()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1622
+                self.state = 1629
                 self.aggregate()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1623
+                self.state = 1630
                 self.domainObject()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1624
+                self.state = 1631
                 self.service()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1625
+                self.state = 1632
                 self.resource()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1626
+                self.state = 1633
                 self.consumer()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 1627
+                self.state = 1634
                 self.repository()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 1628
+                self.state = 1635
                 self.boundedContextAttribute()
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 1629
+                self.state = 1636
                 self.aggregateAttribute()
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 1630
+                self.state = 1637
                 self.subdomainAttribute()
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 1631
+                self.state = 1638
                 self.moduleAttribute()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 1632
+                self.state = 1639
                 self.setting()
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 1633
+                self.state = 1640
                 self.useCase()
                 pass
 
             elif la_ == 14:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 1634
+                self.state = 1641
                 self.subdomain()
                 pass
 
             elif la_ == 15:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 1635
+                self.state = 1642
                 self.module()
                 pass
 
             elif la_ == 16:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 1636
+                self.state = 1643
                 self.application()
                 pass
 
             elif la_ == 17:
                 self.enterOuterAlt(localctx, 17)
-                self.state = 1637
+                self.state = 1644
                 self.contextMap()
                 pass
 
             elif la_ == 18:
                 self.enterOuterAlt(localctx, 18)
-                self.state = 1638
+                self.state = 1645
                 self.domain()
                 pass
 
             elif la_ == 19:
                 self.enterOuterAlt(localctx, 19)
-                self.state = 1639
+                self.state = 1646
                 self.ownerDecl()
                 pass
 
@@ -10485,23 +10511,23 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1642
+            self.state = 1649
             self.match(CMLParser.T__171)
-            self.state = 1644
+            self.state = 1651
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 1643
+                self.state = 1650
                 self.match(CMLParser.T__5)
 
 
-            self.state = 1646
+            self.state = 1653
             self.name()
-            self.state = 1648
+            self.state = 1655
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 1647
+                self.state = 1654
                 self.match(CMLParser.T__105)
 
 
@@ -10566,222 +10592,222 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 176, self.RULE_aggregateAttribute)
         self._la = 0 # Token type
         try:
-            self.state = 1722
+            self.state = 1729
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [173, 174, 175, 176]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1650
+                self.state = 1657
                 _la = self._input.LA(1)
                 if not(((((_la - 173)) & ~0x3f) == 0 and ((1 << (_la - 173)) & 15) != 0)):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 1652
+                self.state = 1659
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1651
+                    self.state = 1658
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1654
+                self.state = 1661
                 self.idList()
-                self.state = 1656
+                self.state = 1663
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1655
+                    self.state = 1662
                     self.match(CMLParser.T__105)
 
 
                 pass
             elif token in [177, 178]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1658
+                self.state = 1665
                 _la = self._input.LA(1)
                 if not(_la==177 or _la==178):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 1660
+                self.state = 1667
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1659
+                    self.state = 1666
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1662
+                self.state = 1669
                 self.volatility()
-                self.state = 1664
+                self.state = 1671
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1663
+                    self.state = 1670
                     self.match(CMLParser.T__105)
 
 
                 pass
             elif token in [179]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1666
+                self.state = 1673
                 self.match(CMLParser.T__178)
-                self.state = 1668
+                self.state = 1675
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1667
+                    self.state = 1674
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1670
+                self.state = 1677
                 self.volatility()
-                self.state = 1672
+                self.state = 1679
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1671
+                    self.state = 1678
                     self.match(CMLParser.T__105)
 
 
                 pass
             elif token in [180]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1674
+                self.state = 1681
                 self.match(CMLParser.T__179)
-                self.state = 1676
+                self.state = 1683
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1675
+                    self.state = 1682
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1678
+                self.state = 1685
                 self.criticality()
-                self.state = 1680
+                self.state = 1687
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1679
+                    self.state = 1686
                     self.match(CMLParser.T__105)
 
 
                 pass
             elif token in [181]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1682
+                self.state = 1689
                 self.match(CMLParser.T__180)
-                self.state = 1684
+                self.state = 1691
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1683
+                    self.state = 1690
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1686
+                self.state = 1693
                 self.criticality()
-                self.state = 1688
+                self.state = 1695
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1687
+                    self.state = 1694
                     self.match(CMLParser.T__105)
 
 
                 pass
             elif token in [182]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1690
+                self.state = 1697
                 self.match(CMLParser.T__181)
-                self.state = 1692
+                self.state = 1699
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1691
+                    self.state = 1698
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1694
+                self.state = 1701
                 self.similarity()
-                self.state = 1696
+                self.state = 1703
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1695
+                    self.state = 1702
                     self.match(CMLParser.T__105)
 
 
                 pass
             elif token in [183]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 1698
+                self.state = 1705
                 self.match(CMLParser.T__182)
-                self.state = 1700
+                self.state = 1707
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1699
+                    self.state = 1706
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1702
+                self.state = 1709
                 self.criticality()
-                self.state = 1704
+                self.state = 1711
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1703
+                    self.state = 1710
                     self.match(CMLParser.T__105)
 
 
                 pass
             elif token in [184]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 1706
+                self.state = 1713
                 self.match(CMLParser.T__183)
-                self.state = 1708
+                self.state = 1715
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1707
+                    self.state = 1714
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1710
+                self.state = 1717
                 self.match(CMLParser.STRING)
-                self.state = 1712
+                self.state = 1719
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1711
+                    self.state = 1718
                     self.match(CMLParser.T__105)
 
 
                 pass
             elif token in [185]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 1714
+                self.state = 1721
                 self.match(CMLParser.T__184)
-                self.state = 1716
+                self.state = 1723
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 1715
+                    self.state = 1722
                     self.match(CMLParser.T__5)
 
 
-                self.state = 1718
+                self.state = 1725
                 self.match(CMLParser.STRING)
-                self.state = 1720
+                self.state = 1727
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==106:
-                    self.state = 1719
+                    self.state = 1726
                     self.match(CMLParser.T__105)
 
 
@@ -10833,7 +10859,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1724
+            self.state = 1731
             _la = self._input.LA(1)
             if not(_la==9 or ((((_la - 186)) & ~0x3f) == 0 and ((1 << (_la - 186)) & 7) != 0)):
                 self._errHandler.recoverInline(self)
@@ -10884,7 +10910,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1726
+            self.state = 1733
             _la = self._input.LA(1)
             if not(_la==9 or ((((_la - 186)) & ~0x3f) == 0 and ((1 << (_la - 186)) & 25) != 0)):
                 self._errHandler.recoverInline(self)
@@ -10935,7 +10961,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1728
+            self.state = 1735
             _la = self._input.LA(1)
             if not(_la==9 or ((((_la - 186)) & ~0x3f) == 0 and ((1 << (_la - 186)) & 97) != 0)):
                 self._errHandler.recoverInline(self)
@@ -10989,17 +11015,17 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1730
+            self.state = 1737
             self.match(CMLParser.T__71)
-            self.state = 1731
+            self.state = 1738
             self.match(CMLParser.T__5)
-            self.state = 1732
+            self.state = 1739
             self.qualifiedName()
-            self.state = 1734
+            self.state = 1741
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 1733
+                self.state = 1740
                 self.match(CMLParser.T__105)
 
 
@@ -11047,21 +11073,21 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ModuleAttributeContext(self, self._ctx, self.state)
         self.enterRule(localctx, 186, self.RULE_moduleAttribute)
         try:
-            self.state = 1740
+            self.state = 1747
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [193]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1736
+                self.state = 1743
                 self.match(CMLParser.T__192)
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1737
+                self.state = 1744
                 self.match(CMLParser.T__93)
-                self.state = 1738
+                self.state = 1745
                 self.match(CMLParser.T__5)
-                self.state = 1739
+                self.state = 1746
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -11160,42 +11186,42 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 188, self.RULE_parameter)
         self._la = 0 # Token type
         try:
-            self.state = 1755
+            self.state = 1762
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,229,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,231,self._ctx)
             if la_ == 1:
                 localctx = CMLParser.JavaStyleParameterContext(self, localctx)
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1743
+                self.state = 1750
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,227,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,229,self._ctx)
                 if la_ == 1:
-                    self.state = 1742
+                    self.state = 1749
                     self.match(CMLParser.T__77)
 
 
-                self.state = 1745
+                self.state = 1752
                 localctx.paramType = self.type_()
-                self.state = 1746
+                self.state = 1753
                 localctx.paramName = self.name()
                 pass
 
             elif la_ == 2:
                 localctx = CMLParser.KotlinStyleParameterContext(self, localctx)
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1749
+                self.state = 1756
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 1748
+                    self.state = 1755
                     self.match(CMLParser.T__77)
 
 
-                self.state = 1751
+                self.state = 1758
                 localctx.paramName = self.name()
-                self.state = 1752
+                self.state = 1759
                 self.match(CMLParser.T__13)
-                self.state = 1753
+                self.state = 1760
                 localctx.paramType = self.type_()
                 pass
 
@@ -11250,17 +11276,17 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1757
+            self.state = 1764
             self.parameter()
-            self.state = 1762
+            self.state = 1769
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==22:
-                self.state = 1758
+                self.state = 1765
                 self.match(CMLParser.T__21)
-                self.state = 1759
+                self.state = 1766
                 self.parameter()
-                self.state = 1764
+                self.state = 1771
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -11324,60 +11350,60 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 192, self.RULE_type)
         self._la = 0 # Token type
         try:
-            self.state = 1786
+            self.state = 1793
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,232,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,234,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1765
+                self.state = 1772
                 self.collectionType()
-                self.state = 1766
+                self.state = 1773
                 self.match(CMLParser.T__193)
-                self.state = 1767
+                self.state = 1774
                 localctx.innerType = self.type_()
-                self.state = 1768
+                self.state = 1775
                 self.match(CMLParser.T__194)
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1770
+                self.state = 1777
                 self.match(CMLParser.T__195)
-                self.state = 1771
+                self.state = 1778
                 self.match(CMLParser.T__193)
-                self.state = 1772
+                self.state = 1779
                 localctx.mapKeyType = self.type_()
-                self.state = 1773
+                self.state = 1780
                 self.match(CMLParser.T__21)
-                self.state = 1774
+                self.state = 1781
                 localctx.mapValueType = self.type_()
-                self.state = 1775
+                self.state = 1782
                 self.match(CMLParser.T__194)
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1777
+                self.state = 1784
                 self.qualifiedName()
-                self.state = 1778
+                self.state = 1785
                 self.match(CMLParser.T__193)
-                self.state = 1779
+                self.state = 1786
                 localctx.innerType = self.type_()
-                self.state = 1780
+                self.state = 1787
                 self.match(CMLParser.T__194)
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1783
+                self.state = 1790
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 1782
+                    self.state = 1789
                     self.match(CMLParser.T__77)
 
 
-                self.state = 1785
+                self.state = 1792
                 self.qualifiedName()
                 pass
 
@@ -11426,7 +11452,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1788
+            self.state = 1795
             _la = self._input.LA(1)
             if not(((((_la - 197)) & ~0x3f) == 0 and ((1 << (_la - 197)) & 15) != 0)):
                 self._errHandler.recoverInline(self)
@@ -11497,38 +11523,38 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 196, self.RULE_service)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1790
+            self.state = 1797
             self.match(CMLParser.T__200)
-            self.state = 1791
+            self.state = 1798
             self.name()
-            self.state = 1796
+            self.state = 1803
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,234,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,236,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1794
+                    self.state = 1801
                     self._errHandler.sync(self)
                     token = self._input.LA(1)
                     if token in [91, 92, 93, 94, 169, 205]:
-                        self.state = 1792
+                        self.state = 1799
                         self.serviceModifier()
                         pass
                     elif token in [195, 209]:
-                        self.state = 1793
+                        self.state = 1800
                         self.dependency()
                         pass
                     else:
                         raise NoViableAltException(self)
              
-                self.state = 1798
+                self.state = 1805
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,234,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,236,self._ctx)
 
-            self.state = 1800
+            self.state = 1807
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,235,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,237,self._ctx)
             if la_ == 1:
-                self.state = 1799
+                self.state = 1806
                 self.serviceBody()
 
 
@@ -11582,19 +11608,19 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1802
+            self.state = 1809
             self.match(CMLParser.T__2)
-            self.state = 1806
+            self.state = 1813
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72475425637649) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596598529) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35184372088833) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 1803
+                self.state = 1810
                 self.serviceBodyElement()
-                self.state = 1808
+                self.state = 1815
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1809
+            self.state = 1816
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -11661,42 +11687,42 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ServiceBodyElementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 200, self.RULE_serviceBodyElement)
         try:
-            self.state = 1817
+            self.state = 1824
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,237,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,239,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1811
+                self.state = 1818
                 self.serviceModifier()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1812
+                self.state = 1819
                 self.dependency()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1813
+                self.state = 1820
                 self.association()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1814
+                self.state = 1821
                 self.operation()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1815
+                self.state = 1822
                 self.callableOperationNoParens()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1816
+                self.state = 1823
                 self.rawStatement()
                 pass
 
@@ -11765,38 +11791,38 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 202, self.RULE_resource)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1819
+            self.state = 1826
             self.match(CMLParser.T__201)
-            self.state = 1820
+            self.state = 1827
             self.name()
-            self.state = 1825
+            self.state = 1832
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,239,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,241,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1823
+                    self.state = 1830
                     self._errHandler.sync(self)
                     token = self._input.LA(1)
                     if token in [91, 92, 93, 94, 160]:
-                        self.state = 1821
+                        self.state = 1828
                         self.resourceModifier()
                         pass
                     elif token in [195, 209]:
-                        self.state = 1822
+                        self.state = 1829
                         self.dependency()
                         pass
                     else:
                         raise NoViableAltException(self)
              
-                self.state = 1827
+                self.state = 1834
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,239,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,241,self._ctx)
 
-            self.state = 1829
+            self.state = 1836
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,240,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,242,self._ctx)
             if la_ == 1:
-                self.state = 1828
+                self.state = 1835
                 self.resourceBody()
 
 
@@ -11850,19 +11876,19 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1831
+            self.state = 1838
             self.match(CMLParser.T__2)
-            self.state = 1835
+            self.state = 1842
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72475425637649) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596598529) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35184372088833) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 1832
+                self.state = 1839
                 self.resourceBodyElement()
-                self.state = 1837
+                self.state = 1844
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1838
+            self.state = 1845
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -11925,36 +11951,36 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ResourceBodyElementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 206, self.RULE_resourceBodyElement)
         try:
-            self.state = 1845
+            self.state = 1852
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,242,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,244,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1840
+                self.state = 1847
                 self.resourceModifier()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1841
+                self.state = 1848
                 self.dependency()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1842
+                self.state = 1849
                 self.operation()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1843
+                self.state = 1850
                 self.callableOperationNoParens()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1844
+                self.state = 1851
                 self.rawStatement()
                 pass
 
@@ -12023,38 +12049,38 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 208, self.RULE_consumer)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1847
+            self.state = 1854
             self.match(CMLParser.T__202)
-            self.state = 1848
+            self.state = 1855
             self.name()
-            self.state = 1853
+            self.state = 1860
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,244,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,246,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1851
+                    self.state = 1858
                     self._errHandler.sync(self)
                     token = self._input.LA(1)
                     if token in [94, 169, 206, 207, 208]:
-                        self.state = 1849
+                        self.state = 1856
                         self.consumerModifier()
                         pass
                     elif token in [195, 209]:
-                        self.state = 1850
+                        self.state = 1857
                         self.dependency()
                         pass
                     else:
                         raise NoViableAltException(self)
              
-                self.state = 1855
+                self.state = 1862
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,244,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,246,self._ctx)
 
-            self.state = 1857
+            self.state = 1864
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,245,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,247,self._ctx)
             if la_ == 1:
-                self.state = 1856
+                self.state = 1863
                 self.consumerBody()
 
 
@@ -12108,19 +12134,19 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1859
+            self.state = 1866
             self.match(CMLParser.T__2)
-            self.state = 1863
+            self.state = 1870
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72561324983569) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596598657) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35186519572481) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 1860
+                self.state = 1867
                 self.consumerBodyElement()
-                self.state = 1865
+                self.state = 1872
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1866
+            self.state = 1873
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -12175,24 +12201,24 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ConsumerBodyElementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 212, self.RULE_consumerBodyElement)
         try:
-            self.state = 1871
+            self.state = 1878
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,247,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,249,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1868
+                self.state = 1875
                 self.consumerModifier()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1869
+                self.state = 1876
                 self.dependency()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1870
+                self.state = 1877
                 self.rawStatement()
                 pass
 
@@ -12261,38 +12287,38 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 214, self.RULE_repository)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1873
+            self.state = 1880
             self.match(CMLParser.T__203)
-            self.state = 1874
+            self.state = 1881
             self.name()
-            self.state = 1879
+            self.state = 1886
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,249,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,251,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1877
+                    self.state = 1884
                     self._errHandler.sync(self)
                     token = self._input.LA(1)
                     if token in [91, 92, 94, 169]:
-                        self.state = 1875
+                        self.state = 1882
                         self.repositoryModifier()
                         pass
                     elif token in [195, 209]:
-                        self.state = 1876
+                        self.state = 1883
                         self.dependency()
                         pass
                     else:
                         raise NoViableAltException(self)
              
-                self.state = 1881
+                self.state = 1888
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,249,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,251,self._ctx)
 
-            self.state = 1883
+            self.state = 1890
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,250,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,252,self._ctx)
             if la_ == 1:
-                self.state = 1882
+                self.state = 1889
                 self.repositoryBody()
 
 
@@ -12346,19 +12372,19 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1885
+            self.state = 1892
             self.match(CMLParser.T__2)
-            self.state = 1889
+            self.state = 1896
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -35184372088862) != 0) or ((((_la - 66)) & ~0x3f) == 0 and ((1 << (_la - 66)) & -72475425637649) != 0) or ((((_la - 130)) & ~0x3f) == 0 and ((1 << (_la - 130)) & -1) != 0) or ((((_la - 194)) & ~0x3f) == 0 and ((1 << (_la - 194)) & -576531396596598529) != 0) or ((((_la - 258)) & ~0x3f) == 0 and ((1 << (_la - 258)) & -35184372088833) != 0) or ((((_la - 322)) & ~0x3f) == 0 and ((1 << (_la - 322)) & 137438953471) != 0):
-                self.state = 1886
+                self.state = 1893
                 self.repositoryBodyElement()
-                self.state = 1891
+                self.state = 1898
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 1892
+            self.state = 1899
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -12417,30 +12443,30 @@ class CMLParser ( Parser ):
         localctx = CMLParser.RepositoryBodyElementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 218, self.RULE_repositoryBodyElement)
         try:
-            self.state = 1898
+            self.state = 1905
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,252,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,254,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1894
+                self.state = 1901
                 self.repositoryModifier()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1895
+                self.state = 1902
                 self.dependency()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1896
+                self.state = 1903
                 self.repositoryMethod()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1897
+                self.state = 1904
                 self.rawStatement()
                 pass
 
@@ -12511,72 +12537,72 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1901
+            self.state = 1908
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==81 or ((((_la - 218)) & ~0x3f) == 0 and ((1 << (_la - 218)) & 7) != 0):
-                self.state = 1900
+                self.state = 1907
                 self.visibility()
 
 
-            self.state = 1910
+            self.state = 1917
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,255,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,257,self._ctx)
             if la_ == 1:
-                self.state = 1904
+                self.state = 1911
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,254,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,256,self._ctx)
                 if la_ == 1:
-                    self.state = 1903
+                    self.state = 1910
                     self.match(CMLParser.T__77)
 
 
-                self.state = 1906
+                self.state = 1913
                 self.type_()
-                self.state = 1907
+                self.state = 1914
                 self.name()
                 pass
 
             elif la_ == 2:
-                self.state = 1909
+                self.state = 1916
                 self.name()
                 pass
 
 
-            self.state = 1917
+            self.state = 1924
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,257,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,259,self._ctx)
             if la_ == 1:
-                self.state = 1912
+                self.state = 1919
                 self.match(CMLParser.T__109)
-                self.state = 1914
+                self.state = 1921
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if ((((_la - 9)) & ~0x3f) == 0 and ((1 << (_la - 9)) & -9223372036821254143) != 0) or ((((_la - 78)) & ~0x3f) == 0 and ((1 << (_la - 78)) & -2199001034747) != 0) or ((((_la - 142)) & ~0x3f) == 0 and ((1 << (_la - 142)) & 1139410703610810367) != 0) or ((((_la - 228)) & ~0x3f) == 0 and ((1 << (_la - 228)) & -12935238269) != 0) or ((((_la - 292)) & ~0x3f) == 0 and ((1 << (_la - 292)) & 6629298651489370113) != 0):
-                    self.state = 1913
+                    self.state = 1920
                     self.parameterList()
 
 
-                self.state = 1916
+                self.state = 1923
                 self.match(CMLParser.T__110)
 
 
-            self.state = 1922
+            self.state = 1929
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,258,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,260,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 1919
+                    self.state = 1926
                     self.repositoryMethodOption() 
-                self.state = 1924
+                self.state = 1931
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,258,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,260,self._ctx)
 
-            self.state = 1926
+            self.state = 1933
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 1925
+                self.state = 1932
                 self.match(CMLParser.T__105)
 
 
@@ -12632,67 +12658,67 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ServiceModifierContext(self, self._ctx, self.state)
         self.enterRule(localctx, 222, self.RULE_serviceModifier)
         try:
-            self.state = 1946
+            self.state = 1953
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [91]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1928
+                self.state = 1935
                 self.match(CMLParser.T__90)
                 pass
             elif token in [92]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1929
+                self.state = 1936
                 self.match(CMLParser.T__91)
                 pass
             elif token in [205]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1930
+                self.state = 1937
                 self.match(CMLParser.T__204)
                 pass
             elif token in [93]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1931
+                self.state = 1938
                 self.match(CMLParser.T__92)
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1932
+                self.state = 1939
                 self.match(CMLParser.T__93)
-                self.state = 1933
+                self.state = 1940
                 self.match(CMLParser.T__5)
-                self.state = 1934
+                self.state = 1941
                 self.match(CMLParser.STRING)
                 pass
             elif token in [169]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 1935
+                self.state = 1942
                 self.match(CMLParser.T__168)
-                self.state = 1936
+                self.state = 1943
                 self.match(CMLParser.T__166)
-                self.state = 1939
+                self.state = 1946
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [355]:
-                    self.state = 1937
+                    self.state = 1944
                     self.match(CMLParser.STRING)
                     pass
                 elif token in [9, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 72, 80, 90, 94, 95, 98, 100, 102, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 167, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 196, 201, 228, 229, 235, 236, 238, 239, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 254, 255, 256, 257, 258, 259, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 350, 351, 352, 354]:
-                    self.state = 1938
+                    self.state = 1945
                     self.channelIdentifier()
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 1944
+                self.state = 1951
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,261,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,263,self._ctx)
                 if la_ == 1:
-                    self.state = 1941
+                    self.state = 1948
                     self.match(CMLParser.T__167)
-                    self.state = 1942
+                    self.state = 1949
                     self.match(CMLParser.T__5)
-                    self.state = 1943
+                    self.state = 1950
                     self.name()
 
 
@@ -12744,40 +12770,40 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ResourceModifierContext(self, self._ctx, self.state)
         self.enterRule(localctx, 224, self.RULE_resourceModifier)
         try:
-            self.state = 1957
+            self.state = 1964
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [91]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1948
+                self.state = 1955
                 self.match(CMLParser.T__90)
                 pass
             elif token in [92]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1949
+                self.state = 1956
                 self.match(CMLParser.T__91)
                 pass
             elif token in [93]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1950
+                self.state = 1957
                 self.match(CMLParser.T__92)
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1951
+                self.state = 1958
                 self.match(CMLParser.T__93)
-                self.state = 1952
+                self.state = 1959
                 self.match(CMLParser.T__5)
-                self.state = 1953
+                self.state = 1960
                 self.match(CMLParser.STRING)
                 pass
             elif token in [160]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 1954
+                self.state = 1961
                 self.match(CMLParser.T__159)
-                self.state = 1955
+                self.state = 1962
                 self.match(CMLParser.T__5)
-                self.state = 1956
+                self.state = 1963
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -12840,80 +12866,80 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 226, self.RULE_consumerModifier)
         self._la = 0 # Token type
         try:
-            self.state = 1982
+            self.state = 1989
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [94]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1959
+                self.state = 1966
                 self.match(CMLParser.T__93)
-                self.state = 1960
+                self.state = 1967
                 self.match(CMLParser.T__5)
-                self.state = 1961
+                self.state = 1968
                 self.match(CMLParser.STRING)
                 pass
             elif token in [169]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1962
+                self.state = 1969
                 self.match(CMLParser.T__168)
-                self.state = 1963
+                self.state = 1970
                 self.match(CMLParser.T__166)
-                self.state = 1966
+                self.state = 1973
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [355]:
-                    self.state = 1964
+                    self.state = 1971
                     self.match(CMLParser.STRING)
                     pass
                 elif token in [9, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 72, 80, 90, 94, 95, 98, 100, 102, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 167, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 196, 201, 228, 229, 235, 236, 238, 239, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 254, 255, 256, 257, 258, 259, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 350, 351, 352, 354]:
-                    self.state = 1965
+                    self.state = 1972
                     self.channelIdentifier()
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 1971
+                self.state = 1978
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,265,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,267,self._ctx)
                 if la_ == 1:
-                    self.state = 1968
+                    self.state = 1975
                     self.match(CMLParser.T__167)
-                    self.state = 1969
+                    self.state = 1976
                     self.match(CMLParser.T__5)
-                    self.state = 1970
+                    self.state = 1977
                     self.name()
 
 
                 pass
             elif token in [206]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1973
+                self.state = 1980
                 self.match(CMLParser.T__205)
-                self.state = 1974
+                self.state = 1981
                 self.match(CMLParser.T__166)
-                self.state = 1976
+                self.state = 1983
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 1975
+                    self.state = 1982
                     self.match(CMLParser.T__77)
 
 
-                self.state = 1978
+                self.state = 1985
                 self.qualifiedName()
                 pass
             elif token in [207, 208]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1979
+                self.state = 1986
                 _la = self._input.LA(1)
                 if not(_la==207 or _la==208):
                     self._errHandler.recoverInline(self)
                 else:
                     self._errHandler.reportMatch(self)
                     self.consume()
-                self.state = 1980
+                self.state = 1987
                 self.match(CMLParser.T__5)
-                self.state = 1981
+                self.state = 1988
                 self.channelIdentifier()
                 pass
             else:
@@ -12966,22 +12992,22 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 1984
+            self.state = 1991
             _la = self._input.LA(1)
             if not(_la==195 or _la==209):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 1986
+            self.state = 1993
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==78:
-                self.state = 1985
+                self.state = 1992
                 self.match(CMLParser.T__77)
 
 
-            self.state = 1988
+            self.state = 1995
             self.qualifiedName()
         except RecognitionException as re:
             localctx.exception = re
@@ -13035,57 +13061,57 @@ class CMLParser ( Parser ):
         localctx = CMLParser.RepositoryModifierContext(self, self._ctx, self.state)
         self.enterRule(localctx, 230, self.RULE_repositoryModifier)
         try:
-            self.state = 2006
+            self.state = 2013
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [91]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 1990
+                self.state = 1997
                 self.match(CMLParser.T__90)
                 pass
             elif token in [92]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 1991
+                self.state = 1998
                 self.match(CMLParser.T__91)
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 1992
+                self.state = 1999
                 self.match(CMLParser.T__93)
-                self.state = 1993
+                self.state = 2000
                 self.match(CMLParser.T__5)
-                self.state = 1994
+                self.state = 2001
                 self.match(CMLParser.STRING)
                 pass
             elif token in [169]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 1995
+                self.state = 2002
                 self.match(CMLParser.T__168)
-                self.state = 1996
+                self.state = 2003
                 self.match(CMLParser.T__166)
-                self.state = 1999
+                self.state = 2006
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [355]:
-                    self.state = 1997
+                    self.state = 2004
                     self.match(CMLParser.STRING)
                     pass
                 elif token in [9, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 72, 80, 90, 94, 95, 98, 100, 102, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 167, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 196, 201, 228, 229, 235, 236, 238, 239, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 254, 255, 256, 257, 258, 259, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 350, 351, 352, 354]:
-                    self.state = 1998
+                    self.state = 2005
                     self.channelIdentifier()
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 2004
+                self.state = 2011
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,270,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,272,self._ctx)
                 if la_ == 1:
-                    self.state = 2001
+                    self.state = 2008
                     self.match(CMLParser.T__167)
-                    self.state = 2002
+                    self.state = 2009
                     self.match(CMLParser.T__5)
-                    self.state = 2003
+                    self.state = 2010
                     self.name()
 
 
@@ -13158,183 +13184,183 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 232, self.RULE_repositoryMethodOption)
         self._la = 0 # Token type
         try:
-            self.state = 2065
+            self.state = 2072
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [159]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2008
+                self.state = 2015
                 self.match(CMLParser.T__158)
-                self.state = 2009
+                self.state = 2016
                 self.qualifiedNameList()
                 pass
             elif token in [94]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2010
+                self.state = 2017
                 self.match(CMLParser.T__93)
-                self.state = 2011
+                self.state = 2018
                 self.match(CMLParser.T__5)
-                self.state = 2012
+                self.state = 2019
                 self.match(CMLParser.STRING)
                 pass
             elif token in [90]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2013
+                self.state = 2020
                 self.match(CMLParser.T__89)
                 pass
             elif token in [91]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2014
+                self.state = 2021
                 self.match(CMLParser.T__90)
                 pass
             elif token in [92]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 2015
+                self.state = 2022
                 self.match(CMLParser.T__91)
                 pass
             elif token in [210]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 2016
+                self.state = 2023
                 self.match(CMLParser.T__209)
                 pass
             elif token in [211]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 2017
+                self.state = 2024
                 self.match(CMLParser.T__210)
                 pass
             elif token in [212]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 2018
+                self.state = 2025
                 self.match(CMLParser.T__211)
                 pass
             elif token in [213]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 2019
+                self.state = 2026
                 self.match(CMLParser.T__212)
-                self.state = 2020
+                self.state = 2027
                 self.match(CMLParser.T__5)
-                self.state = 2021
+                self.state = 2028
                 self.match(CMLParser.STRING)
                 pass
             elif token in [214]:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 2022
+                self.state = 2029
                 self.match(CMLParser.T__213)
-                self.state = 2023
+                self.state = 2030
                 self.match(CMLParser.T__5)
-                self.state = 2024
+                self.state = 2031
                 self.match(CMLParser.STRING)
                 pass
             elif token in [215]:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 2025
+                self.state = 2032
                 self.match(CMLParser.T__214)
-                self.state = 2026
+                self.state = 2033
                 self.match(CMLParser.T__5)
-                self.state = 2027
+                self.state = 2034
                 self.match(CMLParser.STRING)
                 pass
             elif token in [216]:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 2028
+                self.state = 2035
                 self.match(CMLParser.T__215)
-                self.state = 2029
+                self.state = 2036
                 self.match(CMLParser.T__5)
-                self.state = 2030
+                self.state = 2037
                 self.match(CMLParser.STRING)
                 pass
             elif token in [217]:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 2031
+                self.state = 2038
                 self.match(CMLParser.T__216)
-                self.state = 2032
+                self.state = 2039
                 self.match(CMLParser.T__5)
-                self.state = 2033
+                self.state = 2040
                 self.match(CMLParser.STRING)
                 pass
             elif token in [170, 171]:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 2037
+                self.state = 2044
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [170]:
-                    self.state = 2034
+                    self.state = 2041
                     self.match(CMLParser.T__169)
-                    self.state = 2035
+                    self.state = 2042
                     self.match(CMLParser.T__166)
                     pass
                 elif token in [171]:
-                    self.state = 2036
+                    self.state = 2043
                     self.match(CMLParser.T__170)
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 2040
+                self.state = 2047
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==78:
-                    self.state = 2039
+                    self.state = 2046
                     self.match(CMLParser.T__77)
 
 
-                self.state = 2042
+                self.state = 2049
                 self.qualifiedName()
                 pass
             elif token in [166]:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 2043
+                self.state = 2050
                 self.match(CMLParser.T__165)
-                self.state = 2045
+                self.state = 2052
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,274,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,276,self._ctx)
                 if la_ == 1:
-                    self.state = 2044
+                    self.state = 2051
                     self.eventTypeRef()
 
 
-                self.state = 2047
+                self.state = 2054
                 self.match(CMLParser.T__166)
-                self.state = 2048
+                self.state = 2055
                 self.operationTarget()
-                self.state = 2052
+                self.state = 2059
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,275,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,277,self._ctx)
                 if la_ == 1:
-                    self.state = 2049
+                    self.state = 2056
                     self.match(CMLParser.T__167)
-                    self.state = 2050
+                    self.state = 2057
                     self.match(CMLParser.T__5)
-                    self.state = 2051
+                    self.state = 2058
                     self.name()
 
 
                 pass
             elif token in [169]:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 2054
+                self.state = 2061
                 self.match(CMLParser.T__168)
-                self.state = 2056
+                self.state = 2063
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,276,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,278,self._ctx)
                 if la_ == 1:
-                    self.state = 2055
+                    self.state = 2062
                     self.eventTypeRef()
 
 
-                self.state = 2058
+                self.state = 2065
                 self.match(CMLParser.T__166)
-                self.state = 2059
+                self.state = 2066
                 self.operationTarget()
-                self.state = 2063
+                self.state = 2070
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,277,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,279,self._ctx)
                 if la_ == 1:
-                    self.state = 2060
+                    self.state = 2067
                     self.match(CMLParser.T__167)
-                    self.state = 2061
+                    self.state = 2068
                     self.match(CMLParser.T__5)
-                    self.state = 2062
+                    self.state = 2069
                     self.name()
 
 
@@ -13386,7 +13412,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2067
+            self.state = 2074
             _la = self._input.LA(1)
             if not(_la==81 or ((((_la - 218)) & ~0x3f) == 0 and ((1 << (_la - 218)) & 7) != 0)):
                 self._errHandler.recoverInline(self)
@@ -13447,29 +13473,29 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2069
+            self.state = 2076
             self.match(CMLParser.T__220)
-            self.state = 2071
+            self.state = 2078
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if ((((_la - 9)) & ~0x3f) == 0 and ((1 << (_la - 9)) & -9223372036821254143) != 0) or ((((_la - 80)) & ~0x3f) == 0 and ((1 << (_la - 80)) & -549750258687) != 0) or ((((_la - 144)) & ~0x3f) == 0 and ((1 << (_la - 144)) & 149744687081587711) != 0) or ((((_la - 228)) & ~0x3f) == 0 and ((1 << (_la - 228)) & -12935238269) != 0) or ((((_la - 292)) & ~0x3f) == 0 and ((1 << (_la - 292)) & 6629298651489370113) != 0):
-                self.state = 2070
+                self.state = 2077
                 self.name()
 
 
-            self.state = 2073
+            self.state = 2080
             self.match(CMLParser.T__2)
-            self.state = 2077
+            self.state = 2084
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 75)) & ~0x3f) == 0 and ((1 << (_la - 75)) & 251658241) != 0) or ((((_la - 201)) & ~0x3f) == 0 and ((1 << (_la - 201)) & 6457131009) != 0):
-                self.state = 2074
+                self.state = 2081
                 self.applicationElement()
-                self.state = 2079
+                self.state = 2086
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2080
+            self.state = 2087
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -13536,42 +13562,42 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ApplicationElementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 238, self.RULE_applicationElement)
         try:
-            self.state = 2088
+            self.state = 2095
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,281,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,283,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2082
+                self.state = 2089
                 self.commandDecl()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2083
+                self.state = 2090
                 self.flow()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2084
+                self.state = 2091
                 self.service()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2085
+                self.state = 2092
                 self.coordination()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 2086
+                self.state = 2093
                 self.domainEvent()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 2087
+                self.state = 2094
                 self.commandEvent()
                 pass
 
@@ -13623,20 +13649,20 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2090
+            self.state = 2097
             _la = self._input.LA(1)
             if not(_la==102 or _la==222):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2091
+            self.state = 2098
             self.name()
-            self.state = 2093
+            self.state = 2100
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2092
+                self.state = 2099
                 self.match(CMLParser.T__105)
 
 
@@ -13694,28 +13720,28 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2095
+            self.state = 2102
             _la = self._input.LA(1)
             if not(_la==223 or _la==224):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2096
+            self.state = 2103
             self.name()
-            self.state = 2097
+            self.state = 2104
             self.match(CMLParser.T__2)
-            self.state = 2101
+            self.state = 2108
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 222)) & ~0x3f) == 0 and ((1 << (_la - 222)) & 41) != 0):
-                self.state = 2098
+                self.state = 2105
                 self.flowStep()
-                self.state = 2103
+                self.state = 2110
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2104
+            self.state = 2111
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -13770,22 +13796,22 @@ class CMLParser ( Parser ):
         localctx = CMLParser.FlowStepContext(self, self._ctx, self.state)
         self.enterRule(localctx, 244, self.RULE_flowStep)
         try:
-            self.state = 2109
+            self.state = 2116
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [222]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2106
+                self.state = 2113
                 self.flowCommandStep()
                 pass
             elif token in [225]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2107
+                self.state = 2114
                 self.flowEventStep()
                 pass
             elif token in [227]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2108
+                self.state = 2115
                 self.flowOperationStep()
                 pass
             else:
@@ -13846,31 +13872,31 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2111
+            self.state = 2118
             self.match(CMLParser.T__221)
-            self.state = 2112
+            self.state = 2119
             self.name()
-            self.state = 2114
+            self.state = 2121
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==21:
-                self.state = 2113
+                self.state = 2120
                 self.flowInitiator()
 
 
-            self.state = 2117
+            self.state = 2124
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,286,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,288,self._ctx)
             if la_ == 1:
-                self.state = 2116
+                self.state = 2123
                 self.flowCommandTail()
 
 
-            self.state = 2120
+            self.state = 2127
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2119
+                self.state = 2126
                 self.match(CMLParser.T__105)
 
 
@@ -13925,19 +13951,19 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2123
+            self.state = 2130
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==170:
-                self.state = 2122
+                self.state = 2129
                 self.flowDelegate()
 
 
-            self.state = 2126
+            self.state = 2133
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==231:
-                self.state = 2125
+                self.state = 2132
                 self.flowEmitsClause()
 
 
@@ -13992,19 +14018,19 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2128
+            self.state = 2135
             self.match(CMLParser.T__224)
-            self.state = 2129
+            self.state = 2136
             self.flowEventTriggerList()
-            self.state = 2130
+            self.state = 2137
             self.match(CMLParser.T__225)
-            self.state = 2131
+            self.state = 2138
             self.flowInvocationList()
-            self.state = 2133
+            self.state = 2140
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2132
+                self.state = 2139
                 self.match(CMLParser.T__105)
 
 
@@ -14065,17 +14091,17 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2135
+            self.state = 2142
             self.name()
-            self.state = 2141
+            self.state = 2148
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 235)) & ~0x3f) == 0 and ((1 << (_la - 235)) & 31) != 0):
-                self.state = 2136
+                self.state = 2143
                 self.transitionOperator()
-                self.state = 2137
+                self.state = 2144
                 self.name()
-                self.state = 2143
+                self.state = 2150
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -14134,31 +14160,31 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2144
+            self.state = 2151
             self.match(CMLParser.T__226)
-            self.state = 2145
+            self.state = 2152
             self.name()
-            self.state = 2147
+            self.state = 2154
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==21:
-                self.state = 2146
+                self.state = 2153
                 self.flowInitiator()
 
 
-            self.state = 2150
+            self.state = 2157
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,293,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,295,self._ctx)
             if la_ == 1:
-                self.state = 2149
+                self.state = 2156
                 self.flowOperationTail()
 
 
-            self.state = 2153
+            self.state = 2160
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2152
+                self.state = 2159
                 self.match(CMLParser.T__105)
 
 
@@ -14213,19 +14239,19 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2156
+            self.state = 2163
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==170:
-                self.state = 2155
+                self.state = 2162
                 self.flowDelegate()
 
 
-            self.state = 2159
+            self.state = 2166
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==231:
-                self.state = 2158
+                self.state = 2165
                 self.flowEmitsClause()
 
 
@@ -14274,15 +14300,15 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 258, self.RULE_flowInitiator)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2161
+            self.state = 2168
             self.match(CMLParser.T__20)
-            self.state = 2162
+            self.state = 2169
             self.match(CMLParser.T__227)
-            self.state = 2163
+            self.state = 2170
             self.match(CMLParser.T__228)
-            self.state = 2164
+            self.state = 2171
             self.match(CMLParser.STRING)
-            self.state = 2165
+            self.state = 2172
             self.match(CMLParser.T__22)
         except RecognitionException as re:
             localctx.exception = re
@@ -14335,25 +14361,25 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2167
+            self.state = 2174
             self.match(CMLParser.T__169)
-            self.state = 2168
+            self.state = 2175
             self.match(CMLParser.T__166)
-            self.state = 2169
+            self.state = 2176
             self.name()
-            self.state = 2171
+            self.state = 2178
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==230:
-                self.state = 2170
+                self.state = 2177
                 self.match(CMLParser.T__229)
 
 
-            self.state = 2174
+            self.state = 2181
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==21:
-                self.state = 2173
+                self.state = 2180
                 self.stateTransition()
 
 
@@ -14411,15 +14437,15 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2176
+            self.state = 2183
             self.flowInvocation()
-            self.state = 2180
+            self.state = 2187
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 235)) & ~0x3f) == 0 and ((1 << (_la - 235)) & 31) != 0):
-                self.state = 2177
+                self.state = 2184
                 self.flowInvocationConnector()
-                self.state = 2182
+                self.state = 2189
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -14473,9 +14499,9 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 264, self.RULE_flowInvocationConnector)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2183
+            self.state = 2190
             self.transitionOperator()
-            self.state = 2184
+            self.state = 2191
             self.flowInvocation()
         except RecognitionException as re:
             localctx.exception = re
@@ -14528,15 +14554,15 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2187
+            self.state = 2194
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==222 or _la==227:
-                self.state = 2186
+                self.state = 2193
                 self.flowInvocationKind()
 
 
-            self.state = 2189
+            self.state = 2196
             self.name()
         except RecognitionException as re:
             localctx.exception = re
@@ -14582,7 +14608,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2191
+            self.state = 2198
             _la = self._input.LA(1)
             if not(_la==222 or _la==227):
                 self._errHandler.recoverInline(self)
@@ -14635,11 +14661,11 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 270, self.RULE_flowEmitsClause)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2193
+            self.state = 2200
             self.match(CMLParser.T__230)
-            self.state = 2194
+            self.state = 2201
             self.match(CMLParser.T__224)
-            self.state = 2195
+            self.state = 2202
             self.flowEventList()
         except RecognitionException as re:
             localctx.exception = re
@@ -14698,17 +14724,17 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2197
+            self.state = 2204
             self.name()
-            self.state = 2203
+            self.state = 2210
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 235)) & ~0x3f) == 0 and ((1 << (_la - 235)) & 31) != 0):
-                self.state = 2198
+                self.state = 2205
                 self.transitionOperator()
-                self.state = 2199
+                self.state = 2206
                 self.name()
-                self.state = 2205
+                self.state = 2212
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -14766,28 +14792,28 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2206
+            self.state = 2213
             _la = self._input.LA(1)
             if not(_la==232 or _la==233):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2207
+            self.state = 2214
             self.name()
-            self.state = 2208
+            self.state = 2215
             self.match(CMLParser.T__2)
-            self.state = 2212
+            self.state = 2219
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 9)) & ~0x3f) == 0 and ((1 << (_la - 9)) & -9223372036821254143) != 0) or ((((_la - 80)) & ~0x3f) == 0 and ((1 << (_la - 80)) & -549750258687) != 0) or ((((_la - 144)) & ~0x3f) == 0 and ((1 << (_la - 144)) & 149744687081587711) != 0) or ((((_la - 228)) & ~0x3f) == 0 and ((1 << (_la - 228)) & -12935238269) != 0) or ((((_la - 292)) & ~0x3f) == 0 and ((1 << (_la - 292)) & 6629298651489370113) != 0):
-                self.state = 2209
+                self.state = 2216
                 self.coordinationStep()
-                self.state = 2214
+                self.state = 2221
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2215
+            self.state = 2222
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -14836,13 +14862,13 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2217
+            self.state = 2224
             self.coordinationPath()
-            self.state = 2219
+            self.state = 2226
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2218
+                self.state = 2225
                 self.match(CMLParser.T__105)
 
 
@@ -14896,17 +14922,17 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2221
+            self.state = 2228
             self.name()
-            self.state = 2226
+            self.state = 2233
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==234:
-                self.state = 2222
+                self.state = 2229
                 self.match(CMLParser.T__233)
-                self.state = 2223
+                self.state = 2230
                 self.name()
-                self.state = 2228
+                self.state = 2235
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -14971,39 +14997,39 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2229
+            self.state = 2236
             self.match(CMLParser.T__20)
-            self.state = 2231
+            self.state = 2238
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if ((((_la - 9)) & ~0x3f) == 0 and ((1 << (_la - 9)) & -9223372036821254143) != 0) or ((((_la - 80)) & ~0x3f) == 0 and ((1 << (_la - 80)) & -549750258687) != 0) or ((((_la - 144)) & ~0x3f) == 0 and ((1 << (_la - 144)) & 149744687081587711) != 0) or ((((_la - 228)) & ~0x3f) == 0 and ((1 << (_la - 228)) & -12935238269) != 0) or ((((_la - 292)) & ~0x3f) == 0 and ((1 << (_la - 292)) & 6629298651489370113) != 0):
-                self.state = 2230
+                self.state = 2237
                 self.idList()
 
 
-            self.state = 2243
+            self.state = 2250
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==36:
-                self.state = 2233
+                self.state = 2240
                 self.match(CMLParser.T__35)
-                self.state = 2234
+                self.state = 2241
                 self.targetState()
-                self.state = 2240
+                self.state = 2247
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while ((((_la - 235)) & ~0x3f) == 0 and ((1 << (_la - 235)) & 31) != 0):
-                    self.state = 2235
+                    self.state = 2242
                     self.transitionOperator()
-                    self.state = 2236
+                    self.state = 2243
                     self.targetState()
-                    self.state = 2242
+                    self.state = 2249
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 2245
+            self.state = 2252
             self.match(CMLParser.T__22)
         except RecognitionException as re:
             localctx.exception = re
@@ -15052,13 +15078,13 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2247
+            self.state = 2254
             self.name()
-            self.state = 2249
+            self.state = 2256
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==156:
-                self.state = 2248
+                self.state = 2255
                 self.match(CMLParser.T__155)
 
 
@@ -15106,7 +15132,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2251
+            self.state = 2258
             _la = self._input.LA(1)
             if not(((((_la - 235)) & ~0x3f) == 0 and ((1 << (_la - 235)) & 31) != 0)):
                 self._errHandler.recoverInline(self)
@@ -15174,39 +15200,39 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2253
+            self.state = 2260
             self.match(CMLParser.T__239)
-            self.state = 2254
+            self.state = 2261
             self.name()
-            self.state = 2264
+            self.state = 2271
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,311,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,313,self._ctx)
             if la_ == 1:
-                self.state = 2255
+                self.state = 2262
                 self.match(CMLParser.T__2)
-                self.state = 2260
+                self.state = 2267
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while (((_la) & ~0x3f) == 0 and ((1 << _la) & -18) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & -1) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & -1) != 0) or ((((_la - 192)) & ~0x3f) == 0 and ((1 << (_la - 192)) & -1) != 0) or ((((_la - 256)) & ~0x3f) == 0 and ((1 << (_la - 256)) & -1) != 0) or ((((_la - 320)) & ~0x3f) == 0 and ((1 << (_la - 320)) & 549755813887) != 0):
-                    self.state = 2258
+                    self.state = 2265
                     self._errHandler.sync(self)
-                    la_ = self._interp.adaptivePredict(self._input,309,self._ctx)
+                    la_ = self._interp.adaptivePredict(self._input,311,self._ctx)
                     if la_ == 1:
-                        self.state = 2256
+                        self.state = 2263
                         self.useCaseBody()
                         pass
 
                     elif la_ == 2:
-                        self.state = 2257
+                        self.state = 2264
                         self.useCaseFreeText()
                         pass
 
 
-                    self.state = 2262
+                    self.state = 2269
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 2263
+                self.state = 2270
                 self.match(CMLParser.T__3)
 
 
@@ -15275,37 +15301,37 @@ class CMLParser ( Parser ):
         localctx = CMLParser.UseCaseBodyContext(self, self._ctx, self.state)
         self.enterRule(localctx, 288, self.RULE_useCaseBody)
         try:
-            self.state = 2272
+            self.state = 2279
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [241]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2266
+                self.state = 2273
                 self.useCaseActor()
                 pass
             elif token in [242]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2267
+                self.state = 2274
                 self.useCaseSecondaryActors()
                 pass
             elif token in [243]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2268
+                self.state = 2275
                 self.useCaseInteractionsBlock()
                 pass
             elif token in [281]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2269
+                self.state = 2276
                 self.useCaseBenefit()
                 pass
             elif token in [282]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 2270
+                self.state = 2277
                 self.useCaseScope()
                 pass
             elif token in [283]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 2271
+                self.state = 2278
                 self.useCaseLevel()
                 pass
             else:
@@ -15357,17 +15383,17 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2274
+            self.state = 2281
             self.match(CMLParser.T__240)
-            self.state = 2276
+            self.state = 2283
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 2275
+                self.state = 2282
                 self.match(CMLParser.T__5)
 
 
-            self.state = 2278
+            self.state = 2285
             self.match(CMLParser.STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -15418,30 +15444,30 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2280
+            self.state = 2287
             self.match(CMLParser.T__241)
-            self.state = 2282
+            self.state = 2289
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 2281
+                self.state = 2288
                 self.match(CMLParser.T__5)
 
 
-            self.state = 2284
+            self.state = 2291
             self.match(CMLParser.STRING)
-            self.state = 2289
+            self.state = 2296
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,315,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,317,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 2285
+                    self.state = 2292
                     self.match(CMLParser.T__21)
-                    self.state = 2286
+                    self.state = 2293
                     self.match(CMLParser.STRING) 
-                self.state = 2291
+                self.state = 2298
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,315,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,317,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -15493,29 +15519,29 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2292
+            self.state = 2299
             self.match(CMLParser.T__242)
-            self.state = 2294
+            self.state = 2301
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 2293
+                self.state = 2300
                 self.match(CMLParser.T__5)
 
 
-            self.state = 2297 
+            self.state = 2304 
             self._errHandler.sync(self)
             _alt = 1
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt == 1:
-                    self.state = 2296
+                    self.state = 2303
                     self.useCaseInteractionItem()
 
                 else:
                     raise NoViableAltException(self)
-                self.state = 2299 
+                self.state = 2306 
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,317,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,319,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -15573,18 +15599,18 @@ class CMLParser ( Parser ):
         localctx = CMLParser.UseCaseInteractionItemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 296, self.RULE_useCaseInteractionItem)
         try:
-            self.state = 2317
+            self.state = 2324
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,322,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,324,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2301
+                self.state = 2308
                 self.urFeature()
-                self.state = 2303
+                self.state = 2310
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,318,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,320,self._ctx)
                 if la_ == 1:
-                    self.state = 2302
+                    self.state = 2309
                     self.match(CMLParser.T__21)
 
 
@@ -15592,13 +15618,13 @@ class CMLParser ( Parser ):
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2305
+                self.state = 2312
                 self.useCaseReadOperation()
-                self.state = 2307
+                self.state = 2314
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,319,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,321,self._ctx)
                 if la_ == 1:
-                    self.state = 2306
+                    self.state = 2313
                     self.match(CMLParser.T__21)
 
 
@@ -15606,13 +15632,13 @@ class CMLParser ( Parser ):
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2309
+                self.state = 2316
                 self.match(CMLParser.STRING)
-                self.state = 2311
+                self.state = 2318
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,320,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,322,self._ctx)
                 if la_ == 1:
-                    self.state = 2310
+                    self.state = 2317
                     self.match(CMLParser.T__21)
 
 
@@ -15620,13 +15646,13 @@ class CMLParser ( Parser ):
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2313
+                self.state = 2320
                 self.useCaseInteractionId()
-                self.state = 2315
+                self.state = 2322
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,321,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,323,self._ctx)
                 if la_ == 1:
-                    self.state = 2314
+                    self.state = 2321
                     self.match(CMLParser.T__21)
 
 
@@ -15687,30 +15713,30 @@ class CMLParser ( Parser ):
         localctx = CMLParser.UseCaseInteractionIdContext(self, self._ctx, self.state)
         self.enterRule(localctx, 298, self.RULE_useCaseInteractionId)
         try:
-            self.state = 2323
+            self.state = 2330
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,323,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,325,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2319
+                self.state = 2326
                 self.name()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2320
+                self.state = 2327
                 self.match(CMLParser.READ)
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2321
+                self.state = 2328
                 self.match(CMLParser.WITH)
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2322
+                self.state = 2329
                 self.match(CMLParser.ITS)
                 pass
 
@@ -15772,28 +15798,28 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 300, self.RULE_useCaseReadOperation)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2325
+            self.state = 2332
             self.match(CMLParser.READ)
-            self.state = 2326
+            self.state = 2333
             self.match(CMLParser.STRING)
-            self.state = 2327
+            self.state = 2334
             self.match(CMLParser.WITH)
-            self.state = 2328
+            self.state = 2335
             self.match(CMLParser.ITS)
-            self.state = 2329
+            self.state = 2336
             self.match(CMLParser.STRING)
-            self.state = 2334
+            self.state = 2341
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,324,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,326,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 2330
+                    self.state = 2337
                     self.match(CMLParser.T__21)
-                    self.state = 2331
+                    self.state = 2338
                     self.match(CMLParser.STRING) 
-                self.state = 2336
+                self.state = 2343
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,324,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,326,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -15844,17 +15870,17 @@ class CMLParser ( Parser ):
         localctx = CMLParser.UrFeatureContext(self, self._ctx, self.state)
         self.enterRule(localctx, 302, self.RULE_urFeature)
         try:
-            self.state = 2339
+            self.state = 2346
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [244]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2337
+                self.state = 2344
                 self.urStoryFeature()
                 pass
             elif token in [246, 350, 354, 355]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2338
+                self.state = 2345
                 self.urNormalFeature()
                 pass
             else:
@@ -15912,32 +15938,32 @@ class CMLParser ( Parser ):
         localctx = CMLParser.UrStoryFeatureContext(self, self._ctx, self.state)
         self.enterRule(localctx, 304, self.RULE_urStoryFeature)
         try:
-            self.state = 2351
+            self.state = 2358
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,326,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,328,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2341
+                self.state = 2348
                 self.match(CMLParser.T__243)
-                self.state = 2342
+                self.state = 2349
                 self.match(CMLParser.T__244)
-                self.state = 2343
+                self.state = 2350
                 self.match(CMLParser.T__166)
-                self.state = 2344
+                self.state = 2351
                 self.urVerb()
-                self.state = 2345
+                self.state = 2352
                 self.urEntityTail()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2347
+                self.state = 2354
                 self.match(CMLParser.T__243)
-                self.state = 2348
+                self.state = 2355
                 self.match(CMLParser.T__244)
-                self.state = 2349
+                self.state = 2356
                 self.match(CMLParser.T__166)
-                self.state = 2350
+                self.state = 2357
                 self.match(CMLParser.STRING)
                 pass
 
@@ -15992,9 +16018,9 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 306, self.RULE_urNormalFeature)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2353
+            self.state = 2360
             self.urVerb()
-            self.state = 2354
+            self.state = 2361
             self.urEntityTail()
         except RecognitionException as re:
             localctx.exception = re
@@ -16048,7 +16074,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2356
+            self.state = 2363
             _la = self._input.LA(1)
             if not(_la==246 or ((((_la - 350)) & ~0x3f) == 0 and ((1 << (_la - 350)) & 49) != 0)):
                 self._errHandler.recoverInline(self)
@@ -16113,29 +16139,29 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2359
+            self.state = 2366
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if ((((_la - 247)) & ~0x3f) == 0 and ((1 << (_la - 247)) & 7) != 0):
-                self.state = 2358
+                self.state = 2365
                 self.urEntityArticle()
 
 
-            self.state = 2361
+            self.state = 2368
             self.match(CMLParser.STRING)
-            self.state = 2363
+            self.state = 2370
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,328,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,330,self._ctx)
             if la_ == 1:
-                self.state = 2362
+                self.state = 2369
                 self.urEntityAttributes()
 
 
-            self.state = 2366
+            self.state = 2373
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,329,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,331,self._ctx)
             if la_ == 1:
-                self.state = 2365
+                self.state = 2372
                 self.urContainerEntity()
 
 
@@ -16183,7 +16209,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2368
+            self.state = 2375
             _la = self._input.LA(1)
             if not(((((_la - 247)) & ~0x3f) == 0 and ((1 << (_la - 247)) & 7) != 0)):
                 self._errHandler.recoverInline(self)
@@ -16245,29 +16271,29 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2370
+            self.state = 2377
             self.match(CMLParser.WITH)
-            self.state = 2371
+            self.state = 2378
             _la = self._input.LA(1)
             if not(_la==250 or _la==352):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2372
+            self.state = 2379
             self.match(CMLParser.STRING)
-            self.state = 2377
+            self.state = 2384
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,330,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,332,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 2373
+                    self.state = 2380
                     self.match(CMLParser.T__21)
-                    self.state = 2374
+                    self.state = 2381
                     self.match(CMLParser.STRING) 
-                self.state = 2379
+                self.state = 2386
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,330,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,332,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -16319,22 +16345,22 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2380
+            self.state = 2387
             _la = self._input.LA(1)
             if not(_la==167 or _la==251 or _la==252):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2382
+            self.state = 2389
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if ((((_la - 247)) & ~0x3f) == 0 and ((1 << (_la - 247)) & 7) != 0):
-                self.state = 2381
+                self.state = 2388
                 self.urEntityArticle()
 
 
-            self.state = 2384
+            self.state = 2391
             self.match(CMLParser.STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -16380,12 +16406,12 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2387 
+            self.state = 2394 
             self._errHandler.sync(self)
             _alt = 1
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt == 1:
-                    self.state = 2386
+                    self.state = 2393
                     _la = self._input.LA(1)
                     if _la <= 0 or _la==4:
                         self._errHandler.recoverInline(self)
@@ -16395,9 +16421,9 @@ class CMLParser ( Parser ):
 
                 else:
                     raise NoViableAltException(self)
-                self.state = 2389 
+                self.state = 2396 
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,332,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,334,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -16470,52 +16496,52 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2391
+            self.state = 2398
             self.match(CMLParser.T__252)
-            self.state = 2392
+            self.state = 2399
             self.name()
-            self.state = 2396
+            self.state = 2403
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==254:
-                self.state = 2393
+                self.state = 2400
                 self.match(CMLParser.T__253)
-                self.state = 2394
+                self.state = 2401
                 self.match(CMLParser.T__228)
-                self.state = 2395
+                self.state = 2402
                 self.name()
 
 
-            self.state = 2398
+            self.state = 2405
             self.match(CMLParser.T__2)
-            self.state = 2404
+            self.state = 2411
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while (((_la) & ~0x3f) == 0 and ((1 << _la) & -18) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & -1) != 0) or ((((_la - 128)) & ~0x3f) == 0 and ((1 << (_la - 128)) & -1) != 0) or ((((_la - 192)) & ~0x3f) == 0 and ((1 << (_la - 192)) & -1) != 0) or ((((_la - 256)) & ~0x3f) == 0 and ((1 << (_la - 256)) & -1) != 0) or ((((_la - 320)) & ~0x3f) == 0 and ((1 << (_la - 320)) & 549755813887) != 0):
-                self.state = 2402
+                self.state = 2409
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,334,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,336,self._ctx)
                 if la_ == 1:
-                    self.state = 2399
+                    self.state = 2406
                     self.userStoryXtextBody()
                     pass
 
                 elif la_ == 2:
-                    self.state = 2400
+                    self.state = 2407
                     self.userStoryBody()
                     pass
 
                 elif la_ == 3:
-                    self.state = 2401
+                    self.state = 2408
                     self.userStoryLine()
                     pass
 
 
-                self.state = 2406
+                self.state = 2413
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2407
+            self.state = 2414
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -16569,13 +16595,13 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2409
+            self.state = 2416
             self.match(CMLParser.T__254)
-            self.state = 2411
+            self.state = 2418
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==247 or _la==248:
-                self.state = 2410
+                self.state = 2417
                 _la = self._input.LA(1)
                 if not(_la==247 or _la==248):
                     self._errHandler.recoverInline(self)
@@ -16584,19 +16610,19 @@ class CMLParser ( Parser ):
                     self.consume()
 
 
-            self.state = 2413
+            self.state = 2420
             self.match(CMLParser.STRING)
-            self.state = 2414
+            self.state = 2421
             self.match(CMLParser.T__243)
-            self.state = 2415
+            self.state = 2422
             self.match(CMLParser.T__244)
-            self.state = 2416
+            self.state = 2423
             self.match(CMLParser.T__166)
-            self.state = 2418
+            self.state = 2425
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==256 or _la==354:
-                self.state = 2417
+                self.state = 2424
                 _la = self._input.LA(1)
                 if not(_la==256 or _la==354):
                     self._errHandler.recoverInline(self)
@@ -16605,13 +16631,13 @@ class CMLParser ( Parser ):
                     self.consume()
 
 
-            self.state = 2420
+            self.state = 2427
             self.match(CMLParser.STRING)
-            self.state = 2421
+            self.state = 2428
             self.match(CMLParser.T__256)
-            self.state = 2422
+            self.state = 2429
             self.match(CMLParser.T__257)
-            self.state = 2423
+            self.state = 2430
             self.match(CMLParser.STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -16675,13 +16701,13 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2425
+            self.state = 2432
             self.match(CMLParser.T__254)
-            self.state = 2427
+            self.state = 2434
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==247 or _la==248:
-                self.state = 2426
+                self.state = 2433
                 _la = self._input.LA(1)
                 if not(_la==247 or _la==248):
                     self._errHandler.recoverInline(self)
@@ -16690,31 +16716,31 @@ class CMLParser ( Parser ):
                     self.consume()
 
 
-            self.state = 2429
+            self.state = 2436
             localctx.role = self.match(CMLParser.STRING)
-            self.state = 2431 
+            self.state = 2438 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 2430
+                self.state = 2437
                 self.urFeature()
-                self.state = 2433 
+                self.state = 2440 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if not (_la==244 or _la==246 or ((((_la - 350)) & ~0x3f) == 0 and ((1 << (_la - 350)) & 49) != 0)):
                     break
 
-            self.state = 2435
+            self.state = 2442
             self.match(CMLParser.T__256)
-            self.state = 2436
+            self.state = 2443
             self.match(CMLParser.T__257)
-            self.state = 2437
+            self.state = 2444
             localctx.benefit = self.match(CMLParser.STRING)
-            self.state = 2439
+            self.state = 2446
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,340,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,342,self._ctx)
             if la_ == 1:
-                self.state = 2438
+                self.state = 2445
                 self.storyValuation()
 
 
@@ -16770,71 +16796,71 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2441
+            self.state = 2448
             self.match(CMLParser.T__258)
-            self.state = 2442
+            self.state = 2449
             self.match(CMLParser.T__257)
-            self.state = 2443
+            self.state = 2450
             localctx._STRING = self.match(CMLParser.STRING)
             localctx.promoted.append(localctx._STRING)
-            self.state = 2448
+            self.state = 2455
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==22:
-                self.state = 2444
+                self.state = 2451
                 self.match(CMLParser.T__21)
-                self.state = 2445
+                self.state = 2452
                 localctx._STRING = self.match(CMLParser.STRING)
                 localctx.promoted.append(localctx._STRING)
-                self.state = 2450
+                self.state = 2457
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2451
+            self.state = 2458
             _la = self._input.LA(1)
             if not(_la==260 or _la==261):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2452
+            self.state = 2459
             self.match(CMLParser.T__261)
-            self.state = 2454
+            self.state = 2461
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==22:
-                self.state = 2453
+                self.state = 2460
                 self.match(CMLParser.T__21)
 
 
-            self.state = 2456
+            self.state = 2463
             self.match(CMLParser.T__262)
-            self.state = 2457
+            self.state = 2464
             self.match(CMLParser.T__257)
-            self.state = 2458
+            self.state = 2465
             localctx._STRING = self.match(CMLParser.STRING)
             localctx.harmed.append(localctx._STRING)
-            self.state = 2463
+            self.state = 2470
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==22:
-                self.state = 2459
+                self.state = 2466
                 self.match(CMLParser.T__21)
-                self.state = 2460
+                self.state = 2467
                 localctx._STRING = self.match(CMLParser.STRING)
                 localctx.harmed.append(localctx._STRING)
-                self.state = 2465
+                self.state = 2472
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2466
+            self.state = 2473
             _la = self._input.LA(1)
             if not(_la==260 or _la==261):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2467
+            self.state = 2474
             _la = self._input.LA(1)
             if not(_la==264 or _la==265):
                 self._errHandler.recoverInline(self)
@@ -16885,12 +16911,12 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2470 
+            self.state = 2477 
             self._errHandler.sync(self)
             _alt = 1
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt == 1:
-                    self.state = 2469
+                    self.state = 2476
                     _la = self._input.LA(1)
                     if _la <= 0 or _la==4:
                         self._errHandler.recoverInline(self)
@@ -16900,9 +16926,9 @@ class CMLParser ( Parser ):
 
                 else:
                     raise NoViableAltException(self)
-                self.state = 2472 
+                self.state = 2479 
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,344,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,346,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -16959,7 +16985,7 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2474
+            self.state = 2481
             _la = self._input.LA(1)
             if not(((((_la - 9)) & ~0x3f) == 0 and ((1 << (_la - 9)) & -9223372036821254143) != 0) or ((((_la - 80)) & ~0x3f) == 0 and ((1 << (_la - 80)) & -549750258687) != 0) or ((((_la - 144)) & ~0x3f) == 0 and ((1 << (_la - 144)) & 149744687081587711) != 0) or ((((_la - 228)) & ~0x3f) == 0 and ((1 << (_la - 228)) & -12935238269) != 0) or ((((_la - 292)) & ~0x3f) == 0 and ((1 << (_la - 292)) & 6629298651489370113) != 0)):
                 self._errHandler.recoverInline(self)
@@ -17012,17 +17038,17 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2476
+            self.state = 2483
             self.match(CMLParser.T__280)
-            self.state = 2478
+            self.state = 2485
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 2477
+                self.state = 2484
                 self.match(CMLParser.T__5)
 
 
-            self.state = 2480
+            self.state = 2487
             self.match(CMLParser.STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -17070,17 +17096,17 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2482
+            self.state = 2489
             self.match(CMLParser.T__281)
-            self.state = 2484
+            self.state = 2491
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 2483
+                self.state = 2490
                 self.match(CMLParser.T__5)
 
 
-            self.state = 2486
+            self.state = 2493
             self.match(CMLParser.STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -17128,17 +17154,17 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2488
+            self.state = 2495
             self.match(CMLParser.T__282)
-            self.state = 2490
+            self.state = 2497
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==6:
-                self.state = 2489
+                self.state = 2496
                 self.match(CMLParser.T__5)
 
 
-            self.state = 2492
+            self.state = 2499
             self.match(CMLParser.STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -17194,31 +17220,31 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2494
+            self.state = 2501
             self.match(CMLParser.T__288)
-            self.state = 2497
+            self.state = 2504
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==293:
-                self.state = 2495
+                self.state = 2502
                 self.match(CMLParser.T__292)
-                self.state = 2496
+                self.state = 2503
                 self.idList()
 
 
-            self.state = 2499
+            self.state = 2506
             self.match(CMLParser.T__2)
-            self.state = 2503
+            self.state = 2510
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==288 or _la==294:
-                self.state = 2500
+                self.state = 2507
                 self.stakeholderItem()
-                self.state = 2505
+                self.state = 2512
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2506
+            self.state = 2513
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -17269,17 +17295,17 @@ class CMLParser ( Parser ):
         localctx = CMLParser.StakeholderItemContext(self, self._ctx, self.state)
         self.enterRule(localctx, 340, self.RULE_stakeholderItem)
         try:
-            self.state = 2510
+            self.state = 2517
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [294]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2508
+                self.state = 2515
                 self.stakeholderGroup()
                 pass
             elif token in [288]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2509
+                self.state = 2516
                 self.stakeholder()
                 pass
             else:
@@ -17339,27 +17365,27 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2512
+            self.state = 2519
             self.match(CMLParser.T__293)
-            self.state = 2513
+            self.state = 2520
             self.name()
-            self.state = 2522
+            self.state = 2529
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==3:
-                self.state = 2514
+                self.state = 2521
                 self.match(CMLParser.T__2)
-                self.state = 2518
+                self.state = 2525
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==288:
-                    self.state = 2515
+                    self.state = 2522
                     self.stakeholder()
-                    self.state = 2520
+                    self.state = 2527
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 2521
+                self.state = 2528
                 self.match(CMLParser.T__3)
 
 
@@ -17417,27 +17443,27 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2524
+            self.state = 2531
             self.match(CMLParser.T__287)
-            self.state = 2525
+            self.state = 2532
             self.name()
-            self.state = 2534
+            self.state = 2541
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==3:
-                self.state = 2526
+                self.state = 2533
                 self.match(CMLParser.T__2)
-                self.state = 2530
+                self.state = 2537
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while ((((_la - 284)) & ~0x3f) == 0 and ((1 << (_la - 284)) & 522241) != 0):
-                    self.state = 2527
+                    self.state = 2534
                     self.stakeholderAttribute()
-                    self.state = 2532
+                    self.state = 2539
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 2533
+                self.state = 2540
                 self.match(CMLParser.T__3)
 
 
@@ -17498,92 +17524,92 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 346, self.RULE_stakeholderAttribute)
         self._la = 0 # Token type
         try:
-            self.state = 2563
+            self.state = 2570
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [295]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2536
+                self.state = 2543
                 self.match(CMLParser.T__294)
-                self.state = 2538
+                self.state = 2545
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2537
+                    self.state = 2544
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2540
+                self.state = 2547
                 self.name()
                 pass
             elif token in [296]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2541
+                self.state = 2548
                 self.match(CMLParser.T__295)
-                self.state = 2543
+                self.state = 2550
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2542
+                    self.state = 2549
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2545
+                self.state = 2552
                 self.name()
                 pass
             elif token in [297]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2546
+                self.state = 2553
                 self.match(CMLParser.T__296)
-                self.state = 2548
+                self.state = 2555
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2547
+                    self.state = 2554
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2550
+                self.state = 2557
                 self.name()
                 pass
             elif token in [298]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2551
+                self.state = 2558
                 self.match(CMLParser.T__297)
-                self.state = 2553
+                self.state = 2560
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2552
+                    self.state = 2559
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2555
+                self.state = 2562
                 self.name()
                 pass
             elif token in [284]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 2556
+                self.state = 2563
                 self.match(CMLParser.T__283)
-                self.state = 2558
+                self.state = 2565
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2557
+                    self.state = 2564
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2560
+                self.state = 2567
                 self.match(CMLParser.STRING)
                 pass
             elif token in [299]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 2561
+                self.state = 2568
                 self.consequences()
                 pass
             elif token in [300, 301, 302]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 2562
+                self.state = 2569
                 self.consequenceItem()
                 pass
             else:
@@ -17638,18 +17664,18 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 348, self.RULE_consequences)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2565
+            self.state = 2572
             self.match(CMLParser.T__298)
-            self.state = 2569
+            self.state = 2576
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,361,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,363,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 2566
+                    self.state = 2573
                     self.consequenceItem() 
-                self.state = 2571
+                self.state = 2578
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,361,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,363,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -17701,20 +17727,20 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2572
+            self.state = 2579
             _la = self._input.LA(1)
             if not(((((_la - 300)) & ~0x3f) == 0 and ((1 << (_la - 300)) & 7) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2573
+            self.state = 2580
             self.match(CMLParser.STRING)
-            self.state = 2575
+            self.state = 2582
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,362,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,364,self._ctx)
             if la_ == 1:
-                self.state = 2574
+                self.state = 2581
                 self.name()
 
 
@@ -17803,57 +17829,57 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2577
+            self.state = 2584
             self.match(CMLParser.T__302)
-            self.state = 2578
+            self.state = 2585
             self.name()
-            self.state = 2581
+            self.state = 2588
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==252:
-                self.state = 2579
+                self.state = 2586
                 self.match(CMLParser.T__251)
-                self.state = 2580
+                self.state = 2587
                 self.name()
 
 
-            self.state = 2583
+            self.state = 2590
             self.match(CMLParser.T__2)
-            self.state = 2591
+            self.state = 2598
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 304)) & ~0x3f) == 0 and ((1 << (_la - 304)) & 268436041) != 0):
-                self.state = 2589
+                self.state = 2596
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [304]:
-                    self.state = 2584
+                    self.state = 2591
                     self.valueCluster()
                     pass
                 elif token in [307]:
-                    self.state = 2585
+                    self.state = 2592
                     self.value()
                     pass
                 elif token in [310]:
-                    self.state = 2586
+                    self.state = 2593
                     self.valueEpic()
                     pass
                 elif token in [313]:
-                    self.state = 2587
+                    self.state = 2594
                     self.valueNarrative()
                     pass
                 elif token in [332]:
-                    self.state = 2588
+                    self.state = 2595
                     self.valueWeigthing()
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 2593
+                self.state = 2600
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2594
+            self.state = 2601
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -17923,39 +17949,39 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2596
+            self.state = 2603
             self.match(CMLParser.T__303)
-            self.state = 2597
+            self.state = 2604
             self.name()
-            self.state = 2598
+            self.state = 2605
             self.match(CMLParser.T__2)
-            self.state = 2604
+            self.state = 2611
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 285)) & ~0x3f) == 0 and ((1 << (_la - 285)) & 7340059) != 0):
-                self.state = 2602
+                self.state = 2609
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [285, 286, 305, 306]:
-                    self.state = 2599
+                    self.state = 2606
                     self.valueClusterAttribute()
                     pass
                 elif token in [307]:
-                    self.state = 2600
+                    self.state = 2607
                     self.value()
                     pass
                 elif token in [288, 289]:
-                    self.state = 2601
+                    self.state = 2608
                     self.valueElicitation()
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 2606
+                self.state = 2613
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2607
+            self.state = 2614
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -18006,30 +18032,30 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 356, self.RULE_valueClusterAttribute)
         self._la = 0 # Token type
         try:
-            self.state = 2632
+            self.state = 2639
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [305]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2609
+                self.state = 2616
                 self.match(CMLParser.T__304)
-                self.state = 2611
+                self.state = 2618
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2610
+                    self.state = 2617
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2615
+                self.state = 2622
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [9, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 72, 80, 90, 94, 95, 98, 100, 102, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 167, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 196, 201, 228, 229, 235, 236, 238, 239, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 254, 255, 256, 257, 258, 259, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 350, 351, 352, 354]:
-                    self.state = 2613
+                    self.state = 2620
                     self.name()
                     pass
                 elif token in [355]:
-                    self.state = 2614
+                    self.state = 2621
                     self.match(CMLParser.STRING)
                     pass
                 else:
@@ -18038,47 +18064,47 @@ class CMLParser ( Parser ):
                 pass
             elif token in [306]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2617
+                self.state = 2624
                 self.match(CMLParser.T__305)
-                self.state = 2619
+                self.state = 2626
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2618
+                    self.state = 2625
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2621
+                self.state = 2628
                 self.match(CMLParser.STRING)
                 pass
             elif token in [285]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2622
+                self.state = 2629
                 self.match(CMLParser.T__284)
-                self.state = 2624
+                self.state = 2631
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2623
+                    self.state = 2630
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2626
+                self.state = 2633
                 self.match(CMLParser.STRING)
                 pass
             elif token in [286]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2627
+                self.state = 2634
                 self.match(CMLParser.T__285)
-                self.state = 2629
+                self.state = 2636
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2628
+                    self.state = 2635
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2631
+                self.state = 2638
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -18145,35 +18171,35 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2634
+            self.state = 2641
             self.match(CMLParser.T__306)
-            self.state = 2635
+            self.state = 2642
             self.name()
-            self.state = 2636
+            self.state = 2643
             self.match(CMLParser.T__2)
-            self.state = 2641
+            self.state = 2648
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 285)) & ~0x3f) == 0 and ((1 << (_la - 285)) & 3145759) != 0):
-                self.state = 2639
+                self.state = 2646
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [285, 286, 287, 305, 306]:
-                    self.state = 2637
+                    self.state = 2644
                     self.valueAttribute()
                     pass
                 elif token in [288, 289]:
-                    self.state = 2638
+                    self.state = 2645
                     self.valueElicitation()
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 2643
+                self.state = 2650
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2644
+            self.state = 2651
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -18224,30 +18250,30 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 360, self.RULE_valueAttribute)
         self._la = 0 # Token type
         try:
-            self.state = 2670
+            self.state = 2677
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [305]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2646
+                self.state = 2653
                 self.match(CMLParser.T__304)
-                self.state = 2648
+                self.state = 2655
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2647
+                    self.state = 2654
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2652
+                self.state = 2659
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
                 if token in [9, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 72, 80, 90, 94, 95, 98, 100, 102, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 167, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 196, 201, 228, 229, 235, 236, 238, 239, 241, 242, 243, 244, 245, 246, 247, 248, 249, 250, 251, 254, 255, 256, 257, 258, 259, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 350, 351, 352, 354]:
-                    self.state = 2650
+                    self.state = 2657
                     self.name()
                     pass
                 elif token in [355]:
-                    self.state = 2651
+                    self.state = 2658
                     self.match(CMLParser.STRING)
                     pass
                 else:
@@ -18256,52 +18282,52 @@ class CMLParser ( Parser ):
                 pass
             elif token in [287]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2654
+                self.state = 2661
                 self.match(CMLParser.T__286)
                 pass
             elif token in [306]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2655
+                self.state = 2662
                 self.match(CMLParser.T__305)
-                self.state = 2657
+                self.state = 2664
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2656
+                    self.state = 2663
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2659
+                self.state = 2666
                 self.match(CMLParser.STRING)
                 pass
             elif token in [285]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2660
+                self.state = 2667
                 self.match(CMLParser.T__284)
-                self.state = 2662
+                self.state = 2669
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2661
+                    self.state = 2668
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2664
+                self.state = 2671
                 self.match(CMLParser.STRING)
                 pass
             elif token in [286]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 2665
+                self.state = 2672
                 self.match(CMLParser.T__285)
-                self.state = 2667
+                self.state = 2674
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2666
+                    self.state = 2673
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2669
+                self.state = 2676
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -18361,32 +18387,32 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2672
+            self.state = 2679
             _la = self._input.LA(1)
             if not(_la==288 or _la==289):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2673
+            self.state = 2680
             self.name()
-            self.state = 2682
+            self.state = 2689
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==3:
-                self.state = 2674
+                self.state = 2681
                 self.match(CMLParser.T__2)
-                self.state = 2678
+                self.state = 2685
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while ((((_la - 297)) & ~0x3f) == 0 and ((1 << (_la - 297)) & 7) != 0):
-                    self.state = 2675
+                    self.state = 2682
                     self.valueElicitationOption()
-                    self.state = 2680
+                    self.state = 2687
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 2681
+                self.state = 2688
                 self.match(CMLParser.T__3)
 
 
@@ -18443,50 +18469,50 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 364, self.RULE_valueElicitationOption)
         self._la = 0 # Token type
         try:
-            self.state = 2700
+            self.state = 2707
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [297]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2684
+                self.state = 2691
                 self.match(CMLParser.T__296)
-                self.state = 2686
+                self.state = 2693
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2685
+                    self.state = 2692
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2688
+                self.state = 2695
                 self.name()
                 pass
             elif token in [298]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2689
+                self.state = 2696
                 self.match(CMLParser.T__297)
-                self.state = 2691
+                self.state = 2698
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==6:
-                    self.state = 2690
+                    self.state = 2697
                     self.match(CMLParser.T__5)
 
 
-                self.state = 2693
+                self.state = 2700
                 self.name()
                 pass
             elif token in [299]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2694
+                self.state = 2701
                 self.match(CMLParser.T__298)
-                self.state = 2696 
+                self.state = 2703 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while True:
-                    self.state = 2695
+                    self.state = 2702
                     self.valueConsequenceEntry()
-                    self.state = 2698 
+                    self.state = 2705 
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
                     if not (((((_la - 290)) & ~0x3f) == 0 and ((1 << (_la - 290)) & 7169) != 0)):
@@ -18545,17 +18571,17 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ValueConsequenceEntryContext(self, self._ctx, self.state)
         self.enterRule(localctx, 366, self.RULE_valueConsequenceEntry)
         try:
-            self.state = 2704
+            self.state = 2711
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [290, 300, 301]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2702
+                self.state = 2709
                 self.valueConsequence()
                 pass
             elif token in [302]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2703
+                self.state = 2710
                 self.valueAction()
                 pass
             else:
@@ -18607,14 +18633,14 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2706
+            self.state = 2713
             _la = self._input.LA(1)
             if not(((((_la - 290)) & ~0x3f) == 0 and ((1 << (_la - 290)) & 3073) != 0)):
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2707
+            self.state = 2714
             self.match(CMLParser.STRING)
         except RecognitionException as re:
             localctx.exception = re
@@ -18668,19 +18694,19 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 370, self.RULE_valueAction)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2709
+            self.state = 2716
             self.match(CMLParser.T__301)
-            self.state = 2710
+            self.state = 2717
             self.match(CMLParser.STRING)
-            self.state = 2713
+            self.state = 2720
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,389,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,391,self._ctx)
             if la_ == 1:
-                self.state = 2711
+                self.state = 2718
                 self.name()
 
             elif la_ == 2:
-                self.state = 2712
+                self.state = 2719
                 self.match(CMLParser.STRING)
 
 
@@ -18728,25 +18754,25 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ValueEpicClauseContext(self, self._ctx, self.state)
         self.enterRule(localctx, 372, self.RULE_valueEpicClause)
         try:
-            self.state = 2721
+            self.state = 2728
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [308]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2715
+                self.state = 2722
                 self.match(CMLParser.T__307)
-                self.state = 2716
+                self.state = 2723
                 self.match(CMLParser.T__292)
-                self.state = 2717
+                self.state = 2724
                 self.match(CMLParser.STRING)
                 pass
             elif token in [309]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2718
+                self.state = 2725
                 self.match(CMLParser.T__308)
-                self.state = 2719
+                self.state = 2726
                 self.match(CMLParser.T__292)
-                self.state = 2720
+                self.state = 2727
                 self.match(CMLParser.STRING)
                 pass
             else:
@@ -18812,19 +18838,19 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2723
+            self.state = 2730
             self.match(CMLParser.T__309)
-            self.state = 2724
+            self.state = 2731
             self.name()
-            self.state = 2725
+            self.state = 2732
             self.match(CMLParser.T__2)
-            self.state = 2726
+            self.state = 2733
             self.match(CMLParser.T__254)
-            self.state = 2728
+            self.state = 2735
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,391,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,393,self._ctx)
             if la_ == 1:
-                self.state = 2727
+                self.state = 2734
                 _la = self._input.LA(1)
                 if not(_la==247 or _la==248):
                     self._errHandler.recoverInline(self)
@@ -18833,33 +18859,33 @@ class CMLParser ( Parser ):
                     self.consume()
 
 
-            self.state = 2730
+            self.state = 2737
             self.name()
-            self.state = 2731
+            self.state = 2738
             self.match(CMLParser.T__243)
-            self.state = 2732
+            self.state = 2739
             self.match(CMLParser.T__268)
-            self.state = 2733
+            self.state = 2740
             self.match(CMLParser.STRING)
-            self.state = 2734
+            self.state = 2741
             self.match(CMLParser.T__310)
-            self.state = 2735
+            self.state = 2742
             self.match(CMLParser.T__311)
-            self.state = 2736
+            self.state = 2743
             self.match(CMLParser.T__250)
-            self.state = 2738 
+            self.state = 2745 
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while True:
-                self.state = 2737
+                self.state = 2744
                 self.valueEpicClause()
-                self.state = 2740 
+                self.state = 2747 
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if not (_la==308 or _la==309):
                     break
 
-            self.state = 2742
+            self.state = 2749
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -18917,106 +18943,106 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2744
+            self.state = 2751
             self.match(CMLParser.T__312)
-            self.state = 2745
+            self.state = 2752
             self.name()
-            self.state = 2746
+            self.state = 2753
             self.match(CMLParser.T__2)
-            self.state = 2747
+            self.state = 2754
             self.match(CMLParser.T__313)
-            self.state = 2748
+            self.state = 2755
             self.match(CMLParser.T__248)
-            self.state = 2749
+            self.state = 2756
             self.match(CMLParser.T__314)
-            self.state = 2750
+            self.state = 2757
             self.match(CMLParser.T__315)
-            self.state = 2751
+            self.state = 2758
             self.match(CMLParser.STRING)
-            self.state = 2752
+            self.state = 2759
             self.match(CMLParser.T__21)
-            self.state = 2753
+            self.state = 2760
             self.match(CMLParser.T__316)
-            self.state = 2754
+            self.state = 2761
             self.match(CMLParser.T__317)
-            self.state = 2755
+            self.state = 2762
             self.match(CMLParser.T__318)
-            self.state = 2756
+            self.state = 2763
             self.match(CMLParser.T__166)
-            self.state = 2767
+            self.state = 2774
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,393,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,395,self._ctx)
             if la_ == 1:
-                self.state = 2757
+                self.state = 2764
                 self.match(CMLParser.T__319)
                 pass
 
             elif la_ == 2:
-                self.state = 2758
+                self.state = 2765
                 self.match(CMLParser.T__320)
-                self.state = 2759
+                self.state = 2766
                 self.match(CMLParser.T__290)
-                self.state = 2760
+                self.state = 2767
                 self.match(CMLParser.T__321)
-                self.state = 2761
+                self.state = 2768
                 self.match(CMLParser.T__245)
                 pass
 
             elif la_ == 3:
-                self.state = 2762
+                self.state = 2769
                 self.match(CMLParser.T__319)
-                self.state = 2763
+                self.state = 2770
                 self.match(CMLParser.T__21)
-                self.state = 2764
+                self.state = 2771
                 self.match(CMLParser.T__290)
-                self.state = 2765
+                self.state = 2772
                 self.match(CMLParser.T__321)
-                self.state = 2766
+                self.state = 2773
                 self.match(CMLParser.T__245)
                 pass
 
 
-            self.state = 2769
+            self.state = 2776
             self.match(CMLParser.STRING)
-            self.state = 2771
+            self.state = 2778
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==22:
-                self.state = 2770
+                self.state = 2777
                 self.match(CMLParser.T__21)
 
 
-            self.state = 2773
+            self.state = 2780
             self.match(CMLParser.T__322)
-            self.state = 2774
+            self.state = 2781
             self.match(CMLParser.T__323)
-            self.state = 2775
+            self.state = 2782
             self.match(CMLParser.T__321)
-            self.state = 2776
+            self.state = 2783
             self.match(CMLParser.T__324)
-            self.state = 2777
+            self.state = 2784
             self.match(CMLParser.STRING)
-            self.state = 2778
+            self.state = 2785
             self.match(CMLParser.WITH)
-            self.state = 2779
+            self.state = 2786
             self.match(CMLParser.T__248)
-            self.state = 2780
+            self.state = 2787
             self.match(CMLParser.T__325)
-            self.state = 2781
+            self.state = 2788
             self.match(CMLParser.T__326)
-            self.state = 2782
+            self.state = 2789
             self.match(CMLParser.T__327)
-            self.state = 2783
+            self.state = 2790
             self.match(CMLParser.T__328)
-            self.state = 2784
+            self.state = 2791
             self.match(CMLParser.T__329)
-            self.state = 2785
+            self.state = 2792
             self.match(CMLParser.T__87)
-            self.state = 2786
+            self.state = 2793
             self.match(CMLParser.T__330)
-            self.state = 2787
+            self.state = 2794
             self.match(CMLParser.STRING)
-            self.state = 2788
+            self.state = 2795
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -19073,65 +19099,65 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 378, self.RULE_valueWeigthing)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2790
+            self.state = 2797
             self.match(CMLParser.T__331)
-            self.state = 2791
+            self.state = 2798
             self.name()
-            self.state = 2792
+            self.state = 2799
             self.match(CMLParser.T__2)
-            self.state = 2793
+            self.state = 2800
             self.match(CMLParser.T__332)
-            self.state = 2794
+            self.state = 2801
             self.match(CMLParser.T__248)
-            self.state = 2795
+            self.state = 2802
             self.match(CMLParser.T__266)
-            self.state = 2796
+            self.state = 2803
             self.match(CMLParser.T__292)
-            self.state = 2797
+            self.state = 2804
             self.match(CMLParser.T__248)
-            self.state = 2798
+            self.state = 2805
             self.match(CMLParser.T__333)
-            self.state = 2799
+            self.state = 2806
             self.match(CMLParser.T__334)
-            self.state = 2800
+            self.state = 2807
             self.name()
-            self.state = 2801
+            self.state = 2808
             self.match(CMLParser.T__335)
-            self.state = 2802
+            self.state = 2809
             self.match(CMLParser.STRING)
-            self.state = 2803
+            self.state = 2810
             self.match(CMLParser.T__336)
-            self.state = 2804
+            self.state = 2811
             self.match(CMLParser.T__337)
-            self.state = 2805
+            self.state = 2812
             self.match(CMLParser.STRING)
-            self.state = 2806
+            self.state = 2813
             self.match(CMLParser.T__338)
-            self.state = 2807
+            self.state = 2814
             self.match(CMLParser.T__339)
-            self.state = 2808
+            self.state = 2815
             self.match(CMLParser.T__340)
-            self.state = 2809
+            self.state = 2816
             self.match(CMLParser.T__310)
-            self.state = 2810
+            self.state = 2817
             self.match(CMLParser.STRING)
-            self.state = 2811
+            self.state = 2818
             self.match(CMLParser.T__341)
-            self.state = 2812
+            self.state = 2819
             self.match(CMLParser.T__248)
-            self.state = 2813
+            self.state = 2820
             self.match(CMLParser.T__267)
-            self.state = 2814
+            self.state = 2821
             self.match(CMLParser.T__292)
-            self.state = 2815
+            self.state = 2822
             self.match(CMLParser.T__342)
-            self.state = 2816
+            self.state = 2823
             self.match(CMLParser.T__340)
-            self.state = 2817
+            self.state = 2824
             self.match(CMLParser.T__310)
-            self.state = 2818
+            self.state = 2825
             self.match(CMLParser.STRING)
-            self.state = 2819
+            self.state = 2826
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -19177,34 +19203,34 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2821
+            self.state = 2828
             _la = self._input.LA(1)
             if _la <= 0 or (((_la) & ~0x3f) == 0 and ((1 << _la) & 35184372088860) != 0) or ((((_la - 64)) & ~0x3f) == 0 and ((1 << (_la - 64)) & 290245299934275) != 0) or ((((_la - 201)) & ~0x3f) == 0 and ((1 << (_la - 201)) & 4504151535910927) != 0) or _la==289 or _la==303:
                 self._errHandler.recoverInline(self)
             else:
                 self._errHandler.reportMatch(self)
                 self.consume()
-            self.state = 2825
+            self.state = 2832
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,395,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,397,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 2822
+                    self.state = 2829
                     _la = self._input.LA(1)
                     if _la <= 0 or _la==3 or _la==4 or _la==106:
                         self._errHandler.recoverInline(self)
                     else:
                         self._errHandler.reportMatch(self)
                         self.consume() 
-                self.state = 2827
+                self.state = 2834
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,395,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,397,self._ctx)
 
-            self.state = 2829
+            self.state = 2836
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2828
+                self.state = 2835
                 self.match(CMLParser.T__105)
 
 
@@ -19285,52 +19311,52 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ServiceCutterElementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 382, self.RULE_serviceCutterElement)
         try:
-            self.state = 2840
+            self.state = 2847
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [74]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2831
+                self.state = 2838
                 self.scAggregate()
                 pass
             elif token in [76]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2832
+                self.state = 2839
                 self.scEntity()
                 pass
             elif token in [276]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2833
+                self.state = 2840
                 self.scSecurityAccessGroup()
                 pass
             elif token in [277]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2834
+                self.state = 2841
                 self.scSeparatedSecurityZone()
                 pass
             elif token in [278]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 2835
+                self.state = 2842
                 self.scSharedOwnerGroup()
                 pass
             elif token in [279]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 2836
+                self.state = 2843
                 self.scPredefinedService()
                 pass
             elif token in [280]:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 2837
+                self.state = 2844
                 self.scCompatibilities()
                 pass
             elif token in [240]:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 2838
+                self.state = 2845
                 self.scUseCase()
                 pass
             elif token in [270, 271, 272, 273, 274, 275]:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 2839
+                self.state = 2846
                 self.scCharacteristic()
                 pass
             else:
@@ -19385,39 +19411,39 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2842
+            self.state = 2849
             self.match(CMLParser.T__73)
-            self.state = 2843
+            self.state = 2850
             self.match(CMLParser.STRING)
-            self.state = 2844
+            self.state = 2851
             self.match(CMLParser.T__2)
-            self.state = 2853
+            self.state = 2860
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 2845
+                self.state = 2852
                 self.match(CMLParser.STRING)
-                self.state = 2850
+                self.state = 2857
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==22:
-                    self.state = 2846
+                    self.state = 2853
                     self.match(CMLParser.T__21)
-                    self.state = 2847
+                    self.state = 2854
                     self.match(CMLParser.STRING)
-                    self.state = 2852
+                    self.state = 2859
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 2855
+            self.state = 2862
             self.match(CMLParser.T__3)
-            self.state = 2857
+            self.state = 2864
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2856
+                self.state = 2863
                 self.match(CMLParser.T__105)
 
 
@@ -19470,39 +19496,39 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2859
+            self.state = 2866
             self.match(CMLParser.T__75)
-            self.state = 2860
+            self.state = 2867
             self.match(CMLParser.STRING)
-            self.state = 2861
+            self.state = 2868
             self.match(CMLParser.T__2)
-            self.state = 2870
+            self.state = 2877
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 2862
+                self.state = 2869
                 self.match(CMLParser.STRING)
-                self.state = 2867
+                self.state = 2874
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==22:
-                    self.state = 2863
+                    self.state = 2870
                     self.match(CMLParser.T__21)
-                    self.state = 2864
+                    self.state = 2871
                     self.match(CMLParser.STRING)
-                    self.state = 2869
+                    self.state = 2876
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 2872
+            self.state = 2879
             self.match(CMLParser.T__3)
-            self.state = 2874
+            self.state = 2881
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2873
+                self.state = 2880
                 self.match(CMLParser.T__105)
 
 
@@ -19555,39 +19581,39 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2876
+            self.state = 2883
             self.match(CMLParser.T__275)
-            self.state = 2877
+            self.state = 2884
             self.match(CMLParser.STRING)
-            self.state = 2878
+            self.state = 2885
             self.match(CMLParser.T__2)
-            self.state = 2887
+            self.state = 2894
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 2879
+                self.state = 2886
                 self.match(CMLParser.STRING)
-                self.state = 2884
+                self.state = 2891
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==22:
-                    self.state = 2880
+                    self.state = 2887
                     self.match(CMLParser.T__21)
-                    self.state = 2881
+                    self.state = 2888
                     self.match(CMLParser.STRING)
-                    self.state = 2886
+                    self.state = 2893
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 2889
+            self.state = 2896
             self.match(CMLParser.T__3)
-            self.state = 2891
+            self.state = 2898
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2890
+                self.state = 2897
                 self.match(CMLParser.T__105)
 
 
@@ -19640,39 +19666,39 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2893
+            self.state = 2900
             self.match(CMLParser.T__276)
-            self.state = 2894
+            self.state = 2901
             self.match(CMLParser.STRING)
-            self.state = 2895
+            self.state = 2902
             self.match(CMLParser.T__2)
-            self.state = 2904
+            self.state = 2911
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 2896
+                self.state = 2903
                 self.match(CMLParser.STRING)
-                self.state = 2901
+                self.state = 2908
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==22:
-                    self.state = 2897
+                    self.state = 2904
                     self.match(CMLParser.T__21)
-                    self.state = 2898
+                    self.state = 2905
                     self.match(CMLParser.STRING)
-                    self.state = 2903
+                    self.state = 2910
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 2906
+            self.state = 2913
             self.match(CMLParser.T__3)
-            self.state = 2908
+            self.state = 2915
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2907
+                self.state = 2914
                 self.match(CMLParser.T__105)
 
 
@@ -19725,39 +19751,39 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2910
+            self.state = 2917
             self.match(CMLParser.T__277)
-            self.state = 2911
+            self.state = 2918
             self.match(CMLParser.STRING)
-            self.state = 2912
+            self.state = 2919
             self.match(CMLParser.T__2)
-            self.state = 2921
+            self.state = 2928
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 2913
+                self.state = 2920
                 self.match(CMLParser.STRING)
-                self.state = 2918
+                self.state = 2925
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==22:
-                    self.state = 2914
+                    self.state = 2921
                     self.match(CMLParser.T__21)
-                    self.state = 2915
+                    self.state = 2922
                     self.match(CMLParser.STRING)
-                    self.state = 2920
+                    self.state = 2927
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 2923
+            self.state = 2930
             self.match(CMLParser.T__3)
-            self.state = 2925
+            self.state = 2932
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2924
+                self.state = 2931
                 self.match(CMLParser.T__105)
 
 
@@ -19810,39 +19836,39 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2927
+            self.state = 2934
             self.match(CMLParser.T__278)
-            self.state = 2928
+            self.state = 2935
             self.match(CMLParser.STRING)
-            self.state = 2929
+            self.state = 2936
             self.match(CMLParser.T__2)
-            self.state = 2938
+            self.state = 2945
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 2930
+                self.state = 2937
                 self.match(CMLParser.STRING)
-                self.state = 2935
+                self.state = 2942
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==22:
-                    self.state = 2931
+                    self.state = 2938
                     self.match(CMLParser.T__21)
-                    self.state = 2932
+                    self.state = 2939
                     self.match(CMLParser.STRING)
-                    self.state = 2937
+                    self.state = 2944
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 2940
+            self.state = 2947
             self.match(CMLParser.T__3)
-            self.state = 2942
+            self.state = 2949
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==106:
-                self.state = 2941
+                self.state = 2948
                 self.match(CMLParser.T__105)
 
 
@@ -19896,21 +19922,21 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2944
+            self.state = 2951
             self.match(CMLParser.T__279)
-            self.state = 2945
+            self.state = 2952
             self.match(CMLParser.T__2)
-            self.state = 2949
+            self.state = 2956
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 270)) & ~0x3f) == 0 and ((1 << (_la - 270)) & 63) != 0):
-                self.state = 2946
+                self.state = 2953
                 self.scCharacteristic()
-                self.state = 2951
+                self.state = 2958
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2952
+            self.state = 2959
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -19966,23 +19992,23 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2954
+            self.state = 2961
             self.match(CMLParser.T__239)
-            self.state = 2955
+            self.state = 2962
             self.name()
-            self.state = 2956
+            self.state = 2963
             self.match(CMLParser.T__2)
-            self.state = 2960
+            self.state = 2967
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while ((((_la - 344)) & ~0x3f) == 0 and ((1 << (_la - 344)) & 13) != 0):
-                self.state = 2957
+                self.state = 2964
                 self.scUseCaseElement()
-                self.state = 2962
+                self.state = 2969
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 2963
+            self.state = 2970
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -20037,22 +20063,22 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ScUseCaseElementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 400, self.RULE_scUseCaseElement)
         try:
-            self.state = 2968
+            self.state = 2975
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [344]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2965
+                self.state = 2972
                 self.scIsLatencyCritical()
                 pass
             elif token in [346]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2966
+                self.state = 2973
                 self.scReads()
                 pass
             elif token in [347]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2967
+                self.state = 2974
                 self.scWrites()
                 pass
             else:
@@ -20101,11 +20127,11 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 402, self.RULE_scIsLatencyCritical)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2970
+            self.state = 2977
             self.match(CMLParser.T__343)
-            self.state = 2971
+            self.state = 2978
             self.match(CMLParser.T__5)
-            self.state = 2972
+            self.state = 2979
             self.match(CMLParser.T__344)
         except RecognitionException as re:
             localctx.exception = re
@@ -20154,13 +20180,13 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2974
+            self.state = 2981
             self.match(CMLParser.T__345)
-            self.state = 2976
+            self.state = 2983
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 2975
+                self.state = 2982
                 self.scUseCaseNanoentities()
 
 
@@ -20211,13 +20237,13 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2978
+            self.state = 2985
             self.match(CMLParser.T__346)
-            self.state = 2980
+            self.state = 2987
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 2979
+                self.state = 2986
                 self.scUseCaseNanoentities()
 
 
@@ -20270,23 +20296,23 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 2982
-            self.match(CMLParser.STRING)
             self.state = 2989
+            self.match(CMLParser.STRING)
+            self.state = 2996
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==22 or _la==355:
-                self.state = 2984
+                self.state = 2991
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 if _la==22:
-                    self.state = 2983
+                    self.state = 2990
                     self.match(CMLParser.T__21)
 
 
-                self.state = 2986
+                self.state = 2993
                 self.match(CMLParser.STRING)
-                self.state = 2991
+                self.state = 2998
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -20355,37 +20381,37 @@ class CMLParser ( Parser ):
         localctx = CMLParser.ScCharacteristicContext(self, self._ctx, self.state)
         self.enterRule(localctx, 410, self.RULE_scCharacteristic)
         try:
-            self.state = 2998
+            self.state = 3005
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [270]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 2992
+                self.state = 2999
                 self.scAvailabilityCriticality()
                 pass
             elif token in [271]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 2993
+                self.state = 3000
                 self.scConsistencyCriticality()
                 pass
             elif token in [272]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 2994
+                self.state = 3001
                 self.scContentVolatility()
                 pass
             elif token in [273]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 2995
+                self.state = 3002
                 self.scSecurityCriticality()
                 pass
             elif token in [274]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 2996
+                self.state = 3003
                 self.scStorageSimilarity()
                 pass
             elif token in [275]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 2997
+                self.state = 3004
                 self.scStructuralVolatility()
                 pass
             else:
@@ -20442,23 +20468,23 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3000
+            self.state = 3007
             self.match(CMLParser.T__269)
-            self.state = 3001
+            self.state = 3008
             self.match(CMLParser.T__2)
-            self.state = 3002
+            self.state = 3009
             self.match(CMLParser.T__265)
-            self.state = 3003
+            self.state = 3010
             self.name()
-            self.state = 3005
+            self.state = 3012
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 3004
+                self.state = 3011
                 self.scNanoentities()
 
 
-            self.state = 3007
+            self.state = 3014
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -20511,23 +20537,23 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3009
+            self.state = 3016
             self.match(CMLParser.T__270)
-            self.state = 3010
+            self.state = 3017
             self.match(CMLParser.T__2)
-            self.state = 3011
+            self.state = 3018
             self.match(CMLParser.T__265)
-            self.state = 3012
+            self.state = 3019
             self.name()
-            self.state = 3014
+            self.state = 3021
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 3013
+                self.state = 3020
                 self.scNanoentities()
 
 
-            self.state = 3016
+            self.state = 3023
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -20580,23 +20606,23 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3018
+            self.state = 3025
             self.match(CMLParser.T__271)
-            self.state = 3019
+            self.state = 3026
             self.match(CMLParser.T__2)
-            self.state = 3020
+            self.state = 3027
             self.match(CMLParser.T__265)
-            self.state = 3021
+            self.state = 3028
             self.name()
-            self.state = 3023
+            self.state = 3030
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 3022
+                self.state = 3029
                 self.scNanoentities()
 
 
-            self.state = 3025
+            self.state = 3032
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -20649,23 +20675,23 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3027
+            self.state = 3034
             self.match(CMLParser.T__272)
-            self.state = 3028
+            self.state = 3035
             self.match(CMLParser.T__2)
-            self.state = 3029
+            self.state = 3036
             self.match(CMLParser.T__265)
-            self.state = 3030
+            self.state = 3037
             self.name()
-            self.state = 3032
+            self.state = 3039
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 3031
+                self.state = 3038
                 self.scNanoentities()
 
 
-            self.state = 3034
+            self.state = 3041
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -20718,23 +20744,23 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3036
+            self.state = 3043
             self.match(CMLParser.T__273)
-            self.state = 3037
+            self.state = 3044
             self.match(CMLParser.T__2)
-            self.state = 3038
+            self.state = 3045
             self.match(CMLParser.T__265)
-            self.state = 3039
+            self.state = 3046
             self.name()
-            self.state = 3041
+            self.state = 3048
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 3040
+                self.state = 3047
                 self.scNanoentities()
 
 
-            self.state = 3043
+            self.state = 3050
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -20787,23 +20813,23 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3045
+            self.state = 3052
             self.match(CMLParser.T__274)
-            self.state = 3046
+            self.state = 3053
             self.match(CMLParser.T__2)
-            self.state = 3047
+            self.state = 3054
             self.match(CMLParser.T__265)
-            self.state = 3048
+            self.state = 3055
             self.name()
-            self.state = 3050
+            self.state = 3057
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==355:
-                self.state = 3049
+                self.state = 3056
                 self.scNanoentities()
 
 
-            self.state = 3052
+            self.state = 3059
             self.match(CMLParser.T__3)
         except RecognitionException as re:
             localctx.exception = re
@@ -20854,17 +20880,17 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3054
+            self.state = 3061
             self.match(CMLParser.STRING)
-            self.state = 3059
+            self.state = 3066
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==22:
-                self.state = 3055
+                self.state = 3062
                 self.match(CMLParser.T__21)
-                self.state = 3056
+                self.state = 3063
                 self.match(CMLParser.STRING)
-                self.state = 3061
+                self.state = 3068
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -20917,20 +20943,20 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 426, self.RULE_idList)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3062
+            self.state = 3069
             self.name()
-            self.state = 3067
+            self.state = 3074
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,431,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,433,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 3063
+                    self.state = 3070
                     self.match(CMLParser.T__21)
-                    self.state = 3064
+                    self.state = 3071
                     self.name() 
-                self.state = 3069
+                self.state = 3076
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,431,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,433,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -20981,20 +21007,20 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 428, self.RULE_qualifiedNameList)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3070
+            self.state = 3077
             self.qualifiedName()
-            self.state = 3075
+            self.state = 3082
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,432,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,434,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 3071
+                    self.state = 3078
                     self.match(CMLParser.T__21)
-                    self.state = 3072
+                    self.state = 3079
                     self.qualifiedName() 
-                self.state = 3077
+                self.state = 3084
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,432,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,434,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -21045,20 +21071,20 @@ class CMLParser ( Parser ):
         self.enterRule(localctx, 430, self.RULE_qualifiedName)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3078
+            self.state = 3085
             self.name()
-            self.state = 3083
+            self.state = 3090
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,433,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,435,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 3079
+                    self.state = 3086
                     self.match(CMLParser.T__347)
-                    self.state = 3080
+                    self.state = 3087
                     self.name() 
-                self.state = 3085
+                self.state = 3092
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,433,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,435,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -21110,25 +21136,25 @@ class CMLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 3086
+            self.state = 3093
             self.name()
-            self.state = 3091
+            self.state = 3098
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,434,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,436,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 3087
+                    self.state = 3094
                     _la = self._input.LA(1)
                     if not(_la==14 or _la==348 or _la==349):
                         self._errHandler.recoverInline(self)
                     else:
                         self._errHandler.reportMatch(self)
                         self.consume()
-                    self.state = 3088
+                    self.state = 3095
                     self.name() 
-                self.state = 3093
+                self.state = 3100
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,434,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,436,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -0,0 +1,604 @@
+"""
+Multi-threaded and multi-process parse throughput.
+
+benchmark_threads() parses a corpus with parse_file_safe() from thread pools
+of increasing size and reports files per second and the speedup over the
+first pool. With the GIL the speedup stays near 1.0; on a free-threaded
+CPython build (3.13t, 3.14t) parses run truly in parallel. The DFAs are
+warmed by one serial pass first, so the timed runs measure steady-state
+parsing rather than DFA construction.
+
+benchmark_split() times parse_file_parallel() on one large file with pools of
+increasing size, against a serial parse_file() as the 1-worker baseline.
+Both report the speedup per core used, min(pool size, CPUs).
+
+benchmark_walker() times the model builder alone on parse trees built once:
+CMLModelBuilder's dispatch table and explicit-stack walk against the
+recursive accept()/visitChildren() dispatch of the generated visitor, in
+parse tree nodes visited per second, with and without the builder's hooks.
+
+benchmark_grammar() times whole parses in each prediction mode, once with
+empty DFAs and then warm, to compare grammar changes; with parse_only it
+times the generated parser alone. It only relies on parse_text() and the
+generated recognizers, so this module can be copied into an older checkout
+to time it against the current one. context_map_text() generates a large
+context map for it, since the examples have few relationships.
+
+The module is also the command line entry point for these benchmarks:
+
+    python -m cml_parser.benchmark threads FILE... [--threads 1,2,4,8]
+    python -m cml_parser.benchmark split FILE [--threads 1,2,4,8]
+    python -m cml_parser.benchmark walker FILE...
+    python -m cml_parser.benchmark grammar FILE... [--modes auto,sll,ll] [--relationships N] [--parse-only]
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Iterable, List, Sequence
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import sysconfig
+import time
+
+
+@dataclass
+class ThreadRun:
+    """Timing of one pool size: every file parsed `rounds` times."""
+    threads: int
+    seconds: float
+    parses: int
+    speedup: float = 1.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.parses / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class ThreadScaling:
+    """Result of benchmark_threads()."""
+    files: List[str] = field(default_factory=list)
+    rounds: int = 1
+    python: str = ""
+    free_threaded: bool = False
+    gil_enabled: bool = True
+    cpus: int = 1
+    runs: List[ThreadRun] = field(default_factory=list)
+    # What the pool sizes count: "threads", or "workers" for benchmark_split().
+    unit: str = "threads"
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        for run, entry in zip(self.runs, data["runs"]):
+            entry["files_per_second"] = run.files_per_second
+            entry["speedup_per_core"] = self.speedup_per_core(run)
+        return data
+
+    def speedup_per_core(self, run: ThreadRun) -> float:
+        """run.speedup divided by the cores the run could use: 1.0 is linear scaling."""
+        return run.speedup / min(run.threads, self.cpus)
+
+    def format_table(self) -> str:
+        build = "free-threaded" if self.free_threaded else "default build"
+        gil = "GIL enabled" if self.gil_enabled else "GIL disabled"
+        lines = [
+            f"Python {self.python} ({build}, {gil}), {self.cpus} CPU(s), "
+            f"{len(self.files)} file(s) x {self.rounds} round(s)",
+        ]
+        header = f"{self.unit:>7} {'seconds':>9} {'files/s':>9} {'speedup':>8} {'per core':>8}"
+        lines += [header, "-" * len(header)]
+        for run in self.runs:
+            lines.append(
+                f"{run.threads:>7} {run.seconds:>9.3f} {run.files_per_second:>9.1f} {run.speedup:>8.2f}"
+                f" {self.speedup_per_core(run):>8.2f}"
+            )
+        return "\n".join(lines)
+
+
+@dataclass
+class WalkRun:
+    """Timing of one visitor: every tree built `rounds` times."""
+    visitor: str
+    # False when the tree is only traversed, without the builder's hooks.
+    hooks: bool
+    seconds: float
+    nodes: int
+    speedup: float = 1.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class WalkerComparison:
+    """
+    Result of benchmark_walker(). Nodes per second count every node of the
+    trees once per walk; speedups are relative to the recursive visitor with
+    the same hooks.
+    """
+    files: List[str] = field(default_factory=list)
+    rounds: int = 1
+    python: str = ""
+    # Parse tree nodes in all the files, rule contexts and tokens.
+    nodes: int = 0
+    runs: List[WalkRun] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        for run, entry in zip(self.runs, data["runs"]):
+            entry["nodes_per_second"] = run.nodes_per_second
+        return data
+
+    def format_table(self) -> str:
+        lines = [
+            f"Python {self.python}, {len(self.files)} file(s) x {self.rounds} round(s), "
+            f"{self.nodes} parse tree nodes",
+        ]
+        header = f"{'visitor':>9} {'hooks':>5} {'seconds':>9} {'nodes/s':>11} {'speedup':>8}"
+        lines += [header, "-" * len(header)]
+        for run in self.runs:
+            hooks = "yes" if run.hooks else "no"
+            lines.append(
+                f"{run.visitor:>9} {hooks:>5} {run.seconds:>9.3f} {run.nodes_per_second:>11.0f} {run.speedup:>8.2f}"
+            )
+        return "\n".join(lines)
+
+
+@dataclass
+class PredictionRun:
+    """Timing of one prediction mode: one pass over the files with empty DFAs, then `rounds` warm passes."""
+    mode: str
+    cold_seconds: float
+    # The fastest of the warm passes.
+    warm_seconds: float
+    # Parser DFA states after the cold pass.
+    dfa_states: int
+
+
+@dataclass
+class GrammarTiming:
+    """Result of benchmark_grammar()."""
+    files: List[str] = field(default_factory=list)
+    rounds: int = 1
+    python: str = ""
+    runs: List[PredictionRun] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def format_table(self) -> str:
+        lines = [f"Python {self.python}, {len(self.files)} file(s), best of {self.rounds} warm round(s)"]
+        header = f"{'mode':>5} {'cold ms':>10} {'warm ms':>10} {'DFA states':>11}"
+        lines += [header, "-" * len(header)]
+        for run in self.runs:
+            lines.append(
+                f"{run.mode:>5} {run.cold_seconds * 1000:>10.0f} {run.warm_seconds * 1000:>10.0f} {run.dfa_states:>11}"
+            )
+        return "\n".join(lines)
+
+
+def gil_enabled() -> bool:
+    """False only on a free-threaded build running without the GIL."""
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_enabled is None else is_enabled()
+
+
+def benchmark_threads(
+    paths: Iterable,
+    thread_counts: Sequence[int] = (1, 2, 4, 8),
+    *,
+    rounds: int = 3,
+    lexer: str = "fast",
+    prediction_mode: str = "auto"
+) -> ThreadScaling:
+    """
+    Parse every file `rounds` times with each pool size in thread_counts and
+    return the wall-clock timings. Speedups are relative to the first pool size.
+    """
+    from .parser import parse_file_safe
+
+    files = [str(path) for path in paths]
+    if not files:
+        raise ValueError("benchmark_threads() needs at least one file")
+    if rounds < 1 or any(n < 1 for n in thread_counts):
+        raise ValueError("rounds and thread counts must be positive integers")
+
+    def parse(path):
+        parse_file_safe(path, lexer=lexer, prediction_mode=prediction_mode)
+
+    for path in files:
+        parse(path)
+
+    result = _scaling(files, rounds)
+    jobs = files * rounds
+    for threads in thread_counts:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            start = time.perf_counter()
+            for _ in pool.map(parse, jobs):
+                pass
+            seconds = time.perf_counter() - start
+        result.runs.append(ThreadRun(threads=threads, seconds=seconds, parses=len(jobs)))
+
+    _set_speedups(result)
+    return result
+
+
+def benchmark_split(
+    path,
+    worker_counts: Sequence[int] = (1, 2, 4, 8),
+    *,
+    rounds: int = 3,
+    backend: str = "auto",
+    lexer: str = "fast",
+    prediction_mode: str = "auto"
+) -> ThreadScaling:
+    """
+    Parse one file `rounds` times with parse_file_parallel() for each pool
+    size in worker_counts, or with parse_file() for a size of 1, and return
+    the wall-clock timings. Each pool is started and warmed by one parse
+    before timing, as a long-running service would keep it.
+    """
+    from .parallel import _executor, parse_file_parallel
+    from .parser import parse_file
+
+    if rounds < 1 or any(n < 1 for n in worker_counts):
+        raise ValueError("rounds and worker counts must be positive integers")
+    path = str(path)
+    parse_file(path, lexer=lexer, prediction_mode=prediction_mode)
+
+    result = _scaling([path], rounds)
+    result.unit = "workers"
+    for workers in worker_counts:
+        if workers == 1:
+            parse = lambda: parse_file(path, lexer=lexer, prediction_mode=prediction_mode)
+            seconds = _time_rounds(parse, rounds)
+        else:
+            with _executor(backend, workers, None) as pool:
+                parse = lambda: parse_file_parallel(
+                    path, max_workers=workers, executor=pool, lexer=lexer, prediction_mode=prediction_mode
+                )
+                parse()
+                seconds = _time_rounds(parse, rounds)
+        result.runs.append(ThreadRun(threads=workers, seconds=seconds, parses=rounds))
+
+    _set_speedups(result)
+    return result
+
+
+def benchmark_walker(
+    paths: Iterable,
+    *,
+    rounds: int = 3,
+    lexer: str = "fast",
+    prediction_mode: str = "auto"
+) -> WalkerComparison:
+    """
+    Parse every file once, then walk each tree `rounds` times with the
+    recursive visitor and with CMLModelBuilder's dispatch table, both with
+    the builder's hooks (linking left out) and without hooks, which times the
+    traversal alone. The visitors take turns in each round, after one warm-up
+    round.
+    """
+    from .antlr.CMLVisitor import CMLVisitor
+    from .cml_model_builder import CMLModelBuilder, _dispatch_table
+    from pathlib import Path
+
+    from .parser import _parse_tree
+
+    files = [str(path) for path in paths]
+    if not files:
+        raise ValueError("benchmark_walker() needs at least one file")
+    if rounds < 1:
+        raise ValueError("rounds must be a positive integer")
+    trees = []
+    for path in files:
+        tree = _parse_tree(Path(path).read_text(encoding="utf-8"), path, prediction_mode, lexer)
+        if tree is None:
+            raise ValueError(f"{path} has syntax errors")
+        trees.append((path, tree))
+
+    recursive = _recursive_builder()
+    hookless = _dispatch_table(CMLVisitor)
+
+    def walk_only(path):
+        builder = CMLModelBuilder(path)
+        builder._hooks = hookless
+        return builder
+
+    visitors = [
+        ("recursive", True, recursive),
+        ("dispatch", True, CMLModelBuilder),
+        ("recursive", False, lambda path: CMLVisitor()),
+        ("dispatch", False, walk_only),
+    ]
+    seconds = [0.0] * len(visitors)
+    for round_ in range(rounds + 1):
+        for i, (_, _, make) in enumerate(visitors):
+            gc.collect()
+            start = time.perf_counter()
+            for path, tree in trees:
+                make(path).visitChildren(tree)
+            if round_:
+                seconds[i] += time.perf_counter() - start
+
+    result = WalkerComparison(
+        files=files, rounds=rounds, python=platform.python_version(), nodes=sum(_count_nodes(t) for _, t in trees)
+    )
+    for (name, hooks, _), time_taken in zip(visitors, seconds):
+        result.runs.append(WalkRun(visitor=name, hooks=hooks, seconds=time_taken, nodes=result.nodes * rounds))
+    for base, run in zip(result.runs[::2], result.runs[1::2]):
+        run.speedup = run.nodes_per_second / base.nodes_per_second if base.nodes_per_second else 0.0
+    return result
+
+
+def context_map_text(relationships: int) -> str:
+    """
+    A context map with the given number of relationships, cycling through
+    the relationship forms: roles on either side of the arrow, roles on the
+    next line, names and attribute blocks.
+    """
+    forms = (
+        "C{0} [P]<->[P] C{1}",
+        "C{0} [U,OHS]->[D,ACL] C{1} : Rel{0}",
+        "[D] C{0} <- C{1}",
+        "C{0} -> C{1}\n  [ACL] C{1} <- [OHS] C{0}",
+        'C{0} Shared-Kernel C{1} {{ implementationTechnology = "REST" }}',
+    )
+    lines = []
+    for i in range(relationships):
+        lines.extend(forms[i % len(forms)].format(i, i + 1).split("\n  "))
+    return "ContextMap Generated {\n" + "".join(f"  {line}\n" for line in lines[:relationships]) + "}\n"
+
+
+def benchmark_grammar(
+    paths: Iterable,
+    modes: Sequence[str] = ("auto", "sll", "ll"),
+    *,
+    rounds: int = 3,
+    relationships: int = 0,
+    parse_only: bool = False
+) -> GrammarTiming:
+    """
+    For each prediction mode, clear the DFAs, parse every file once (cold),
+    then parse them `rounds` more times and keep the fastest pass (warm).
+    Files are parsed with parse_text(strict=False), so syntax errors are
+    timed with the recovery they trigger. With relationships > 0 a
+    context_map_text() of that size is parsed along with the files.
+    parse_only runs the generated lexer and parser without the model
+    builder, falling back from SLL to LL like the "auto" mode does.
+    """
+    from pathlib import Path
+
+    from .parser import parse_text
+
+    files = [str(path) for path in paths]
+    if not files and relationships < 1:
+        raise ValueError("benchmark_grammar() needs at least one file")
+    if rounds < 1:
+        raise ValueError("rounds must be a positive integer")
+    texts = [Path(path).read_text(encoding="utf-8") for path in files]
+    if relationships > 0:
+        files.append(f"<context map with {relationships} relationships>")
+        texts.append(context_map_text(relationships))
+
+    def parse_all(mode):
+        gc.collect()
+        start = time.perf_counter()
+        for text in texts:
+            if parse_only:
+                _parse_definitions(text, mode)
+            else:
+                parse_text(text, strict=False, prediction_mode=mode)
+        return time.perf_counter() - start
+
+    # Load the generated recognizers, so the first cold pass does not time it.
+    parse_text("", strict=False)
+    from .antlr.CMLParser import CMLParser
+
+    result = GrammarTiming(files=files, rounds=rounds, python=platform.python_version())
+    for mode in modes:
+        _clear_dfas()
+        cold = parse_all(mode)
+        states = sum(len(dfa.states) for dfa in CMLParser.decisionsToDFA)
+        warm = min(parse_all(mode) for _ in range(rounds))
+        result.runs.append(PredictionRun(mode=mode, cold_seconds=cold, warm_seconds=warm, dfa_states=states))
+    return result
+
+
+def _clear_dfas() -> None:
+    """Like dfa_cache.clear_parser_caches(), which older checkouts do not have."""
+    from antlr4.dfa.DFA import DFA
+
+    from .antlr.CMLLexer import CMLLexer
+    from .antlr.CMLParser import CMLParser
+
+    for recognizer in (CMLLexer, CMLParser):
+        for i, state in enumerate(recognizer.atn.decisionToState):
+            recognizer.decisionsToDFA[i] = DFA(state, i)
+    CMLParser.sharedContextCache.cache.clear()
+
+
+def _parse_definitions(text: str, mode: str):
+    """Parse text with the generated recognizers alone; no error reporting, no model."""
+    from antlr4 import CommonTokenStream, InputStream
+    from antlr4.atn.PredictionMode import PredictionMode
+    from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+    from antlr4.error.Errors import ParseCancellationException
+
+    from .antlr.CMLLexer import CMLLexer
+    from .antlr.CMLParser import CMLParser
+
+    lexer = CMLLexer(InputStream(text))
+    lexer.removeErrorListeners()
+    parser = CMLParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    if mode == "auto":
+        parser._interp.predictionMode = PredictionMode.SLL
+        parser._errHandler = BailErrorStrategy()
+        try:
+            return parser.definitions()
+        except ParseCancellationException:
+            parser.reset()
+            parser._errHandler = DefaultErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL if mode == "sll" else PredictionMode.LL
+    return parser.definitions()
+
+
+def _recursive_builder() -> type:
+    """CMLModelBuilder dispatching through accept() and the recursive ParseTreeVisitor.visitChildren()."""
+    from antlr4.tree.Tree import ParseTreeVisitor
+    from .cml_model_builder import CMLModelBuilder
+
+    class RecursiveBuilder(CMLModelBuilder):
+        def visit(self, tree):
+            if self.cancellation is not None:
+                self.cancellation.check()
+            return tree.accept(self)
+
+        def visitChildren(self, node):
+            if self.cancellation is not None:
+                self.cancellation.check()
+            return ParseTreeVisitor.visitChildren(self, node)
+
+    return RecursiveBuilder
+
+
+def _count_nodes(tree) -> int:
+    count = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(getattr(node, "children", None) or ())
+    return count
+
+
+def _scaling(files: List[str], rounds: int) -> ThreadScaling:
+    return ThreadScaling(
+        files=files,
+        rounds=rounds,
+        python=platform.python_version(),
+        free_threaded=bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+        gil_enabled=gil_enabled(),
+        cpus=os.cpu_count() or 1,
+    )
+
+
+def _time_rounds(parse, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parse()
+    return time.perf_counter() - start
+
+
+def _set_speedups(result: ThreadScaling) -> None:
+    base = result.runs[0].files_per_second
+    for run in result.runs:
+        run.speedup = run.files_per_second / base if base else 0.0
+
+
+def main(argv=None) -> int:
+    """Command line entry point: python -m cml_parser.benchmark MODE ..."""
+    args = sys.argv[1:] if argv is None else argv
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json", action="store_true", help="Emit the result as JSON")
+    common.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Parse each file, or walk each tree, N times per run (default: 3)",
+    )
+    pools = argparse.ArgumentParser(add_help=False)
+    pools.add_argument(
+        "--threads",
+        default="1,2,4,8",
+        metavar="N,N,...",
+        help="Pool sizes to time (default: 1,2,4,8)",
+    )
+
+    parser = argparse.ArgumentParser(prog="python -m cml_parser.benchmark", add_help=True)
+    modes = parser.add_subparsers(dest="mode", required=True)
+    threads = modes.add_parser(
+        "threads", parents=[common, pools], help="Measure parse throughput of FILE(s) with thread pools of increasing size"
+    )
+    threads.add_argument("files", nargs="+", metavar="FILE")
+    split = modes.add_parser(
+        "split", parents=[common, pools], help="Measure parse_file_parallel() on FILE with worker pools of increasing size"
+    )
+    split.add_argument("file", metavar="FILE")
+    walker = modes.add_parser(
+        "walker",
+        parents=[common],
+        help="Compare parse tree nodes visited per second by the model builder and the recursive visitor",
+    )
+    walker.add_argument("files", nargs="+", metavar="FILE")
+    grammar = modes.add_parser(
+        "grammar", parents=[common], help="Time parses of FILE(s) in each prediction mode, with cold and warm DFAs"
+    )
+    grammar.add_argument("files", nargs="*", metavar="FILE")
+    grammar.add_argument(
+        "--modes",
+        default="auto,sll,ll",
+        metavar="MODE,...",
+        help="Prediction modes to time (default: auto,sll,ll)",
+    )
+    grammar.add_argument(
+        "--relationships",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Also parse a generated context map with N relationships",
+    )
+    grammar.add_argument(
+        "--parse-only", action="store_true", help="Time the generated parser alone, without building the model"
+    )
+    parsed = parser.parse_args(args)
+
+    if parsed.rounds < 1:
+        parser.error("--rounds must be a positive integer")
+    thread_counts = []
+    if parsed.mode in ("threads", "split"):
+        try:
+            thread_counts = [int(n) for n in parsed.threads.split(",")]
+        except ValueError:
+            parser.error("--threads must be a comma-separated list of integers")
+        if any(n < 1 for n in thread_counts):
+            parser.error("--threads must be positive integers")
+    if parsed.mode == "grammar" and any(m not in ("auto", "sll", "ll") for m in parsed.modes.split(",")):
+        parser.error("--modes must be a comma-separated list of auto, sll and ll")
+    if parsed.mode == "grammar" and not parsed.files and parsed.relationships < 1:
+        parser.error("grammar needs a FILE or a positive --relationships")
+
+    try:
+        if parsed.mode == "threads":
+            result = benchmark_threads(parsed.files, thread_counts, rounds=parsed.rounds)
+        elif parsed.mode == "split":
+            result = benchmark_split(parsed.file, thread_counts, rounds=parsed.rounds)
+        elif parsed.mode == "grammar":
+            result = benchmark_grammar(
+                parsed.files,
+                parsed.modes.split(","),
+                rounds=parsed.rounds,
+                relationships=parsed.relationships,
+                parse_only=parsed.parse_only,
+            )
+        else:
+            result = benchmark_walker(parsed.files, rounds=parsed.rounds)
+    except OSError as e:
+        print(f"Error reading {e.filename}: {e.strerror}", file=sys.stderr)
+        return 1
+
+    if parsed.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print(result.format_table())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Cooperative cancellation and deadlines for parsing.
+
+The parser, the lexer feeding it and the model builder call
+CancellationToken.check() as they go, so a parse can be stopped from another
+thread or when its deadline passes. No signals are involved, which keeps this
+usable in thread-pool workers.
+"""
+from typing import List, Optional
+import time
+
+from .cml_objects import Diagnostic
+
+
+class CmlParseCancelled(Exception):
+    """
+    Raised when a parse is cancelled through its CancellationToken.
+
+    diagnostics holds the syntax errors reported before the parse stopped.
+    """
+
+    def __init__(self, message: str, diagnostics: Optional[List[Diagnostic]] = None):
+        super().__init__(message)
+        self.diagnostics: List[Diagnostic] = list(diagnostics or [])
+
+
+class CmlParseTimeout(CmlParseCancelled):
+    """Raised when a parse runs past its deadline."""
+
+
+class CancellationToken:
+    """
+    Cancellation flag for one or more parses, with an optional deadline.
+
+    timeout is in seconds from the creation of the token. cancel() may be
+    called from any thread; the running parse raises CmlParseCancelled (or
+    CmlParseTimeout once the deadline has passed) at its next check.
+    A token created with a parent is also cancelled when the parent is.
+    """
+
+    def __init__(self, timeout: Optional[float] = None, *, parent: Optional["CancellationToken"] = None):
+        if timeout is not None and timeout < 0:
+            raise ValueError(f"timeout must be a non-negative number of seconds or None, got {timeout!r}")
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout if timeout is not None else None
+        self.parent = parent
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() was called (here or on a parent) or the deadline passed."""
+        return self._cancelled or self.timed_out or (self.parent is not None and self.parent.cancelled)
+
+    @property
+    def timed_out(self) -> bool:
+        if self.expires_at is not None and time.monotonic() >= self.expires_at:
+            return True
+        return self.parent is not None and self.parent.timed_out
+
+    def check(self) -> None:
+        """Raise CmlParseTimeout or CmlParseCancelled if the parse must stop."""
+        token = self
+        while token is not None:
+            if token.expires_at is not None and time.monotonic() >= token.expires_at:
+                raise CmlParseTimeout(f"Parsing exceeded its deadline of {token.timeout:g} s")
+            if token._cancelled:
+                raise CmlParseCancelled("Parsing was cancelled")
+            token = token.parent
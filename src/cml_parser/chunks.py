@@ -0,0 +1,226 @@
+"""
+Splitting one CML document into top-level chunks, and merging their models.
+
+split_definitions() finds the ends of top-level blocks with a brace-matching
+scan that skips strings and comments, and groups the blocks into contiguous
+chunks of similar size. Every chunk is a `definitions` input of its own, so
+parse_file_parallel() parses and builds them in separate workers, with
+builders that stop before linking. merge_chunk() then folds each chunk's
+state (see dump_chunk()) into one builder, in document order, and
+CMLModelBuilder.finish() links the result once.
+
+A chunk built on its own differs from the same text built after the chunks
+before it wherever the builder looks names up as it goes: bounded contexts
+referenced or defined in several chunks, use cases and user stories named by
+aggregates, and traits. merge_chunk() replays those lookups. Chunks are
+pickled with every context reference replaced by the context's name, and
+unpickled with names resolving to the contexts merged so far, so a context
+known from an earlier chunk is shared without walking the model (it takes
+over the chunk's contents if only this chunk defines it). References to use
+cases and user stories are resolved again against the earlier chunks. Where
+that cannot reproduce the serial model (a context built in two chunks,
+traits used after the chunk that defines them, ServiceCutter compatibilities
+declared twice) it raises ChunkMergeError and the caller parses the
+document serially.
+"""
+from bisect import bisect_left
+from dataclasses import fields
+from typing import Dict, List, NamedTuple
+import io
+import pickle
+import re
+
+from .cml_objects import CML, Context, UseCase
+
+_SCAN_RE = re.compile(
+    r"\"(?:\\.|[^\\\"])*\"|'(?:\\.|[^\\'])*'|//[^\r\n]*|/\*.*?\*/"
+    r"|(?P<brace>[{}])|(?P<with>\bwith\b)",
+    re.DOTALL,
+)
+
+# Builder attributes that make up the state of a chunk, besides its contexts.
+STATE = (
+    "cml",
+    "context_map_obj_map",
+    "subdomain_map",
+    "domain_map",
+    "imports",
+    "deferred_context_map_links",
+    "deferred_context_links",
+    "deferred_subdomain_supports",
+    "trait_map",
+    "requirement_references",
+    "service_cutter",
+)
+
+
+class Chunk(NamedTuple):
+    """A run of top-level definitions: text[start:end]."""
+    start: int
+    end: int
+    # The chunk contains `with`, so it may use traits defined before it.
+    uses_traits: bool
+
+
+class ChunkMergeError(Exception):
+    """The chunks cannot be merged into the model a serial parse builds."""
+
+
+def split_definitions(text: str, parts: int) -> List[Chunk]:
+    """
+    Split text after top-level closing braces into at most `parts` chunks of
+    similar length. Text that never returns to brace depth 0 stays in one chunk.
+    """
+    ends = []
+    withs = []
+    depth = 0
+    for match in _SCAN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == "brace":
+            if match.group() == "{":
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 0:
+                ends.append(match.end())
+            elif depth < 0:
+                break
+        elif kind == "with":
+            withs.append(match.start())
+
+    size = len(text) / max(parts, 1)
+    bounds = [0]
+    # Never cut after the last block, which would leave only trailing comments.
+    for end in ends[:-1]:
+        if end - bounds[-1] >= size:
+            bounds.append(end)
+    bounds.append(len(text))
+    return [
+        Chunk(start, end, bisect_left(withs, end) > bisect_left(withs, start))
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def dump_chunk(builder) -> tuple:
+    """
+    The state of an unlinked chunk builder, for merge_chunk(): a header of
+    (name, blank) for each bounded context and the pickled state, in which
+    every reference to a context is pickled as its name.
+    """
+    contexts = builder.cml.contexts
+    state = {name: getattr(builder, name) for name in STATE}
+    state["context_states"] = [vars(context) for context in contexts]
+    buffer = io.BytesIO()
+    _ChunkPickler(buffer, pickle.HIGHEST_PROTOCOL).dump(state)
+    return [(context.name, _is_blank(context)) for context in contexts], buffer.getvalue()
+
+
+def merge_chunk(builder, chunk: tuple, uses_traits: bool) -> None:
+    """
+    Add a chunk from dump_chunk() to builder, as if its text had been visited
+    by builder after everything merged so far.
+    """
+    if uses_traits and builder.trait_map:
+        raise ChunkMergeError("traits may be used after the chunk that defines them")
+    header, data = chunk
+    contexts = builder.context_map_obj_map
+    resolved: Dict[str, Context] = {}
+    new_contexts = []
+    for name, blank in header:
+        known = contexts.get(name)
+        if known is None:
+            known = Context.__new__(Context)
+            new_contexts.append(known)
+        elif not blank and not _is_blank(known):
+            raise ChunkMergeError(f"bounded context {name} is built in several chunks")
+        resolved[name] = known
+
+    # References to contexts resolve to the objects merged before, as they
+    # would while building serially.
+    unpickler = _ChunkUnpickler(io.BytesIO(data))
+    unpickler.contexts = resolved
+    state = unpickler.load()
+    cml: CML = state["cml"]
+    target = builder.cml
+
+    # Aggregates name use cases and user stories by the first match so far,
+    # which in a serial parse may be one from an earlier chunk.
+    dropped = set()  # ids of placeholders the serial parse would not have created
+    unresolved = []
+    for aggregate, index, keyword, created in state["requirement_references"]:
+        requirement = aggregate.user_requirements[index]
+        found = _find_requirement(target, requirement, keyword, created)
+        if found is None:
+            unresolved.append(requirement)
+            continue
+        aggregate.user_requirements[index] = found
+        if created:
+            dropped.add(id(requirement))
+    if any(id(requirement) in dropped for requirement in unresolved):
+        raise ChunkMergeError("a use case or user story is named with different keywords across chunks")
+
+    sc, chunk_sc = builder.service_cutter, state["service_cutter"]
+    if chunk_sc.compatibilities is not None and sc.compatibilities is not None:
+        raise ChunkMergeError("ServiceCutter compatibilities are declared in several chunks")
+
+    # New contexts take their state; a context only referenced before takes
+    # the state this chunk defines it with; a blank one here keeps its own.
+    for (name, blank), context_state in zip(header, state["context_states"]):
+        context = resolved[name]
+        if not blank or name not in contexts:
+            vars(context).update(context_state)
+    target.contexts.extend(new_contexts)
+    for context in new_contexts:
+        contexts[context.name] = context
+
+    for f in fields(CML):
+        value = getattr(cml, f.name)
+        if f.name != "contexts" and isinstance(value, list):
+            getattr(target, f.name).extend(item for item in value if id(item) not in dropped)
+    builder.subdomain_map.update(state["subdomain_map"])
+    builder.domain_map.update(state["domain_map"])
+    builder.trait_map.update(state["trait_map"])
+    builder.imports.extend(state["imports"])
+    builder.deferred_context_map_links.extend(state["deferred_context_map_links"])
+    builder.deferred_context_links.extend(state["deferred_context_links"])
+    builder.deferred_subdomain_supports.extend(state["deferred_subdomain_supports"])
+
+    for f in fields(chunk_sc):
+        value = getattr(chunk_sc, f.name)
+        if isinstance(value, list):
+            getattr(sc, f.name).extend(value)
+    if chunk_sc.compatibilities is not None:
+        sc.compatibilities = chunk_sc.compatibilities
+
+
+class _ChunkPickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        return obj.name if type(obj) is Context else None
+
+
+class _ChunkUnpickler(pickle.Unpickler):
+    contexts: Dict[str, Context] = {}
+
+    def persistent_load(self, name):
+        return self.contexts[name]
+
+
+def _is_blank(context: Context) -> bool:
+    return context == Context(name=context.name)
+
+
+def _find_requirement(cml: CML, requirement, keyword: str, created: bool):
+    """
+    What a serial parse resolves an aggregate's reference to requirement to
+    among the use cases and user stories of cml, merged before its chunk;
+    None where that is the chunk's own object.
+    """
+    name = requirement.name
+    if keyword != "userStories":
+        use_case = next((u for u in cml.use_cases if u.name == name), None)
+        if keyword == "useCases" or use_case is not None:
+            return use_case
+        if isinstance(requirement, UseCase) and not created:
+            # features/userRequirements look through every use case before any user story.
+            return None
+    return next((s for s in cml.user_stories if s.name == name), None)
@@ -1,7 +1,9 @@
 from typing import List, Optional, Any, Dict, Set
 from antlr4 import *
+from antlr4.tree.Tree import ErrorNodeImpl, TerminalNodeImpl
 from .antlr.CMLParser import CMLParser
 from .antlr.CMLVisitor import CMLVisitor
+from .limits import LimitBreach
 from .cml_objects import (
     CML,
     Domain,
@@ -66,9 +68,56 @@ from .service_cutter_objects import (
     SCCharacteristic,
 )
 
+# Dispatch table entries that are not hooks: walk the node's children in
+# place, or give None without a call (terminals and error nodes).
+_WALK = object()
+_LEAF = object()
+
+
+def _node_methods() -> List[tuple]:
+    """
+    (node class, visit method name, default method, table entry if the default
+    is kept) for every parse tree node class.
+    """
+    methods = [
+        (node_class, method, getattr(ParseTreeVisitor, method), _LEAF)
+        for node_class, method in ((TerminalNodeImpl, "visitTerminal"), (ErrorNodeImpl, "visitErrorNode"))
+    ]
+    for name, node_class in vars(CMLParser).items():
+        if isinstance(node_class, type) and issubclass(node_class, ParserRuleContext):
+            method = "visit" + name[:-len("Context")]
+            if hasattr(CMLVisitor, method):
+                methods.append((node_class, method, getattr(CMLVisitor, method), _WALK))
+    return methods
+
+
+_NODE_METHODS = _node_methods()
+
+
+def _dispatch_table(builder_class: type) -> Dict[type, Any]:
+    """
+    Map each parse tree node class to the visit method builder_class overrides
+    for it, or to _WALK / _LEAF where the generated accept() would end in the
+    default visitChildren() / visitTerminal(). Built per builder, so that
+    hooks replaced on the class are picked up.
+    """
+    table: Dict[type, Any] = {}
+    for node_class, method, default, entry in _NODE_METHODS:
+        hook = getattr(builder_class, method)
+        table[node_class] = entry if hook is default else hook
+    return table
+
+
 class CMLModelBuilder(CMLVisitor):
-    def __init__(self, filename: str = None):
+    def __init__(self, filename: str = None, cancellation=None, limits=None):
         self.filename = filename
+        # Optional CancellationToken, checked on every visited node
+        self.cancellation = cancellation
+        # Optional ParseLimits; element counts are checked as objects are created
+        self.limits = limits
+        self._element_counts = {}
+        # Node class -> visit hook, used instead of accept(); see _dispatch_table()
+        self._hooks = _dispatch_table(type(self))
         self.cml = CML()
         self.context_map_obj_map = {} # Name -> Context
         self.subdomain_map = {} # Name -> Subdomain
@@ -82,6 +131,9 @@ class CMLModelBuilder(CMLVisitor):
         self.deferred_context_links = [] # (Context, [implements_names])
         self.deferred_subdomain_supports = [] # (Subdomain, [requirement_names])
         self.trait_map = {}  # name -> Trait
+        # (Aggregate, index in its user_requirements, keyword, whether the reference
+        # created the use case or user story) for every requirement an aggregate names
+        self.requirement_references = []
         self.service_cutter = ServiceCutterConfig()
         
         self.current_domain = None
@@ -233,12 +285,81 @@ class CMLModelBuilder(CMLVisitor):
         self.imports.append(import_path)
         return None
 
+    def visit(self, tree):
+        """Call the hook for tree's node class directly, instead of through tree.accept()."""
+        if self.cancellation is not None:
+            self.cancellation.check()
+        hook = self._hooks.get(type(tree), None)
+        if hook is _WALK:
+            return self._walk(tree)
+        if hook is _LEAF:
+            return None
+        if hook is None:
+            return tree.accept(self)
+        return hook(self, tree)
+
+    def visitChildren(self, node):
+        if self.cancellation is not None:
+            self.cancellation.check()
+        return self._walk(node)
+
+    def _walk(self, node):
+        """
+        Visit the children of node as CMLVisitor.visitChildren() does and return
+        the last child's result, but with an explicit stack: nodes without a
+        hook of their own are descended into here rather than through
+        accept() and visitChildren() frames, so only hooks add to the Python
+        call depth.
+        """
+        hooks = self._hooks
+        cancellation = self.cancellation
+        result = None
+        stack = [iter(node.children or ())]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+            hook = hooks.get(type(child), None)
+            if hook is _WALK:
+                if cancellation is not None:
+                    cancellation.check()
+                # A node's result is its last child's, or None if it has none.
+                result = None
+                stack.append(iter(child.children or ()))
+            elif hook is _LEAF:
+                result = None
+            elif hook is None:
+                result = child.accept(self)
+            else:
+                result = hook(self, child)
+        return result
+
+    def _count_element(self, kind: str, ctx=None):
+        """Count one created context/aggregate/attribute against limits.max_<kind>."""
+        if self.limits is None:
+            return
+        limit = getattr(self.limits, f"max_{kind}")
+        count = self._element_counts.get(kind, 0) + 1
+        self._element_counts[kind] = count
+        if limit is not None and count > limit:
+            start = getattr(ctx, "start", None)
+            raise LimitBreach(
+                f"max_{kind}",
+                f"Number of {kind} exceeds the max_{kind} limit of {limit}",
+                start.line if start is not None else None,
+                start.column if start is not None else None,
+            )
+
     def visitDefinitions(self, ctx: CMLParser.DefinitionsContext):
         try:
             self.visitChildren(ctx)
         except Exception as e:
             raise e
+        return self.finish()
 
+    def finish(self) -> CML:
+        """Link the collected references and return the model; run once, after all definitions."""
         # Post-processing: Link contexts and subdomains
         self._link_references()
         # Attach service cutter config if any content was collected
@@ -257,6 +378,15 @@ class CMLModelBuilder(CMLVisitor):
         
         return self.cml
 
+    def build_fragment(self, ctx):
+        """
+        Build the object for a single declaration parsed without `definitions`
+        (an Aggregate, Entity, ContextMap, ...) and return it.
+        """
+        obj = self.visit(ctx)
+        self._link_references()
+        return obj
+
     def _link_references(self):
         # Link ContextMap contains
         for cm, ctx_names in self.deferred_context_map_links:
@@ -844,8 +974,8 @@ class CMLModelBuilder(CMLVisitor):
         left_name = left_endpoint.name().getText()
         right_name = right_endpoint.name().getText()
         
-        left_ctx = self._get_or_create_context(left_name)
-        right_ctx = self._get_or_create_context(right_name)
+        left_ctx = self._get_or_create_context(left_name, left_endpoint)
+        right_ctx = self._get_or_create_context(right_name, right_endpoint)
         
         connection = ctx.relationshipConnection()
         connection_text = "Unknown"
@@ -923,10 +1053,11 @@ class CMLModelBuilder(CMLVisitor):
                         
         return rel
 
-    def _get_or_create_context(self, name: str) -> Context:
+    def _get_or_create_context(self, name: str, node=None) -> Context:
         if name in self.context_map_obj_map:
             return self.context_map_obj_map[name]
         
+        self._count_element("contexts", node)
         ctx = Context(name=name)
         self.context_map_obj_map[name] = ctx
         if ctx not in self.cml.contexts:  # pragma: no branch
@@ -939,7 +1070,7 @@ class CMLModelBuilder(CMLVisitor):
             name = ctx_names[0].getText()
         else:
             name = ctx_names.getText()
-        context = self._get_or_create_context(name)
+        context = self._get_or_create_context(name, ctx)
         
         implements_list = []
         realizes_list = []
@@ -999,8 +1130,10 @@ class CMLModelBuilder(CMLVisitor):
 
     def visitSubdomain(self, ctx: CMLParser.SubdomainContext):
         name = ctx.name().getText()
-        # Type is set via subdomainAttribute inside the body, not directly on subdomain
+        # Type is set inline (`Subdomain X type CORE_DOMAIN`) or via subdomainAttribute inside the body
         sd_type = SubdomainType.UNDEFINED if hasattr(SubdomainType, "UNDEFINED") else SubdomainType.GENERIC
+        if ctx.subdomainType():
+            sd_type = SubdomainType(ctx.subdomainType().getText())
 
         subdomain = Subdomain(name=name, type=sd_type, vision="", domain=self.current_domain)
         self.subdomain_map[name] = subdomain
@@ -1028,6 +1161,7 @@ class CMLModelBuilder(CMLVisitor):
 
     def visitAggregate(self, ctx: CMLParser.AggregateContext):
         name = ctx.name().getText()
+        self._count_element("aggregates", ctx)
         agg = Aggregate(name=name)
         
         if self.current_module:
@@ -1054,14 +1188,17 @@ class CMLModelBuilder(CMLVisitor):
         if keyword in ("useCases", "userStories", "features", "userRequirements") and ctx.idList():
             names = [n.getText() for n in ctx.idList().name()]
             for n in names:
+                created = False
                 if keyword == "useCases":
                     req = next((u for u in self.cml.use_cases if u.name == n), None) or UseCase(name=n)
                     if req not in self.cml.use_cases:
                         self.cml.use_cases.append(req)
+                        created = True
                 elif keyword == "userStories":
                     req = next((s for s in self.cml.user_stories if s.name == n), None) or UserStory(name=n)
                     if req not in self.cml.user_stories:
                         self.cml.user_stories.append(req)
+                        created = True
                 else:
                     req = next((u for u in self.cml.use_cases if u.name == n), None)
                     if not req:
@@ -1069,6 +1206,8 @@ class CMLModelBuilder(CMLVisitor):
                     if not req:
                         req = UseCase(name=n)
                         self.cml.use_cases.append(req)
+                        created = True
+                self.requirement_references.append((agg, len(agg.user_requirements), keyword, created))
                 agg.user_requirements.append(req)
             return None
 
@@ -1341,6 +1480,7 @@ class CMLModelBuilder(CMLVisitor):
 
         # Enum attributes
         for enum_attr_ctx in ctx.enumAttribute():
+            self._count_element("attributes", enum_attr_ctx)
             attr = Attribute(
                 name=enum_attr_ctx.name().getText(),
                 type=enum_attr_ctx.type_().getText(),
@@ -1424,6 +1564,7 @@ class CMLModelBuilder(CMLVisitor):
         name = ctx.attrName.getText()
         type_name = ctx.attrType.getText()
 
+        self._count_element("attributes", ctx)
         attr = Attribute(name=name, type=type_name)
 
         if ctx.reference:
@@ -1485,6 +1626,7 @@ class CMLModelBuilder(CMLVisitor):
 
         # Backwards-compatible "named association" syntax: represent it as a reference attribute.
         name = ctx.name().getText()
+        self._count_element("attributes", ctx)
         type_name = ctx.type_().getText()
         if is_ref:
             type_name = type_name if type_name.startswith("@") else f"@{type_name}"
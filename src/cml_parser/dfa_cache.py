@@ -0,0 +1,613 @@
+"""
+Persistent cache for the ANTLR prediction DFAs of the CML lexer and parser.
+
+ANTLR builds its DFAs lazily while parsing, so the first parse of every
+process pays for the full ATN simulation. The helpers in this module save the
+warmed DFA state (for example after parsing the bundled ``examples/``) to a
+compressed JSON file and restore it in later processes.
+
+Every cache file records a fingerprint of the serialized lexer and parser
+ATNs. A cache written for a different grammar (e.g. after regenerating
+``CMLParser.py``) is ignored on load.
+
+The DFAs and the shared prediction-context cache live at class level and grow
+for the life of the process. Long-running services can bound them with
+set_cache_policy() or clear_parser_caches(), and watch them through
+get_parser_cache_stats().
+
+The DFAs are shared by all parsers of the process, including those running
+in other threads. Predictions that hit the DFA only read it; inserting new
+states and edges (a cache miss), clearing, loading and saving take a
+process-wide lock, so concurrent parses never lose or duplicate DFA states.
+"""
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import zlib
+
+from antlr4.PredictionContext import (
+    PredictionContext,
+    PredictionContextCache,
+    SingletonPredictionContext,
+    ArrayPredictionContext,
+)
+from antlr4.atn.ATNConfig import ATNConfig, LexerATNConfig
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.atn.SemanticContext import (
+    SemanticContext,
+    Predicate,
+    PrecedencePredicate,
+    AND,
+    OR,
+)
+from antlr4.dfa.DFA import DFA
+from antlr4.dfa.DFAState import DFAState, PredPrediction
+
+from .antlr import CMLLexer as lexer_module
+from .antlr import CMLParser as parser_module
+from .antlr.CMLLexer import CMLLexer
+from .antlr.CMLParser import CMLParser
+
+# Bump when the on-disk layout changes.
+FORMAT_VERSION = 1
+
+# Environment variable naming a cache file that is loaded before the first parse.
+CACHE_ENV_VAR = "CML_PARSER_DFA_CACHE"
+
+_ERROR_STATE = -1
+
+_env_cache_checked = False
+
+
+def grammar_fingerprint() -> str:
+    """Hash of the serialized lexer and parser ATNs the cache is valid for."""
+    digest = hashlib.sha256()
+    for module in (lexer_module, parser_module):
+        digest.update(",".join(str(v) for v in module.serializedATN()).encode("ascii"))
+        digest.update(b";")
+    return digest.hexdigest()
+
+
+def dfa_state_count() -> Dict[str, int]:
+    """Number of DFA states currently cached for the lexer and the parser."""
+    return {
+        "lexer": sum(len(dfa.states) for dfa in CMLLexer.decisionsToDFA),
+        "parser": sum(len(dfa.states) for dfa in CMLParser.decisionsToDFA),
+    }
+
+
+@dataclass
+class CachePolicy:
+    """
+    Limits applied after each parse; when one is exceeded all caches are cleared.
+
+    max_dfa_states: total lexer and parser DFA states
+    max_context_cache_size: entries in the shared prediction-context cache
+    reset_every: number of parses between unconditional clears
+    """
+    max_dfa_states: Optional[int] = None
+    max_context_cache_size: Optional[int] = None
+    reset_every: Optional[int] = None
+
+
+@dataclass
+class ParserCacheStats:
+    """Cache sizes plus process-wide prediction counters since the last reset."""
+    lexer_dfa_states: int = 0
+    parser_dfa_states: int = 0
+    context_cache_size: int = 0
+    predictions: int = 0
+    dfa_hits: int = 0
+    clears: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of parser predictions answered from the DFA without ATN simulation."""
+        return self.dfa_hits / self.predictions if self.predictions else 0.0
+
+
+_NO_POLICY = CachePolicy()
+_cache_policy = CachePolicy()
+_cache_stats = ParserCacheStats()
+_parses_since_clear = 0
+
+# Serializes every change to the shared DFAs, the prediction-context cache and
+# the module state above. Reentrant: enforce_cache_policy() calls clear_parser_caches().
+_lock = threading.RLock()
+
+
+class CountingParserATNSimulator(ParserATNSimulator):
+    """
+    ParserATNSimulator that records whether each prediction hit the DFA.
+
+    Every prediction also checks the CancellationToken of the running parse,
+    if any: on entry and for each token of lookahead, as one prediction can
+    scan far ahead. Raising there is safe: adaptivePredict restores the input
+    position and DFA edges are only added for completed reach sets.
+
+    Counts are kept per simulator, so other threads cannot skew them, and are
+    added to the process-wide stats by flush_counts() after each parse.
+    """
+
+    cancellation = None
+    predictions = 0
+    dfa_hits = 0
+    _simulations = 0
+
+    def adaptivePredict(self, input, decision, outerContext):
+        if self.cancellation is not None:
+            self.cancellation.check()
+        before = self._simulations
+        if self.decisionToDFA[decision].s0 is None:
+            self._simulations += 1
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            self.predictions += 1
+            if self._simulations == before:
+                self.dfa_hits += 1
+
+    def getExistingTargetState(self, previousD, t):
+        if self.cancellation is not None:
+            self.cancellation.check()
+        return super().getExistingTargetState(previousD, t)
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if self.cancellation is not None:
+            self.cancellation.check()
+        return super().computeReachSet(closure, t, fullCtx)
+
+    def computeTargetState(self, dfa, previousD, t):
+        self._simulations += 1
+        return super().computeTargetState(dfa, previousD, t)
+
+    def execATNWithFullContext(self, dfa, D, s0, input, startIndex, outerContext):
+        self._simulations += 1
+        return super().execATNWithFullContext(dfa, D, s0, input, startIndex, outerContext)
+
+    def addDFAState(self, dfa, D):
+        with _lock:
+            return super().addDFAState(dfa, D)
+
+    def addDFAEdge(self, dfa, from_, t, to):
+        with _lock:
+            return super().addDFAEdge(dfa, from_, t, to)
+
+    def flush_counts(self) -> None:
+        """Add this simulator's prediction counts to get_parser_cache_stats() and reset them."""
+        with _lock:
+            _cache_stats.predictions += self.predictions
+            _cache_stats.dfa_hits += self.dfa_hits
+        self.predictions = 0
+        self.dfa_hits = 0
+
+
+class LockingLexerATNSimulator(LexerATNSimulator):
+    """LexerATNSimulator that adds DFA states and edges under the module lock, like the parser."""
+
+    def addDFAState(self, configs):
+        with _lock:
+            return super().addDFAState(configs)
+
+    def addDFAEdge(self, from_, tk, to=None, cfgs=None):
+        with _lock:
+            return super().addDFAEdge(from_, tk, to, cfgs)
+
+
+def new_parser(token_stream) -> CMLParser:
+    """Create a CMLParser whose predictions are counted in get_parser_cache_stats()."""
+    parser = CMLParser(token_stream)
+    parser._interp = CountingParserATNSimulator(parser, parser.atn, parser.decisionsToDFA, parser.sharedContextCache)
+    return parser
+
+
+def new_lexer(input_stream) -> CMLLexer:
+    """Create a CMLLexer that can share its DFAs with lexers in other threads."""
+    lexer = CMLLexer(input_stream)
+    lexer._interp = LockingLexerATNSimulator(lexer, lexer.atn, lexer.decisionsToDFA, PredictionContextCache())
+    return lexer
+
+
+def clear_parser_caches() -> None:
+    """
+    Drop all lexer and parser DFA states and the shared prediction-context cache.
+
+    Following parses are slower until the DFAs are warm again. Parsers that
+    already exist keep working: the DFA lists are updated in place.
+    """
+    global _parses_since_clear
+    with _lock:
+        for recognizer in (CMLLexer, CMLParser):
+            dfas = recognizer.decisionsToDFA
+            for i, state in enumerate(recognizer.atn.decisionToState):
+                dfas[i] = DFA(state, i)
+        CMLParser.sharedContextCache.cache.clear()
+        _cache_stats.clears += 1
+        _parses_since_clear = 0
+
+
+def set_cache_policy(
+    *,
+    max_dfa_states: Optional[int] = None,
+    max_context_cache_size: Optional[int] = None,
+    reset_every: Optional[int] = None
+) -> CachePolicy:
+    """Replace the cache policy; omitted limits are disabled. Returns the new policy."""
+    global _cache_policy
+    for name, value in (
+        ("max_dfa_states", max_dfa_states),
+        ("max_context_cache_size", max_context_cache_size),
+        ("reset_every", reset_every),
+    ):
+        if value is not None and value < 1:
+            raise ValueError(f"{name} must be a positive integer or None, got {value!r}")
+    _cache_policy = CachePolicy(max_dfa_states, max_context_cache_size, reset_every)
+    return replace(_cache_policy)
+
+
+def get_cache_policy() -> CachePolicy:
+    return replace(_cache_policy)
+
+
+def enforce_cache_policy() -> bool:
+    """Count a finished parse and clear the caches if the policy says so."""
+    global _parses_since_clear
+    if _cache_policy == _NO_POLICY:
+        # Without limits there is nothing to count; skip the lock every parse would take.
+        return False
+    with _lock:
+        _parses_since_clear += 1
+        policy = _cache_policy
+        if policy.reset_every is not None and _parses_since_clear >= policy.reset_every:
+            clear_parser_caches()
+            return True
+        if policy.max_dfa_states is not None and sum(dfa_state_count().values()) > policy.max_dfa_states:
+            clear_parser_caches()
+            return True
+        if (
+            policy.max_context_cache_size is not None
+            and len(CMLParser.sharedContextCache) > policy.max_context_cache_size
+        ):
+            clear_parser_caches()
+            return True
+        return False
+
+
+def get_parser_cache_stats() -> ParserCacheStats:
+    """Return a snapshot of the current cache sizes and prediction counters."""
+    with _lock:
+        counts = dfa_state_count()
+        return replace(
+            _cache_stats,
+            lexer_dfa_states=counts["lexer"],
+            parser_dfa_states=counts["parser"],
+            context_cache_size=len(CMLParser.sharedContextCache),
+        )
+
+
+def reset_parser_cache_stats() -> None:
+    with _lock:
+        _cache_stats.predictions = 0
+        _cache_stats.dfa_hits = 0
+        _cache_stats.clears = 0
+
+
+def save_dfa_cache(path) -> None:
+    """Write the current lexer and parser DFAs to ``path``."""
+    encoder = _Encoder()
+    # Snapshot under the lock: parses in other threads may be adding states.
+    with _lock:
+        payload = {
+            "format": FORMAT_VERSION,
+            "grammar": grammar_fingerprint(),
+            "lexer": [encoder.encode_dfa(dfa, lexer=True) for dfa in CMLLexer.decisionsToDFA],
+            "parser": [encoder.encode_dfa(dfa, lexer=False) for dfa in CMLParser.decisionsToDFA],
+            "contexts": encoder.contexts,
+            "semantics": encoder.semantics,
+            "executors": encoder.executors,
+        }
+    data = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+    # Write atomically so concurrent CI jobs never read a half-written cache.
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=str(target.parent), prefix=target.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_dfa_cache(path) -> bool:
+    """
+    Replace the lexer and parser DFAs with the ones stored in ``path``.
+
+    Returns False (leaving the current DFAs untouched) when the file is missing,
+    unreadable, or was written for a different grammar or cache format.
+    """
+    try:
+        payload = json.loads(zlib.decompress(Path(path).read_bytes()).decode("utf-8"))
+    except (OSError, ValueError, zlib.error):
+        return False
+    if not isinstance(payload, dict):
+        return False
+    if payload.get("format") != FORMAT_VERSION or payload.get("grammar") != grammar_fingerprint():
+        return False
+
+    try:
+        decoder = _Decoder(payload)
+        lexer_dfas = [decoder.decode_dfa(CMLLexer.atn, d, lexer=True) for d in payload["lexer"]]
+        parser_dfas = [decoder.decode_dfa(CMLParser.atn, d, lexer=False) for d in payload["parser"]]
+    except (KeyError, IndexError, TypeError, ValueError):
+        return False
+    if len(lexer_dfas) != len(CMLLexer.decisionsToDFA) or len(parser_dfas) != len(CMLParser.decisionsToDFA):
+        return False
+
+    # Update the DFA objects in place: live parser and lexer instances hold
+    # references to these lists, not copies.
+    with _lock:
+        for targets, loaded in ((CMLLexer.decisionsToDFA, lexer_dfas), (CMLParser.decisionsToDFA, parser_dfas)):
+            for dfa, (states, s0) in zip(targets, loaded):
+                dfa._states = states
+                dfa.s0 = s0
+        for ctx in decoder.contexts:
+            if ctx is not None:
+                CMLParser.sharedContextCache.add(ctx)
+    return True
+
+
+def warm_dfa_cache(paths: Iterable, save_to=None) -> int:
+    """
+    Warm the DFAs by parsing ``paths`` (errors are ignored) and optionally save them.
+
+    Returns the number of files parsed.
+    """
+    from .parser import parse_file_safe
+
+    count = 0
+    for path in paths:
+        parse_file_safe(str(path))
+        count += 1
+    if save_to is not None:
+        save_dfa_cache(save_to)
+    return count
+
+
+def load_env_dfa_cache() -> None:
+    """Load the cache named by ``CML_PARSER_DFA_CACHE`` once per process, if set."""
+    global _env_cache_checked
+    if _env_cache_checked:
+        return
+    # Threads starting their first parse together wait for the one that loads.
+    with _lock:
+        if _env_cache_checked:
+            return
+        try:
+            path = os.environ.get(CACHE_ENV_VAR)
+            if path:
+                load_dfa_cache(path)
+        finally:
+            _env_cache_checked = True
+
+
+class _Encoder:
+    """Flattens DFA object graphs into JSON-friendly lists with shared tables."""
+
+    def __init__(self):
+        self.contexts: List[list] = []
+        self.semantics: List[list] = []
+        self.executors: List[list] = []
+        self._context_index: Dict[int, int] = {}
+        self._semantic_index: Dict[int, int] = {}
+        self._executor_index: Dict[int, int] = {}
+
+    def encode_dfa(self, dfa: DFA, *, lexer: bool) -> dict:
+        states = list(dfa.states.values())
+        index = {id(state): i for i, state in enumerate(states)}
+        encoded = [self._encode_state(state, index, lexer) for state in states]
+        s0 = index.get(id(dfa.s0)) if dfa.s0 is not None else None
+        return {"s0": s0, "states": encoded}
+
+    def _encode_state(self, state: DFAState, index: Dict[int, int], lexer: bool) -> list:
+        edges = None
+        if state.edges is not None:
+            edges = []
+            for symbol, target in enumerate(state.edges):
+                if target is None:
+                    continue
+                if target is ATNSimulator.ERROR:
+                    edges.extend((symbol, _ERROR_STATE))
+                elif id(target) in index:
+                    edges.extend((symbol, index[id(target)]))
+        predicates = None
+        if state.predicates is not None:
+            predicates = [[self._semantic(p.pred), p.alt] for p in state.predicates]
+        executor = self._executor(state.lexerActionExecutor) if lexer else None
+        return [
+            self._encode_configs(state.configs, lexer),
+            int(state.isAcceptState),
+            state.prediction,
+            int(state.requiresFullContext),
+            executor,
+            predicates,
+            edges,
+            len(state.edges) if state.edges is not None else None,
+        ]
+
+    def _encode_configs(self, configs: ATNConfigSet, lexer: bool) -> list:
+        encoded = []
+        for cfg in configs.configs:
+            item = [
+                cfg.state.stateNumber,
+                cfg.alt,
+                self._context(cfg.context),
+                self._semantic(cfg.semanticContext),
+                cfg.reachesIntoOuterContext,
+                int(cfg.precedenceFilterSuppressed),
+            ]
+            if lexer:
+                item.append(self._executor(cfg.lexerActionExecutor))
+                item.append(int(cfg.passedThroughNonGreedyDecision))
+            encoded.append(item)
+        conflicting = sorted(configs.conflictingAlts) if configs.conflictingAlts is not None else None
+        return [
+            int(configs.fullCtx),
+            configs.uniqueAlt,
+            conflicting,
+            int(configs.hasSemanticContext),
+            int(configs.dipsIntoOuterContext),
+            encoded,
+        ]
+
+    def _context(self, ctx: Optional[PredictionContext]) -> Optional[int]:
+        if ctx is None:
+            return None
+        found = self._context_index.get(id(ctx))
+        if found is not None:
+            return found
+        if ctx is PredictionContext.EMPTY:
+            entry = ["E"]
+        elif isinstance(ctx, SingletonPredictionContext):
+            entry = ["S", self._context(ctx.parentCtx), ctx.returnState]
+        elif isinstance(ctx, ArrayPredictionContext):
+            entry = ["A", [self._context(p) for p in ctx.parents], list(ctx.returnStates)]
+        else:
+            raise TypeError(f"Unsupported prediction context {type(ctx).__name__}")
+        self._context_index[id(ctx)] = len(self.contexts)
+        self.contexts.append(entry)
+        return self._context_index[id(ctx)]
+
+    def _semantic(self, sem: Optional[SemanticContext]) -> Optional[int]:
+        if sem is None:
+            return None
+        found = self._semantic_index.get(id(sem))
+        if found is not None:
+            return found
+        if sem is SemanticContext.NONE:
+            entry = ["N"]
+        elif isinstance(sem, Predicate):
+            entry = ["P", sem.ruleIndex, sem.predIndex, int(sem.isCtxDependent)]
+        elif isinstance(sem, PrecedencePredicate):
+            entry = ["PP", sem.precedence]
+        elif isinstance(sem, (AND, OR)):
+            entry = ["AND" if isinstance(sem, AND) else "OR", [self._semantic(o) for o in sem.opnds]]
+        else:
+            raise TypeError(f"Unsupported semantic context {type(sem).__name__}")
+        self._semantic_index[id(sem)] = len(self.semantics)
+        self.semantics.append(entry)
+        return self._semantic_index[id(sem)]
+
+    def _executor(self, executor: Optional[LexerActionExecutor]) -> Optional[int]:
+        if executor is None:
+            return None
+        found = self._executor_index.get(id(executor))
+        if found is not None:
+            return found
+        actions = CMLLexer.atn.lexerActions or []
+        entry = []
+        for action in executor.lexerActions:
+            # Only grammar-level actions can be referenced by index; position
+            # dependent wrappers never reach the DFA for this grammar.
+            entry.append(next(i for i, a in enumerate(actions) if a is action))
+        self._executor_index[id(executor)] = len(self.executors)
+        self.executors.append(entry)
+        return self._executor_index[id(executor)]
+
+
+class _Decoder:
+    """Rebuilds DFA object graphs from the tables written by _Encoder."""
+
+    def __init__(self, payload: dict):
+        self.semantics: List[SemanticContext] = []
+        for entry in payload["semantics"]:
+            self.semantics.append(self._decode_semantic(entry))
+        self.contexts: List[Optional[PredictionContext]] = []
+        for entry in payload["contexts"]:
+            self.contexts.append(self._decode_context(entry))
+        actions = CMLLexer.atn.lexerActions or []
+        self.executors = [LexerActionExecutor([actions[i] for i in entry]) for entry in payload["executors"]]
+
+    def _decode_semantic(self, entry: list) -> SemanticContext:
+        kind = entry[0]
+        if kind == "N":
+            return SemanticContext.NONE
+        if kind == "P":
+            return Predicate(entry[1], entry[2], bool(entry[3]))
+        if kind == "PP":
+            return PrecedencePredicate(entry[1])
+        if kind in ("AND", "OR"):
+            sem = (AND if kind == "AND" else OR).__new__(AND if kind == "AND" else OR)
+            sem.opnds = [self.semantics[i] for i in entry[1]]
+            return sem
+        raise ValueError(f"Unknown semantic context kind {kind!r}")
+
+    def _decode_context(self, entry: list) -> PredictionContext:
+        kind = entry[0]
+        if kind == "E":
+            return PredictionContext.EMPTY
+        if kind == "S":
+            parent = self.contexts[entry[1]] if entry[1] is not None else None
+            return SingletonPredictionContext(parent, entry[2])
+        if kind == "A":
+            parents = [self.contexts[i] if i is not None else None for i in entry[1]]
+            return ArrayPredictionContext(parents, list(entry[2]))
+        raise ValueError(f"Unknown prediction context kind {kind!r}")
+
+    def decode_dfa(self, atn, encoded: dict, *, lexer: bool):
+        states: List[DFAState] = []
+        for number, item in enumerate(encoded["states"]):
+            configs_entry, accept, prediction, full_ctx, executor, predicates, _edges, _width = item
+            state = DFAState(stateNumber=number, configs=self._decode_configs(atn, configs_entry, lexer))
+            state.isAcceptState = bool(accept)
+            state.prediction = prediction
+            state.requiresFullContext = bool(full_ctx)
+            state.lexerActionExecutor = self.executors[executor] if executor is not None else None
+            if predicates is not None:
+                state.predicates = [PredPrediction(self.semantics[s], alt) for s, alt in predicates]
+            states.append(state)
+
+        for state, item in zip(states, encoded["states"]):
+            edges, width = item[6], item[7]
+            if edges is None:
+                continue
+            state.edges = [None] * width
+            for i in range(0, len(edges), 2):
+                target = edges[i + 1]
+                state.edges[edges[i]] = ATNSimulator.ERROR if target == _ERROR_STATE else states[target]
+
+        s0 = states[encoded["s0"]] if encoded["s0"] is not None else None
+        return {state: state for state in states}, s0
+
+    def _decode_configs(self, atn, entry: list, lexer: bool) -> ATNConfigSet:
+        full_ctx, unique_alt, conflicting, has_semantic, dips, encoded = entry
+        configs = ATNConfigSet(bool(full_ctx))
+        for item in encoded:
+            cfg = (LexerATNConfig if lexer else ATNConfig).__new__(LexerATNConfig if lexer else ATNConfig)
+            cfg.state = atn.states[item[0]]
+            cfg.alt = item[1]
+            cfg.context = self.contexts[item[2]] if item[2] is not None else None
+            cfg.semanticContext = self.semantics[item[3]] if item[3] is not None else SemanticContext.NONE
+            cfg.reachesIntoOuterContext = item[4]
+            cfg.precedenceFilterSuppressed = bool(item[5])
+            if lexer:
+                cfg.lexerActionExecutor = self.executors[item[6]] if item[6] is not None else None
+                cfg.passedThroughNonGreedyDecision = bool(item[7])
+            configs.configs.append(cfg)
+        configs.uniqueAlt = unique_alt
+        configs.conflictingAlts = set(conflicting) if conflicting is not None else None
+        configs.hasSemanticContext = bool(has_semantic)
+        configs.dipsIntoOuterContext = bool(dips)
+        configs.setReadonly(True)
+        return configs
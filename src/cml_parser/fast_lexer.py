@@ -0,0 +1,207 @@
+"""
+Hand-written token source for CML, a drop-in replacement for CMLLexer.
+
+The generated CMLLexer simulates the lexer ATN one character at a time in pure
+Python. The CML lexical grammar is small (implicit literal tokens, READ/WITH/ITS,
+INT, ID, STRING and skipped comments/whitespace), so a single compiled regular
+expression produces the same tokens at a fraction of the cost. Token types,
+start/stop indexes, lines, columns and lexer error messages (including ANTLR's
+recovery, which drops the offending characters) match CMLLexer exactly;
+tests/test_fast_lexer.py checks this token for token.
+"""
+import re
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.InputStream import InputStream
+from antlr4.Lexer import TokenSource
+from antlr4.Recognizer import Recognizer
+from antlr4.Token import CommonToken, Token
+
+from .antlr.CMLParser import CMLParser
+
+
+def _literal_types():
+    """Map each implicit literal token ('Aggregate', '->', ...) to its token type."""
+    literals = {}
+    for ttype, name in enumerate(CMLParser.literalNames):
+        if name.startswith("'"):
+            literals[name[1:-1]] = ttype
+    return literals
+
+
+_LITERALS = _literal_types()
+_ID_SHAPED = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Literals that look like an identifier (keywords, including read/with/its) are
+# recognized by matching ID and looking the text up, as ANTLR resolves ties in
+# favour of the rule defined first. Literals that start like an identifier but
+# continue with other characters ('Shared-Kernel', 'promote,') are always longer
+# than the ID they start with, so they are tried before ID. Alternatives are
+# ordered longest first to get the lexer's longest-match behaviour.
+_KEYWORDS = {text: ttype for text, ttype in _LITERALS.items() if _ID_SHAPED.fullmatch(text)}
+_COMPOUND = sorted(
+    (text for text in _LITERALS if text not in _KEYWORDS and _ID_SHAPED.match(text)),
+    key=len, reverse=True,
+)
+_PUNCTUATION = sorted(
+    (text for text in _LITERALS if not _ID_SHAPED.match(text)),
+    key=len, reverse=True,
+)
+
+_TOKEN_RE = re.compile(
+    r"(?P<skip>[ \t\r\n]+|//[^\r\n]*|/\*.*?\*/)"
+    r"|(?P<compound>" + "|".join(map(re.escape, _COMPOUND)) + r")"
+    r"|(?P<id>\^?[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<int>[0-9]+)"
+    r"|(?P<string>\"(?:\\.|[^\\\"])*\"|'(?:\\.|[^\\'])*')"
+    r"|(?P<punct>" + "|".join(map(re.escape, _PUNCTUATION)) + r")",
+    re.DOTALL,
+)
+
+
+class FastCMLLexer(Recognizer, TokenSource):
+    """
+    Token source producing the same tokens as CMLLexer for use with CommonTokenStream.
+
+    Like CMLLexer it reports unrecognized characters to its error listeners
+    ("token recognition error at: ...") and skips them.
+    """
+
+    def __init__(self, input: InputStream = None):
+        super().__init__()
+        self._factory = CommonTokenFactory.DEFAULT
+        self._input = None
+        self.inputStream = input
+
+    @property
+    def inputStream(self) -> InputStream:
+        return self._input
+
+    @inputStream.setter
+    def inputStream(self, input: InputStream):
+        self._input = input
+        self._tokenFactorySourcePair = (self, input)
+        self._data = input.strdata if input is not None else ""
+        self.reset()
+
+    def reset(self):
+        if self._input is not None:
+            self._input.seek(0)
+        self._pos = 0
+        self.line = 1
+        self.column = 0
+
+    def getInputStream(self) -> InputStream:
+        return self._input
+
+    def getSourceName(self) -> str:
+        return self._input.getSourceName()
+
+    def getCharIndex(self) -> int:
+        return self._pos
+
+    def nextToken(self) -> Token:
+        token = self._scan()
+        if token is None:
+            return self._eof_token()
+        ttype, start, stop, line, column = token
+        token = CommonToken(self._tokenFactorySourcePair, ttype, Token.DEFAULT_CHANNEL, start, stop)
+        token.line, token.column = line, column
+        return token
+
+    def fetch_into(self, store, n: int) -> int:
+        """
+        Append the next n tokens to a TokenStore without creating token
+        objects; return how many were added, stopping after EOF.
+        """
+        store.source = self._tokenFactorySourcePair
+        add = store.add
+        for i in range(n):
+            token = self._scan()
+            if token is None:
+                size = len(self._data)
+                self._input.seek(size)
+                add(Token.EOF, size, size - 1, self.line, self.column)
+                return i + 1
+            add(*token)
+        return n
+
+    def _eof_token(self) -> Token:
+        size = len(self._data)
+        self._input.seek(size)
+        return CommonToken(self._tokenFactorySourcePair, Token.EOF, Token.DEFAULT_CHANNEL, size, size - 1)
+
+    def _scan(self):
+        """Move past the next token; return its (type, start, stop, line, column), or None at the end."""
+        data = self._data
+        size = len(data)
+        while self._pos < size:
+            start = self._pos
+            match = _TOKEN_RE.match(data, start)
+            if match is None:
+                self._recognition_error(start)
+                continue
+
+            kind = match.lastgroup
+            stop = match.end()
+            if kind == "skip" or kind == "string":
+                newlines = data.count("\n", start, stop)
+                if newlines:
+                    line = self.line + newlines
+                    column = stop - data.rindex("\n", start, stop) - 1
+                else:
+                    line, column = self.line, self.column + stop - start
+            else:
+                line, column = self.line, self.column + stop - start
+            if kind == "skip":
+                self._pos, self.line, self.column = stop, line, column
+                continue
+
+            if kind == "id":
+                ttype = _KEYWORDS.get(match.group(), CMLParser.ID)
+            elif kind == "string":
+                ttype = CMLParser.STRING
+            elif kind == "int":
+                ttype = CMLParser.INT
+            else:
+                ttype = _LITERALS[match.group()]
+            token = (ttype, start, stop - 1, self.line, self.column)
+            self._pos, self.line, self.column = stop, line, column
+            return token
+        return None
+
+    def getAllTokens(self) -> list:
+        tokens = []
+        token = self.nextToken()
+        while token.type != Token.EOF:
+            tokens.append(token)
+            token = self.nextToken()
+        return tokens
+
+    def _recognition_error(self, start: int) -> None:
+        """Report and skip input no token starts with, the way CMLLexer recovers."""
+        data = self._data
+        first = data[start]
+        # ANTLR reports everything up to and including the character where its
+        # DFA stopped, then consumes one more character. An unterminated string
+        # runs to the end of the input; '^' is only valid in front of an ID.
+        if first == '"' or first == "'":
+            failed_at = len(data)
+        elif first == "^":
+            failed_at = start + 1
+        else:
+            failed_at = start
+        text = data[start:failed_at + 1]
+        display = text.replace("\n", "\\n").replace("\t", "\\t").replace("\r", "\\r")
+        self.getErrorListenerDispatch().syntaxError(
+            self, None, self.line, self.column, f"token recognition error at: '{display}'", None
+        )
+
+        stop = min(failed_at + 1, len(data))
+        newlines = data.count("\n", start, stop)
+        if newlines:
+            self.line += newlines
+            self.column = stop - data.rindex("\n", start, stop) - 1
+        else:
+            self.column += stop - start
+        self._pos = stop
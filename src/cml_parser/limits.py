@@ -0,0 +1,96 @@
+"""
+Hard resource limits for parsing untrusted input.
+
+A ParseLimits passed as limits= bounds the work done for each file: its size
+is checked before it is lexed, the token stream counts tokens as the parser
+pulls them, a parse listener tracks the rule nesting depth and the model
+builder counts the elements it creates. The first limit that is exceeded stops
+the parse; the parse functions turn it into a Diagnostic (non-strict) or a
+CmlLimitExceeded error (strict).
+"""
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Optional
+import os
+
+from antlr4.tree.Tree import ParseTreeListener
+
+
+@dataclass(frozen=True)
+class ParseLimits:
+    """
+    Limits applied to each parsed file (imports are checked one by one); None disables a limit.
+
+    max_bytes: size of the source in UTF-8 bytes
+    max_tokens: tokens produced by the lexer
+    max_depth: nesting depth of grammar rules, which also bounds the recursion of the model builder
+    max_contexts: bounded contexts, including those only named in a context map
+    max_aggregates: aggregates
+    max_attributes: attributes of entities, value objects, domain events and enums
+    """
+    max_bytes: Optional[int] = None
+    max_tokens: Optional[int] = None
+    max_depth: Optional[int] = None
+    max_contexts: Optional[int] = None
+    max_aggregates: Optional[int] = None
+    max_attributes: Optional[int] = None
+
+    def __post_init__(self):
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is not None and (not isinstance(value, int) or value < 1):
+                raise ValueError(f"{field.name} must be a positive integer or None, got {value!r}")
+
+
+class LimitBreach(Exception):
+    """Raised internally when a ParseLimits field is exceeded; limit is the field name."""
+
+    def __init__(self, limit: str, message: str, line: Optional[int] = None, col: Optional[int] = None):
+        super().__init__(message)
+        self.limit = limit
+        self.line = line
+        self.col = col
+
+
+def check_source_size(limits: ParseLimits, text: Optional[str] = None, path=None) -> None:
+    """
+    Raise LimitBreach if the source is larger than max_bytes. A file is checked
+    with stat() before it is read; a text is only encoded when its length alone
+    does not decide.
+    """
+    if limits.max_bytes is None:
+        return
+    if path is not None:
+        size = os.stat(Path(path)).st_size
+    elif len(text) > limits.max_bytes:
+        # UTF-8 never uses fewer bytes than characters.
+        size = len(text)
+    elif len(text) * 4 <= limits.max_bytes:
+        return
+    else:
+        size = len(text.encode("utf-8", "surrogatepass"))
+    if size > limits.max_bytes:
+        raise LimitBreach(
+            "max_bytes", f"Source size of {size} bytes exceeds the max_bytes limit of {limits.max_bytes}"
+        )
+
+
+class DepthGuard(ParseTreeListener):
+    """Parse listener that raises LimitBreach when rules nest deeper than max_depth."""
+
+    def __init__(self, max_depth: int):
+        self.max_depth = max_depth
+        self.depth = 0
+
+    def enterEveryRule(self, ctx):
+        self.depth += 1
+        if self.depth > self.max_depth:
+            raise LimitBreach(
+                "max_depth",
+                f"Nesting depth exceeds the max_depth limit of {self.max_depth}",
+                ctx.start.line,
+                ctx.start.column,
+            )
+
+    def exitEveryRule(self, ctx):
+        self.depth -= 1
@@ -0,0 +1,188 @@
+"""
+Outline of the declarations in CML documents, without parsing them.
+
+outline_text() lexes a document with FastCMLLexer and walks its tokens with
+a brace-matching scan that knows which declarations each kind of block can
+contain. It yields one OutlineEntry per named declaration (bounded
+contexts, aggregates, entities, services, use cases, ...), nested ones
+included, with the line span of the declaration. No parse tree or model is
+built, which makes it cheap enough to index a whole workspace for symbol
+search.
+
+The scan does not check the syntax: on invalid input it still returns the
+declarations it recognizes, and lexer errors are ignored.
+"""
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional
+
+from antlr4.Token import Token
+
+from .antlr.CMLParser import CMLParser
+from .fast_lexer import FastCMLLexer
+from .streams import CodePointStream
+from .token_store import TokenStore
+
+
+class OutlineEntry(NamedTuple):
+    """One declaration; start and end are the 1-based lines its keyword and closing brace are on."""
+    kind: str
+    qualified_name: str
+    file: Optional[str]
+    start: int
+    end: int
+
+
+def _literal(text: str) -> int:
+    return CMLParser.literalNames.index(f"'{text}'")
+
+
+# Declaration keywords and the kind of declaration they start.
+_KINDS = {
+    "ContextMap": "context_map",
+    "BoundedContext": "bounded_context",
+    "Domain": "domain",
+    "Subdomain": "subdomain",
+    "Module": "module",
+    "TacticDDDApplication": "tactic_ddd_application",
+    "ApplicationPart": "tactic_ddd_application",
+    "Aggregate": "aggregate",
+    "Entity": "entity",
+    "ValueObject": "value_object",
+    "DomainEvent": "domain_event",
+    "Event": "domain_event",
+    "CommandEvent": "command_event",
+    "Command": "command_event",
+    "DataTransferObject": "data_transfer_object",
+    "Trait": "trait",
+    "BasicType": "basic_type",
+    "enum": "enum",
+    "Service": "service",
+    "Repository": "repository",
+    "Resource": "resource",
+    "Consumer": "consumer",
+    "Application": "application",
+    "command": "command_event",
+    "Flow": "flow",
+    "flow": "flow",
+    "Coordination": "coordination",
+    "coordination": "coordination",
+    "UseCase": "use_case",
+    "UserStory": "user_story",
+    "ValueRegister": "value_register",
+}
+_KIND_OF = {_literal(keyword): kind for keyword, kind in _KINDS.items()}
+
+# The declaration keywords recognized in each kind of block; blocks of any
+# other kind (service bodies, use cases, relationship attributes, ...) hold
+# no declarations.
+_TOP_LEVEL = frozenset(_literal(keyword) for keyword in (
+    "ContextMap", "BoundedContext", "Domain", "TacticDDDApplication", "ApplicationPart",
+    "UseCase", "UserStory", "ValueRegister",
+))
+_CONTENT = frozenset(_literal(keyword) for keyword in (
+    "ContextMap", "Domain", "Subdomain", "Module", "Aggregate", "Entity", "ValueObject", "DomainEvent",
+    "Event", "CommandEvent", "Command", "DataTransferObject", "Trait", "BasicType", "enum", "Service",
+    "Repository", "Resource", "Consumer", "Application", "UseCase",
+))
+_APPLICATION = frozenset(_literal(keyword) for keyword in (
+    "Service", "DomainEvent", "Event", "CommandEvent", "Command", "command", "Flow", "flow",
+    "Coordination", "coordination",
+))
+_FEATURES = frozenset((_literal("Repository"),))
+_CONTAINS = {
+    None: _TOP_LEVEL,
+    "bounded_context": _CONTENT,
+    "domain": _CONTENT,
+    "subdomain": _CONTENT,
+    "module": _CONTENT,
+    "aggregate": _CONTENT,
+    "tactic_ddd_application": _CONTENT,
+    "application": _APPLICATION,
+    "entity": _FEATURES,
+    "value_object": _FEATURES,
+    "domain_event": _FEATURES,
+    "command_event": _FEATURES,
+    "data_transfer_object": _FEATURES,
+}
+
+_OPEN, _CLOSE = _literal("{"), _literal("}")
+# Declarations whose name is optional; unnamed ones are not listed.
+_UNNAMED = frozenset((_literal("ContextMap"), _literal("Application")))
+# 'Service', 'Event' and 'Command' are names too; after these they are references.
+_REFERENCE_BEFORE = frozenset((_literal("extends"), _literal("@"), _literal(","), CMLParser.WITH))
+
+
+def _name_types() -> frozenset:
+    atn = CMLParser.atn
+    return frozenset(atn.nextTokens(atn.ruleToStartState[CMLParser.RULE_name]))
+
+
+_NAMES = _name_types()
+
+
+def outline_text(text: str, filename: Optional[str] = None) -> List[OutlineEntry]:
+    """
+    Return the declarations in text, in document order. Qualified names join
+    the names of the enclosing declarations with dots ("Orders.Cart.Item").
+    """
+    store = TokenStore()
+    lexer = FastCMLLexer(CodePointStream(text))
+    lexer.removeErrorListeners()
+    types = store.types
+    while not types or types[-1] != Token.EOF:
+        lexer.fetch_into(store, 4096)
+    starts, stops, lines = store.starts, store.stops, store.lines
+
+    entries: List[OutlineEntry] = []
+    # One (kind, qualified name, index in entries) per open block; anonymous
+    # blocks repeat a kind that declares nothing.
+    stack = [(None, "", None)]
+    pending = None  # (kind, qualified name, index) of a declaration whose body may follow
+    previous = -1
+    for i in range(len(types) - 1):
+        ttype = types[i]
+        if ttype == _OPEN:
+            if pending is not None:
+                stack.append(pending)
+                pending = None
+            else:
+                stack.append(("", stack[-1][1], None))
+        elif ttype == _CLOSE:
+            pending = None
+            if len(stack) > 1:
+                _, _, index = stack.pop()
+                if index is not None:
+                    entries[index] = entries[index]._replace(end=lines[i])
+        elif ttype in _CONTAINS.get(stack[-1][0], ()) and previous not in _REFERENCE_BEFORE:
+            kind = _KIND_OF[ttype]
+            following = types[i + 1]
+            if following in _NAMES:
+                name = text[starts[i + 1]:stops[i + 1] + 1]
+                parent = stack[-1][1]
+                pending = (kind, f"{parent}.{name}" if parent else name, len(entries))
+                entries.append(OutlineEntry(kind, pending[1], filename, lines[i], lines[i + 1]))
+            elif ttype in _UNNAMED and following == _OPEN:
+                pending = (kind, stack[-1][1], None)
+            else:
+                pending = None
+        elif pending is not None and pending[2] is not None:
+            entry = entries[pending[2]]
+            if lines[i] > entry.end:
+                entries[pending[2]] = entry._replace(end=lines[i])
+        previous = ttype
+    # Blocks left open run to the last token.
+    for _, _, index in stack:
+        if index is not None:
+            entries[index] = entries[index]._replace(end=lines[len(types) - 2])
+    return entries
+
+
+def outline_file(file_path) -> List[OutlineEntry]:
+    """Return the declarations in a .cml file; imports are not followed."""
+    text = Path(file_path).read_text(encoding="utf-8")
+    return outline_text(text, str(file_path))
+
+
+def outline_files(file_paths: Iterable) -> List[OutlineEntry]:
+    """Return the declarations in each file, one flat list in the order of file_paths."""
+    return [entry for path in file_paths for entry in outline_file(path)]
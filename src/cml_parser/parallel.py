@@ -0,0 +1,299 @@
+"""
+Parallel parsing of many files.
+
+parse_files() parses every file, and every file they import, in a pool of
+workers and assembles each model in the calling interpreter exactly as
+parse_file_safe() would. On Python 3.14+ the workers are subinterpreters
+(concurrent.futures.InterpreterPoolExecutor): each one imports cml_parser on
+its own and builds its own DFAs, optionally warmed from a saved dfa_cache, at
+a fraction of the start-up cost and memory of a process. Where subinterpreters
+are not available, or cannot start, a process pool is used instead.
+
+Workers send each file's result back as a pickle. It is unpickled whenever a
+model needs the file, so files imported by several roots never share objects.
+
+parse_file_parallel() spreads a single large file over the pool instead: it
+splits the file's top-level definitions into chunks (see cml_parser.chunks),
+builds each chunk in a worker and merges and links them in the calling
+interpreter, into the model parse_file() would return.
+"""
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    ProcessPoolExecutor,
+    wait,
+)
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import concurrent.futures
+import multiprocessing
+import os
+import pickle
+
+BACKENDS = ("auto", "interpreters", "processes")
+
+# The ParserSession of this worker, created by its first task.
+_worker_session = None
+
+
+def _init_worker(dfa_cache) -> None:
+    if dfa_cache is not None:
+        from .dfa_cache import load_dfa_cache
+        load_dfa_cache(dfa_cache)
+
+
+def _parse_in_worker(path: str, options: dict) -> tuple:
+    """Parse one file without its imports; return (imports, pickled result)."""
+    global _worker_session
+    from .parser import ParserSession, _parse_single_file
+
+    if _worker_session is None:
+        _worker_session = ParserSession()
+    cml, imports, errors = _parse_single_file(path, None, session=_worker_session, **options)
+    return imports, pickle.dumps((cml, imports, errors), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _build_chunk_in_worker(text: str, filename: str, prediction_mode: str, lexer: str) -> Optional[tuple]:
+    """Build one chunk without linking; return its dump_chunk() state, or None to parse serially."""
+    global _worker_session
+    from .chunks import dump_chunk
+    from .parser import ParserSession, _build_unlinked
+
+    if _worker_session is None:
+        _worker_session = ParserSession()
+    builder = _build_unlinked(text, filename, prediction_mode, lexer, session=_worker_session)
+    if builder is None:
+        return None
+    return dump_chunk(builder)
+
+
+def unpack_result(result) -> tuple:
+    """Return a fresh (cml, imports, errors) from a worker result, or raise its error."""
+    if isinstance(result, BaseException):
+        raise result
+    if isinstance(result, tuple):
+        # Assembled by parse_file_parallel(), used once.
+        return result
+    return pickle.loads(result)
+
+
+def _executor(backend: str, max_workers: Optional[int], dfa_cache):
+    if backend != "processes":
+        executor_class = getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+        if executor_class is not None:
+            return executor_class(max_workers, initializer=_init_worker, initargs=(dfa_cache,))
+        if backend == "interpreters":
+            raise RuntimeError("The interpreters backend needs Python 3.14 or newer")
+    return ProcessPoolExecutor(
+        max_workers, mp_context=_process_context(), initializer=_init_worker, initargs=(dfa_cache,)
+    )
+
+
+def _process_context():
+    """
+    Start method for process workers. Forking a process that may run threads
+    (a ParserSession pool, a GUI, a web server) can deadlock the child, and
+    Python 3.12+ warns about it, so workers come from a fork server where
+    there is one and are spawned elsewhere.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _parse_all(roots: List[str], options: dict, backend: str, max_workers: Optional[int], dfa_cache) -> Dict[str, object]:
+    """Parse the roots and everything they import; map each path to its worker result."""
+    from .parser import _resolve_import_path
+
+    results: Dict[str, object] = {}
+    with _executor(backend, max_workers, dfa_cache) as pool:
+        running = {}
+
+        def submit(path: str) -> None:
+            if path not in results and path not in running.values():
+                running[pool.submit(_parse_in_worker, path, options)] = path
+
+        for root in roots:
+            submit(root)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = running.pop(future)
+                try:
+                    imports, results[path] = future.result()
+                except BrokenExecutor:
+                    raise
+                except Exception as e:
+                    results[path] = e
+                    continue
+                for import_path in imports:
+                    resolved = _resolve_import_path(import_path, Path(path).parent)
+                    if resolved:
+                        submit(str(resolved))
+    return results
+
+
+def parse_files(
+    paths: Iterable,
+    *,
+    backend: str = "auto",
+    max_workers: Optional[int] = None,
+    strict: bool = False,
+    prediction_mode: str = "auto",
+    max_errors: Optional[int] = None,
+    lexer: str = "antlr",
+    limits=None,
+    dfa_cache=None
+) -> list:
+    """
+    Parse many CML files in parallel and return their models in order.
+
+    Each model is the one parse_file_safe() (strict=False) or parse_file()
+    (strict=True) returns for that path, imports included; in strict mode the
+    first failing root raises. backend is one of BACKENDS: "auto" prefers
+    subinterpreters and falls back to processes, the other two force a pool
+    type. max_workers defaults to the executor's own default, and dfa_cache
+    is a file written by save_dfa_cache() that every worker loads at start-up.
+    """
+    from .parser import _check_modes, _parse_with_imports
+
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(BACKENDS)}, got {backend!r}")
+    _check_modes(prediction_mode, lexer)
+    if max_errors is not None and max_errors < 1:
+        raise ValueError(f"max_errors must be a positive integer or None, got {max_errors!r}")
+
+    roots = [str(path) for path in paths]
+    if not roots:
+        return []
+    options = dict(strict=strict, prediction_mode=prediction_mode, max_errors=max_errors, lexer=lexer, limits=limits)
+    try:
+        results = _parse_all(roots, options, backend, max_workers, dfa_cache)
+    except BrokenExecutor:
+        if backend != "auto":
+            raise
+        results = _parse_all(roots, options, "processes", max_workers, dfa_cache)
+
+    return [
+        _parse_with_imports(path=root, text=None, prefetched=results, **options)
+        for root in roots
+    ]
+
+
+def _build_chunks(path: str, text: str, pieces: list, pool, prediction_mode: str, lexer: str) -> Optional[tuple]:
+    """Build the pieces of text in pool, then merge and link them here."""
+    from .chunks import merge_chunk
+    from .cml_model_builder import CMLModelBuilder
+
+    futures = [
+        pool.submit(_build_chunk_in_worker, text[piece.start:piece.end], path, prediction_mode, lexer)
+        for piece in pieces
+    ]
+    builder = CMLModelBuilder(path)
+    try:
+        for piece, future in zip(pieces, futures):
+            state = future.result()
+            if state is None:
+                return None
+            merge_chunk(builder, state, piece.uses_traits)
+        return builder.finish(), builder.imports
+    except BrokenExecutor:
+        raise
+    except Exception:
+        # A ChunkMergeError, or a model that fails to link: the serial parse
+        # builds the model or reports the error.
+        return None
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _parse_chunked(
+    path: str,
+    chunks: int,
+    executor,
+    backend: str,
+    max_workers: Optional[int],
+    dfa_cache,
+    prediction_mode: str,
+    lexer: str
+) -> Optional[tuple]:
+    """
+    Parse path as chunks built by a pool; return (cml, imports, errors) like
+    _parse_single_file(), or None where only a serial parse gives that result.
+    """
+    from .chunks import split_definitions
+    from .cml_objects import ParseResult
+
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+    except (OSError, ValueError):
+        return None  # reported by the serial parse
+    pieces = split_definitions(text, chunks)
+    if len(pieces) < 2:
+        return None
+
+    if executor is not None:
+        built = _build_chunks(path, text, pieces, executor, prediction_mode, lexer)
+    else:
+        try:
+            with _executor(backend, max_workers, dfa_cache) as pool:
+                built = _build_chunks(path, text, pieces, pool, prediction_mode, lexer)
+        except BrokenExecutor:
+            if backend != "auto":
+                raise
+            with _executor("processes", max_workers, dfa_cache) as pool:
+                built = _build_chunks(path, text, pieces, pool, prediction_mode, lexer)
+    if built is None:
+        return None
+
+    cml, imports = built
+    errors = []
+    cml.parse_results = ParseResult(model=cml, errors=errors, warnings=[], source=text, filename=path)
+    return cml, imports, errors
+
+
+def parse_file_parallel(
+    file_path,
+    *,
+    strict: bool = True,
+    backend: str = "auto",
+    max_workers: Optional[int] = None,
+    chunks: Optional[int] = None,
+    executor=None,
+    prediction_mode: str = "auto",
+    lexer: str = "antlr",
+    dfa_cache=None
+):
+    """
+    Parse one large CML file on several cores and return the model that
+    parse_file() (strict=True) or parse_file_safe() (strict=False) returns.
+
+    The top-level definitions are split into `chunks` pieces of similar size
+    (twice the number of workers by default), each piece is parsed and built
+    in a worker, and the pieces are merged and linked once here. Files with
+    syntax errors, and the few models a merge cannot reproduce exactly (see
+    cml_parser.chunks), are parsed serially instead, as are all files with
+    prediction_mode="sll", whose result can depend on where the input ends.
+    Imports are parsed serially. backend, max_workers and dfa_cache are as
+    for parse_files(); executor is an existing pool to use instead, which
+    saves starting workers for every file.
+    """
+    from .parser import _check_modes, _parse_with_imports
+
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {', '.join(BACKENDS)}, got {backend!r}")
+    _check_modes(prediction_mode, lexer)
+    if chunks is not None and chunks < 1:
+        raise ValueError(f"chunks must be a positive integer or None, got {chunks!r}")
+
+    path = str(file_path)
+    if chunks is None:
+        chunks = 2 * (max_workers or os.cpu_count() or 1)
+    result = None
+    if prediction_mode != "sll" and chunks > 1:
+        result = _parse_chunked(path, chunks, executor, backend, max_workers, dfa_cache, prediction_mode, lexer)
+
+    prefetched = {path: result} if result is not None else None
+    return _parse_with_imports(
+        path=path, text=None, strict=strict, prediction_mode=prediction_mode, lexer=lexer, prefetched=prefetched
+    )
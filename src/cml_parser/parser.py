@@ -1,17 +1,26 @@
-from dataclasses import asdict
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
-from typing import List, Optional, Any, Union, Set
+from typing import TYPE_CHECKING, Iterable, List, Optional, Any, Union, Set
 import argparse
+import importlib
 import json
 import sys
 import os
+import threading
 
 from antlr4 import *
+from antlr4.atn.PredictionMode import PredictionMode
 from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
 
-from .antlr.CMLLexer import CMLLexer
-from .antlr.CMLParser import CMLParser
-from .cml_model_builder import CMLModelBuilder
+if TYPE_CHECKING:  # pragma: no cover
+    from .tokens import TokenCache
+
+from .cancellation import CancellationToken, CmlParseCancelled
+from .limits import DepthGuard, LimitBreach, ParseLimits, check_source_size
+from .streams import CodePointStream
+from .token_store import TokenStore
 from .cml_objects import (
     CML,
     ParseResult,
@@ -36,16 +45,184 @@ from .cml_objects import (
     Parameter
 )
 
+# The generated lexer/parser (and the builder that depends on them) take most of
+# the import time, mainly to deserialize the ATN. They are imported on the first
+# parse instead of when this module is imported.
+_LAZY_IMPORTS = {
+    "CMLLexer": ".antlr.CMLLexer",
+    "FastCMLLexer": ".fast_lexer",
+    "CMLModelBuilder": ".cml_model_builder",
+    "load_env_dfa_cache": ".dfa_cache",
+    "load_dfa_cache": ".dfa_cache",
+    "save_dfa_cache": ".dfa_cache",
+    "dfa_state_count": ".dfa_cache",
+    "new_parser": ".dfa_cache",
+    "new_lexer": ".dfa_cache",
+    "enforce_cache_policy": ".dfa_cache",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __package__), name)
+    globals()[name] = value
+    return value
+
+
+def _load_generated() -> None:
+    """Bind the lazily imported names as module globals before they are used."""
+    module_globals = globals()
+    for name in _LAZY_IMPORTS:
+        if name not in module_globals:
+            __getattr__(name)
+
+
 class CmlSyntaxError(Exception):
     def __init__(self, diagnostic: Diagnostic):
         super().__init__(diagnostic.pretty())
         self.diagnostic = diagnostic
 
+    def __reduce__(self):
+        # Rebuild from the diagnostic, e.g. when raised in a parse_files() worker.
+        return type(self), (self.diagnostic,), self.__dict__
+
+
+class CmlLimitExceeded(CmlSyntaxError):
+    """Raised by strict parsing when the input exceeds one of its ParseLimits; limit names the field."""
+
+    def __init__(self, diagnostic: Diagnostic, limit: str):
+        super().__init__(diagnostic)
+        self.limit = limit
+
+    def __reduce__(self):
+        return type(self), (self.diagnostic, self.limit), self.__dict__
+
+
+class _ErrorLimitReached(Exception):
+    """Raised by CMLErrorListener to stop parsing once max_errors diagnostics were reported."""
+
+    def __init__(self, parser=None):
+        super().__init__()
+        # Rule contexts are unwound while the exception propagates, so keep the
+        # root of the partial parse tree for best-effort model building.
+        ctx = parser._ctx if parser is not None else None
+        while ctx is not None and ctx.parentCtx is not None:
+            ctx = ctx.parentCtx
+        self.tree = ctx
+
+
+class _GuardedTokenStream(CommonTokenStream):
+    """
+    CommonTokenStream over a TokenStore that checks the running parse's
+    CancellationToken and token limit each time it pulls tokens from the
+    lexer. Error reporting can make ANTLR lex the whole remaining input at
+    once, with no prediction in between.
+    """
+
+    cancellation = None
+    max_tokens = None
+
+    def __init__(self, tokenSource):
+        super().__init__(tokenSource)
+        self.tokens = TokenStore()
+
+    def setTokenSource(self, tokenSource):
+        super().setTokenSource(tokenSource)
+        self.tokens = TokenStore()
+
+    def fetch(self, n: int) -> int:
+        if self.cancellation is not None:
+            self.cancellation.check()
+        if self.fetchedEOF:
+            return 0
+        tokens = self.tokens
+        fetch_into = getattr(self.tokenSource, "fetch_into", None)
+        if fetch_into is not None:
+            # FastCMLLexer and cached token sources write straight into the store.
+            n = fetch_into(tokens, n)
+            self.fetchedEOF = tokens.types[-1] == Token.EOF
+        else:
+            for i in range(n):
+                token = self.tokenSource.nextToken()
+                tokens.append(token)
+                if token.type == Token.EOF:
+                    self.fetchedEOF = True
+                    n = i + 1
+                    break
+        if self.max_tokens is not None and len(tokens) - self.fetchedEOF > self.max_tokens:
+            index = len(tokens) - 1
+            raise LimitBreach(
+                "max_tokens",
+                f"Token count exceeds the max_tokens limit of {self.max_tokens}",
+                tokens.lines[index],
+                tokens.columns[index],
+            )
+        return n
+
+    # Lookahead and consume read the arrays of the TokenStore, as long as every
+    # token is on the default channel (CML skips comments and whitespace rather
+    # than hiding them), instead of going through token objects.
+
+    def sync(self, i: int) -> bool:
+        n = i - len(self.tokens.types) + 1
+        if n > 0:
+            return self.fetch(n) >= n
+        return True
+
+    def consume(self):
+        if self.tokens.off_channel:
+            return super().consume()
+        if not 0 <= self.index < len(self.tokens.types) - self.fetchedEOF and self.LA(1) == Token.EOF:
+            raise IllegalStateException("cannot consume EOF")
+        if self.sync(self.index + 1):
+            self.index = self.adjustSeekIndex(self.index + 1)
+
+    def _lookahead(self, k: int) -> int:
+        if self.index == -1:
+            self.setup()
+        i = self.index + k - 1
+        size = len(self.tokens.types)
+        if i >= size:
+            self.sync(i)
+            size = len(self.tokens.types)
+            if i >= size:
+                i = size - 1
+        return i
+
+    # Fetching more tokens may bring in the first off-channel one, hence the second check.
+
+    def LA(self, k: int) -> int:
+        if k > 0 and not self.tokens.off_channel:
+            i = self._lookahead(k)
+            if not self.tokens.off_channel:
+                return self.tokens.types[i]
+        return super().LA(k)
+
+    def LT(self, k: int):
+        if k > 0 and not self.tokens.off_channel:
+            i = self._lookahead(k)
+            if not self.tokens.off_channel:
+                return self.tokens[i]
+        return super().LT(k)
+
+    def nextTokenOnChannel(self, i: int, channel: int) -> int:
+        if not self.tokens.off_channel:
+            self.sync(i)
+            if not self.tokens.off_channel:
+                return min(i, len(self.tokens.types) - 1)
+        return super().nextTokenOnChannel(i, channel)
+
+
 class CMLErrorListener(ErrorListener):
     def __init__(self, filename: str = None):
         super().__init__()
         self.filename = filename
         self.errors = []
+        # Set by _run_rule for the pass whose diagnostics are reported.
+        self.max_errors: Optional[int] = None
+        self.parser = None
 
     def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
         self.errors.append(Diagnostic(
@@ -54,34 +231,256 @@ class CMLErrorListener(ErrorListener):
             col=column,
             filename=self.filename
         ))
-
-def parse_file(file_path) -> CML:
+        if self.max_errors is not None and len(self.errors) >= self.max_errors:
+            raise _ErrorLimitReached(self.parser)
+
+# Prediction modes accepted by the parse functions:
+# - "auto": fast SLL prediction first, full LL re-parse only if SLL fails
+# - "sll": SLL prediction only (may report spurious errors on inputs that need full context)
+# - "ll": full LL prediction only (the ANTLR default)
+PREDICTION_MODES = ("auto", "sll", "ll")
+
+# Token sources accepted by the parse functions:
+# - "antlr": the generated CMLLexer
+# - "fast": the hand-written FastCMLLexer, which produces the same tokens much faster
+LEXERS = ("antlr", "fast")
+
+# Levels of detail accepted by the parse functions:
+# - "full": every declaration is parsed and built
+# - "strategic": bounded context bodies are skimmed down to their attributes
+#   before parsing, see cml_parser.skim
+LEVELS = ("full", "strategic")
+
+
+@dataclass
+class PredictionStats:
+    """Process-wide counters for the two-stage ("auto") prediction strategy."""
+    sll_parses: int = 0
+    ll_fallbacks: int = 0
+
+    @property
+    def fallback_rate(self) -> float:
+        total = self.sll_parses + self.ll_fallbacks
+        return self.ll_fallbacks / total if total else 0.0
+
+
+_prediction_stats = PredictionStats()
+_prediction_stats_lock = threading.Lock()
+
+
+def get_prediction_stats() -> PredictionStats:
+    """Return a snapshot of how often "auto" parses needed the full LL fallback."""
+    with _prediction_stats_lock:
+        return replace(_prediction_stats)
+
+
+def reset_prediction_stats() -> None:
+    with _prediction_stats_lock:
+        _prediction_stats.sll_parses = 0
+        _prediction_stats.ll_fallbacks = 0
+
+
+def parse_file(
+    file_path,
+    *,
+    prediction_mode: str = "auto",
+    lexer: str = "antlr",
+    token_cache: Optional["TokenCache"] = None,
+    deadline: Optional[float] = None,
+    cancellation: Optional[CancellationToken] = None,
+    limits: Optional[ParseLimits] = None,
+    level: str = "full",
+    streaming: bool = False
+) -> CML:
     """
     Strict parsing of a .cml file. Raises CmlSyntaxError on failure.
     Supports import statements - imported files are resolved relative to the main file.
+    level is one of LEVELS; "strategic" skips what is inside bounded contexts
+    apart from their attributes, along with any syntax errors there.
+    With streaming=True each top-level declaration is built as soon as it is
+    parsed and its parse tree dropped, which bounds peak memory on big files.
     """
-    return _parse_with_imports(path=file_path, text=None, strict=True)
+    return _parse_with_imports(
+        path=file_path, text=None, strict=True, prediction_mode=prediction_mode, lexer=lexer,
+        token_cache=token_cache, deadline=deadline, cancellation=cancellation, limits=limits, level=level,
+        streaming=streaming
+    )
 
-def parse_file_safe(file_path) -> CML:
+def parse_file_safe(
+    file_path,
+    *,
+    prediction_mode: str = "auto",
+    max_errors: Optional[int] = None,
+    lexer: str = "antlr",
+    token_cache: Optional["TokenCache"] = None,
+    deadline: Optional[float] = None,
+    cancellation: Optional[CancellationToken] = None,
+    limits: Optional[ParseLimits] = None,
+    level: str = "full",
+    streaming: bool = False
+) -> CML:
     """
     Non-strict parsing of a .cml file. Returns CML with parse_results containing errors.
     Supports import statements - imported files are resolved relative to the main file.
+    With max_errors, error recovery stops after that many syntax errors per file.
+    Cancellation and deadlines raise even in non-strict mode. An input that exceeds
+    limits (a ParseLimits) is reported as a diagnostic instead of being parsed further.
+    level and streaming work as for parse_file().
     """
-    return _parse_with_imports(path=file_path, text=None, strict=False)
+    return _parse_with_imports(
+        path=file_path, text=None, strict=False, prediction_mode=prediction_mode, max_errors=max_errors,
+        lexer=lexer, token_cache=token_cache, deadline=deadline, cancellation=cancellation, limits=limits,
+        level=level, streaming=streaming
+    )
 
-def parse_text(text: str, *, filename: Optional[str] = None, strict: bool = True) -> CML:
+def parse_text(
+    text: str,
+    *,
+    filename: Optional[str] = None,
+    strict: bool = True,
+    prediction_mode: str = "auto",
+    max_errors: Optional[int] = None,
+    lexer: str = "antlr",
+    token_cache: Optional["TokenCache"] = None,
+    deadline: Optional[float] = None,
+    cancellation: Optional[CancellationToken] = None,
+    limits: Optional[ParseLimits] = None,
+    level: str = "full",
+    streaming: bool = False
+) -> CML:
     """
     Parse CML from a text string.
     Note: Import statements in text will be resolved relative to filename if provided.
+    max_errors only applies to non-strict parsing; strict parsing stops at the first error.
+    lexer is one of LEXERS. With a token_cache, text that was lexed before is not lexed again.
+    deadline is a time budget in seconds for the whole call, imports included; when it
+    runs out CmlParseTimeout is raised. cancellation.cancel() (from any thread) stops
+    the parse with CmlParseCancelled. Both carry the syntax errors reported so far.
+    limits is an optional ParseLimits; a breach raises CmlLimitExceeded in strict mode
+    and is reported as a diagnostic otherwise. level and streaming work as for parse_file().
+    """
+    return _parse_with_imports(
+        path=filename, text=text, strict=strict, prediction_mode=prediction_mode, max_errors=max_errors,
+        lexer=lexer, token_cache=token_cache, deadline=deadline, cancellation=cancellation, limits=limits,
+        level=level, streaming=streaming
+    )
+
+
+# Declarations accepted by parse_fragment(), mapped to the CMLParser rule that parses them.
+FRAGMENT_KINDS = {
+    "context_map": "contextMap",
+    "bounded_context": "boundedContext",
+    "domain": "domain",
+    "subdomain": "subdomain",
+    "module": "module",
+    "aggregate": "aggregate",
+    "entity": "entity",
+    "value_object": "valueObject",
+    "domain_event": "domainEvent",
+    "command_event": "commandEvent",
+    "service": "service",
+    "repository": "repository",
+}
+
+
+def parse_fragment(
+    text: str,
+    kind: str = "aggregate",
+    *,
+    filename: Optional[str] = None,
+    prediction_mode: str = "auto",
+    lexer: str = "antlr",
+    token_cache: Optional["TokenCache"] = None,
+    deadline: Optional[float] = None,
+    cancellation: Optional[CancellationToken] = None,
+    limits: Optional[ParseLimits] = None
+) -> Any:
+    """
+    Strict parsing of a single declaration, e.g. one Aggregate or ContextMap block.
+    kind is one of FRAGMENT_KINDS. The text must contain exactly that declaration;
+    it is parsed with the matching grammar rule instead of `definitions`, so no
+    enclosing BoundedContext is needed. Returns the built object (Aggregate,
+    Entity, ContextMap, ...). Raises CmlSyntaxError on failure, CmlLimitExceeded
+    if the text exceeds limits.
     """
-    return _parse_with_imports(path=filename, text=text, strict=strict)
+    return _parse_fragment(
+        text, kind, filename, prediction_mode, lexer, token_cache, deadline, cancellation, limits
+    )
+
+
+def _parse_fragment(
+    text: str,
+    kind: str,
+    filename: Optional[str],
+    prediction_mode: str,
+    lexer: str = "antlr",
+    token_cache: Optional["TokenCache"] = None,
+    deadline: Optional[float] = None,
+    cancellation: Optional[CancellationToken] = None,
+    limits: Optional[ParseLimits] = None,
+    session: Optional["ParserSession"] = None
+) -> Any:
+    rule = FRAGMENT_KINDS.get(kind)
+    if rule is None:
+        raise ValueError(f"Unknown fragment kind {kind!r}; expected one of {', '.join(FRAGMENT_KINDS)}")
+    _check_modes(prediction_mode, lexer)
+    if deadline is not None:
+        cancellation = CancellationToken(deadline, parent=cancellation)
+
+    try:
+        if limits is not None:
+            check_source_size(limits, text)
+    except LimitBreach as breach:
+        raise _limit_error(breach, filename) from None
+
+    _load_generated()
+    load_env_dfa_cache()
+
+    token_source, token_stream, parser = _recognizers(
+        CodePointStream(text), lexer, token_cache, session, cancellation
+    )
+    error_listener = CMLErrorListener(filename)
+    token_source.removeErrorListeners()
+    token_source.addErrorListener(error_listener)
+    parser.removeErrorListeners()
+
+    try:
+        tree = _run_rule(
+            parser, token_source, token_stream, error_listener, prediction_mode, 1, rule, cancellation, limits
+        )
+    except LimitBreach as breach:
+        raise _limit_error(breach, filename) from None
+    finally:
+        enforce_cache_policy()
+
+    if error_listener.errors:
+        raise CmlSyntaxError(error_listener.errors[0])
+    try:
+        return CMLModelBuilder(filename, cancellation, limits).build_fragment(tree)
+    except CmlParseCancelled:
+        raise
+    except LimitBreach as breach:
+        raise _limit_error(breach, filename) from None
+    except Exception as e:
+        raise CmlSyntaxError(Diagnostic(message=f"Model building error: {str(e)}", filename=filename)) from e
 
 
 def _parse_with_imports(
     path: Optional[str],
     text: Optional[str],
     strict: bool,
-    _parsed_files: Optional[Set[str]] = None
+    _parsed_files: Optional[Set[str]] = None,
+    prediction_mode: str = "auto",
+    session: Optional["ParserSession"] = None,
+    max_errors: Optional[int] = None,
+    lexer: str = "antlr",
+    token_cache: Optional["TokenCache"] = None,
+    deadline: Optional[float] = None,
+    cancellation: Optional[CancellationToken] = None,
+    limits: Optional[ParseLimits] = None,
+    prefetched: Optional[dict] = None,
+    level: str = "full",
+    streaming: bool = False
 ) -> CML:
     """
     Parse a CML file with support for import statements.
@@ -96,7 +495,25 @@ def _parse_with_imports(
         text: Optional text content (if provided, path is only used for import resolution)
         strict: If True, raises CmlSyntaxError on parse errors
         _parsed_files: Internal set to track already-parsed files (prevents circular imports)
+        prediction_mode: One of PREDICTION_MODES
+        session: Optional ParserSession whose lexer/parser are reused
+        max_errors: Stop error recovery after this many syntax errors (strict parsing always stops at 1)
+        lexer: One of LEXERS
+        token_cache: Optional TokenCache holding the tokens of previously lexed texts
+        deadline: Seconds allowed for this call, imports included
+        cancellation: Optional CancellationToken checked while lexing, parsing and building
+        limits: Optional ParseLimits applied to each file
+        prefetched: Results of files parsed elsewhere (by parse_files() workers), keyed
+            by path; see cml_parser.parallel
+        level: One of LEVELS
+        streaming: Build each top-level declaration as soon as it is parsed; see cml_parser.streaming
     """
+    _check_modes(prediction_mode, lexer, level)
+    if max_errors is not None and max_errors < 1:
+        raise ValueError(f"max_errors must be a positive integer or None, got {max_errors!r}")
+    if deadline is not None:
+        cancellation = CancellationToken(deadline, parent=cancellation)
+
     # Track parsed files to prevent circular imports
     if _parsed_files is None:
         _parsed_files = set()
@@ -111,7 +528,14 @@ def _parse_with_imports(
         _parsed_files.add(abs_path)
 
     # Parse the single file (without recursing into imports yet)
-    cml, builder_imports, errors = _parse_single_file(path, text, strict)
+    if prefetched is not None and text is None and str(path) in prefetched:
+        from .parallel import unpack_result
+        cml, builder_imports, errors = unpack_result(prefetched[str(path)])
+    else:
+        cml, builder_imports, errors = _parse_single_file(
+            path, text, strict, prediction_mode, session, max_errors, lexer, token_cache, cancellation, limits,
+            level, streaming
+        )
 
     # Resolve and parse imports
     if builder_imports and path:
@@ -124,9 +548,22 @@ def _parse_with_imports(
                         path=str(resolved_path),
                         text=None,
                         strict=strict,
-                        _parsed_files=_parsed_files
+                        _parsed_files=_parsed_files,
+                        prediction_mode=prediction_mode,
+                        session=session,
+                        max_errors=max_errors,
+                        lexer=lexer,
+                        token_cache=token_cache,
+                        cancellation=cancellation,
+                        limits=limits,
+                        prefetched=prefetched,
+                        level=level,
+                        streaming=streaming
                     )
                     _merge_cml(cml, imported_cml)
+                except CmlParseCancelled as e:
+                    e.diagnostics[:0] = errors
+                    raise
                 except CmlSyntaxError as e:
                     errors.append(Diagnostic(
                         message=f"Error in imported file '{import_path}': {e.diagnostic.message}",
@@ -149,8 +586,8 @@ def _parse_with_imports(
                     if strict:
                         raise CmlSyntaxError(errors[-1])
 
-    # Update parse results with any import errors
-    if cml.parse_results:
+    # Update parse results with any import errors (usually the same list already)
+    if cml.parse_results and cml.parse_results.errors is not errors:
         cml.parse_results.errors.extend(errors)
 
     return cml
@@ -159,7 +596,16 @@ def _parse_with_imports(
 def _parse_single_file(
     path: Optional[str],
     text: Optional[str],
-    strict: bool
+    strict: bool,
+    prediction_mode: str = "auto",
+    session: Optional["ParserSession"] = None,
+    max_errors: Optional[int] = None,
+    lexer: str = "antlr",
+    token_cache: Optional["TokenCache"] = None,
+    cancellation: Optional[CancellationToken] = None,
+    limits: Optional[ParseLimits] = None,
+    level: str = "full",
+    streaming: bool = False
 ) -> tuple:
     """
     Parse a single CML file without following imports.
@@ -169,43 +615,86 @@ def _parse_single_file(
     """
     filename = str(path) if path else None
     source = text
-    if path and source is None:
-        source = Path(path).read_text(encoding="utf-8")
-
-    input_stream = InputStream(source)
-    lexer = CMLLexer(input_stream)
+    try:
+        if path and source is None:
+            if limits is not None:
+                # Check the size before reading, so an oversized file is never loaded.
+                check_source_size(limits, path=path)
+            source = Path(path).read_text(encoding="utf-8")
+        elif limits is not None:
+            check_source_size(limits, source)
+    except LimitBreach as breach:
+        return _limit_breached(breach, [], strict, filename, source)
+
+    _load_generated()
+    load_env_dfa_cache()
+
+    token_source, token_stream, parser = _recognizers(
+        CodePointStream(source), lexer, token_cache, session, cancellation, level
+    )
 
     # Custom error listener
     error_listener = CMLErrorListener(filename)
-    lexer.removeErrorListeners()
-    lexer.addErrorListener(error_listener)
-
-    token_stream = CommonTokenStream(lexer)
-    parser = CMLParser(token_stream)
+    token_source.removeErrorListeners()
+    token_source.addErrorListener(error_listener)
     parser.removeErrorListeners()
-    parser.addErrorListener(error_listener)
+
+    streaming_build = None
+    if streaming:
+        from .streaming import StreamingBuild
+        streaming_build = StreamingBuild(lambda: CMLModelBuilder(filename, cancellation, limits), token_stream)
+        parser.addParseListener(streaming_build)
 
     # Parse
-    tree = parser.definitions()
+    # Strict parsing only reports the first error, so skip the recovery after it.
+    error_limit = 1 if strict else max_errors
+    try:
+        tree = _run_rule(
+            parser, token_source, token_stream, error_listener, prediction_mode, error_limit,
+            cancellation=cancellation, limits=limits
+        )
+    except CmlParseCancelled as e:
+        e.diagnostics[:0] = error_listener.errors
+        raise
+    except LimitBreach as breach:
+        return _limit_breached(breach, error_listener.errors, strict, filename, source)
+    finally:
+        if streaming_build is not None:
+            parser.removeParseListener(streaming_build)
+        enforce_cache_policy()
 
     errors = error_listener.errors
     if errors and strict:
         raise CmlSyntaxError(errors[0])
+    truncated = error_limit is not None and len(errors) >= error_limit
 
     # Build model if no critical errors (or even if there are, try best effort)
     cml = CML()
     builder_imports = []
 
-    if not errors or not strict:
+    if tree is not None and (not errors or not strict):
         try:
-            builder = CMLModelBuilder(filename)
-            cml = builder.visit(tree)
+            if streaming_build is not None:
+                # The declarations were built during the parse; only linking is left.
+                builder = streaming_build.builder
+                cml = streaming_build.finish()
+            else:
+                builder = CMLModelBuilder(filename, cancellation, limits)
+                cml = builder.visit(tree)
             builder_imports = builder.imports  # Get collected imports
+        except CmlParseCancelled as e:
+            e.diagnostics[:0] = errors
+            raise
+        except LimitBreach as breach:
+            return _limit_breached(breach, errors, strict, filename, source)
         except Exception as e:
-            errors.append(Diagnostic(
-                message=f"Model building error: {str(e)}",
-                filename=filename
-            ))
+            # A tree cut short by max_errors is expected to be incomplete; the
+            # syntax errors already explain why the model could not be built.
+            if not truncated:
+                errors.append(Diagnostic(
+                    message=f"Model building error: {str(e)}",
+                    filename=filename
+                ))
             if strict:
                 raise CmlSyntaxError(errors[-1]) from e
 
@@ -224,6 +713,374 @@ def _parse_single_file(
     return cml, builder_imports, errors
 
 
+def _build_unlinked(
+    text: str,
+    filename: Optional[str],
+    prediction_mode: str = "auto",
+    lexer: str = "antlr",
+    session: Optional["ParserSession"] = None
+) -> Optional["CMLModelBuilder"]:
+    """
+    Parse text as `definitions` and visit it with a builder that stops before
+    linking; see cml_parser.chunks. Returns None if the text has a syntax
+    error or fails to build, so that the caller can parse serially instead.
+    """
+    tree = _parse_tree(text, filename, prediction_mode, lexer, session)
+    if tree is None:
+        return None
+
+    builder = CMLModelBuilder(filename)
+    try:
+        builder.visitChildren(tree)
+    except Exception:
+        return None
+    return builder
+
+
+def _parse_tree(
+    text: str,
+    filename: Optional[str],
+    prediction_mode: str = "auto",
+    lexer: str = "antlr",
+    session: Optional["ParserSession"] = None
+):
+    """Parse text as `definitions` and return the parse tree; None on a syntax error."""
+    _load_generated()
+    load_env_dfa_cache()
+
+    token_source, token_stream, parser = _recognizers(CodePointStream(text), lexer, None, session)
+    error_listener = CMLErrorListener(filename)
+    token_source.removeErrorListeners()
+    token_source.addErrorListener(error_listener)
+    parser.removeErrorListeners()
+    try:
+        tree = _run_rule(parser, token_source, token_stream, error_listener, prediction_mode, 1)
+    finally:
+        enforce_cache_policy()
+    if tree is None or error_listener.errors:
+        return None
+    return tree
+
+
+def _limit_error(breach: LimitBreach, filename: Optional[str]) -> CmlLimitExceeded:
+    diagnostic = Diagnostic(message=str(breach), line=breach.line, col=breach.col, filename=filename)
+    return CmlLimitExceeded(diagnostic, breach.limit)
+
+
+def _limit_breached(
+    breach: LimitBreach,
+    errors: List[Diagnostic],
+    strict: bool,
+    filename: Optional[str],
+    source: Optional[str]
+) -> tuple:
+    """
+    Stop a file that exceeded its ParseLimits: raise CmlLimitExceeded in strict
+    mode, otherwise return an empty model whose errors end with the breach.
+    """
+    error = _limit_error(breach, filename)
+    if strict:
+        raise error from None
+    errors.append(error.diagnostic)
+    cml = CML()
+    cml.parse_results = ParseResult(model=None, errors=errors, warnings=[], source=source, filename=filename)
+    return cml, [], errors
+
+
+def _check_modes(prediction_mode: str, lexer: str, level: str = "full") -> None:
+    if prediction_mode not in PREDICTION_MODES:
+        raise ValueError(
+            f"Unknown prediction_mode {prediction_mode!r}; expected one of {', '.join(PREDICTION_MODES)}"
+        )
+    if lexer not in LEXERS:
+        raise ValueError(f"Unknown lexer {lexer!r}; expected one of {', '.join(LEXERS)}")
+    if level not in LEVELS:
+        raise ValueError(f"Unknown level {level!r}; expected one of {', '.join(LEVELS)}")
+
+
+def _new_lexer(input_stream: InputStream, lexer: str):
+    return FastCMLLexer(input_stream) if lexer == "fast" else new_lexer(input_stream)
+
+
+def _recognizers(
+    input_stream: InputStream,
+    lexer: str,
+    token_cache: Optional["TokenCache"],
+    session: Optional["ParserSession"],
+    cancellation: Optional[CancellationToken] = None,
+    level: str = "full"
+) -> tuple:
+    """Return (token_source, token_stream, parser) for input_stream, from session if given."""
+    if session is not None:
+        return session._recognizers(input_stream, lexer, token_cache, cancellation, level)
+    if level == "strategic":
+        from .skim import strategic_token_source
+        token_source = strategic_token_source(input_stream, lexer, token_cache, cancellation)
+    elif token_cache is not None:
+        token_source = token_cache.token_source(input_stream, lexer, cancellation)
+    else:
+        token_source = _new_lexer(input_stream, lexer)
+    token_stream = _GuardedTokenStream(token_source)
+    return token_source, token_stream, new_parser(token_stream)
+
+
+class ParserSession:
+    """
+    Reuses one CMLLexer/CMLParser pair per thread across many parses.
+
+    Building the ANTLR recognizers is a noticeable part of parsing small
+    snippets. A session keeps them in thread-local storage and resets them
+    between documents, so it can be shared by the threads of a server.
+    Results are identical to parse_text().
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def parse(
+        self,
+        text: str,
+        *,
+        filename: Optional[str] = None,
+        strict: bool = True,
+        prediction_mode: str = "auto",
+        max_errors: Optional[int] = None,
+        lexer: str = "antlr",
+        token_cache: Optional["TokenCache"] = None,
+        deadline: Optional[float] = None,
+        cancellation: Optional[CancellationToken] = None,
+        limits: Optional[ParseLimits] = None,
+        level: str = "full",
+        streaming: bool = False
+    ) -> CML:
+        """Parse CML text like parse_text(), reusing this thread's recognizers."""
+        return _parse_with_imports(
+            path=filename,
+            text=text,
+            strict=strict,
+            prediction_mode=prediction_mode,
+            session=self,
+            max_errors=max_errors,
+            lexer=lexer,
+            token_cache=token_cache,
+            deadline=deadline,
+            cancellation=cancellation,
+            limits=limits,
+            level=level,
+            streaming=streaming
+        )
+
+    def parse_fragment(
+        self,
+        text: str,
+        kind: str = "aggregate",
+        *,
+        filename: Optional[str] = None,
+        prediction_mode: str = "auto",
+        lexer: str = "antlr",
+        token_cache: Optional["TokenCache"] = None,
+        deadline: Optional[float] = None,
+        cancellation: Optional[CancellationToken] = None,
+        limits: Optional[ParseLimits] = None
+    ) -> Any:
+        """Parse a single declaration like parse_fragment(), reusing this thread's recognizers."""
+        return _parse_fragment(
+            text, kind, filename, prediction_mode, lexer, token_cache, deadline, cancellation, limits,
+            session=self
+        )
+
+    def parse_many(
+        self,
+        texts: Iterable[str],
+        *,
+        strict: bool = True,
+        prediction_mode: str = "auto",
+        max_errors: Optional[int] = None,
+        lexer: str = "antlr",
+        token_cache: Optional["TokenCache"] = None,
+        deadline: Optional[float] = None,
+        cancellation: Optional[CancellationToken] = None,
+        limits: Optional[ParseLimits] = None,
+        level: str = "full",
+        streaming: bool = False
+    ) -> List[CML]:
+        """
+        Parse each text in turn and return one CML per input, in order.
+        In strict mode the first syntax error raises CmlSyntaxError.
+        deadline and limits apply to each text; cancellation stops the whole batch.
+        """
+        return [
+            self.parse(
+                text,
+                strict=strict,
+                prediction_mode=prediction_mode,
+                max_errors=max_errors,
+                lexer=lexer,
+                token_cache=token_cache,
+                deadline=deadline,
+                cancellation=cancellation,
+                limits=limits,
+                level=level,
+                streaming=streaming
+            )
+            for text in texts
+        ]
+
+    def _recognizers(
+        self,
+        input_stream: InputStream,
+        lexer: str = "antlr",
+        token_cache: Optional["TokenCache"] = None,
+        cancellation: Optional[CancellationToken] = None,
+        level: str = "full"
+    ) -> tuple:
+        """Return this thread's (token_source, token_stream, parser), reset onto input_stream."""
+        recognizers = getattr(self._local, "recognizers", None)
+        if recognizers is None:
+            _load_generated()
+            self._local.lexers = {}
+            token_source = self._token_source(input_stream, lexer, token_cache, cancellation, level)
+            token_stream = _GuardedTokenStream(token_source)
+            recognizers = (token_source, token_stream, new_parser(token_stream))
+            self._local.recognizers = recognizers
+            return recognizers
+
+        _, token_stream, parser = recognizers
+        token_source = self._token_source(input_stream, lexer, token_cache, cancellation, level)
+        recognizers = (token_source, token_stream, parser)
+        self._local.recognizers = recognizers
+        token_stream.setTokenSource(token_source)
+        # The previous parse may have left the bail-out strategy of "auto" mode installed.
+        parser._errHandler = DefaultErrorStrategy()
+        parser.setTokenStream(token_stream)
+        return recognizers
+
+    def _token_source(
+        self,
+        input_stream: InputStream,
+        lexer: str,
+        token_cache: Optional["TokenCache"],
+        cancellation: Optional[CancellationToken],
+        level: str = "full"
+    ):
+        if level == "strategic":
+            from .skim import strategic_token_source
+            return strategic_token_source(input_stream, lexer, token_cache, cancellation)
+        if token_cache is not None:
+            return token_cache.token_source(input_stream, lexer, cancellation)
+        # One lexer per kind is kept and reset onto each new input.
+        token_source = self._local.lexers.get(lexer)
+        if token_source is None:
+            token_source = self._local.lexers[lexer] = _new_lexer(input_stream, lexer)
+        else:
+            token_source.inputStream = input_stream
+        return token_source
+
+
+def _run_rule(
+    parser,
+    lexer,
+    token_stream,
+    error_listener,
+    prediction_mode: str,
+    max_errors: Optional[int] = None,
+    rule: str = "definitions",
+    cancellation: Optional[CancellationToken] = None,
+    limits: Optional[ParseLimits] = None
+):
+    """
+    Run the given start rule (`definitions` by default) with the requested
+    prediction strategy.
+
+    In "auto" mode the input is first parsed with SLL prediction and a bail-out
+    error strategy. SLL is exact whenever it succeeds, so only inputs on which it
+    fails (real syntax errors or decisions that need full context) are parsed a
+    second time with full LL and the default recovery, which is what produces
+    the reported diagnostics.
+
+    The reporting pass stops once max_errors diagnostics were collected and
+    returns the partial tree built so far. cancellation is checked by the
+    parser's predictions and whenever the token stream pulls from the lexer;
+    so is limits.max_tokens, while a parse listener enforces limits.max_depth.
+    """
+    start = getattr(parser, rule)
+    parser._interp.cancellation = cancellation
+    token_stream.cancellation = cancellation
+    depth_guard = None
+    if limits is not None:
+        token_stream.max_tokens = limits.max_tokens
+        if limits.max_depth is not None:
+            depth_guard = DepthGuard(limits.max_depth)
+            parser.addParseListener(depth_guard)
+    try:
+        if prediction_mode == "auto":
+            parser._interp.predictionMode = PredictionMode.SLL
+            parser._errHandler = BailErrorStrategy()
+            try:
+                tree = start()
+                _expect_end_of_input(parser, token_stream, rule)
+                with _prediction_stats_lock:
+                    _prediction_stats.sll_parses += 1
+                return tree
+            except ParseCancellationException:
+                with _prediction_stats_lock:
+                    _prediction_stats.ll_fallbacks += 1
+
+            if error_listener.errors:
+                # Lexer errors interleave with parser errors in the diagnostics,
+                # so re-lex to report them in the same order as a plain LL parse.
+                error_listener.errors.clear()
+                lexer.reset()
+                token_stream.setTokenSource(lexer)
+            # Parser.reset() fails with parse listeners attached (it removes the
+            # tracer, None, from their list); they stay attached for the LL pass.
+            listeners, parser._parseListeners = parser._parseListeners, None
+            parser.reset()
+            parser._parseListeners = listeners
+            parser._errHandler = DefaultErrorStrategy()
+            prediction_mode = "ll"
+
+        parser._interp.predictionMode = PredictionMode.SLL if prediction_mode == "sll" else PredictionMode.LL
+        parser.addErrorListener(error_listener)
+        error_listener.max_errors = max_errors
+        error_listener.parser = parser
+        try:
+            tree = start()
+            _expect_end_of_input(parser, token_stream, rule)
+            return tree
+        except _ErrorLimitReached as stop:
+            return stop.tree
+        finally:
+            error_listener.max_errors = None
+            error_listener.parser = None
+    finally:
+        parser._interp.flush_counts()
+        parser._interp.cancellation = None
+        token_stream.cancellation = None
+        token_stream.max_tokens = None
+        if depth_guard is not None:
+            parser.removeParseListener(depth_guard)
+
+
+def _expect_end_of_input(parser, token_stream, rule: str) -> None:
+    """
+    Report input left over after a fragment rule.
+
+    `definitions` ends with EOF in the grammar, the fragment rules do not, so
+    "Aggregate A {} Aggregate B {}" would otherwise parse as just A.
+    """
+    if rule == "definitions":
+        return
+    token = token_stream.LT(1)
+    if token.type == Token.EOF:
+        return
+    if isinstance(parser._errHandler, BailErrorStrategy):
+        raise ParseCancellationException("extraneous input after the fragment")
+    parser.notifyErrorListeners(
+        f"extraneous input {parser._errHandler.getTokenErrorDisplay(token)} expecting <EOF>", token, None
+    )
+
+
 def _resolve_import_path(import_path: str, base_dir: Path) -> Optional[Path]:
     """
     Resolve an import path relative to a base directory.
@@ -368,13 +1225,79 @@ def main(argv=None) -> int:
     parser.add_argument("file", nargs="?", help="Path to .cml file")
     parser.add_argument("--json", action="store_true", help="Emit parse result as JSON")
     parser.add_argument("--summary", action="store_true", help="Print a short success summary")
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        metavar="N",
+        help="Stop error recovery after N syntax errors",
+    )
+    parser.add_argument(
+        "--level",
+        default="full",
+        choices=LEVELS,
+        help="Parse everything, or skim bounded context bodies down to their attributes (default: full)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Build each top-level declaration as soon as it is parsed, without keeping the whole parse tree",
+    )
+    parser.add_argument(
+        "--dfa-cache",
+        metavar="PATH",
+        help="Load warmed parser DFAs from PATH before parsing and update PATH afterwards",
+    )
+    parser.add_argument(
+        "--profile-grammar",
+        nargs="+",
+        metavar="FILE",
+        help="Profile grammar decisions while parsing FILE(s) and print per-decision statistics",
+    )
+    parser.add_argument(
+        "--profile-sort",
+        default="time",
+        choices=("time", "invocations", "ll_fallbacks", "sll_max_look", "ambiguities"),
+        help="Sort key for the --profile-grammar table (default: time)",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        metavar="N",
+        help="Only show the N highest-ranked decisions in the --profile-grammar table",
+    )
+    parser.add_argument(
+        "--outline",
+        nargs="+",
+        metavar="FILE",
+        help="List the declarations in FILE(s) with their line spans, without parsing them",
+    )
     parsed = parser.parse_args(args)
 
+    if parsed.profile_grammar:
+        return _profile_grammar_main(parsed)
+
+    if parsed.outline:
+        return _outline_main(parsed)
+
     if not parsed.file:
         parser.print_usage(file=sys.stderr)
         return 1
 
-    cml = parse_file_safe(parsed.file)
+    if parsed.max_errors is not None and parsed.max_errors < 1:
+        parser.error("--max-errors must be a positive integer")
+
+    if parsed.dfa_cache:
+        _load_generated()
+        load_dfa_cache(parsed.dfa_cache)
+        states_before = dfa_state_count()
+
+    cml = parse_file_safe(parsed.file, max_errors=parsed.max_errors, level=parsed.level, streaming=parsed.streaming)
+
+    if parsed.dfa_cache and dfa_state_count() != states_before:
+        try:
+            save_dfa_cache(parsed.dfa_cache)
+        except OSError as e:
+            print(f"Warning: could not write DFA cache {parsed.dfa_cache}: {e}", file=sys.stderr)
     if not cml.parse_results.ok:
         print(f"Error parsing {parsed.file}:", file=sys.stderr)
         for err in cml.parse_results.errors:
@@ -395,5 +1318,42 @@ def main(argv=None) -> int:
     print(f"Successfully parsed {parsed.file}")
     return 0
 
+def _profile_grammar_main(parsed) -> int:
+    """Run the --profile-grammar CLI mode."""
+    from .profiling import profile_grammar
+
+    try:
+        profile = profile_grammar(parsed.profile_grammar)
+    except OSError as e:
+        print(f"Error reading {e.filename}: {e.strerror}", file=sys.stderr)
+        return 1
+
+    if parsed.json:
+        print(json.dumps(profile.to_dict(), indent=2))
+    else:
+        print(profile.format_table(sort_by=parsed.profile_sort, limit=parsed.profile_top))
+
+    failed = [path for path, count in profile.syntax_errors.items() if count]
+    for path in failed:
+        print(f"Warning: {path} has {profile.syntax_errors[path]} syntax error(s)", file=sys.stderr)
+    return 1 if failed else 0
+
+def _outline_main(parsed) -> int:
+    """Run the --outline CLI mode."""
+    from .outline import outline_files
+
+    try:
+        entries = outline_files(parsed.outline)
+    except OSError as e:
+        print(f"Error reading {e.filename}: {e.strerror}", file=sys.stderr)
+        return 1
+
+    if parsed.json:
+        print(json.dumps([entry._asdict() for entry in entries], indent=2))
+    else:
+        for entry in entries:
+            print(f"{entry.file}:{entry.start}-{entry.end}\t{entry.kind}\t{entry.qualified_name}")
+    return 0
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+Per-decision profiling of the CML grammar.
+
+The Python ANTLR runtime has no ProfilingATNSimulator, so this module provides
+one modelled on the Java runtime's: every adaptivePredict() call is timed and
+its SLL and full-context (LL) lookahead depth, fallbacks, ambiguities and DFA
+misses are recorded against the decision number, which maps back to a rule
+name in CML.g4.
+"""
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import time
+
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.atn.PredictionMode import PredictionMode
+
+from .antlr.CMLParser import CMLParser
+from .dfa_cache import _lock, new_lexer
+
+# Sort keys accepted by GrammarProfile.format_table().
+SORT_KEYS = ("time", "invocations", "ll_fallbacks", "sll_max_look", "ambiguities")
+
+
+@dataclass
+class DecisionProfile:
+    """Statistics for one grammar decision, summed over all profiled parses."""
+    decision: int
+    rule: str
+    invocations: int = 0
+    time_ns: int = 0
+    sll_total_look: int = 0
+    sll_min_look: int = 0
+    sll_max_look: int = 0
+    sll_atn_transitions: int = 0
+    sll_dfa_transitions: int = 0
+    ll_fallbacks: int = 0
+    ll_total_look: int = 0
+    ll_min_look: int = 0
+    ll_max_look: int = 0
+    ll_atn_transitions: int = 0
+    ambiguities: int = 0
+    context_sensitivities: int = 0
+    errors: int = 0
+
+    @property
+    def sll_avg_look(self) -> float:
+        return self.sll_total_look / self.invocations if self.invocations else 0.0
+
+    @property
+    def ll_avg_look(self) -> float:
+        return self.ll_total_look / self.ll_fallbacks if self.ll_fallbacks else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["time_ms"] = self.time_ns / 1e6
+        data["sll_avg_look"] = self.sll_avg_look
+        data["ll_avg_look"] = self.ll_avg_look
+        return data
+
+
+@dataclass
+class GrammarProfile:
+    """Result of profile_grammar(): invoked decisions plus per-file totals."""
+    files: List[str] = field(default_factory=list)
+    syntax_errors: Dict[str, int] = field(default_factory=dict)
+    decisions: List[DecisionProfile] = field(default_factory=list)
+
+    @property
+    def total_time_ns(self) -> int:
+        return sum(d.time_ns for d in self.decisions)
+
+    def to_dict(self) -> dict:
+        return {
+            "files": self.files,
+            "syntax_errors": self.syntax_errors,
+            "total_time_ms": self.total_time_ns / 1e6,
+            "decisions": [d.to_dict() for d in self.decisions],
+        }
+
+    def format_table(self, sort_by: str = "time", limit: Optional[int] = None) -> str:
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {sort_by!r}; expected one of {', '.join(SORT_KEYS)}")
+        attr = "time_ns" if sort_by == "time" else sort_by
+        rows = sorted(self.decisions, key=lambda d: (-getattr(d, attr), d.decision))
+        if limit is not None:
+            rows = rows[:limit]
+        header = (
+            f"{'decision':>8}  {'rule':<32} {'calls':>8} {'time ms':>9} "
+            f"{'SLL k avg/max':>13} {'LL fb':>6} {'LL k avg/max':>12} "
+            f"{'ambig':>6} {'ctx':>5} {'ATN':>6} {'err':>4}"
+        )
+        lines = [header, "-" * len(header)]
+        for d in rows:
+            lines.append(
+                f"{d.decision:>8}  {d.rule[:32]:<32} {d.invocations:>8} {d.time_ns / 1e6:>9.2f} "
+                f"{d.sll_avg_look:>8.2f}/{d.sll_max_look:<4} {d.ll_fallbacks:>6} "
+                f"{d.ll_avg_look:>7.2f}/{d.ll_max_look:<4} "
+                f"{d.ambiguities:>6} {d.context_sensitivities:>5} "
+                f"{d.sll_atn_transitions + d.ll_atn_transitions:>6} {d.errors:>4}"
+            )
+        lines.append(f"Total prediction time: {self.total_time_ns / 1e6:.2f} ms over {len(self.files)} file(s)")
+        return "\n".join(lines)
+
+
+class ProfilingParserATNSimulator(ParserATNSimulator):
+    """
+    ParserATNSimulator that records DecisionProfile statistics for each
+    prediction. It shares the parser DFAs, so like the parsers of
+    dfa_cache.new_parser() it adds states and edges under the module lock.
+    """
+
+    def __init__(self, parser, atn, decisionToDFA, sharedContextCache, decisions: List[DecisionProfile]):
+        super().__init__(parser, atn, decisionToDFA, sharedContextCache)
+        self.decisions = decisions
+        self._current = None
+        self._sll_stop_index = -1
+        self._ll_stop_index = -1
+        self._conflicting_alt_resolved_by_sll = None
+
+    def adaptivePredict(self, input, decision, outerContext):
+        info = self.decisions[decision]
+        self._current = info
+        self._sll_stop_index = -1
+        self._ll_stop_index = -1
+        start = time.perf_counter_ns()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            info.time_ns += time.perf_counter_ns() - start
+            info.invocations += 1
+            sll_k = self._sll_stop_index - self._startIndex + 1
+            info.sll_total_look += sll_k
+            info.sll_min_look = sll_k if info.invocations == 1 else min(info.sll_min_look, sll_k)
+            info.sll_max_look = max(info.sll_max_look, sll_k)
+            if self._ll_stop_index >= 0:
+                ll_k = self._ll_stop_index - self._startIndex + 1
+                info.ll_total_look += ll_k
+                info.ll_min_look = ll_k if info.ll_min_look == 0 else min(info.ll_min_look, ll_k)
+                info.ll_max_look = max(info.ll_max_look, ll_k)
+            self._current = None
+
+    def addDFAState(self, dfa, D):
+        with _lock:
+            return super().addDFAState(dfa, D)
+
+    def addDFAEdge(self, dfa, from_, t, to):
+        with _lock:
+            return super().addDFAEdge(dfa, from_, t, to)
+
+    def getExistingTargetState(self, previousD, t):
+        # Called each time the input advances during SLL prediction.
+        self._sll_stop_index = self._input.index
+        existing = super().getExistingTargetState(previousD, t)
+        if existing is not None and self._current is not None:
+            self._current.sll_dfa_transitions += 1
+            if existing is ATNSimulator.ERROR:
+                self._current.errors += 1
+        return existing
+
+    def computeReachSet(self, closure, t, fullCtx):
+        if fullCtx:
+            # Called each time the input advances during full-context prediction.
+            self._ll_stop_index = self._input.index
+        reach = super().computeReachSet(closure, t, fullCtx)
+        if self._current is not None:
+            if fullCtx:
+                self._current.ll_atn_transitions += 1
+            else:
+                self._current.sll_atn_transitions += 1
+            if reach is None:
+                self._current.errors += 1
+        return reach
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex, stopIndex):
+        alts = conflictingAlts if conflictingAlts is not None else configs.getAlts()
+        self._conflicting_alt_resolved_by_sll = min(alts) if alts else None
+        self.decisions[dfa.decision].ll_fallbacks += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex, stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        if prediction != self._conflicting_alt_resolved_by_sll:
+            self.decisions[dfa.decision].context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self.decisions[dfa.decision].ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+def profile_grammar(paths: Iterable, *, prediction_mode: str = "ll") -> GrammarProfile:
+    """
+    Parse each file with the profiling simulator and return per-decision statistics.
+
+    prediction_mode is "ll" (SLL first with per-decision full-context fallback,
+    as ANTLR does by default) or "sll". Imports are not followed.
+    """
+    from .parser import CMLErrorListener
+
+    if prediction_mode not in ("ll", "sll"):
+        raise ValueError(f"Unknown prediction_mode {prediction_mode!r}; expected 'll' or 'sll'")
+
+    atn = CMLParser.atn
+    decisions = [
+        DecisionProfile(decision=i, rule=CMLParser.ruleNames[state.ruleIndex])
+        for i, state in enumerate(atn.decisionToState)
+    ]
+    profile = GrammarProfile()
+    for path in paths:
+        path = str(path)
+        source = Path(path).read_text(encoding="utf-8")
+        error_listener = CMLErrorListener(path)
+
+        lexer = new_lexer(InputStream(source))
+        lexer.removeErrorListeners()
+        lexer.addErrorListener(error_listener)
+        parser = CMLParser(CommonTokenStream(lexer))
+        parser._interp = ProfilingParserATNSimulator(
+            parser, atn, parser.decisionsToDFA, parser.sharedContextCache, decisions
+        )
+        parser._interp.predictionMode = PredictionMode.SLL if prediction_mode == "sll" else PredictionMode.LL
+        parser.removeErrorListeners()
+        parser.addErrorListener(error_listener)
+        parser.definitions()
+
+        profile.files.append(path)
+        profile.syntax_errors[path] = len(error_listener.errors)
+
+    profile.decisions = [d for d in decisions if d.invocations]
+    return profile
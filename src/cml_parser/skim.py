@@ -0,0 +1,240 @@
+"""
+Strategic-level skimming of bounded context bodies.
+
+With level="strategic" the parse functions only build what context maps and
+domain models need: context maps and their relationships, domains,
+subdomains, and bounded contexts with their header and attributes (type,
+domainVisionStatement, implementationTechnology, ...). Aggregates, modules,
+services and the other tactical declarations inside a BoundedContext body are
+removed from the token stream before the parser sees it, by brace matching,
+so the parser never predicts inside them. Only the attributes written
+directly in the body are kept; they are parsed and built as usual.
+
+A body is kept whole when removing its declarations could change the
+strategic model: when it declares a context map, domain, subdomain or use
+case, when one of its modules sets a context attribute, when an attribute
+directly in the body is malformed, or when its braces do not balance.
+Declarations outside bounded contexts are always parsed in full.
+"""
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Tuple
+
+from antlr4.InputStream import InputStream
+from antlr4.Token import Token
+
+from .antlr.CMLParser import CMLParser
+from .fast_lexer import FastCMLLexer
+from .streams import CodePointStream
+from .token_store import TokenStore
+from .tokens import CachedTokenSource, TokenCache, TokenInfo, _CollectErrors, _LexedText, _lex
+
+
+def _literal(text: str) -> int:
+    return CMLParser.literalNames.index(f"'{text}'")
+
+
+def _first_set(rule: int) -> frozenset:
+    """The token types a rule can start with."""
+    atn = CMLParser.atn
+    return frozenset(atn.nextTokens(atn.ruleToStartState[rule]))
+
+
+_BOUNDED_CONTEXT = _literal("BoundedContext")
+_AGGREGATE = _literal("Aggregate")
+_OPEN, _CLOSE = _literal("{"), _literal("}")
+_COMMA, _EQUALS = _literal(","), _literal("=")
+_LINKS = {_literal("implements"): True, _literal("realizes"): True, _literal("refines"): False}
+_NAMES = _first_set(CMLParser.RULE_name)
+_STRINGS = frozenset((CMLParser.STRING,))
+
+# Each boundedContextAttribute keyword, with the tokens its value can be made
+# of and whether the value is a comma-separated list.
+_ATTRIBUTES = {
+    _literal("type"): (_first_set(CMLParser.RULE_boundedContextType), False),
+    _literal("domainVisionStatement"): (_STRINGS, False),
+    _literal("implementationTechnology"): (_STRINGS, False),
+    _literal("responsibilities"): (_STRINGS, True),
+    _literal("knowledgeLevel"): (_first_set(CMLParser.RULE_knowledgeLevel), False),
+    _literal("businessModel"): (_STRINGS, False),
+    _literal("evolution"): (_first_set(CMLParser.RULE_evolutionType), False),
+    _literal("realizes"): (_NAMES, True),
+}
+
+# Declarations that add to the model outside their bounded context.
+_STRATEGIC = frozenset(
+    _literal(keyword) for keyword in ("ContextMap", "Domain", "Subdomain", "UseCase", "BoundedContext")
+)
+
+
+def strategic_token_source(
+    input_stream: InputStream,
+    lexer: str,
+    token_cache: Optional[TokenCache] = None,
+    cancellation=None
+) -> CachedTokenSource:
+    """
+    Lex input_stream (or take its tokens from token_cache) and return a token
+    source replaying them with bounded context bodies skimmed.
+    """
+    text = input_stream.strdata
+    if token_cache is not None:
+        lexed = skim_contexts(token_cache._lexed(text, lexer, cancellation))
+    elif lexer == "fast":
+        lexed = _skim_fast(text, cancellation)
+    else:
+        lexed = skim_contexts(_lex(text, lexer, cancellation))
+    return CachedTokenSource(lexed, input_stream)
+
+
+def skim_contexts(lexed: _LexedText) -> _LexedText:
+    """Remove everything but the attributes from the bounded context bodies in lexed."""
+    tokens = lexed.tokens
+    kept = _kept([token.type for token in tokens])
+    if len(kept) == len(tokens):
+        return lexed
+    return _LexedText(
+        tuple(tokens[i] for i in kept), _move_errors(lexed.errors, kept), lexed.eof_line, lexed.eof_column
+    )
+
+
+def _skim_fast(text: str, cancellation=None) -> _LexedText:
+    """
+    skim_contexts() for text lexed with FastCMLLexer into a TokenStore, which
+    only creates TokenInfo tuples for the tokens that are kept.
+    """
+    token_source = FastCMLLexer(CodePointStream(text))
+    store = TokenStore()
+    listener = _CollectErrors(store)
+    token_source.removeErrorListeners()
+    token_source.addErrorListener(listener)
+    types = store.types
+    while not types or types[-1] != Token.EOF:
+        if cancellation is not None:
+            cancellation.check()
+        token_source.fetch_into(store, 1024)
+    size = len(types) - 1
+    kept = _kept(types[:size])
+    starts, stops, lines, columns = store.starts, store.stops, store.lines, store.columns
+    tokens = tuple(
+        TokenInfo(types[i], text[starts[i]:stops[i] + 1], starts[i], stops[i], lines[i], columns[i])
+        for i in kept
+    )
+    return _LexedText(tokens, _move_errors(listener.errors, kept), lines[size], columns[size])
+
+
+def _kept(types: Sequence[int]) -> List[int]:
+    """Indexes of the tokens left once bounded context bodies are skimmed."""
+    ranges: List[Tuple[int, int]] = []
+    start = 0
+    i = 0
+    while True:
+        try:
+            i = types.index(_BOUNDED_CONTEXT, i) + 1
+        except ValueError:
+            break
+        body = _body(types, i)
+        skimmed = _skim_body(types, body + 1) if body is not None else None
+        if skimmed is None:
+            continue
+        attributes, close = skimmed
+        ranges.append((start, body + 1))
+        ranges.extend(attributes)
+        start = i = close
+    ranges.append((start, len(types)))
+    return [i for first, end in ranges for i in range(first, end)]
+
+
+def _move_errors(errors: tuple, kept: List[int]) -> tuple:
+    """Lexer errors, reported before the first kept token at or after the one they preceded."""
+    return tuple((bisect_left(kept, index), line, column, msg) for index, line, column, msg in errors)
+
+
+def _type(types: Sequence[int], i: int) -> int:
+    return types[i] if i < len(types) else -1
+
+
+def _body(types: Sequence[int], i: int) -> Optional[int]:
+    """Index of the '{' opening the body of the bounded context named at types[i], if any."""
+    if _type(types, i) not in _NAMES:
+        return None
+    i += 1
+    while True:
+        kind = _type(types, i)
+        if kind == _OPEN:
+            return i
+        if kind not in _LINKS or _type(types, i + 1) not in _NAMES:
+            return None
+        i += 2
+        if _LINKS[kind]:
+            while _type(types, i) == _COMMA and _type(types, i + 1) in _NAMES:
+                i += 2
+
+
+def _skim_body(types: Sequence[int], i: int) -> Optional[Tuple[List[Tuple[int, int]], int]]:
+    """
+    Ranges of the attributes in the body starting at types[i], and the index
+    of its closing '}'; None if the body has to be kept whole.
+    """
+    ranges = []
+    while i < len(types):
+        kind = types[i]
+        if kind == _CLOSE:
+            return ranges, i
+        if kind in _ATTRIBUTES:
+            end = _attribute_end(types, i)
+            if end is None:
+                return None
+            ranges.append((i, end))
+            i = end
+        elif kind == _OPEN:
+            i = _block_end(types, i)
+            if i is None:
+                return None
+        elif kind in _STRATEGIC:
+            return None
+        else:
+            i += 1
+    return None
+
+
+def _attribute_end(types: Sequence[int], i: int) -> Optional[int]:
+    """Index after the boundedContextAttribute at types[i]; None if it is malformed."""
+    values, is_list = _ATTRIBUTES[types[i]]
+    i += 1
+    if _type(types, i) == _EQUALS:
+        i += 1
+    if _type(types, i) not in values:
+        return None
+    i += 1
+    if is_list:
+        while _type(types, i) == _COMMA and _type(types, i + 1) in values:
+            i += 2
+    if _type(types, i) == _COMMA:
+        return None
+    return i
+
+
+def _block_end(types: Sequence[int], i: int) -> Optional[int]:
+    """
+    Index after the block opened at types[i], inside a bounded context body;
+    None if it does not end or may change the strategic model. Attributes in
+    an aggregate belong to the aggregate, anywhere else to the bounded context.
+    """
+    in_aggregate = [_opens_aggregate(types, i)]
+    i += 1
+    while i < len(types):
+        kind = types[i]
+        if kind == _OPEN:
+            in_aggregate.append(in_aggregate[-1] or _opens_aggregate(types, i))
+        elif kind == _CLOSE:
+            in_aggregate.pop()
+            if not in_aggregate:
+                return i + 1
+        elif kind in _STRATEGIC or (kind in _ATTRIBUTES and not in_aggregate[-1]):
+            return None
+        i += 1
+    return None
+
+
+def _opens_aggregate(types: Sequence[int], i: int) -> bool:
+    return i >= 2 and types[i - 2] == _AGGREGATE and types[i - 1] in _NAMES
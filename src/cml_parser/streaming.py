@@ -0,0 +1,81 @@
+"""
+Streaming model construction.
+
+With streaming=True the parse functions build the model while the file is
+being parsed: a parse listener hands every top-level declaration (and import)
+to the CMLModelBuilder as soon as the parser exits it, then detaches its
+subtree from the `definitions` context and drops the token objects it used.
+The complete parse tree of the file never exists at once, so peak memory
+follows the largest top-level declaration rather than the whole file. The
+token arrays of the TokenStore are still kept for the whole parse.
+
+Where the SLL pass fails and the file is parsed again with LL, the model
+built so far is discarded and built again from the second pass.
+"""
+from typing import Callable, Optional
+
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.tree.Tree import ParseTreeListener
+
+from .antlr.CMLParser import CMLParser
+from .cancellation import CmlParseCancelled
+from .cml_model_builder import CMLModelBuilder
+from .cml_objects import CML
+from .limits import LimitBreach
+from .token_store import TokenStore
+
+
+class StreamingBuild(ParseTreeListener):
+    """
+    Parse listener building each child of the `definitions` context as it is
+    exited. An exception from the builder stops the build (later declarations
+    are only dropped) and is raised again by finish(); cancellation and
+    LimitBreach propagate at once and stop the parse.
+    """
+
+    def __init__(self, make_builder: Callable[[], CMLModelBuilder], token_stream):
+        self.make_builder = make_builder
+        self.token_stream = token_stream
+        self.builder: Optional[CMLModelBuilder] = None
+        self.error: Optional[Exception] = None
+        # Tokens before this index have had their token objects released.
+        self.released = 0
+
+    def enterDefinitions(self, ctx):
+        # Every parse attempt, the LL pass after a failed SLL pass included, starts here.
+        self.builder = self.make_builder()
+        self.error = None
+        self.released = 0
+
+    def exitImports(self, ctx):
+        self._build(ctx)
+
+    def exitTopLevel(self, ctx):
+        self._build(ctx)
+
+    def finish(self) -> CML:
+        """Link the built declarations and return the model, like visitDefinitions()."""
+        if self.error is not None:
+            raise self.error
+        return self.builder.finish()
+
+    def _build(self, ctx):
+        parent = ctx.parentCtx
+        if not isinstance(parent, CMLParser.DefinitionsContext):
+            return
+        # A failing SLL pass unwinds through here; the LL pass builds the model again.
+        bailing = ctx.exception is not None and isinstance(ctx.parser._errHandler, BailErrorStrategy)
+        if self.error is None and not bailing:
+            try:
+                self.builder.visit(ctx)
+            except (CmlParseCancelled, LimitBreach):
+                raise
+            except Exception as e:
+                self.error = e
+        if parent.children and parent.children[-1] is ctx:
+            parent.children.pop()
+        tokens = self.token_stream.tokens
+        if ctx.stop is not None and isinstance(tokens, TokenStore):
+            end = ctx.stop.tokenIndex + 1
+            tokens.release(self.released, end)
+            self.released = max(self.released, end)
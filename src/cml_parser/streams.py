@@ -0,0 +1,48 @@
+"""
+Character streams for the CML lexers.
+
+antlr4.InputStream turns the whole source into a list of Python ints, one
+8-byte pointer per character (plus an int object for every character above
+U+00FF), and builds it with a Python-level loop. CodePointStream keeps the
+same interface but only builds its code points when a lexer first asks for
+one: the fast lexer and cached token sources work on the str directly and
+never do. The code points are then a bytes object for ASCII sources (1 byte
+per character) or a UTF-32 buffer otherwise (4 bytes per character), both
+produced by a single encode. getText() slices the original str.
+"""
+from antlr4.InputStream import InputStream
+from antlr4.Token import Token
+
+
+def code_points(text: str):
+    """Return a sequence indexing to the code points of text, as compact as the text allows."""
+    if text.isascii():
+        return text.encode("ascii")
+    # The BOM selects native byte order, so the buffer can be viewed as unsigned ints.
+    return memoryview(text.encode("utf-32", "surrogatepass"))[4:].cast("I")
+
+
+class CodePointStream(InputStream):
+    """Drop-in replacement for antlr4.InputStream with a compact, lazily built buffer."""
+    __slots__ = ()
+
+    def _loadString(self):
+        self._index = 0
+        self._size = len(self.strdata)
+        self.data = None
+
+    def LA(self, offset: int):
+        if offset == 0:
+            return 0  # undefined
+        if offset < 0:
+            offset += 1  # LA(-1) is the previous character
+        pos = self._index + offset - 1
+        if pos < 0 or pos >= self._size:
+            return Token.EOF
+        data = self.data
+        if data is None:
+            data = self.data = code_points(self.strdata)
+        return data[pos]
+
+    def LT(self, offset: int):
+        return self.LA(offset)
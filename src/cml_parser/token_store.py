@@ -0,0 +1,147 @@
+"""
+Array-backed token buffer for the parser's token stream.
+
+CommonTokenStream keeps one CommonToken per token, and the lexers allocate a
+text string and several int objects for each one, about 270 bytes per token
+in all. TokenStore keeps types, channels, offsets, lines and columns in
+parallel arrays instead (20 bytes per token), plus a list with one 8-byte
+slot per token for the token objects, 28 bytes per token in all. A token
+object is created the first time the parser asks for one, as a StoredToken
+view reading its fields from the arrays; its text is sliced from the input
+stream on access.
+Lookahead during prediction reads the type array directly.
+"""
+from array import array
+from typing import Dict, Iterator, Optional
+
+from antlr4.Token import CommonToken, Token
+
+
+class StoredToken(Token):
+    """A Token whose fields live in a TokenStore; read-only except for text."""
+    __slots__ = ("_store",)
+
+    def __init__(self, store: "TokenStore", index: int):
+        self._store = store
+        self.tokenIndex = index
+
+    @property
+    def type(self) -> int:
+        return self._store.types[self.tokenIndex]
+
+    @property
+    def channel(self) -> int:
+        return self._store.channels[self.tokenIndex]
+
+    @property
+    def start(self) -> int:
+        return self._store.starts[self.tokenIndex]
+
+    @property
+    def stop(self) -> int:
+        return self._store.stops[self.tokenIndex]
+
+    @property
+    def line(self) -> int:
+        return self._store.lines[self.tokenIndex]
+
+    @property
+    def column(self) -> int:
+        return self._store.columns[self.tokenIndex]
+
+    @property
+    def source(self) -> tuple:
+        return self._store.source
+
+    @property
+    def text(self) -> Optional[str]:
+        store = self._store
+        index = self.tokenIndex
+        if index in store.texts:
+            return store.texts[index]
+        input = store.source[1]
+        if input is None:
+            return None
+        start, stop = store.starts[index], store.stops[index]
+        if start < input.size and stop < input.size:
+            return input.getText(start, stop)
+        return "<EOF>"
+
+    @text.setter
+    def text(self, text: str):
+        self._store.texts[self.tokenIndex] = text
+
+    __str__ = CommonToken.__str__
+
+
+class TokenStore:
+    """
+    The tokens of one parse, as a sequence of StoredToken indexed like
+    BufferedTokenStream.tokens. off_channel is set once a token outside the
+    default channel is added, so streams know when lookahead must skip tokens.
+    """
+    __slots__ = (
+        "types", "channels", "starts", "stops", "lines", "columns",
+        "texts", "source", "off_channel", "_views",
+    )
+
+    def __init__(self):
+        self.types = array("h")
+        self.channels = array("h")
+        self.starts = array("i")
+        self.stops = array("i")
+        self.lines = array("i")
+        self.columns = array("i")
+        # Explicit texts set by the token source or later; usually empty.
+        self.texts: Dict[int, str] = {}
+        self.source = CommonToken.EMPTY_SOURCE
+        self.off_channel = False
+        self._views = []
+
+    def append(self, token: Token) -> None:
+        """Copy the fields of a token produced by a token source."""
+        if not self._views:
+            self.source = token.source
+        if token._text is not None:
+            self.texts[len(self._views)] = token._text
+        if token.channel != Token.DEFAULT_CHANNEL:
+            self.off_channel = True
+        self.types.append(token.type)
+        self.channels.append(token.channel)
+        self.starts.append(token.start)
+        self.stops.append(token.stop)
+        self.lines.append(token.line)
+        self.columns.append(token.column)
+        self._views.append(None)
+
+    def add(self, type: int, start: int, stop: int, line: int, column: int) -> None:
+        """Add a default-channel token from its fields; see FastCMLLexer.fetch_into()."""
+        self.types.append(type)
+        self.channels.append(Token.DEFAULT_CHANNEL)
+        self.starts.append(start)
+        self.stops.append(stop)
+        self.lines.append(line)
+        self.columns.append(column)
+        self._views.append(None)
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def release(self, start: int, stop: int) -> None:
+        """Drop the token objects of indexes start..stop-1; asking for them again creates new ones."""
+        views = self._views
+        for index in range(start, min(stop, len(views))):
+            views[index] = None
+
+    def __getitem__(self, index: int) -> StoredToken:
+        views = self._views
+        token = views[index]
+        if token is None:
+            if index < 0:
+                index += len(views)
+            token = views[index] = StoredToken(self, index)
+        return token
+
+    def __iter__(self) -> Iterator[StoredToken]:
+        for index in range(len(self._views)):
+            yield self[index]
@@ -0,0 +1,247 @@
+"""
+Lexer-only access to CML tokens.
+
+tokenize() runs only the lexer and yields lightweight TokenInfo tuples, for
+tools such as syntax highlighters and diff viewers that never need a parse
+tree or a model. A TokenCache keeps the token arrays of recently seen texts,
+keyed by a hash of their content. The same cache can be passed to the parse
+functions as token_cache=, which then replay the cached tokens into the
+parser instead of lexing a text that has not changed.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Iterator, NamedTuple, Optional, Tuple
+import hashlib
+import threading
+
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.InputStream import InputStream
+from antlr4.Lexer import TokenSource
+from antlr4.Recognizer import Recognizer
+from antlr4.Token import CommonToken, Token
+from antlr4.error.ErrorListener import ErrorListener
+
+from .antlr.CMLParser import CMLParser
+from .streams import CodePointStream
+
+
+class TokenInfo(NamedTuple):
+    """One token: type is a CMLParser token type, start/stop are inclusive character offsets."""
+    type: int
+    text: str
+    start: int
+    stop: int
+    line: int
+    column: int
+
+    @property
+    def name(self) -> str:
+        """Display name of the token type, e.g. "ID", "STRING" or "'Aggregate'"."""
+        if self.type < len(CMLParser.literalNames) and CMLParser.literalNames[self.type] != "<INVALID>":
+            return CMLParser.literalNames[self.type]
+        return CMLParser.symbolicNames[self.type]
+
+
+@dataclass(frozen=True)
+class _LexedText:
+    """Cached lexer output for one text."""
+    tokens: Tuple[TokenInfo, ...]
+    # (index of the token the error precedes, line, column, message)
+    errors: Tuple[Tuple[int, int, int, str], ...]
+    eof_line: int
+    eof_column: int
+
+
+@dataclass
+class TokenCacheStats:
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _CollectErrors(ErrorListener):
+    def __init__(self, tokens: list):
+        super().__init__()
+        self.tokens = tokens
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append((len(self.tokens), line, column, msg))
+
+
+def _new_lexer(input_stream: InputStream, lexer: str):
+    if lexer == "fast":
+        from .fast_lexer import FastCMLLexer
+        return FastCMLLexer(input_stream)
+    if lexer == "antlr":
+        from .dfa_cache import new_lexer
+        return new_lexer(input_stream)
+    raise ValueError(f"Unknown lexer {lexer!r}; expected one of antlr, fast")
+
+
+def _lex(text: str, lexer: str, cancellation=None) -> _LexedText:
+    token_source = _new_lexer(CodePointStream(text), lexer)
+    tokens = []
+    listener = _CollectErrors(tokens)
+    token_source.removeErrorListeners()
+    token_source.addErrorListener(listener)
+    token = token_source.nextToken()
+    while token.type != Token.EOF:
+        tokens.append(TokenInfo(token.type, token.text, token.start, token.stop, token.line, token.column))
+        if cancellation is not None and len(tokens) % 1024 == 0:
+            cancellation.check()
+        token = token_source.nextToken()
+    return _LexedText(tuple(tokens), tuple(listener.errors), token.line, token.column)
+
+
+class TokenCache:
+    """
+    Least-recently-used cache of token arrays keyed by a hash of the source text.
+
+    maxsize bounds the number of texts kept (None for no limit). Safe to share
+    between threads.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(f"maxsize must be a positive integer or None, got {maxsize!r}")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = TokenCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> TokenCacheStats:
+        with self._lock:
+            return replace(self._stats, entries=len(self._entries))
+
+    def tokens(self, text: str, lexer: str = "fast") -> Tuple[TokenInfo, ...]:
+        """Return the tokens of text, lexing it with `lexer` only if it is not cached."""
+        return self._lexed(text, lexer).tokens
+
+    def token_source(self, input_stream: InputStream, lexer: str = "fast", cancellation=None) -> "CachedTokenSource":
+        """
+        Return a token source for CommonTokenStream that replays the cached tokens of input_stream.
+        A text that is not cached yet is lexed first, checking cancellation as it goes.
+        """
+        return CachedTokenSource(self._lexed(input_stream.strdata, lexer, cancellation), input_stream)
+
+    def _lexed(self, text: str, lexer: str, cancellation=None) -> _LexedText:
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return entry
+            self._stats.misses += 1
+
+        entry = _lex(text, lexer, cancellation)
+        with self._lock:
+            self._entries[key] = entry
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+
+class CachedTokenSource(Recognizer, TokenSource):
+    """
+    Token source that replays a cached token array, including its lexer errors.
+
+    Errors are reported to the error listeners just before the token that
+    followed them, so diagnostics interleave with parser errors exactly as
+    with a live lexer.
+    """
+
+    def __init__(self, lexed: _LexedText, input: InputStream):
+        super().__init__()
+        self._factory = CommonTokenFactory.DEFAULT
+        self._lexed = lexed
+        self._input = input
+        self._tokenFactorySourcePair = (self, input)
+        self.reset()
+
+    @property
+    def inputStream(self) -> InputStream:
+        return self._input
+
+    def reset(self):
+        self._index = 0
+        self._error = 0
+        self.line = 1
+        self.column = 0
+
+    def getInputStream(self) -> InputStream:
+        return self._input
+
+    def getSourceName(self) -> str:
+        return self._input.getSourceName()
+
+    def nextToken(self) -> Token:
+        self._report_errors()
+        lexed = self._lexed
+        if self._index < len(lexed.tokens):
+            info = lexed.tokens[self._index]
+            self._index += 1
+            self.line, self.column = info.line, info.column
+            # The text is sliced from the input stream when asked for, as with the lexers.
+            return CommonToken(self._tokenFactorySourcePair, info.type, Token.DEFAULT_CHANNEL, info.start, info.stop)
+
+        self.line, self.column = lexed.eof_line, lexed.eof_column
+        size = len(self._input.strdata)
+        return CommonToken(self._tokenFactorySourcePair, Token.EOF, Token.DEFAULT_CHANNEL, size, size - 1)
+
+    def fetch_into(self, store, n: int) -> int:
+        """Append the next n tokens to a TokenStore, like FastCMLLexer.fetch_into()."""
+        store.source = self._tokenFactorySourcePair
+        tokens = self._lexed.tokens
+        for i in range(n):
+            self._report_errors()
+            if self._index < len(tokens):
+                info = tokens[self._index]
+                self._index += 1
+                self.line, self.column = info.line, info.column
+                store.add(info.type, info.start, info.stop, info.line, info.column)
+                continue
+            self.line, self.column = self._lexed.eof_line, self._lexed.eof_column
+            size = len(self._input.strdata)
+            store.add(Token.EOF, size, size - 1, self.line, self.column)
+            return i + 1
+        return n
+
+    def _report_errors(self) -> None:
+        errors = self._lexed.errors
+        while self._error < len(errors) and errors[self._error][0] <= self._index:
+            _, line, column, msg = errors[self._error]
+            self._error += 1
+            self.getErrorListenerDispatch().syntaxError(self, None, line, column, msg, None)
+
+
+def tokenize(text: str, *, cache: Optional[TokenCache] = None, lexer: str = "fast") -> Iterator[TokenInfo]:
+    """
+    Yield the tokens of text without parsing it. Comments and whitespace are
+    skipped, as are characters the lexer rejects; the EOF token is not yielded.
+
+    With a cache, the token array of a text seen before is reused. lexer is
+    "fast" (default) or "antlr"; both produce the same tokens.
+    """
+    if cache is not None:
+        yield from cache.tokens(text, lexer)
+        return
+    token_source = _new_lexer(CodePointStream(text), lexer)
+    token_source.removeErrorListeners()
+    token = token_source.nextToken()
+    while token.type != Token.EOF:
+        yield TokenInfo(token.type, token.text, token.start, token.stop, token.line, token.column)
+        token = token_source.nextToken()
@@ -0,0 +1,17 @@
+"""Comparison helper shared by the tests that build the same model in two ways."""
+import dataclasses
+
+
+def model_graph(obj, seen=None):
+    """The whole model as nested tuples, with shared objects numbered by first visit."""
+    seen = {} if seen is None else seen
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        if id(obj) in seen:
+            return ("ref", seen[id(obj)])
+        seen[id(obj)] = len(seen)
+        return (type(obj).__name__,) + tuple(
+            model_graph(getattr(obj, f.name), seen) for f in dataclasses.fields(obj) if f.name != "parse_results"
+        )
+    if isinstance(obj, (list, tuple)):
+        return [model_graph(item, seen) for item in obj]
+    return repr(obj)
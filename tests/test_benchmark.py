@@ -0,0 +1,123 @@
+import contextlib
+import json
+import sys
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import parse_text
+from cml_parser.benchmark import (
+    benchmark_grammar,
+    benchmark_split,
+    benchmark_threads,
+    context_map_text,
+    gil_enabled,
+    main,
+)
+from cml_parser.parser import main as parse_main
+
+FILES = sorted((ROOT / "examples").rglob("*.cml"))[:2]
+
+
+def test_benchmark_reports_each_pool_size():
+    result = benchmark_threads(FILES, (1, 2), rounds=1)
+    assert result.files == [str(p) for p in FILES]
+    assert [run.threads for run in result.runs] == [1, 2]
+    assert all(run.parses == len(FILES) and run.seconds > 0 for run in result.runs)
+    assert result.runs[0].speedup == 1.0
+    assert result.gil_enabled == gil_enabled()
+
+    table = result.format_table()
+    assert "files/s" in table and f"{len(FILES)} file(s) x 1 round(s)" in table
+    assert result.to_dict()["runs"][1]["speedup_per_core"] == result.runs[1].speedup / min(2, result.cpus)
+
+
+def test_benchmark_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        benchmark_threads([], (1,))
+    with pytest.raises(ValueError):
+        benchmark_threads(FILES, (0,))
+
+
+def test_cli_bench_threads_json():
+    out = StringIO()
+    with contextlib.redirect_stdout(out):
+        code = main(["threads", *map(str, FILES), "--threads", "1,2", "--rounds", "1", "--json"])
+    assert code == 0
+    data = json.loads(out.getvalue())
+    assert [run["threads"] for run in data["runs"]] == [1, 2]
+    assert data["runs"][0]["files_per_second"] > 0
+
+
+def test_benchmark_split_compares_worker_pools_with_serial_parse():
+    result = benchmark_split(FILES[0], (1, 2), rounds=1, backend="processes")
+    assert result.files == [str(FILES[0])] and result.unit == "workers"
+    assert [run.threads for run in result.runs] == [1, 2]
+    assert result.runs[0].speedup == 1.0 and result.runs[1].seconds > 0
+    assert result.format_table().splitlines()[1].split()[0] == "workers"
+    with pytest.raises(ValueError):
+        benchmark_split(FILES[0], (0,))
+
+
+def test_cli_bench_split_json():
+    out = StringIO()
+    with contextlib.redirect_stdout(out):
+        code = main(["split", str(FILES[0]), "--threads", "1,2", "--rounds", "1", "--json"])
+    assert code == 0
+    data = json.loads(out.getvalue())
+    assert data["unit"] == "workers" and [run["threads"] for run in data["runs"]] == [1, 2]
+
+
+def test_cli_rejects_bad_arguments():
+    with pytest.raises(SystemExit):
+        main(["threads", str(FILES[0]), "--threads", "1,x"])
+    with pytest.raises(SystemExit):
+        main(["walker", str(FILES[0]), "--rounds", "0"])
+    with pytest.raises(SystemExit):
+        main([])
+
+
+def test_parse_cli_has_no_benchmark_options():
+    with pytest.raises(SystemExit):
+        parse_main(["--bench-threads", str(FILES[0])])
+
+
+def test_benchmark_grammar_times_cold_and_warm_parses_per_mode():
+    result = benchmark_grammar(FILES[:1], ("sll", "auto"), rounds=1)
+    assert [run.mode for run in result.runs] == ["sll", "auto"]
+    assert all(run.cold_seconds > 0 and run.warm_seconds > 0 and run.dfa_states > 0 for run in result.runs)
+    assert "warm ms" in result.format_table()
+    with pytest.raises(ValueError):
+        benchmark_grammar([])
+
+    out = StringIO()
+    with contextlib.redirect_stdout(out):
+        code = main(["grammar", str(FILES[0]), "--modes", "sll", "--rounds", "1", "--json"])
+    assert code == 0
+    assert [run["mode"] for run in json.loads(out.getvalue())["runs"]] == ["sll"]
+    with pytest.raises(SystemExit):
+        main(["grammar", str(FILES[0]), "--modes", "fast"])
+
+
+def test_benchmark_grammar_on_a_generated_context_map():
+    text = context_map_text(10)
+    relationships = parse_text(text).get_context_map("Generated").relationships
+    assert len(relationships) == 10
+    # Every fifth relationship gets its leading roles from the line after the one before it.
+    assert relationships[4].downstream_roles == ["ACL"] and relationships[3].roles == []
+
+    result = benchmark_grammar([], ("auto", "ll"), rounds=1, relationships=50, parse_only=True)
+    assert result.files == ["<context map with 50 relationships>"]
+    assert [run.mode for run in result.runs] == ["auto", "ll"]
+    assert all(run.warm_seconds > 0 and run.dfa_states > 0 for run in result.runs)
+
+    out = StringIO()
+    with contextlib.redirect_stdout(out):
+        assert main(["grammar", "--relationships", "20", "--parse-only", "--rounds", "1", "--modes", "sll"]) == 0
+    assert "1 file(s)" in out.getvalue()
+    with pytest.raises(SystemExit):
+        main(["grammar"])
@@ -0,0 +1,97 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import (
+    CancellationToken,
+    CmlParseCancelled,
+    CmlParseTimeout,
+    ParserSession,
+    parse_fragment,
+    parse_text,
+)
+from cml_parser.cml_model_builder import CMLModelBuilder
+
+ENTITIES = "\n".join(
+    f"Entity E{i} {{ String x{i} - List<@E{i}> refs def void f{i}(String a); }}" for i in range(3000)
+)
+LARGE = "BoundedContext B { Aggregate G {\n" + ENTITIES + "\n} }"
+
+
+def test_deadline_raises_timeout_in_worker_thread(monkeypatch):
+    checks = []
+    check = CancellationToken.check
+
+    def counting_check(self):
+        try:
+            check(self)
+        except CmlParseCancelled:
+            checks.append(True)
+            raise
+        checks.append(False)
+
+    monkeypatch.setattr(CancellationToken, "check", counting_check)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(parse_text, LARGE, strict=False, deadline=0.05)
+        with pytest.raises(CmlParseTimeout) as exc:
+            future.result()
+    assert "deadline of 0.05 s" in str(exc.value)
+    # The parse stopped at the first check after the deadline passed.
+    assert checks.count(True) == 1 and checks[-1] is True
+
+
+def test_cancel_from_another_thread():
+    token = CancellationToken()
+    timer = threading.Timer(0.05, token.cancel)
+    timer.start()
+    try:
+        with pytest.raises(CmlParseCancelled) as exc:
+            parse_text(LARGE, cancellation=token)
+    finally:
+        timer.cancel()
+    assert not isinstance(exc.value, CmlParseTimeout)
+    assert token.cancelled
+
+
+def test_cancellation_carries_partial_diagnostics(monkeypatch):
+    token = CancellationToken()
+    build = CMLModelBuilder.visitDefinitions
+
+    def cancel_then_build(self, ctx):
+        token.cancel()
+        return build(self, ctx)
+
+    monkeypatch.setattr(CMLModelBuilder, "visitDefinitions", cancel_then_build)
+    text = "BoundedContext A { Aggregate G { Entity E { String name;; } } }"
+    with pytest.raises(CmlParseCancelled) as exc:
+        parse_text(text, strict=False, cancellation=token)
+    assert len(exc.value.diagnostics) == 1
+    assert exc.value.diagnostics[0].line == 1
+
+
+def test_deadline_and_token_combine():
+    token = CancellationToken()
+    token.cancel()
+    with pytest.raises(CmlParseCancelled):
+        parse_text("BoundedContext A {}", deadline=10, cancellation=token)
+    with pytest.raises(CmlParseTimeout):
+        parse_fragment("Aggregate A {}", deadline=0)
+
+
+def test_session_recovers_after_timeout():
+    session = ParserSession()
+    with pytest.raises(CmlParseTimeout):
+        session.parse(LARGE, deadline=0.01)
+    cml = session.parse("BoundedContext A { Aggregate G { Entity E { String x } } }")
+    assert cml.get_context("A").aggregates[0].entities[0].attributes[0].name == "x"
+
+
+def test_timeout_must_not_be_negative():
+    with pytest.raises(ValueError):
+        CancellationToken(-1)
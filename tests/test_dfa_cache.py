@@ -0,0 +1,104 @@
+import sys
+import json
+import zlib
+import contextlib
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import parse_file_safe, save_dfa_cache, load_dfa_cache, warm_dfa_cache
+from cml_parser import dfa_cache
+from cml_parser.antlr.CMLLexer import CMLLexer
+from cml_parser.antlr.CMLParser import CMLParser
+from cml_parser.parser import main
+
+EXAMPLE = ROOT / "examples" / "Insurance" / "Insurance-Example_Team-Map.cml"
+
+
+def _empty_dfas():
+    for dfa in CMLLexer.decisionsToDFA + CMLParser.decisionsToDFA:
+        dfa._states = {}
+        dfa.s0 = None
+
+
+def _summary(cml):
+    return (
+        [c.name for c in cml.contexts],
+        [(r.left.name, r.right.name, r.type) for cm in cml.context_maps for r in cm.relationships],
+        [(c.name, [a.name for a in c.aggregates]) for c in cml.contexts],
+    )
+
+
+def test_saved_cache_restores_warm_dfas(tmp_path):
+    cache = tmp_path / "dfa.cache"
+    _empty_dfas()
+    expected = _summary(parse_file_safe(str(EXAMPLE)))
+    save_dfa_cache(cache)
+    warm_counts = dfa_cache.dfa_state_count()
+    assert warm_counts["parser"] > 0 and warm_counts["lexer"] > 0
+
+    _empty_dfas()
+    assert load_dfa_cache(cache) is True
+    assert dfa_cache.dfa_state_count() == warm_counts
+
+    cml = parse_file_safe(str(EXAMPLE))
+    assert cml.parse_results.errors == []
+    assert _summary(cml) == expected
+    # Everything the parse needed was already in the restored DFAs.
+    assert dfa_cache.dfa_state_count() == warm_counts
+
+
+def test_stale_grammar_cache_is_ignored(tmp_path, monkeypatch):
+    cache = tmp_path / "dfa.cache"
+    warm_dfa_cache([EXAMPLE], save_to=cache)
+    monkeypatch.setattr(dfa_cache, "grammar_fingerprint", lambda: "regenerated-parser")
+    _empty_dfas()
+    assert load_dfa_cache(cache) is False
+    assert dfa_cache.dfa_state_count() == {"lexer": 0, "parser": 0}
+
+
+@pytest.mark.parametrize("content", [b"", b"not a cache", zlib.compress(b"[1, 2]")])
+def test_corrupt_cache_is_ignored(tmp_path, content):
+    cache = tmp_path / "dfa.cache"
+    cache.write_bytes(content)
+    assert load_dfa_cache(cache) is False
+    assert load_dfa_cache(tmp_path / "missing.cache") is False
+
+
+def test_cache_file_records_format_and_grammar(tmp_path):
+    cache = tmp_path / "nested" / "dfa.cache"
+    save_dfa_cache(cache)
+    payload = json.loads(zlib.decompress(cache.read_bytes()))
+    assert payload["format"] == dfa_cache.FORMAT_VERSION
+    assert payload["grammar"] == dfa_cache.grammar_fingerprint()
+    assert len(payload["parser"]) == len(CMLParser.decisionsToDFA)
+
+
+def test_env_cache_is_loaded_once(tmp_path, monkeypatch):
+    cache = tmp_path / "dfa.cache"
+    warm_dfa_cache([EXAMPLE], save_to=cache)
+    warm_counts = dfa_cache.dfa_state_count()
+    _empty_dfas()
+    monkeypatch.setenv(dfa_cache.CACHE_ENV_VAR, str(cache))
+    monkeypatch.setattr(dfa_cache, "_env_cache_checked", False)
+    dfa_cache.load_env_dfa_cache()
+    assert dfa_cache.dfa_state_count() == warm_counts
+
+    _empty_dfas()
+    dfa_cache.load_env_dfa_cache()
+    assert dfa_cache.dfa_state_count() == {"lexer": 0, "parser": 0}
+
+
+def test_cli_dfa_cache_option_writes_cache(tmp_path):
+    cache = tmp_path / "dfa.cache"
+    f = tmp_path / "test.cml"
+    f.write_text("ContextMap M { A -> B }")
+    _empty_dfas()
+    with contextlib.redirect_stdout(StringIO()):
+        assert main([str(f), "--dfa-cache", str(cache)]) == 0
+    assert cache.exists()
+    assert load_dfa_cache(cache) is True
@@ -0,0 +1,71 @@
+import sys
+import contextlib
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import parse_file, parse_file_safe, parse_text, CmlSyntaxError
+from cml_parser.parser import main
+
+BROKEN = [
+    "ContextMap { invalid",
+    "ContextMap M { A -> }\nBoundedContext B { Aggregate X { Entity } }\nBoundedContext C {",
+    "BoundedContext A { Aggregate B { Entity C { String x } } } }\nContextMap ~ M { A -> B }",
+    "BoundedContext A { § }\nBoundedContext B { Aggregate X { Entity E { - } } }",
+]
+
+
+def _diagnostics(errors):
+    return [(e.message, e.line, e.col) for e in errors]
+
+
+@pytest.mark.parametrize("mode", ["auto", "ll", "sll"])
+@pytest.mark.parametrize("text", BROKEN)
+def test_strict_raises_the_first_full_recovery_error(text, mode):
+    full = parse_text(text, strict=False, prediction_mode=mode).parse_results.errors
+    with pytest.raises(CmlSyntaxError) as excinfo:
+        parse_text(text, prediction_mode=mode)
+    assert _diagnostics([excinfo.value.diagnostic]) == _diagnostics(full[:1])
+
+
+@pytest.mark.parametrize("text", BROKEN)
+@pytest.mark.parametrize("limit", [1, 2])
+def test_max_errors_truncates_safe_diagnostics(text, limit):
+    full = parse_text(text, strict=False).parse_results.errors
+    limited = parse_text(text, strict=False, max_errors=limit).parse_results.errors
+    assert _diagnostics(limited) == _diagnostics(full[:limit])
+
+
+def test_max_errors_keeps_partial_model(tmp_path):
+    path = tmp_path / "broken.cml"
+    path.write_text("BoundedContext A {}\nBoundedContext B { Aggregate X { Entity } }\nContextMap { invalid }")
+    cml = parse_file_safe(str(path), max_errors=1)
+    assert len(cml.parse_results.errors) >= 1
+    assert cml.get_context("A") is not None
+
+
+def test_max_errors_is_validated():
+    with pytest.raises(ValueError):
+        parse_text("ContextMap M {}", strict=False, max_errors=0)
+
+
+def test_strict_file_stops_at_first_error(tmp_path):
+    path = tmp_path / "broken.cml"
+    path.write_text("\n".join(BROKEN))
+    first = parse_file_safe(str(path)).parse_results.errors[0]
+    with pytest.raises(CmlSyntaxError) as excinfo:
+        parse_file(str(path))
+    assert _diagnostics([excinfo.value.diagnostic]) == _diagnostics([first])
+
+
+def test_cli_max_errors(tmp_path):
+    path = tmp_path / "broken.cml"
+    path.write_text("\n".join(BROKEN))
+    with contextlib.redirect_stderr(StringIO()) as stderr:
+        assert main([str(path), "--max-errors", "1"]) == 1
+    lines = [l for l in stderr.getvalue().splitlines() if l and not l.startswith("Error parsing")]
+    assert len(lines) == 1
@@ -0,0 +1,100 @@
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+from antlr4.error.ErrorListener import ErrorListener
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import ParserSession, parse_text
+from cml_parser.antlr.CMLLexer import CMLLexer
+from cml_parser.fast_lexer import FastCMLLexer
+
+CML_FILES = sorted(ROOT.glob("examples/**/*.cml")) + sorted(ROOT.glob("tests/**/*.cml"))
+
+EDGE_CASES = [
+    "",
+    "Aggregate ^Aggregate _x 12ab read with its",
+    "read-only read-onlyx promote,x behavior:: and/or <-> <-x --> ::: =>",
+    "Customer-Sup Shared-Kernel Upstream-Downstream",
+    "\"a\\\"b\" 'c\\'d' \"multi\nline\" x",
+    "a/*b\n*/c//d\n e /**/ f",
+    "\r\n\t x\ry",
+    # Lexer errors and recovery
+    "\"unterminated",
+    "'a\\",
+    "^",
+    "^ x",
+    "^\nx",
+    "#$%é\n x",
+    "/* open",
+    "\f\v x",
+]
+
+
+class _Collect(ErrorListener):
+    def __init__(self):
+        self.errors = []
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        self.errors.append((line, column, msg))
+
+
+def _lex(lexer_class, text):
+    lexer = lexer_class(InputStream(text))
+    listener = _Collect()
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(listener)
+    stream = CommonTokenStream(lexer)
+    stream.fill()
+    tokens = [(t.type, t.channel, t.start, t.stop, t.line, t.column, t.text) for t in stream.tokens]
+    return tokens, listener.errors
+
+
+def _test_corpus_strings():
+    """CML snippets embedded in the test modules."""
+    for path in sorted((ROOT / "tests").glob("test_*.py")):
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and "{" in node.value:
+                yield node.value
+
+
+@pytest.mark.parametrize("path", CML_FILES, ids=lambda p: str(p.relative_to(ROOT)))
+def test_matches_antlr_lexer_on_files(path):
+    text = path.read_text(encoding="utf-8")
+    assert _lex(FastCMLLexer, text) == _lex(CMLLexer, text)
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_matches_antlr_lexer_on_edge_cases(text):
+    assert _lex(FastCMLLexer, text) == _lex(CMLLexer, text)
+
+
+def test_matches_antlr_lexer_on_test_corpus():
+    snippets = list(_test_corpus_strings())
+    assert len(snippets) > 100
+    for text in snippets:
+        assert _lex(FastCMLLexer, text) == _lex(CMLLexer, text), text
+
+
+def test_parse_results_match():
+    text = 'BoundedContext A { Aggregate G { Entity E { String x ยง } } } ContextMap { A -> }'
+    fast = parse_text(text, strict=False, lexer="fast")
+    antlr = parse_text(text, strict=False, lexer="antlr")
+    assert [e.pretty() for e in fast.parse_results.errors] == [e.pretty() for e in antlr.parse_results.errors]
+    assert fast.parse_results.errors
+
+
+def test_session_switches_lexers():
+    session = ParserSession()
+    for lexer in ("fast", "antlr", "fast"):
+        cml = session.parse("BoundedContext A { Aggregate G { Entity E { String x } } }", lexer=lexer)
+        assert cml.get_context("A").aggregates[0].entities[0].attributes[0].name == "x"
+
+
+def test_unknown_lexer():
+    with pytest.raises(ValueError):
+        parse_text("BoundedContext A {}", lexer="regex")
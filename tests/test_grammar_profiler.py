@@ -0,0 +1,97 @@
+import sys
+import json
+import contextlib
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import dfa_cache, profiling
+from cml_parser.parser import main
+from cml_parser.profiling import profile_grammar
+from cml_parser.antlr.CMLParser import CMLParser
+
+
+@pytest.fixture
+def model(tmp_path):
+    path = tmp_path / "model.cml"
+    path.write_text(
+        "ContextMap M {\n  A [U] -> B [D] C -> D\n}\n"
+        "BoundedContext A { Aggregate X { Entity E { String name } } }\n"
+    )
+    return path
+
+
+def test_profile_maps_decisions_to_rules(model):
+    profile = profile_grammar([model])
+    assert profile.files == [str(model)]
+    assert profile.syntax_errors == {str(model): 0}
+    assert profile.decisions and all(d.invocations > 0 for d in profile.decisions)
+    for d in profile.decisions:
+        state = CMLParser.atn.decisionToState[d.decision]
+        assert d.rule == CMLParser.ruleNames[state.ruleIndex]
+        assert d.sll_min_look <= d.sll_avg_look <= d.sll_max_look
+    assert profile.total_time_ns == sum(d.time_ns for d in profile.decisions)
+
+    # "B [D] C" is resolved by full-context prediction and reported as ambiguous.
+    endpoint = [d for d in profile.decisions if d.rule == "relationshipEndpointRight"]
+    assert sum(d.ll_fallbacks for d in endpoint) >= 1
+    assert sum(d.ambiguities for d in endpoint) >= 1
+
+
+def test_sll_profile_has_no_fallbacks(model):
+    profile = profile_grammar([model], prediction_mode="sll")
+    assert sum(d.ll_fallbacks for d in profile.decisions) == 0
+    with pytest.raises(ValueError):
+        profile_grammar([model], prediction_mode="auto")
+
+
+def test_format_table(model):
+    table = profile_grammar([model]).format_table(sort_by="invocations", limit=3)
+    lines = table.splitlines()
+    assert lines[0].split()[:3] == ["decision", "rule", "calls"]
+    assert len(lines) == 2 + 3 + 1
+    with pytest.raises(ValueError):
+        profile_grammar([model]).format_table(sort_by="nope")
+
+
+def test_cli_profile_json(model, tmp_path):
+    broken = tmp_path / "broken.cml"
+    broken.write_text("ContextMap { invalid")
+    with contextlib.redirect_stdout(StringIO()) as stdout:
+        assert main(["--profile-grammar", str(model), "--json"]) == 0
+    data = json.loads(stdout.getvalue())
+    assert data["files"] == [str(model)]
+    assert {"decision", "rule", "invocations", "time_ms", "ll_fallbacks"} <= set(data["decisions"][0])
+
+    with contextlib.redirect_stdout(StringIO()), contextlib.redirect_stderr(StringIO()) as stderr:
+        assert main(["--profile-grammar", str(model), str(broken)]) == 1
+    assert "syntax error" in stderr.getvalue()
+
+
+def test_cli_profile_missing_file(tmp_path):
+    with contextlib.redirect_stderr(StringIO()) as stderr:
+        assert main(["--profile-grammar", str(tmp_path / "missing.cml")]) == 1
+    assert "missing.cml" in stderr.getvalue()
+
+
+def test_profiler_adds_shared_dfa_states_under_the_lock(model, monkeypatch):
+    entered = []
+
+    class RecordingLock:
+        def __enter__(self):
+            entered.append(True)
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(profiling, "_lock", RecordingLock())
+    monkeypatch.setattr(dfa_cache, "_lock", RecordingLock())
+    dfa_cache.clear_parser_caches()
+    before = len(entered)
+    profile_grammar([model])
+    assert len(entered) > before
+    assert dfa_cache.dfa_state_count()["parser"] > 0
@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import cml_parser
+
+# Documented in docs/usage.md: importing the package (and the parse entry
+# points) must not load the generated ANTLR parser or the model builder.
+# Wall-clock import time depends on the machine, so the time budget is only
+# checked when CML_PARSER_IMPORT_BUDGET_MS is set (the documented one is 200).
+IMPORT_TIME_BUDGET_MS = os.environ.get("CML_PARSER_IMPORT_BUDGET_MS")
+DEFERRED_MODULES = (
+    "cml_parser.antlr.CMLLexer",
+    "cml_parser.antlr.CMLParser",
+    "cml_parser.cml_model_builder",
+    "cml_parser.dfa_cache",
+)
+IMPORT_CODE = "import cml_parser\nfrom cml_parser import parse_file, parse_text, Diagnostic"
+
+
+def _run_fresh(code: str) -> dict:
+    """Run code in a fresh interpreter and report import time and loaded modules."""
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{code}\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        "print(json.dumps({'ms': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+    env.pop("CML_PARSER_DFA_CACHE", None)
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True)
+    return json.loads(proc.stdout)
+
+
+def test_import_defers_generated_parser():
+    result = _run_fresh(IMPORT_CODE)
+    assert not [m for m in DEFERRED_MODULES if m in result["modules"]]
+
+
+@pytest.mark.skipif(not IMPORT_TIME_BUDGET_MS, reason="CML_PARSER_IMPORT_BUDGET_MS is not set")
+def test_import_time_budget():
+    assert _run_fresh(IMPORT_CODE)["ms"] < float(IMPORT_TIME_BUDGET_MS)
+
+
+def test_first_parse_loads_generated_parser():
+    result = _run_fresh("from cml_parser import parse_text\nparse_text('ContextMap M {}')")
+    assert "cml_parser.antlr.CMLParser" in result["modules"]
+
+
+def test_lazy_exports():
+    assert set(cml_parser.__all__) <= set(dir(cml_parser))
+    assert cml_parser.ParserSession.__module__ == "cml_parser.parser"
+    with pytest.raises(AttributeError):
+        cml_parser.not_an_export
@@ -0,0 +1,124 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import (
+    CmlLimitExceeded,
+    CmlSyntaxError,
+    ParseLimits,
+    ParserSession,
+    TokenCache,
+    parse_file,
+    parse_file_safe,
+    parse_fragment,
+    parse_text,
+)
+
+TEXT = "BoundedContext A { Aggregate G { Entity E { String x String y } } } BoundedContext B {}"
+
+
+@pytest.mark.parametrize(
+    "limits, name, message",
+    [
+        (ParseLimits(max_bytes=10), "max_bytes", "Source size of 87 bytes exceeds the max_bytes limit of 10"),
+        (ParseLimits(max_tokens=10), "max_tokens", "Token count exceeds the max_tokens limit of 10"),
+        (ParseLimits(max_depth=8), "max_depth", "Nesting depth exceeds the max_depth limit of 8"),
+        (ParseLimits(max_contexts=1), "max_contexts", "Number of contexts exceeds the max_contexts limit of 1"),
+        (ParseLimits(max_attributes=1), "max_attributes", "Number of attributes exceeds the max_attributes limit of 1"),
+    ],
+)
+def test_breach_raises_in_strict_mode_and_is_reported_otherwise(limits, name, message):
+    with pytest.raises(CmlLimitExceeded) as exc:
+        parse_text(TEXT, limits=limits)
+    assert exc.value.limit == name
+    assert exc.value.diagnostic.message == message
+    assert isinstance(exc.value, CmlSyntaxError)
+
+    cml = parse_text(TEXT, strict=False, limits=limits)
+    assert [e.message for e in cml.parse_results.errors] == [message]
+    assert cml.parse_results.model is None
+    assert cml.contexts == []
+
+
+def test_breach_location_points_at_the_offending_input():
+    cml = parse_text(TEXT, strict=False, limits=ParseLimits(max_aggregates=1, max_contexts=1))
+    error = cml.parse_results.errors[0]
+    assert (error.line, error.col) == (1, 68)
+
+
+def test_input_within_limits_parses_normally():
+    limits = ParseLimits(
+        max_bytes=1000, max_tokens=100, max_depth=100, max_contexts=2, max_aggregates=1, max_attributes=2
+    )
+    cml = parse_text(TEXT, limits=limits)
+    assert [c.name for c in cml.contexts] == ["A", "B"]
+
+
+@pytest.mark.parametrize("mode", ["auto", "sll", "ll"])
+def test_max_depth_stops_deep_nesting_before_recursion_error(mode):
+    nested = "List<" * 1000 + "String" + ">" * 1000
+    text = f"BoundedContext A {{ Aggregate G {{ Entity E {{ {nested} x }} }} }}"
+    cml = parse_text(text, strict=False, prediction_mode=mode, limits=ParseLimits(max_depth=200))
+    assert cml.parse_results.errors[0].message == "Nesting depth exceeds the max_depth limit of 200"
+
+
+def test_syntax_errors_before_the_breach_are_kept():
+    text = "BoundedContext A { § } " + "BoundedContext B {} " * 20
+    cml = parse_text(text, strict=False, limits=ParseLimits(max_tokens=20))
+    messages = [e.message for e in cml.parse_results.errors]
+    assert len(messages) == 2
+    assert "token recognition error" in messages[0]
+    assert messages[-1] == "Token count exceeds the max_tokens limit of 20"
+
+
+def test_oversized_file_is_not_read(tmp_path, monkeypatch):
+    path = tmp_path / "big.cml"
+    path.write_text(TEXT, encoding="utf-8")
+    monkeypatch.setattr(Path, "read_text", lambda *args, **kwargs: pytest.fail("file was read"))
+    cml = parse_file_safe(path, limits=ParseLimits(max_bytes=50))
+    assert cml.parse_results.errors[0].filename == str(path)
+    with pytest.raises(CmlLimitExceeded):
+        parse_file(path, limits=ParseLimits(max_bytes=50))
+
+
+def test_limits_apply_to_each_imported_file(tmp_path):
+    (tmp_path / "base.cml").write_text("BoundedContext B {} BoundedContext C {}", encoding="utf-8")
+    main = tmp_path / "main.cml"
+    main.write_text('import "base.cml"\nBoundedContext A {}', encoding="utf-8")
+    assert len(parse_file(main, limits=ParseLimits(max_contexts=2)).contexts) == 3
+    with pytest.raises(CmlLimitExceeded):
+        parse_file(main, limits=ParseLimits(max_contexts=1))
+
+
+def test_max_bytes_counts_utf8_bytes():
+    text = 'BoundedContext A { domainVisionStatement = "' + "é" * 20 + '" }'
+    assert len(text) <= 70
+    parse_text(text, limits=ParseLimits(max_bytes=len(text.encode("utf-8"))))
+    with pytest.raises(CmlLimitExceeded):
+        parse_text(text, limits=ParseLimits(max_bytes=70))
+
+
+def test_fragments_sessions_and_token_cache():
+    aggregate = "Aggregate A { Entity E { String x String y } }"
+    with pytest.raises(CmlLimitExceeded):
+        parse_fragment(aggregate, limits=ParseLimits(max_attributes=1))
+
+    session = ParserSession()
+    cache = TokenCache()
+    for _ in range(2):
+        with pytest.raises(CmlLimitExceeded):
+            session.parse(TEXT, token_cache=cache, lexer="fast", limits=ParseLimits(max_tokens=10))
+    assert session.parse_fragment(aggregate, limits=ParseLimits(max_depth=50)).name == "A"
+    results = session.parse_many([TEXT, "BoundedContext C {}"], strict=False, limits=ParseLimits(max_contexts=1))
+    assert [len(r.parse_results.errors) for r in results] == [1, 0]
+
+
+def test_limits_must_be_positive():
+    with pytest.raises(ValueError):
+        ParseLimits(max_tokens=0)
+    with pytest.raises(ValueError):
+        ParseLimits(max_depth=2.5)
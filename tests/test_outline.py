@@ -0,0 +1,114 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import OutlineEntry, outline_file, outline_files, outline_text, parse_file
+from cml_parser.parser import main
+
+EXAMPLES = sorted((ROOT / "examples").rglob("*.cml"))
+
+MODEL = """\
+ContextMap {
+  contains Orders
+}
+BoundedContext Orders implements Sales {
+  Aggregate Cart {
+    Entity Cart {
+      aggregateRoot
+      - Service service
+      Repository CartRepository {
+        @Cart find(String id);
+      }
+    }
+    abstract DomainEvent CartChanged extends Event {
+      String id
+    }
+    Service Pricing { void price(); }
+  }
+  Module checkout {
+    Aggregate Payment
+  }
+  Application {
+    Command Pay;
+    Flow PaymentFlow {
+      command Pay emits event CartChanged
+    }
+  }
+}
+Domain Commerce {
+  Subdomain Sales
+}
+UseCase Checkout {
+  actor "Customer"
+}
+"""
+
+
+def test_outline_lists_nested_declarations_with_line_spans():
+    assert outline_text(MODEL, "shop.cml") == [
+        OutlineEntry("bounded_context", "Orders", "shop.cml", 4, 27),
+        OutlineEntry("aggregate", "Orders.Cart", "shop.cml", 5, 17),
+        OutlineEntry("entity", "Orders.Cart.Cart", "shop.cml", 6, 12),
+        OutlineEntry("repository", "Orders.Cart.Cart.CartRepository", "shop.cml", 9, 11),
+        OutlineEntry("domain_event", "Orders.Cart.CartChanged", "shop.cml", 13, 15),
+        OutlineEntry("service", "Orders.Cart.Pricing", "shop.cml", 16, 16),
+        OutlineEntry("module", "Orders.checkout", "shop.cml", 18, 20),
+        OutlineEntry("aggregate", "Orders.checkout.Payment", "shop.cml", 19, 19),
+        OutlineEntry("command_event", "Orders.Pay", "shop.cml", 22, 22),
+        OutlineEntry("flow", "Orders.PaymentFlow", "shop.cml", 23, 25),
+        OutlineEntry("domain", "Commerce", "shop.cml", 28, 30),
+        OutlineEntry("subdomain", "Commerce.Sales", "shop.cml", 29, 29),
+        OutlineEntry("use_case", "Checkout", "shop.cml", 31, 33),
+    ]
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=lambda p: p.name)
+def test_outline_agrees_with_the_model(path):
+    entries = outline_file(path)
+    cml = parse_file(path)
+    names = {(entry.kind, entry.qualified_name) for entry in entries}
+
+    for context in cml.contexts:
+        if context.aggregates or context.modules:
+            assert ("bounded_context", context.name) in names
+        for aggregate in context.aggregates:
+            assert ("aggregate", f"{context.name}.{aggregate.name}") in names
+            for entity in aggregate.entities:
+                assert ("entity", f"{context.name}.{aggregate.name}.{entity.name}") in names
+    for domain in cml.domains:
+        assert ("domain", domain.name) in names
+    assert {uc.name for uc in cml.use_cases if uc.actor} <= {n for k, n in names if k == "use_case"}
+    assert all(entry.file == str(path) and entry.start <= entry.end for entry in entries)
+
+
+def test_outline_survives_invalid_input():
+    entries = outline_text("BoundedContext A {\n  Aggregate B {\n    Entity § C {\n")
+    assert [(e.kind, e.qualified_name, e.start, e.end) for e in entries] == [
+        ("bounded_context", "A", 1, 3),
+        ("aggregate", "A.B", 2, 3),
+        ("entity", "A.B.C", 3, 3),
+    ]
+    assert outline_text("} } Aggregate X {}") == []
+
+
+def test_outline_files_and_cli(tmp_path, capsys):
+    first, second = tmp_path / "a.cml", tmp_path / "b.cml"
+    first.write_text("BoundedContext A {}", encoding="utf-8")
+    second.write_text("BoundedContext B {\n}", encoding="utf-8")
+    assert [e.qualified_name for e in outline_files([first, second])] == ["A", "B"]
+
+    assert main(["--outline", str(first), str(second)]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        f"{first}:1-1\tbounded_context\tA",
+        f"{second}:1-2\tbounded_context\tB",
+    ]
+    assert main(["--outline", str(second), "--json"]) == 0
+    assert json.loads(capsys.readouterr().out) == [
+        {"kind": "bounded_context", "qualified_name": "B", "file": str(second), "start": 1, "end": 2}
+    ]
+    assert main(["--outline", str(tmp_path / "missing.cml")]) == 1
@@ -0,0 +1,205 @@
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+import concurrent.futures
+from concurrent.futures import ProcessPoolExecutor
+
+from cml_parser import (
+    CmlLimitExceeded,
+    CmlSyntaxError,
+    ParseLimits,
+    parse_file,
+    parse_file_parallel,
+    parse_file_safe,
+    parse_files,
+)
+from cml_parser.chunks import split_definitions
+from cml_parser.cml_objects import Diagnostic
+from cml_parser.parallel import _executor, _process_context
+from model_graph import model_graph
+
+EXAMPLES = sorted((ROOT / "examples").rglob("*.cml"))
+
+
+def _summary(cml):
+    return (
+        [c.name for c in cml.contexts],
+        [(a.name, [e.name for e in a.entities]) for c in cml.contexts for a in c.aggregates],
+        [(r.left.name, r.right.name, r.type) for cm in cml.context_maps for r in cm.relationships],
+        [d.name for d in cml.domains],
+        [(e.message, e.filename, e.line, e.col) for e in cml.parse_results.errors],
+    )
+
+
+def test_process_pool_matches_serial_parses():
+    results = parse_files(EXAMPLES, backend="processes", max_workers=2)
+    assert [_summary(cml) for cml in results] == [_summary(parse_file_safe(path)) for path in EXAMPLES]
+
+
+def test_imports_are_resolved_and_not_shared(tmp_path):
+    (tmp_path / "base.cml").write_text("BoundedContext Base {}", encoding="utf-8")
+    (tmp_path / "a.cml").write_text('import "base.cml"\nBoundedContext A {}', encoding="utf-8")
+    (tmp_path / "b.cml").write_text('import "base.cml"\nimport "missing.cml"\nBoundedContext B {', encoding="utf-8")
+    paths = [tmp_path / "a.cml", tmp_path / "b.cml"]
+
+    a, b = parse_files(paths, backend="processes", max_workers=2)
+    assert [_summary(cml) for cml in (a, b)] == [_summary(parse_file_safe(path)) for path in paths]
+    assert {c.name for c in a.contexts} == {"A", "Base"}
+    assert a.get_context("Base") is not b.get_context("Base")
+
+
+def test_strict_mode_raises_the_first_error(tmp_path):
+    (tmp_path / "ok.cml").write_text("BoundedContext A {}", encoding="utf-8")
+    (tmp_path / "bad.cml").write_text("BoundedContext B {", encoding="utf-8")
+    with pytest.raises(CmlSyntaxError) as exc:
+        parse_files([tmp_path / "ok.cml", tmp_path / "bad.cml"], backend="processes", strict=True)
+    assert exc.value.diagnostic.filename == str(tmp_path / "bad.cml")
+
+    with pytest.raises(CmlLimitExceeded):
+        parse_files([tmp_path / "ok.cml"], backend="processes", strict=True, limits=ParseLimits(max_tokens=2))
+
+
+def test_auto_backend_and_empty_input():
+    assert parse_files([]) == []
+    assert _summary(parse_files(EXAMPLES[:1])[0]) == _summary(parse_file_safe(EXAMPLES[0]))
+
+
+@pytest.mark.skipif(
+    hasattr(concurrent.futures, "InterpreterPoolExecutor"), reason="subinterpreters are available"
+)
+def test_interpreters_backend_needs_python_3_14():
+    with pytest.raises(RuntimeError):
+        parse_files(EXAMPLES[:1], backend="interpreters")
+
+
+@pytest.mark.skipif(
+    not hasattr(concurrent.futures, "InterpreterPoolExecutor"), reason="subinterpreters need Python 3.14"
+)
+def test_interpreters_backend_parses_in_subinterpreters():
+    with _executor("interpreters", 2, None) as pool:
+        assert isinstance(pool, concurrent.futures.InterpreterPoolExecutor)
+    results = parse_files(EXAMPLES[:3], backend="interpreters", max_workers=2)
+    assert [_summary(cml) for cml in results] == [_summary(parse_file_safe(path)) for path in EXAMPLES[:3]]
+
+
+def test_process_workers_are_not_forked():
+    with _executor("processes", 1, None) as pool:
+        assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        parse_files(EXAMPLES[:1], backend="threads")
+    with pytest.raises(ValueError):
+        parse_files(EXAMPLES[:1], lexer="nope")
+
+
+def test_syntax_errors_survive_pickling():
+    error = CmlLimitExceeded(Diagnostic(message="too big", line=1, col=2), "max_bytes")
+    copy = pickle.loads(pickle.dumps(error))
+    assert (type(copy), copy.limit, copy.diagnostic, str(copy)) == (CmlLimitExceeded, "max_bytes", error.diagnostic, str(error))
+
+
+CROSS_CHUNK = """
+ContextMap M {
+  contains A, B
+  A [U]->[D] B {
+    exposedAggregates = Orders
+  }
+}
+UseCase UC1 {
+  actor "Clerk"
+}
+BoundedContext A implements S1 {
+  Aggregate Orders {
+    useCases = UC1, UC9
+    features = US0, UC7
+  }
+}
+UserStory US0 {
+  As a "User"
+  I want to "buy"
+  so that "value"
+}
+BoundedContext B {
+  Aggregate Other {
+    useCases = UC9
+    features = US0, UC7
+  }
+}
+Domain D1 {
+  Subdomain S1 supports UC1, UC9
+}
+BoundedContext C {
+  Aggregate Coord {
+    owner = A
+  }
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(2, mp_context=_process_context()) as executor:
+        yield executor
+
+
+def test_split_definitions_cuts_after_top_level_blocks():
+    text = 'BoundedContext A { vision = "}" }\n// }\nBoundedContext B { Aggregate X {} }\n/* { */ BoundedContext C {}\n'
+    chunks = split_definitions(text, 10)
+    assert [text[c.start:c.end].split()[0] for c in chunks] == ["BoundedContext", "//", "/*"]
+    assert chunks[0].start == 0 and chunks[-1].end == len(text)
+    assert all(a.end == b.start for a, b in zip(chunks, chunks[1:]))
+    assert len(split_definitions(text, 1)) == 1
+    assert [c.uses_traits for c in split_definitions("Entity A with @T {}\nEntity B {}", 2)] == [True, False]
+
+
+def test_parse_file_parallel_matches_parse_file(tmp_path, pool):
+    model = tmp_path / "model.cml"
+    model.write_text(CROSS_CHUNK, encoding="utf-8")
+    for path in [model, *EXAMPLES[:6]]:
+        expected = model_graph(parse_file(path))
+        for chunks in (2, 3, 50):
+            assert model_graph(parse_file_parallel(path, chunks=chunks, executor=pool)) == expected
+
+
+def test_parse_file_parallel_falls_back_to_serial(tmp_path, pool):
+    traits = "BoundedContext A {\n Aggregate X {\n  Trait T {\n   String who\n  }\n }\n}\n" \
+        "BoundedContext B {\n Aggregate Y {\n  ValueObject V with @T {}\n }\n}\n"
+    twice = "BoundedContext A {\n Aggregate X {}\n}\nBoundedContext A {\n Aggregate Y {}\n}\n"
+    for name, text in (("traits", traits), ("twice", twice)):
+        path = tmp_path / f"{name}.cml"
+        path.write_text(text, encoding="utf-8")
+        assert model_graph(parse_file_parallel(path, chunks=2, executor=pool)) == model_graph(parse_file(path))
+
+    bad = tmp_path / "bad.cml"
+    bad.write_text("BoundedContext A {}\nBoundedContext B {\n Aggregate Y {\n}\n", encoding="utf-8")
+    with pytest.raises(CmlSyntaxError):
+        parse_file_parallel(bad, chunks=2, executor=pool)
+    # Recovery messages can vary with the DFAs warmed so far, so compare positions.
+    errors = parse_file_parallel(bad, strict=False, chunks=2, executor=pool).parse_results.errors
+    assert [(e.line, e.col, e.filename) for e in errors] == [
+        (e.line, e.col, e.filename) for e in parse_file_safe(bad).parse_results.errors
+    ]
+
+
+def test_parse_file_parallel_resolves_imports(tmp_path):
+    (tmp_path / "base.cml").write_text("BoundedContext Base {\n Aggregate Q {}\n}\n", encoding="utf-8")
+    root = tmp_path / "root.cml"
+    root.write_text('import "base.cml"\nBoundedContext A {}\nContextMap {\n A [U]->[D] Base\n}\n', encoding="utf-8")
+    cml = parse_file_parallel(root, backend="processes", max_workers=2)
+    assert model_graph(cml) == model_graph(parse_file(root))
+    assert cml.parse_results.filename == str(root)
+
+
+def test_parse_file_parallel_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        parse_file_parallel(EXAMPLES[0], chunks=0)
+    with pytest.raises(ValueError):
+        parse_file_parallel(EXAMPLES[0], backend="threads")
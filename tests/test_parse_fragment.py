@@ -0,0 +1,76 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import CmlSyntaxError, ParserSession, parse_fragment
+from cml_parser.cml_objects import Aggregate, ContextMap, Entity, Service
+
+
+def test_aggregate_fragment_returns_aggregate():
+    agg = parse_fragment("""
+    Aggregate Orders {
+      Entity Order {
+        aggregateRoot
+        - OrderId id key
+        def void cancel(String reason);
+      }
+      ValueObject OrderId { String value }
+      Service Checkout { void place(@Order order); }
+    }
+    """)
+    assert isinstance(agg, Aggregate)
+    assert agg.name == "Orders"
+    assert agg.context is None
+    assert [e.name for e in agg.entities] == ["Order"]
+    assert agg.entities[0].is_aggregate_root
+    assert [v.name for v in agg.value_objects] == ["OrderId"]
+    assert [s.name for s in agg.services] == ["Checkout"]
+
+
+@pytest.mark.parametrize("kind, text, cls", [
+    ("entity", "Entity Order { String number }", Entity),
+    ("service", "Service Checkout { void place(); }", Service),
+    ("context_map", "ContextMap M { contains A, B  A -> B }", ContextMap),
+])
+def test_fragment_kinds(kind, text, cls):
+    obj = parse_fragment(text, kind)
+    assert isinstance(obj, cls)
+
+
+def test_context_map_fragment_links_contexts():
+    cm = parse_fragment("ContextMap M { contains A, B  A [U]->[D] B }", kind="context_map")
+    assert [c.name for c in cm.contexts] == ["A", "B"]
+    assert len(cm.relationships) == 1
+
+
+@pytest.mark.parametrize("mode", ["auto", "sll", "ll"])
+def test_trailing_input_is_a_syntax_error(mode):
+    with pytest.raises(CmlSyntaxError) as exc:
+        parse_fragment("Aggregate A {} Aggregate B {}", prediction_mode=mode)
+    assert exc.value.diagnostic.col == 15
+    assert "expecting <EOF>" in exc.value.diagnostic.message
+
+
+def test_wrong_kind_is_a_syntax_error():
+    with pytest.raises(CmlSyntaxError):
+        parse_fragment("Entity E {}", kind="aggregate")
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError):
+        parse_fragment("Aggregate A {}", kind="aggregates")
+
+
+def test_session_parse_fragment_reuses_recognizers():
+    session = ParserSession()
+    first = session.parse_fragment("Service S { void f(); }", kind="service", filename="s.cml")
+    with pytest.raises(CmlSyntaxError) as exc:
+        session.parse_fragment("Service S { void f();; }", kind="service", filename="s.cml")
+    assert exc.value.diagnostic.filename == "s.cml"
+    again = session.parse_fragment("Service S { void g(); }", kind="service")
+    assert [op.name for op in first.operations] == ["f"]
+    assert [op.name for op in again.operations] == ["g"]
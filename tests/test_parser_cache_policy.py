@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import (
+    ParserSession,
+    parse_text,
+    clear_parser_caches,
+    set_cache_policy,
+    get_cache_policy,
+    get_parser_cache_stats,
+    reset_parser_cache_stats,
+)
+from cml_parser.antlr.CMLParser import CMLParser
+
+TEXT = "BoundedContext A { Aggregate X { Entity E { String name } } }\nContextMap M { A -> B }"
+
+
+@pytest.fixture(autouse=True)
+def _default_policy():
+    set_cache_policy()
+    reset_parser_cache_stats()
+    yield
+    set_cache_policy()
+
+
+def test_stats_report_sizes_and_hit_rate():
+    clear_parser_caches()
+    reset_parser_cache_stats()
+    parse_text(TEXT)
+    cold = get_parser_cache_stats()
+    assert cold.parser_dfa_states > 0 and cold.lexer_dfa_states > 0
+    assert cold.predictions > 0
+    assert cold.dfa_hits < cold.predictions
+
+    reset_parser_cache_stats()
+    parse_text(TEXT)
+    warm = get_parser_cache_stats()
+    assert warm.predictions == cold.predictions
+    assert warm.hit_rate == 1.0
+    assert warm.parser_dfa_states == cold.parser_dfa_states
+
+
+def test_clear_parser_caches_keeps_existing_parsers_working():
+    session = ParserSession()
+    session.parse(TEXT)
+    clear_parser_caches()
+    stats = get_parser_cache_stats()
+    assert (stats.lexer_dfa_states, stats.parser_dfa_states, stats.context_cache_size) == (0, 0, 0)
+    assert stats.clears == 1
+
+    cml = session.parse(TEXT)
+    assert [c.name for c in cml.contexts] == ["A", "B"]
+    assert get_parser_cache_stats().parser_dfa_states > 0
+
+
+def test_max_dfa_states_bounds_the_cache():
+    clear_parser_caches()
+    parse_text(TEXT)
+    limit = sum((lambda s: (s.lexer_dfa_states, s.parser_dfa_states))(get_parser_cache_stats())) - 1
+    clear_parser_caches()
+    reset_parser_cache_stats()
+    set_cache_policy(max_dfa_states=limit)
+    parse_text(TEXT)
+    stats = get_parser_cache_stats()
+    assert stats.clears == 1
+    assert stats.lexer_dfa_states + stats.parser_dfa_states == 0
+
+
+def test_reset_every_clears_periodically():
+    set_cache_policy(reset_every=2)
+    assert get_cache_policy().reset_every == 2
+    for _ in range(5):
+        parse_text(TEXT)
+    assert get_parser_cache_stats().clears == 2
+
+
+def test_max_context_cache_size():
+    clear_parser_caches()
+    reset_parser_cache_stats()
+    set_cache_policy(max_context_cache_size=10)
+    parse_text(TEXT)
+    assert get_parser_cache_stats().clears == 1
+    assert len(CMLParser.sharedContextCache) == 0
+
+
+def test_invalid_policy_is_rejected():
+    with pytest.raises(ValueError):
+        set_cache_policy(max_dfa_states=0)
@@ -0,0 +1,85 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import ParserSession, parse_text, CmlSyntaxError
+
+EXAMPLES_DIR = ROOT / "examples"
+
+
+def _summary(cml):
+    return (
+        [c.name for c in cml.contexts],
+        [(a.name, [e.name for e in a.entities]) for c in cml.contexts for a in c.aggregates],
+        [(r.left.name, r.right.name, r.type) for cm in cml.context_maps for r in cm.relationships],
+        [d.name for d in cml.domains],
+    )
+
+
+def _diagnostics(cml):
+    return [(e.message, e.line, e.col) for e in cml.parse_results.errors]
+
+
+def test_parse_many_matches_parse_text():
+    texts = [p.read_text(encoding="utf-8") for p in sorted(EXAMPLES_DIR.rglob("*.cml"))[:4]]
+    session = ParserSession()
+    results = session.parse_many(texts, strict=False)
+    assert len(results) == len(texts)
+    for text, cml in zip(texts, results):
+        assert _summary(cml) == _summary(parse_text(text, strict=False))
+
+
+def test_session_recovers_after_errors_and_mode_changes():
+    session = ParserSession()
+    bad = "ContextMap M { A -> }"
+    good = "ContextMap M { A -> B }"
+
+    first = session.parse(bad, strict=False)
+    assert _diagnostics(first) == _diagnostics(parse_text(bad, strict=False))
+
+    # A following document must not inherit errors or the bail-out strategy.
+    for mode in ("ll", "sll", "auto"):
+        cml = session.parse(good, prediction_mode=mode)
+        assert cml.parse_results.errors == []
+        assert cml.context_maps[0].relationships[0].right.name == "B"
+        assert _diagnostics(session.parse(bad, strict=False, prediction_mode=mode)) == _diagnostics(
+            parse_text(bad, strict=False, prediction_mode=mode)
+        )
+
+
+def test_session_reuses_recognizers_per_thread():
+    session = ParserSession()
+    session.parse("ContextMap M {}")
+    lexer, _, parser = session._local.recognizers
+    session.parse("BoundedContext A {}")
+    assert session._local.recognizers[0] is lexer
+    assert session._local.recognizers[2] is parser
+
+    seen = []
+
+    def worker():
+        session.parse("BoundedContext B {}")
+        seen.append(session._local.recognizers[2])
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert seen and seen[0] is not parser
+
+
+def test_parse_many_strict_raises():
+    with pytest.raises(CmlSyntaxError):
+        ParserSession().parse_many(["ContextMap M {}", "ContextMap { invalid"])
+
+
+def test_session_resolves_imports(tmp_path):
+    (tmp_path / "lib.cml").write_text("BoundedContext Lib {}")
+    main_file = tmp_path / "main.cml"
+    main_file.write_text('import "lib.cml"\nBoundedContext Main {}')
+    cml = ParserSession().parse(main_file.read_text(), filename=str(main_file))
+    assert {c.name for c in cml.contexts} == {"Main", "Lib"}
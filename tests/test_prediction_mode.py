@@ -0,0 +1,84 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import parse_file_safe, parse_text, CmlSyntaxError
+from cml_parser import parser as parser_mod
+
+EXAMPLES_DIR = ROOT / "examples"
+
+
+def _summary(cml):
+    return (
+        [c.name for c in cml.contexts],
+        [(a.name, [e.name for e in a.entities]) for c in cml.contexts for a in c.aggregates],
+        [(r.left.name, r.right.name, r.type, r.roles) for cm in cml.context_maps for r in cm.relationships],
+        [d.name for d in cml.domains],
+        [u.name for u in cml.use_cases],
+    )
+
+
+def _diagnostics(cml):
+    return [(e.message, e.line, e.col) for e in cml.parse_results.errors]
+
+
+@pytest.mark.parametrize("file_path", sorted(EXAMPLES_DIR.rglob("*.cml"))[:4], ids=lambda p: p.name)
+def test_auto_mode_matches_full_ll(file_path):
+    auto = parse_file_safe(str(file_path), prediction_mode="auto")
+    full = parse_file_safe(str(file_path), prediction_mode="ll")
+    assert _summary(auto) == _summary(full)
+    assert _diagnostics(auto) == _diagnostics(full) == []
+
+
+@pytest.mark.parametrize("text", [
+    "ContextMap { invalid",
+    "ContextMap M { A -> }",
+    "BoundedContext A { Aggregate B { Entity C { String x } } } }",
+    # lexer errors interleaved with a parser error
+    "ContextMap M { A -> # B }\nBoundedContext X {",
+])
+def test_auto_mode_fallback_reports_same_diagnostics(text):
+    parser_mod.reset_prediction_stats()
+    auto = parse_text(text, strict=False, prediction_mode="auto")
+    stats = parser_mod.get_prediction_stats()
+    assert stats.ll_fallbacks == 1
+    assert stats.fallback_rate == 1.0
+
+    full = parse_text(text, strict=False, prediction_mode="ll")
+    assert _diagnostics(auto) == _diagnostics(full)
+    assert _diagnostics(auto)
+
+
+def test_auto_mode_counts_sll_successes():
+    parser_mod.reset_prediction_stats()
+    parse_text("ContextMap M { A -> B }")
+    parse_text("BoundedContext A")
+    stats = parser_mod.get_prediction_stats()
+    assert stats.sll_parses == 2
+    assert stats.ll_fallbacks == 0
+    assert stats.fallback_rate == 0.0
+
+    parse_text("ContextMap M { A -> B }", prediction_mode="ll")
+    assert parser_mod.get_prediction_stats() == stats
+
+
+def test_strict_mode_raises_first_error_in_auto_mode():
+    with pytest.raises(CmlSyntaxError) as auto:
+        parse_text("ContextMap { invalid")
+    with pytest.raises(CmlSyntaxError) as full:
+        parse_text("ContextMap { invalid", prediction_mode="ll")
+    assert auto.value.diagnostic == full.value.diagnostic
+
+
+def test_sll_mode_parses_valid_input():
+    cml = parse_text("ContextMap M { A -> B }", prediction_mode="sll")
+    assert cml.get_context_map("M").relationships[0].type == "Upstream-Downstream"
+
+
+def test_unknown_prediction_mode_is_rejected():
+    with pytest.raises(ValueError, match="prediction_mode"):
+        parse_text("ContextMap M {}", prediction_mode="fast")
@@ -1,10 +1,12 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
-from cml_parser import parse_file_safe
+from cml_parser import CmlSyntaxError, parse_file_safe, parse_fragment, parse_text
 
 
 def test_relationship_right_endpoint_trailing_roles(tmp_path):
@@ -39,3 +41,55 @@ def test_relationship_right_endpoint_trailing_roles(tmp_path):
     assert kernel_trailing.name == "KernelTrailing"
     assert "SK" in kernel_trailing.roles
 
+
+def test_next_line_roles_bind_to_following_relationship(tmp_path):
+    content = """
+    ContextMap Demo {
+      A -> B
+      [U,OHS] C -> D [D]
+      E -> F : Named
+      [U] G -> H
+      I -> J { implementationTechnology = "REST" }
+      [D] K <- L
+    }
+    """
+    path = tmp_path / "rel_next_line_roles.cml"
+    path.write_text(content, encoding="utf-8")
+
+    cml = parse_file_safe(str(path))
+    assert cml.parse_results.errors == []
+
+    rels = cml.get_context_map("Demo").relationships
+    assert [(r.left.name, r.right.name) for r in rels] == [
+        ("A", "B"), ("C", "D"), ("E", "F"), ("G", "H"), ("I", "J"), ("K", "L"),
+    ]
+    assert rels[0].roles == []
+    assert rels[1].upstream_roles == ["U", "OHS"]
+    assert rels[1].downstream_roles == ["D"]
+    assert rels[2].roles == []
+    assert rels[3].upstream_roles == ["U"]
+    assert rels[5].downstream_roles == ["D"]
+
+
+@pytest.mark.parametrize(
+    "body, position",
+    [
+        ("  A -> B\n  [D]\n", (3, 2)),
+        ("  A -> B\n  [D] [U] C -> D\n", (3, 2)),
+        ("  A -> B\n  [D] : Named\n", (3, 2)),
+        ("  A -> B\n  [D] { implementationTechnology = \"REST\" }\n", (3, 2)),
+    ],
+    ids=["before-brace", "before-leading-roles", "before-name", "before-attributes"],
+)
+def test_next_line_roles_that_start_no_relationship_are_syntax_errors(body, position):
+    text = "ContextMap Demo {\n" + body + "}\n"
+    with pytest.raises(CmlSyntaxError) as raised:
+        parse_text(text)
+    diagnostic = raised.value.diagnostic
+    assert (diagnostic.line, diagnostic.col) == position
+
+    cml = parse_text(text, strict=False)
+    assert (cml.parse_results.errors[0].line, cml.parse_results.errors[0].col) == position
+    assert cml.parse_results.model is None
+    with pytest.raises(CmlSyntaxError):
+        parse_fragment(text, "context_map")
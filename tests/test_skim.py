@@ -0,0 +1,150 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import CmlSyntaxError, ParserSession, TokenCache, parse_file, parse_text
+from cml_parser.parser import main, parse_file_safe
+from cml_parser.skim import skim_contexts
+from cml_parser.tokens import _lex
+
+EXAMPLES = sorted((ROOT / "examples").rglob("*.cml"))
+
+MODEL = """
+ContextMap Shop {
+  contains Orders, Billing
+  Orders [D,ACL] -> [U,OHS] Billing {
+    implementationTechnology = "REST"
+    exposedAggregates = Invoice
+  }
+}
+Domain Commerce {
+  Subdomain Sales { type = CORE_DOMAIN }
+}
+BoundedContext Orders implements Sales realizes Billing {
+  type = FEATURE
+  domainVisionStatement = "Takes orders"
+  responsibilities = "orders", "carts"
+  Aggregate Cart {
+    responsibilities = "cart"
+    Entity Item { String name }
+  }
+  knowledgeLevel CONCRETE
+  Service CheckoutService { void checkout(); }
+  evolution = CUSTOM_BUILT
+}
+BoundedContext Billing {
+  implementationTechnology = "Java"
+  Module invoicing {
+    Aggregate Invoice { Entity Invoice { aggregateRoot } }
+  }
+}
+"""
+
+HEADER_FIELDS = (
+    "name", "type", "vision", "responsibilities", "implementation_technology", "knowledge_level",
+    "business_model", "evolution", "realizes", "refines",
+)
+
+
+def _strategic_view(cml):
+    contexts = [
+        tuple(getattr(c, f) for f in HEADER_FIELDS)
+        + ([s.name for s in c.implements], [r.name for r in c.realizes_refs])
+        for c in cml.contexts
+    ]
+    relationships = [
+        (cm.name, [c.name for c in cm.contexts], r.left.name, r.right.name, r.type, r.upstream_roles,
+         r.downstream_roles, r.implementation_technology, r.exposed_aggregates)
+        for cm in cml.context_maps
+        for r in cm.relationships
+    ]
+    domains = [
+        (d.name, [(s.name, s.type, [c.name for c in s.implementations]) for s in d.subdomains])
+        for d in cml.domains
+    ]
+    return contexts, relationships, domains
+
+
+def test_strategic_level_keeps_headers_and_relationships():
+    full = parse_text(MODEL)
+    strategic = parse_text(MODEL, level="strategic")
+
+    assert _strategic_view(strategic) == _strategic_view(full)
+    orders = strategic.get_context("Orders")
+    assert (orders.type, orders.vision, orders.responsibilities) == ("FEATURE", "Takes orders", "orders, carts")
+    assert (orders.knowledge_level, orders.evolution) == ("CONCRETE", "CUSTOM_BUILT")
+    assert orders.aggregates == [] and orders.services == []
+    assert strategic.get_context("Billing").modules == []
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=lambda p: p.name)
+def test_strategic_level_matches_full_parse_on_examples(path):
+    assert _strategic_view(parse_file(path, level="strategic")) == _strategic_view(parse_file(path))
+
+
+def test_skimming_only_removes_bounded_context_bodies():
+    lexed = _lex(MODEL, "antlr")
+    texts = [token.text for token in skim_contexts(lexed).tokens]
+    assert "Cart" not in texts and "checkout" not in texts and "invoicing" not in texts
+    header = texts.index("implements") - 1
+    assert texts[header:header + 8] == ["Orders", "implements", "Sales", "realizes", "Billing", "{", "type", "="]
+
+
+@pytest.mark.parametrize("body", [
+    "Domain Inner {}",
+    "Module m { type = SYSTEM }",
+    "type = CORE_DOMAIN",
+    "Aggregate A {",
+])
+def test_bodies_that_could_change_the_model_are_kept(body):
+    text = f"BoundedContext A {{ {body} }}"
+    lexed = _lex(text, "antlr")
+    assert skim_contexts(lexed) is lexed
+
+
+def test_errors_in_skimmed_bodies_are_not_reported():
+    text = "BoundedContext A {\n  type = SYSTEM\n  Aggregate X { Entity E { String name;; } }\n}\nContextMap { A -> }\n"
+    with pytest.raises(CmlSyntaxError) as raised:
+        parse_text(text)
+    assert raised.value.diagnostic.line == 3
+    with pytest.raises(CmlSyntaxError) as raised:
+        parse_text(text, level="strategic")
+    assert raised.value.diagnostic.line == 5
+
+    errors = parse_text(text, strict=False, level="strategic").parse_results.errors
+    assert (errors[0].line, errors[0].col) == (5, 18)
+    assert parse_text("BoundedContext A { Aggregate X { Entity } }", level="strategic").get_context("A")
+
+
+@pytest.mark.parametrize("options", [
+    {"lexer": "fast"},
+    {"token_cache": TokenCache()},
+])
+def test_strategic_level_with_other_token_sources(options):
+    text = MODEL + "\nBoundedContext Broken { Aggregate X { § } }\n"
+    expected = parse_text(text, strict=False, level="strategic")
+    actual = parse_text(text, strict=False, level="strategic", **options)
+    assert _strategic_view(actual) == _strategic_view(expected)
+    errors = [(e.line, e.col, e.message) for e in actual.parse_results.errors]
+    assert errors == [(e.line, e.col, e.message) for e in expected.parse_results.errors]
+    assert "token recognition error" in errors[0][2]
+
+
+def test_strategic_level_in_sessions_imports_and_cli(tmp_path, capsys):
+    (tmp_path / "billing.cml").write_text('BoundedContext Billing { type = SYSTEM Aggregate A {} }', encoding="utf-8")
+    main_file = tmp_path / "main.cml"
+    main_file.write_text('import "billing.cml"\nBoundedContext Orders { Aggregate B {} }', encoding="utf-8")
+
+    cml = parse_file_safe(main_file, level="strategic")
+    assert [(c.name, c.type, c.aggregates) for c in cml.contexts] == [("Orders", "FEATURE", []), ("Billing", "SYSTEM", [])]
+    session_cml = ParserSession().parse(MODEL, level="strategic")
+    assert _strategic_view(session_cml) == _strategic_view(parse_text(MODEL))
+
+    assert main([str(main_file), "--summary", "--level", "strategic"]) == 0
+    assert "Contexts: 2" in capsys.readouterr().out
+    with pytest.raises(ValueError, match="Unknown level"):
+        parse_text(MODEL, level="tactical")
@@ -0,0 +1,94 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import CmlLimitExceeded, CmlSyntaxError, ParseLimits, ParserSession, parse_file, parse_text
+from cml_parser.cml_model_builder import CMLModelBuilder
+from cml_parser.parser import _recognizers, _run_rule, CMLErrorListener, main, parse_file_safe
+from cml_parser.streaming import StreamingBuild
+from cml_parser.streams import CodePointStream
+from model_graph import model_graph
+
+EXAMPLES = sorted((ROOT / "examples").rglob("*.cml"))
+
+MODEL = """
+import "missing.cml"
+ContextMap Shop {
+  contains Orders, Billing
+  Orders [D]->[U] Billing
+}
+BoundedContext Orders implements Sales {
+  Aggregate Cart {
+    owner = Billing
+    Entity Item { String name }
+  }
+}
+BoundedContext Billing
+Domain Commerce {
+  Subdomain Sales
+}
+"""
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=lambda p: p.name)
+def test_streaming_builds_the_same_model(path):
+    assert model_graph(parse_file(path, streaming=True)) == model_graph(parse_file(path))
+
+
+@pytest.mark.parametrize("options", [{}, {"lexer": "fast"}, {"prediction_mode": "ll"}, {"level": "strategic"}])
+def test_streaming_matches_with_other_options(options):
+    expected = parse_text(MODEL, strict=False, **options)
+    actual = parse_text(MODEL, strict=False, streaming=True, **options)
+    assert model_graph(actual) == model_graph(expected)
+    assert [e.message for e in actual.parse_results.errors] == [e.message for e in expected.parse_results.errors]
+
+
+def test_top_level_subtrees_are_dropped_once_built():
+    token_source, token_stream, parser = _recognizers(CodePointStream(MODEL), "antlr", None, None)
+    build = StreamingBuild(CMLModelBuilder, token_stream)
+    parser.addParseListener(build)
+    tree = _run_rule(parser, token_source, token_stream, CMLErrorListener(None), "auto")
+
+    assert [child.getText() for child in tree.children] == ["<EOF>"]
+    assert [c.name for c in build.finish().contexts] == ["Orders", "Billing"]
+    assert build.builder.imports == ["missing.cml"]
+    assert all(view is None for view in token_stream.tokens._views[:-2])
+
+
+def test_streaming_reports_syntax_errors_like_a_full_parse():
+    text = "BoundedContext A {}\nBoundedContext B { Aggregate X { Entity E { String name;; } } }\nBoundedContext C {}\n"
+    with pytest.raises(CmlSyntaxError) as raised:
+        parse_text(text, streaming=True)
+    assert (raised.value.diagnostic.line, raised.value.diagnostic.col) == (2, 56)
+
+    expected = parse_text(text, strict=False)
+    actual = parse_text(text, strict=False, streaming=True)
+    assert [(e.line, e.col) for e in actual.parse_results.errors] == [
+        (e.line, e.col) for e in expected.parse_results.errors
+    ]
+    assert model_graph(actual) == model_graph(expected)
+    truncated = parse_text(text, strict=False, max_errors=1, streaming=True)
+    assert model_graph(truncated) == model_graph(parse_text(text, strict=False, max_errors=1))
+
+
+def test_streaming_with_limits_sessions_and_cli(tmp_path, capsys):
+    with pytest.raises(CmlLimitExceeded):
+        parse_text(MODEL, streaming=True, limits=ParseLimits(max_contexts=1))
+    deep = "BoundedContext A { Aggregate X { Entity E { String name;; } } }"
+    cml = parse_text(deep, strict=False, streaming=True, limits=ParseLimits(max_depth=100))
+    assert cml.parse_results.errors
+
+    session = ParserSession()
+    assert [model_graph(c) for c in session.parse_many([MODEL, MODEL], strict=False, streaming=True)] == [
+        model_graph(parse_text(MODEL, strict=False))
+    ] * 2
+
+    path = tmp_path / "model.cml"
+    path.write_text(MODEL.replace('import "missing.cml"', ""), encoding="utf-8")
+    assert model_graph(parse_file_safe(path, streaming=True)) == model_graph(parse_file_safe(path))
+    assert main([str(path), "--summary", "--streaming"]) == 0
+    assert "Contexts: 2" in capsys.readouterr().out
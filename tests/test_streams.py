@@ -0,0 +1,77 @@
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from antlr4 import InputStream
+from antlr4.Token import Token
+
+from cml_parser import parse_file, parse_text
+from cml_parser.antlr.CMLLexer import CMLLexer
+from cml_parser.streams import CodePointStream, code_points
+
+TEXTS = [
+    "",
+    "BoundedContext A {}",
+    'BoundedContext Café { domainVisionStatement = "naïve 😀 \\u00e9" }',
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_stream_matches_input_stream(text):
+    expected, actual = InputStream(text), CodePointStream(text)
+    assert actual.size == expected.size
+    for index in range(len(text) + 2):
+        expected.seek(index)
+        actual.seek(index)
+        assert [actual.LA(i) for i in (-1, 1, 2)] == [expected.LA(i) for i in (-1, 1, 2)]
+        assert actual.getText(0, index) == expected.getText(0, index)
+    assert str(actual) == text
+
+
+def test_code_points_stay_compact():
+    assert isinstance(code_points("abc"), bytes)
+    astral = code_points("a😀é")
+    assert list(astral) == [ord("a"), 0x1F600, ord("é")]
+    assert astral.itemsize == 4
+
+
+def test_buffer_is_built_on_first_lookahead_only():
+    stream = CodePointStream("BoundedContext A {}")
+    assert stream.data is None
+    stream.getText(0, 5)
+    assert stream.data is None
+    assert stream.LA(1) == ord("B")
+    assert stream.data is not None
+
+
+def test_antlr_lexer_produces_the_same_tokens():
+    text = sorted((ROOT / "examples").rglob("*.cml"))[0].read_text(encoding="utf-8")
+    text += "\nBoundedContext Ünïcode { /* 😀 */ }"
+
+    def tokens(stream):
+        return [(t.type, t.text, t.start, t.stop, t.line, t.column) for t in CMLLexer(stream).getAllTokens()]
+
+    assert tokens(CodePointStream(text)) == tokens(InputStream(text))
+    assert CodePointStream(text).LA(len(text) + 1) == Token.EOF
+
+
+def test_parse_result_keeps_the_file_text(tmp_path):
+    path = tmp_path / "model.cml"
+    path.write_bytes("// café\r\nBoundedContext B {}\n".encode("utf-8"))
+    result = parse_file(path).parse_results
+    assert result.source == path.read_text(encoding="utf-8")
+
+    path.write_text("BoundedContext Changed {}", encoding="utf-8")
+    path.unlink()
+    assert result.source == "// café\nBoundedContext B {}\n"
+    assert pickle.loads(pickle.dumps(result)).source == result.source
+
+
+def test_parsed_text_is_kept_as_is():
+    text = "BoundedContext A {}"
+    assert parse_text(text).parse_results.source is text
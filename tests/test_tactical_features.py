@@ -0,0 +1,109 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import parse_text
+
+TACTICAL = """
+BoundedContext Shop {
+  Aggregate Orders {
+    Entity Order {
+      aggregateRoot
+      - OrderId id key
+      String number required
+      - customer: @Customer nullable
+      "Line items" - List<@OrderLine> lines
+      -- @Invoice
+      association "billed by" @Clerk clerk
+      def void cancel(String reason);
+      * confirm;
+      public Money total();
+      Repository OrderRepository {
+        @Order find(OrderId id) throws NotFound;
+        List<@Order> findAll;
+      }
+    }
+    ValueObject Money {
+      BigDecimal amount
+      currency: String
+    }
+    DomainEvent OrderPlaced {
+      Date timestamp
+      - @Order order
+    }
+    Service Checkout {
+      void place(@Order order);
+      reset;
+    }
+  }
+}
+"""
+
+def test_tactical_features_build_the_model():
+    cml = parse_text(TACTICAL)
+    agg = cml.get_context("Shop").aggregates[0]
+    order = agg.entities[0]
+
+    assert [(a.name, a.type, a.is_reference) for a in order.attributes] == [
+        ("id", "OrderId", True),
+        ("number", "String", False),
+        ("customer", "@Customer", True),
+        ("lines", "List<@OrderLine>", True),
+        ("clerk", "@Clerk", True),
+    ]
+    assert order.attributes[0].is_key
+    assert [op.name for op in order.operations] == ["cancel", "confirm", "total"]
+    assert order.operations[2].visibility == "public"
+
+    repo = agg.repositories[0]
+    find = repo.operations[0]
+    assert (find.return_type, find.throws) == ("Order", ["NotFound"])
+    assert [(p.name, p.type) for p in find.parameters] == [("id", "OrderId")]
+
+    place, reset = agg.services[0].operations
+    assert [(p.name, p.type, p.is_reference) for p in place.parameters] == [("order", "Order", True)]
+    assert reset.return_type is None
+
+
+@pytest.mark.parametrize(
+    "body, attributes",
+    [
+        ("extends @Base", []),
+        ("abstract", []),
+        ("transient String t", [("String", "transient")]),
+        ("inheritanceType = SINGLE_TABLE", []),
+        ("String x; foo bar baz; String y;", [("x", "String"), ("bar", "foo"), ("y", "String")]),
+        ('foo = "bar" - String name', []),
+    ],
+)
+def test_unrecognized_statements_are_skipped(body, attributes):
+    cml = parse_text(f"BoundedContext B {{ Aggregate A {{ Entity E {{ {body} }} }} }}")
+    entity = cml.get_context("B").aggregates[0].entities[0]
+    assert [(a.name, a.type) for a in entity.attributes] == attributes
+
+
+def test_bare_blocks_and_unrecognized_service_statements_are_skipped():
+    assert parse_text("BoundedContext A { { } }").get_context("A")
+    cml = parse_text("BoundedContext A { Aggregate G { Service S { void f(); garbage =; } } }")
+    service = cml.get_context("A").aggregates[0].services[0]
+    assert [(op.name, op.return_type) for op in service.operations] == [("f", "void"), ("garbage", None)]
+
+
+def test_abstract_detection_on_operation_names():
+    text = """
+    BoundedContext A {
+      Aggregate G {
+        Entity E { void abstractify(); def abstract void g; }
+        Service S { void abstractOp; void abstractCall(); }
+      }
+    }
+    """
+    agg = parse_text(text).get_context("A").aggregates[0]
+    assert [(op.name, op.is_abstract) for op in agg.entities[0].operations] == [("abstractify", True), ("g", True)]
+    assert [(op.name, op.is_abstract) for op in agg.services[0].operations] == [
+        ("abstractOp", False), ("abstractCall", True)
+    ]
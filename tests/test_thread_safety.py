@@ -0,0 +1,117 @@
+import itertools
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import (
+    ParserSession,
+    clear_parser_caches,
+    get_parser_cache_stats,
+    get_prediction_stats,
+    parse_file_safe,
+    parse_text,
+    reset_parser_cache_stats,
+    reset_prediction_stats,
+    save_dfa_cache,
+)
+
+EXAMPLES = sorted((ROOT / "examples").rglob("*.cml"))
+
+BROKEN = [
+    "ContextMap M { A -> }",
+    "BoundedContext A { Aggregate G { Entity E { String x § } } } ContextMap { A -> }",
+    "BoundedContext A { Aggregate G { Entity E { foo = 1 } } }",
+]
+
+# (kind, input, lexer, prediction_mode); examples go through parse_file_safe so imports are followed.
+JOBS = [("file", path, lexer, "auto") for path, lexer in itertools.product(EXAMPLES, ("antlr", "fast"))] + [
+    ("text", text, lexer, mode) for text, lexer, mode in itertools.product(BROKEN, ("antlr", "fast"), ("auto", "ll"))
+]
+
+_sessions = ParserSession()
+
+
+def _summary(cml):
+    return (
+        [c.name for c in cml.contexts],
+        [(a.name, [(e.name, [x.name for x in e.attributes]) for e in a.entities])
+         for c in cml.contexts for a in c.aggregates],
+        [(r.left.name, r.right.name, r.type) for cm in cml.context_maps for r in cm.relationships],
+        [d.name for d in cml.domains],
+        [(e.message, e.line, e.col) for e in cml.parse_results.errors],
+    )
+
+
+def _run(job, session=None):
+    kind, source, lexer, mode = job
+    if kind == "file":
+        return _summary(parse_file_safe(source, lexer=lexer, prediction_mode=mode))
+    if session is not None:
+        return _summary(session.parse(source, strict=False, lexer=lexer, prediction_mode=mode))
+    return _summary(parse_text(source, strict=False, lexer=lexer, prediction_mode=mode))
+
+
+@pytest.fixture
+def frequent_switches():
+    # Switch threads as often as possible so races in shared state show up.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-4)
+    try:
+        yield
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_concurrent_parses_match_serial_parses(frequent_switches):
+    expected = [_run(job) for job in JOBS]
+
+    # Start cold so the threads race to build the same DFA states.
+    clear_parser_caches()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(_run, JOBS, [_sessions if i % 2 else None for i in range(len(JOBS))]))
+    assert results == expected
+
+
+def test_counters_are_exact_under_concurrency(frequent_switches):
+    auto_jobs = [job for job in JOBS if job[3] == "auto"][::2]
+
+    reset_prediction_stats()
+    reset_parser_cache_stats()
+    for job in auto_jobs:
+        _run(job)
+    serial = (get_prediction_stats(), get_parser_cache_stats().predictions)
+
+    reset_prediction_stats()
+    reset_parser_cache_stats()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_run, auto_jobs))
+    concurrent = (get_prediction_stats(), get_parser_cache_stats().predictions)
+
+    assert concurrent == serial
+
+
+def test_cache_maintenance_while_parsing(tmp_path, frequent_switches):
+    jobs = JOBS[::4]
+    expected = [_run(job) for job in jobs]
+    stop = threading.Event()
+
+    def maintain():
+        while not stop.wait(0.25):
+            clear_parser_caches()
+            save_dfa_cache(tmp_path / "dfa.cache")
+
+    maintainer = threading.Thread(target=maintain)
+    maintainer.start()
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(_run, jobs))
+    finally:
+        stop.set()
+        maintainer.join()
+    assert results == expected
@@ -0,0 +1,84 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from antlr4 import CommonTokenStream
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.Token import CommonToken, Token
+
+from cml_parser import TokenCache
+from cml_parser.antlr.CMLLexer import CMLLexer
+from cml_parser.fast_lexer import FastCMLLexer
+from cml_parser.parser import _GuardedTokenStream
+from cml_parser.streams import CodePointStream
+from cml_parser.token_store import StoredToken, TokenStore
+
+TEXT = 'BoundedContext Café { /* comment */ domainVisionStatement = "multi\nline" }\n§ ContextMap M { contains Café }'
+
+
+def _fields(token):
+    return (token.type, token.channel, token.start, token.stop, token.line, token.column, token.tokenIndex, token.text)
+
+
+def _token_sources():
+    yield CMLLexer(CodePointStream(TEXT))
+    yield FastCMLLexer(CodePointStream(TEXT))
+    yield TokenCache().token_source(CodePointStream(TEXT))
+
+
+@pytest.mark.parametrize("source", list(_token_sources()), ids=["antlr", "fast", "cached"])
+def test_store_matches_common_token_stream(source):
+    source.removeErrorListeners()
+    expected = CommonTokenStream(FastCMLLexer(CodePointStream(TEXT)))
+    expected.fill()
+    stream = _GuardedTokenStream(source)
+    stream.fill()
+
+    assert isinstance(stream.tokens, TokenStore)
+    assert [_fields(t) for t in stream.tokens] == [_fields(t) for t in expected.tokens]
+    assert [str(t) for t in stream.tokens] == [str(t) for t in expected.tokens]
+    assert stream.getText() == expected.getText()
+    assert stream.tokens[-1].text == "<EOF>"
+
+
+def test_tokens_are_created_on_first_access_only():
+    stream = _GuardedTokenStream(FastCMLLexer(CodePointStream(TEXT)))
+    stream.fill()
+    assert stream.LA(1) == stream.tokens.types[0]
+    assert stream.tokens._views == [None] * len(stream.tokens)
+
+    token = stream.LT(2)
+    assert isinstance(token, StoredToken) and isinstance(token, Token)
+    assert stream.LT(2) is token is stream.tokens[1]
+    token.text = "renamed"
+    assert stream.tokens[1].text == "renamed"
+
+
+def test_lookahead_and_consume_follow_the_stream():
+    stream = _GuardedTokenStream(FastCMLLexer(CodePointStream("BoundedContext A {}")))
+    assert [stream.LA(k) for k in (1, 2, 3, 4, 5, 9)] == stream.tokens.types.tolist()[:5] + [Token.EOF]
+    for _ in range(4):
+        stream.consume()
+    assert stream.LA(1) == Token.EOF and stream.LT(-1).text == "}"
+    with pytest.raises(Exception, match="cannot consume EOF"):
+        stream.consume()
+
+
+def test_hidden_channel_tokens_are_skipped():
+    tokens = []
+    for index, channel in enumerate([0, 1, 0, 1, 0]):
+        token = CommonToken(type=10 + index, channel=channel, start=index, stop=index)
+        token.line, token.column = 1, index
+        tokens.append(token)
+
+    stream = _GuardedTokenStream(ListTokenSource(tokens))
+    expected = CommonTokenStream(ListTokenSource([t.clone() for t in tokens]))
+    assert [stream.LA(k) for k in range(1, 5)] == [expected.LA(k) for k in range(1, 5)] == [10, 12, 14, Token.EOF]
+    stream.consume()
+    expected.consume()
+    assert stream.LT(1).type == expected.LT(1).type == 12
+    assert stream.tokens.off_channel
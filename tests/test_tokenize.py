@@ -0,0 +1,90 @@
+import sys
+from pathlib import Path
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from cml_parser import ParserSession, TokenCache, TokenInfo, parse_fragment, parse_text, tokenize
+from cml_parser.antlr.CMLLexer import CMLLexer
+
+EXAMPLE = ROOT / "examples" / "Insurance" / "Insurance-Example-Model.cml"
+
+# A lexer error ('§') followed by parser errors, so replayed diagnostics must interleave.
+BROKEN = 'BoundedContext A { Aggregate G { Entity E { String x § } } } ContextMap { A -> }'
+
+
+def test_tokenize_matches_lexer():
+    text = EXAMPLE.read_text(encoding="utf-8")
+    stream = CommonTokenStream(CMLLexer(InputStream(text)))
+    stream.fill()
+    expected = [(t.type, t.text, t.start, t.stop, t.line, t.column) for t in stream.tokens[:-1]]
+
+    assert list(tokenize(text)) == expected
+    assert list(tokenize(text, lexer="antlr")) == expected
+
+
+def test_token_info_fields_and_name():
+    tokens = list(tokenize('BoundedContext A {\n  "x" 42 }'))
+    assert tokens[0] == TokenInfo(tokens[0].type, "BoundedContext", 0, 13, 1, 0)
+    assert [t.name for t in tokens] == ["'BoundedContext'", "ID", "'{'", "STRING", "INT", "'}'"]
+    assert (tokens[3].line, tokens[3].column) == (2, 2)
+
+
+def test_tokenize_with_cache_reuses_token_array():
+    cache = TokenCache()
+    first = list(tokenize("Aggregate A {}", cache=cache))
+    second = list(tokenize("Aggregate A {}", cache=cache))
+    assert first == second
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TokenCache(maxsize=2)
+    for text in ("Aggregate A {}", "Aggregate B {}", "Aggregate A {}", "Aggregate C {}"):
+        cache.tokens(text)
+    assert len(cache) == 2
+    cache.tokens("Aggregate A {}")
+    assert cache.stats().hits == 2
+    cache.tokens("Aggregate B {}")
+    assert cache.stats().misses == 4
+
+    with pytest.raises(ValueError):
+        TokenCache(maxsize=0)
+
+
+@pytest.mark.parametrize("mode", ["auto", "ll"])
+def test_parse_with_cache_replays_tokens_and_errors(mode):
+    expected = [e.pretty() for e in parse_text(BROKEN, strict=False, prediction_mode=mode).parse_results.errors]
+    assert "token recognition error" in expected[0] and len(expected) > 1
+
+    cache = TokenCache()
+    for _ in range(2):
+        cml = parse_text(BROKEN, strict=False, prediction_mode=mode, token_cache=cache)
+        assert [e.pretty() for e in cml.parse_results.errors] == expected
+    assert cache.stats().hits == 1
+
+
+def test_cached_model_matches_uncached():
+    text = EXAMPLE.read_text(encoding="utf-8")
+    cache = TokenCache()
+    parse_text(text, token_cache=cache)
+    cached = parse_text(text, token_cache=cache)
+    plain = parse_text(text)
+    assert [c.name for c in cached.contexts] == [c.name for c in plain.contexts]
+    assert len(cached.context_maps[0].relationships) == len(plain.context_maps[0].relationships)
+    assert cache.stats().hits == 1
+
+
+def test_session_and_fragments_use_cache():
+    cache = TokenCache()
+    session = ParserSession()
+    for _ in range(2):
+        agg = session.parse_fragment("Aggregate A { Entity E { String x } }", token_cache=cache)
+        assert agg.entities[0].attributes[0].name == "x"
+    assert parse_fragment("Aggregate A { Entity E { String x } }", token_cache=cache).name == "A"
+    assert cache.stats().hits == 2
+    assert session.parse("§ BoundedContext A {}", strict=False, token_cache=cache).parse_results.errors
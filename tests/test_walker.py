@@ -0,0 +1,76 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from antlr4.tree.Tree import ParseTreeVisitor, TerminalNodeImpl
+
+from cml_parser import parse_text
+from cml_parser.antlr.CMLParser import CMLParser
+from cml_parser.antlr.CMLVisitor import CMLVisitor
+from cml_parser.benchmark import _recursive_builder, benchmark_walker, main
+from cml_parser.cml_model_builder import _LEAF, _WALK, CMLModelBuilder, _dispatch_table
+from cml_parser.parser import _parse_tree
+from model_graph import model_graph
+
+EXAMPLES = sorted((ROOT / "examples").rglob("*.cml"))
+
+
+@pytest.mark.parametrize("path", EXAMPLES, ids=lambda p: p.name)
+def test_dispatch_walker_builds_the_same_model_as_the_recursive_visitor(path):
+    tree = _parse_tree(path.read_text(encoding="utf-8"), str(path))
+    expected = _recursive_builder()(str(path)).visit(tree)
+    assert model_graph(CMLModelBuilder(str(path)).visit(tree)) == model_graph(expected)
+
+
+def test_dispatch_table_maps_hooks_and_defaults():
+    table = _dispatch_table(CMLModelBuilder)
+    assert table[CMLParser.AggregateContext] is CMLModelBuilder.visitAggregate
+    assert table[CMLParser.TopLevelContext] is _WALK
+    assert table[TerminalNodeImpl] is _LEAF
+    assert all(entry in (_WALK, _LEAF) for entry in _dispatch_table(CMLVisitor).values())
+
+    class Terminals(CMLModelBuilder):
+        def visitTerminal(self, node):
+            return node.getText()
+
+    tree = _parse_tree("BoundedContext A {}", None)
+    # Like visitChildren() in ANTLR: the result of the last child, here the EOF token.
+    assert Terminals().visitChildren(tree) == "<EOF>"
+    assert CMLModelBuilder().visitChildren(tree) is ParseTreeVisitor().visitChildren(tree) is None
+
+
+def test_hooks_replaced_on_the_class_are_used(monkeypatch):
+    seen = []
+    monkeypatch.setattr(CMLModelBuilder, "visitModule", lambda self, ctx: seen.append(ctx.name().getText()))
+    parse_text("BoundedContext A { Module m1 { Module m2 {} } Module m3 }")
+    assert seen == ["m1", "m3"]
+
+
+def test_nesting_the_parser_accepts_is_built_without_recursion_errors():
+    depth = 200
+    text = "BoundedContext A { " + "Module m { " * depth + "Aggregate X {}" + " }" * depth + " }"
+    tree = _parse_tree(text, None)
+    cml = CMLModelBuilder().visit(tree)
+    assert len(cml.get_context("A").modules) == depth
+    with pytest.raises(RecursionError):
+        _recursive_builder()().visit(tree)
+
+
+def test_benchmark_walker_compares_node_visits(capsys):
+    result = benchmark_walker(EXAMPLES[:2], rounds=1)
+    assert [(run.visitor, run.hooks) for run in result.runs] == [
+        ("recursive", True), ("dispatch", True), ("recursive", False), ("dispatch", False)
+    ]
+    assert result.nodes > 0 and all(run.nodes == result.nodes and run.seconds > 0 for run in result.runs)
+    assert result.runs[0].speedup == result.runs[2].speedup == 1.0
+    assert "nodes/s" in result.format_table()
+    assert result.to_dict()["runs"][3]["nodes_per_second"] == result.runs[3].nodes_per_second
+
+    assert main(["walker", str(EXAMPLES[0]), "--rounds", "1"]) == 0
+    assert "dispatch" in capsys.readouterr().out
+    with pytest.raises(ValueError):
+        benchmark_walker([])